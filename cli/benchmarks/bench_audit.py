@@ -0,0 +1,134 @@
+"""Benchmark: custo da auditoria (changelog) na latência de escrita.
+
+Executa a mesma carga de escrita pelos services, num banco novo em arquivo,
+com e sem os hooks de auditoria de `services/audit.py`, alternando as duas
+variantes a cada rodada para que aquecimento e cache de disco afetem ambas
+igualmente. A carga cobre os dois formatos de escrita da agenda:
+
+- em lote: criar um hábito e gerar suas instâncias (um flush com N linhas);
+- pontual: concluir e pular instâncias, criar e remarcar tarefas (um
+  commit por operação).
+
+Compara o menor tempo de cada variante (como o timeit): o ruído da máquina
+só soma tempo, e com a mediana ele chegava a ±15% numa diferença real de
+~0%. Sai com código 1 se o overhead passar de `--max-overhead` (padrão 10%).
+
+Uso (a partir de cli/):
+    python -m benchmarks.bench_audit [--runs 7] [--instances 365] [--edits 40]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from datetime import time as time_of_day
+from pathlib import Path
+
+MAX_OVERHEAD = 0.10
+
+
+@contextmanager
+def audit_disabled():
+    """Remove temporariamente os hooks de auditoria do Session."""
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session as OrmSession
+
+    from src.timeblock.services import audit
+
+    hooks = [
+        ("before_flush", audit._collect_changes),
+        ("after_flush", audit._write_changes),
+    ]
+    for name, fn in hooks:
+        event.remove(OrmSession, name, fn)
+    try:
+        yield
+    finally:
+        for name, fn in hooks:
+            event.listen(OrmSession, name, fn)
+
+
+def write_workload(db_path: Path, instances: int, edits: int) -> float:
+    """Executa a carga num banco novo e devolve o tempo de escrita em segundos."""
+    os.environ["TIMEBLOCK_DB_PATH"] = str(db_path)
+
+    from sqlmodel import Session
+
+    from src.timeblock.database import create_db_and_tables, get_engine_context
+    from src.timeblock.models import Recurrence, Routine, SkipReason
+    from src.timeblock.services import HabitInstanceService, HabitService, TaskService
+
+    create_db_and_tables()
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Bench")
+        session.add(routine)
+        session.commit()
+        routine_id = routine.id
+
+    start = time.perf_counter()
+    habit = HabitService.create_habit(
+        routine_id, "Meditar", time_of_day(7, 0), time_of_day(7, 30), Recurrence.EVERYDAY
+    )
+    first_day = date(2025, 1, 1)
+    created = HabitInstanceService.generate_instances(
+        habit.id, first_day, first_day + timedelta(days=instances - 1)
+    )
+    for index, instance in enumerate(created[:edits]):
+        if index % 2:
+            HabitInstanceService.skip_habit_instance(instance.id, SkipReason.WORK)
+        else:
+            HabitInstanceService.mark_completed(instance.id)
+    when = datetime(2025, 1, 1, 14, 0)
+    for index in range(edits // 2):
+        task = TaskService.create_task(f"Tarefa {index}", when)
+        TaskService.update_task(task.id, scheduled_datetime=when + timedelta(hours=1))
+    return time.perf_counter() - start
+
+
+def measure(runs: int = 7, instances: int = 365, edits: int = 40) -> dict[str, float]:
+    """Menor tempo da carga com e sem auditoria e o overhead relativo."""
+    import logging
+
+    # Logs INFO dos services não fazem parte do que se mede
+    logging.disable(logging.INFO)
+    timings: dict[str, list[float]] = {"audited": [], "plain": []}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for run in range(runs):
+                for variant in ("plain", "audited") if run % 2 else ("audited", "plain"):
+                    db_path = Path(tmp) / f"{variant}-{run}.db"
+                    if variant == "plain":
+                        with audit_disabled():
+                            elapsed = write_workload(db_path, instances, edits)
+                    else:
+                        elapsed = write_workload(db_path, instances, edits)
+                    timings[variant].append(elapsed)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    audited = min(timings["audited"])
+    plain = min(timings["plain"])
+    return {"audited_s": audited, "plain_s": plain, "overhead": audited / plain - 1}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--instances", type=int, default=365)
+    parser.add_argument("--edits", type=int, default=40)
+    parser.add_argument("--max-overhead", type=float, default=MAX_OVERHEAD)
+    args = parser.parse_args()
+
+    result = measure(args.runs, args.instances, args.edits)
+    print(f"sem auditoria   {result['plain_s'] * 1000:8.1f} ms")
+    print(f"com auditoria   {result['audited_s'] * 1000:8.1f} ms")
+    print(f"overhead        {result['overhead']:8.1%}  (limite {args.max_overhead:.0%})")
+    if result["overhead"] > args.max_overhead:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
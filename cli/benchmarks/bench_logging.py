@@ -0,0 +1,184 @@
+"""Benchmark: custo do logging nos services (utils/logger.py).
+
+Mede três coisas, sempre pelo menor tempo de `--runs` rodadas (o ruído da
+máquina só soma tempo):
+
+1. chamada descartada: `logger.debug` com DEBUG desligado, montando a
+   mensagem com f-string (como os services faziam) e com argumentos
+   (avaliados só se o nível está habilitado);
+2. chamada gravada: `logger.info` num arquivo, medido na thread que loga,
+   com o handler de arquivo síncrono e com a fila (QueueHandler +
+   QueueListener), que deixa a escrita para outra thread;
+3. service: gerar um ano de instâncias e concluir/remarcar parte delas
+   (`generate_instances`, `mark_completed`, `adjust_instance_time`) com o
+   logger do service desligado, gravando em arquivo direto e pela fila.
+
+Uso (a partir de cli/):
+    python -m benchmarks.bench_logging [--runs 5] [--days 365] [--edits 40]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+import timeit
+from datetime import date, timedelta
+from datetime import time as time_of_day
+from pathlib import Path
+
+SERVICE_LOGGER = "src.timeblock.services.habit_instance_service"
+VARIANTS = ("off", "sync", "queued")
+
+
+def discarded_call_ns(runs: int, calls: int = 100_000) -> dict[str, float]:
+    """ns por `logger.debug` com DEBUG desligado: f-string e argumentos."""
+    logger = logging.getLogger("bench.discarded")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    instance_id, start, end = 42, time_of_day(7, 0), time_of_day(7, 30)
+
+    def eager() -> None:
+        message = f"Ajustando horário instance_id={instance_id}, new_start={start}, new_end={end}"
+        logger.debug(message)
+
+    def lazy() -> None:
+        logger.debug(
+            "Ajustando horário instance_id=%s, new_start=%s, new_end=%s",
+            instance_id,
+            start,
+            end,
+            extra={"instance_id": instance_id},
+        )
+
+    return {
+        name: min(timeit.repeat(fn, number=calls, repeat=runs)) / calls * 1e9
+        for name, fn in (("eager", eager), ("lazy", lazy))
+    }
+
+
+def emitted_call_us(log_dir: Path, runs: int, calls: int = 20_000) -> dict[str, float]:
+    """µs por `logger.info` gravado em arquivo, na thread que loga."""
+    from src.timeblock.utils.logger import setup_logger, shutdown_logging
+
+    result = {}
+    for variant in ("sync", "queued"):
+        timings = []
+        for run in range(runs):
+            logger = setup_logger(
+                f"bench.emitted.{variant}",
+                log_file=log_dir / f"emitted-{variant}-{run}.log",
+                console=False,
+                queued=variant == "queued",
+            )
+            start = time.perf_counter()
+            for index in range(calls):
+                logger.info(
+                    "Instância completada: instance_id=%s", index, extra={"instance_id": index}
+                )
+            timings.append(time.perf_counter() - start)
+            # Esvaziar a fila acontece na outra thread: fora da medida
+            shutdown_logging()
+        result[variant] = min(timings) / calls * 1e6
+    return result
+
+
+def service_workload(db_path: Path, days: int, edits: int) -> float:
+    """Executa a carga num banco novo e devolve o tempo dos services em segundos."""
+    os.environ["TIMEBLOCK_DB_PATH"] = str(db_path)
+
+    from sqlmodel import Session
+
+    from src.timeblock.database import create_db_and_tables, get_engine_context
+    from src.timeblock.models import Recurrence, Routine
+    from src.timeblock.services import HabitInstanceService, HabitService
+
+    create_db_and_tables()
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Bench")
+        session.add(routine)
+        session.commit()
+        routine_id = routine.id
+    habit = HabitService.create_habit(
+        routine_id, "Meditar", time_of_day(7, 0), time_of_day(7, 30), Recurrence.EVERYDAY
+    )
+
+    start = time.perf_counter()
+    first_day = date(2025, 1, 1)
+    created = HabitInstanceService.generate_instances(
+        habit.id, first_day, first_day + timedelta(days=days - 1)
+    )
+    for instance in created[:edits]:
+        HabitInstanceService.adjust_instance_time(
+            instance.id, time_of_day(8, 0), time_of_day(8, 30)
+        )
+        HabitInstanceService.mark_completed(instance.id)
+    return time.perf_counter() - start
+
+
+def service_seconds(base: Path, runs: int, days: int, edits: int) -> dict[str, float]:
+    """Menor tempo da carga dos services por variante do logger do service."""
+    from src.timeblock.utils.logger import get_logger, setup_logger, shutdown_logging
+
+    timings: dict[str, list[float]] = {variant: [] for variant in VARIANTS}
+    try:
+        for run in range(runs):
+            # Ordem rotativa: aquecimento e cache de disco afetam todas igualmente
+            order = VARIANTS[run % 3 :] + VARIANTS[: run % 3]
+            for variant in order:
+                if variant == "off":
+                    logging.disable(logging.CRITICAL)
+                else:
+                    setup_logger(
+                        SERVICE_LOGGER,
+                        log_file=base / f"service-{variant}-{run}.log",
+                        console=False,
+                        queued=variant == "queued",
+                    )
+                try:
+                    elapsed = service_workload(base / f"{variant}-{run}.db", days, edits)
+                finally:
+                    logging.disable(logging.NOTSET)
+                    shutdown_logging()
+                timings[variant].append(elapsed)
+    finally:
+        # Devolve ao service os handlers padrão
+        logging.getLogger(SERVICE_LOGGER).handlers.clear()
+        get_logger(SERVICE_LOGGER)
+    return {variant: min(values) for variant, values in timings.items()}
+
+
+def measure(runs: int = 5, days: int = 365, edits: int = 40) -> dict[str, dict[str, float]]:
+    """Custos por chamada (descartada e gravada) e tempo da carga dos services."""
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        return {
+            "discarded_ns": discarded_call_ns(runs),
+            "emitted_us": emitted_call_us(base, runs),
+            "service_s": service_seconds(base, runs, days, edits),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--edits", type=int, default=40)
+    args = parser.parse_args()
+
+    result = measure(args.runs, args.days, args.edits)
+    discarded, emitted, service = result["discarded_ns"], result["emitted_us"], result["service_s"]
+    print("logger.debug descartado (DEBUG desligado)")
+    print(f"  f-string        {discarded['eager']:8.0f} ns/chamada")
+    print(f"  argumentos      {discarded['lazy']:8.0f} ns/chamada")
+    print("logger.info gravado em arquivo (thread que loga)")
+    print(f"  síncrono        {emitted['sync']:8.2f} µs/chamada")
+    print(f"  fila            {emitted['queued']:8.2f} µs/chamada")
+    print(f"services ({args.days} instâncias, {args.edits} edições)")
+    for variant, label in (("off", "sem log"), ("sync", "síncrono"), ("queued", "fila")):
+        overhead = service[variant] / service["off"] - 1
+        print(f"  {label:<15} {service[variant] * 1000:8.1f} ms  ({overhead:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
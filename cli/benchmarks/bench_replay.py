@@ -0,0 +1,158 @@
+"""Benchmark: vazão do replay do log de operações (services/replay.py).
+
+Popula um banco pelo ORM (as operações entram na `sync_queue` pelo flush,
+como no uso real) em duas fases, com um snapshot entre elas:
+
+1. rotina, hábitos e um ano de instâncias por hábito;
+2. remarcação de todas as instâncias, conclusão de metade e remoção de um
+   décimo, mais tarefas criadas e remarcadas.
+
+Mede a reconstrução completa (log inteiro, sem snapshot) e a partir do
+snapshot (só a fase 2), em operações do log por segundo (melhor de
+`--runs`: o ruído da máquina só tira vazão), e confere cada banco
+reconstruído contra o atual com o diff de hashes. O alvo vale para os
+dois modos. A partir do snapshot esta carga é o pior caso (cerca de uma
+operação por linha, quase nada a reduzir): nesta máquina (um núcleo) o
+completo fica em ~85-110 mil ops/s e o do snapshot em ~70-85 mil, e o alvo
+de 50 mil deixa folga para o ruído nos dois.
+
+Uso (a partir de cli/):
+    python -m benchmarks.bench_replay [--habits 150] [--runs 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from datetime import time as time_of_day
+from pathlib import Path
+
+TARGET_EVENTS_PER_SECOND = 50_000
+
+
+def seed_database(db_path: Path, snapshots: Path, habits: int) -> int:
+    """Cria o banco com as duas fases e um snapshot entre elas.
+
+    Returns:
+        Total de operações no log
+    """
+    os.environ["TIMEBLOCK_DB_PATH"] = str(db_path)
+
+    from sqlmodel import Session, select
+
+    from src.timeblock.database import create_db_and_tables, get_engine_context
+    from src.timeblock.models import (
+        DoneSubstatus,
+        Habit,
+        HabitInstance,
+        Recurrence,
+        Routine,
+        Status,
+        Task,
+    )
+    from src.timeblock.services.replay import ReplayService
+    from src.timeblock.services.sync_queue import SyncQueue
+
+    create_db_and_tables()
+    first_day = date(2025, 1, 1)
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Bench")
+        session.add(routine)
+        session.flush()
+        habit_rows = [
+            Habit(
+                routine_id=routine.id,
+                title=f"Hábito {index}",
+                scheduled_start=time_of_day(6, 0),
+                scheduled_end=time_of_day(6, 30),
+                recurrence=Recurrence.EVERYDAY,
+            )
+            for index in range(habits)
+        ]
+        session.add_all(habit_rows)
+        session.flush()
+        session.add_all(
+            HabitInstance(
+                habit_id=habit.id,
+                date=first_day + timedelta(days=day),
+                scheduled_start=time_of_day(6, 0),
+                scheduled_end=time_of_day(6, 30),
+            )
+            for habit in habit_rows
+            for day in range(365)
+        )
+        session.commit()
+
+    ReplayService.snapshot(str(snapshots))
+
+    with get_engine_context() as engine, Session(engine) as session:
+        instances = session.exec(select(HabitInstance).order_by(HabitInstance.id)).all()
+        for index, instance in enumerate(instances):
+            instance.scheduled_start = time_of_day(7, 0)
+            instance.scheduled_end = time_of_day(7, 30)
+            if index % 2:
+                instance.status = Status.DONE
+                instance.done_substatus = DoneSubstatus.FULL
+        session.flush()
+        for instance in instances[::10]:
+            session.delete(instance)
+        when = datetime(2025, 1, 1, 14, 0)
+        tasks = [Task(title=f"Tarefa {index}", scheduled_datetime=when) for index in range(1000)]
+        session.add_all(tasks)
+        session.flush()
+        for task in tasks:
+            task.scheduled_datetime = when + timedelta(days=1)
+        session.commit()
+
+    return SyncQueue.count()
+
+
+def measure(habits: int = 150, runs: int = 5) -> dict[str, float]:
+    """Melhor vazão do replay completo e a partir do snapshot."""
+    import logging
+
+    from src.timeblock.services.replay import ReplayService
+
+    logging.disable(logging.INFO)
+    result: dict[str, float] = {}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            snapshots = base / "snapshots"
+            result["log_events"] = seed_database(base / "live.db", snapshots, habits)
+            for mode, directory in (("full", base / "none"), ("snapshot", snapshots)):
+                rates = []
+                for run in range(runs):
+                    target = base / f"{mode}-{run}.db"
+                    stats = ReplayService.rebuild(str(target), str(directory))
+                    rates.append(stats.events_per_second)
+                    if ReplayService.verify(str(target)).tables:
+                        raise RuntimeError(f"replay {mode} diverge do banco atual")
+                result[f"{mode}_events"] = stats.events
+                result[f"{mode}_events_per_s"] = max(rates)
+    finally:
+        logging.disable(logging.NOTSET)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--habits", type=int, default=150)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target", type=int, default=TARGET_EVENTS_PER_SECOND)
+    args = parser.parse_args()
+
+    result = measure(args.habits, args.runs)
+    print(f"log             {result['log_events']:>10,.0f} operações")
+    for mode, label in (("full", "sem snapshot"), ("snapshot", "com snapshot")):
+        print(
+            f"{label:<15} {result[f'{mode}_events']:>10,.0f} operações  "
+            f"{result[f'{mode}_events_per_s']:>10,.0f} ops/s  (alvo {args.target:,})"
+        )
+    if min(result["full_events_per_s"], result["snapshot_events_per_s"]) < args.target:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
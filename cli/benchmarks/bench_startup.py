@@ -0,0 +1,269 @@
+"""Benchmark: tempo de inicialização (cold start) dos comandos da CLI.
+
+Cada comando roda em um processo Python novo contra um banco temporário
+populado (rotina, hábitos com instâncias, eventos, tarefas e um timer
+ativo), como um usuário faria no terminal. Mede:
+
+- tempo de parede (mediana de N execuções, inclui o interpretador);
+- maiores ofensores de import (`-X importtime`), agregados por pacote.
+
+Compara a mediana com o orçamento por comando em `startup_budgets.json` e
+sai com código 1 se algum comando estourar ou terminar com erro (um
+traceback não é o caminho que se quer medir). `--update-budgets` regrava o
+arquivo com a mediana medida vezes `--headroom`, só para os comandos que
+terminaram com sucesso.
+
+Uso (a partir de cli/):
+    python -m benchmarks.bench_startup [--runs 5] [--top 8]
+    python -m benchmarks.bench_startup --update-budgets [--headroom 2.0]
+
+A mesma verificação roda no pytest com `pytest --run-benchmarks -m benchmark`.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from datetime import time as time_of_day
+from pathlib import Path
+
+CLI_DIR = Path(__file__).resolve().parent.parent
+BUDGETS_PATH = Path(__file__).resolve().parent / "startup_budgets.json"
+
+# Comandos representativos: nome -> argumentos da CLI
+COMMANDS: dict[str, list[str]] = {
+    "version": ["version"],
+    "list": ["list"],
+    "timer status": ["timer", "status"],
+    "report daily": ["report", "daily"],
+    "habit list": ["habit", "list"],
+}
+
+
+def seed_database(db_path: Path, days: int = 30, habits: int = 8) -> None:
+    """Cria e popula um banco para os comandos medidos.
+
+    Args:
+        db_path: Arquivo do banco (é criado)
+        days: Dias de instâncias, eventos e tarefas ao redor de hoje
+        habits: Quantidade de hábitos na rotina ativa
+    """
+    # Imports pesados só aqui: o processo medido é sempre o filho
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from src.timeblock.models import (
+        Event,
+        Habit,
+        HabitInstance,
+        Recurrence,
+        Routine,
+        Task,
+    )
+    from src.timeblock.services.timer_service import TimerService
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine)
+
+    today = date.today()
+    first_day = today - timedelta(days=days // 2)
+    with Session(engine) as session:
+        routine = Routine(name="Rotina Benchmark", is_active=True)
+        session.add(routine)
+        session.flush()
+
+        habit_rows = []
+        for index in range(habits):
+            start = time_of_day(6 + index, 0)
+            habit = Habit(
+                routine_id=routine.id,
+                title=f"Hábito {index}",
+                scheduled_start=start,
+                scheduled_end=start.replace(minute=45),
+                recurrence=Recurrence.EVERYDAY,
+            )
+            session.add(habit)
+            habit_rows.append(habit)
+        session.flush()
+
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            for habit in habit_rows:
+                session.add(
+                    HabitInstance(
+                        habit_id=habit.id,
+                        date=day,
+                        scheduled_start=habit.scheduled_start,
+                        scheduled_end=habit.scheduled_end,
+                    )
+                )
+            start = datetime.combine(day, time_of_day(18, 0))
+            session.add(
+                Event(
+                    title=f"Evento {offset}",
+                    scheduled_start=start,
+                    scheduled_end=start + timedelta(hours=1),
+                )
+            )
+            session.add(Task(title=f"Tarefa {offset}", scheduled_datetime=start))
+        session.commit()
+
+        instance = session.exec(
+            HabitInstance.__table__.select().where(HabitInstance.date == today).limit(1)
+        ).first()
+        TimerService.start_timer(instance.id, session=session)
+    engine.dispose()
+
+
+def _command_env(db_path: Path) -> dict[str, str]:
+    return {**os.environ, "TIMEBLOCK_DB_PATH": str(db_path), "COLUMNS": "100"}
+
+
+def _command_argv(args: list[str]) -> list[str]:
+    return [sys.executable, "-m", "src.timeblock.main", *args]
+
+
+def time_command(args: list[str], db_path: Path, runs: int = 5) -> dict:
+    """Executa o comando `runs` vezes em processos novos.
+
+    Returns:
+        Dicionário com median_ms, min_ms, exit_code (o primeiro diferente de
+        zero, se houver) e error (última linha do stderr da execução que falhou)
+    """
+    samples = []
+    exit_code = 0
+    error = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            _command_argv(args),
+            cwd=CLI_DIR,
+            env=_command_env(db_path),
+            capture_output=True,
+            stdin=subprocess.DEVNULL,
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+        if result.returncode and not exit_code:
+            exit_code = result.returncode
+            lines = result.stderr.decode(errors="replace").strip().splitlines()
+            error = lines[-1] if lines else ""
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "exit_code": exit_code,
+        "error": error,
+    }
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Soma o tempo próprio (µs) de `-X importtime` por pacote de topo.
+
+    `src.timeblock.*` é agrupado pelo subpacote (ex: `src.timeblock.services`),
+    para que o custo do próprio projeto apareça separado das dependências.
+    """
+    totals: dict[str, int] = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _cumulative, name = line.split(":", 1)[1].split("|")
+        if not self_us.strip().isdigit():
+            continue  # cabeçalho
+        module = name.strip()
+        parts = module.split(".")
+        package = ".".join(parts[:3]) if parts[:2] == ["src", "timeblock"] else parts[0]
+        totals[package] += int(self_us)
+    return dict(totals)
+
+
+def import_offenders(args: list[str], db_path: Path, top: int = 8) -> list[tuple[str, float]]:
+    """Pacotes que mais custam em import para o comando, em ms (decrescente)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *_command_argv(args)[1:]],
+        cwd=CLI_DIR,
+        env=_command_env(db_path),
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+    )
+    totals = parse_importtime(result.stderr)
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    return [(package, us / 1000) for package, us in ranked[:top]]
+
+
+def load_budgets(path: Path = BUDGETS_PATH) -> dict[str, float]:
+    """Orçamentos em ms por comando."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_budgets(budgets: dict[str, float], path: Path = BUDGETS_PATH) -> None:
+    path.write_text(json.dumps(budgets, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def check_budgets(results: dict[str, dict], budgets: dict[str, float]) -> list[str]:
+    """Lista de violações (comando com erro, acima do orçamento ou sem orçamento)."""
+    violations = []
+    for name, result in results.items():
+        budget = budgets.get(name)
+        if result.get("exit_code"):
+            detail = f": {result['error']}" if result.get("error") else ""
+            violations.append(f"{name}: quebrado, saiu com código {result['exit_code']}{detail}")
+        elif budget is None:
+            violations.append(f"{name}: sem orçamento em {BUDGETS_PATH.name}")
+        elif result["median_ms"] > budget:
+            violations.append(f"{name}: {result['median_ms']:.0f} ms > orçamento {budget:.0f} ms")
+    return violations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="ofensores de import por comando")
+    parser.add_argument("--update-budgets", action="store_true")
+    parser.add_argument("--headroom", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        seed_database(db_path)
+
+        results = {}
+        for name, command in COMMANDS.items():
+            results[name] = time_command(command, db_path, args.runs)
+            offenders = import_offenders(command, db_path, args.top)
+            result = results[name]
+            print(
+                f"{name:<14} median {result['median_ms']:>7.0f} ms"
+                f"  min {result['min_ms']:>7.0f} ms  exit {result['exit_code']}"
+            )
+            for package, ms in offenders:
+                print(f"    {ms:>7.1f} ms  {package}")
+
+    broken = [name for name, result in results.items() if result["exit_code"]]
+    if args.update_budgets:
+        budgets = {
+            name: round(result["median_ms"] * args.headroom, -1)
+            for name, result in results.items()
+            if name not in broken
+        }
+        save_budgets(budgets)
+        print(f"Orçamentos gravados em {BUDGETS_PATH}")
+        for name in broken:
+            print(f"FALHA {name}: quebrado, sem orçamento ({results[name]['error']})")
+        if broken:
+            sys.exit(1)
+        return
+
+    violations = check_budgets(results, load_budgets())
+    for violation in violations:
+        print(f"FALHA {violation}")
+    if violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark: chaves inteiras vs UUIDv7 BLOB vs UUID TEXT (ADR-013).
+
+Compara três layouts para habits/habitinstance:
+
+- int:        PK inteira, FK inteira (baseline atual)
+- int+uuid7:  PK/FK inteiras + coluna uuid BLOB(16) única (migração 005)
+- text-uuid4: PK/FK TEXT com UUIDv4 (abordagem ingênua)
+
+Mede vazão de inserção, vazão do join habitinstance -> habits e tamanho
+das tabelas/índices (dbstat).
+
+Uso (a partir de cli/):
+    python -m benchmarks.bench_uuid_keys [--habits 200] [--instances 100000]
+"""
+
+import argparse
+import sqlite3
+import time
+import uuid
+
+from src.timeblock.models.uuid_encoding import uuid7
+
+LAYOUTS = {
+    "int": (
+        "CREATE TABLE habits (id INTEGER PRIMARY KEY, title TEXT)",
+        "CREATE TABLE habitinstance (id INTEGER PRIMARY KEY, habit_id INTEGER, date TEXT)",
+    ),
+    "int+uuid7": (
+        "CREATE TABLE habits (id INTEGER PRIMARY KEY, uuid BLOB UNIQUE, title TEXT)",
+        "CREATE TABLE habitinstance (id INTEGER PRIMARY KEY, uuid BLOB UNIQUE,"
+        " habit_id INTEGER, date TEXT)",
+    ),
+    "text-uuid4": (
+        "CREATE TABLE habits (id TEXT PRIMARY KEY, title TEXT)",
+        "CREATE TABLE habitinstance (id TEXT PRIMARY KEY, habit_id TEXT, date TEXT)",
+    ),
+}
+
+
+def _habit_row(layout: str, index: int) -> tuple:
+    if layout == "int":
+        return (index + 1, f"habit {index}")
+    if layout == "int+uuid7":
+        return (index + 1, uuid7().bytes, f"habit {index}")
+    return (str(uuid.uuid4()), f"habit {index}")
+
+
+def _instance_row(layout: str, index: int, habit_key) -> tuple:
+    if layout == "int":
+        return (None, habit_key, "2025-10-17")
+    if layout == "int+uuid7":
+        return (None, uuid7().bytes, habit_key, "2025-10-17")
+    return (str(uuid.uuid4()), habit_key, "2025-10-17")
+
+
+def run(layout: str, habits: int, instances: int) -> dict:
+    conn = sqlite3.connect(":memory:")
+    for statement in LAYOUTS[layout]:
+        conn.execute(statement)
+    conn.execute("CREATE INDEX ix_habitinstance_habit_id ON habitinstance (habit_id)")
+
+    habit_rows = [_habit_row(layout, i) for i in range(habits)]
+    placeholders = ", ".join("?" * len(habit_rows[0]))
+    conn.executemany(f"INSERT INTO habits VALUES ({placeholders})", habit_rows)
+    habit_keys = [row[0] for row in habit_rows]
+
+    instance_rows = [_instance_row(layout, i, habit_keys[i % habits]) for i in range(instances)]
+    placeholders = ", ".join("?" * len(instance_rows[0]))
+    start = time.perf_counter()
+    with conn:
+        conn.executemany(f"INSERT INTO habitinstance VALUES ({placeholders})", instance_rows)
+    insert_seconds = time.perf_counter() - start
+
+    join_sql = (
+        "SELECT h.title, count(*) FROM habitinstance AS hi"
+        " JOIN habits AS h ON h.id = hi.habit_id GROUP BY h.id"
+    )
+    repeats = 5
+    start = time.perf_counter()
+    for _ in range(repeats):
+        conn.execute(join_sql).fetchall()
+    join_seconds = (time.perf_counter() - start) / repeats
+
+    sizes = dict(
+        conn.execute(
+            "SELECT name, sum(pgsize) FROM dbstat WHERE name LIKE '%habitinstance%' GROUP BY name"
+        ).fetchall()
+    )
+    conn.close()
+    return {
+        "insert_rows_per_s": instances / insert_seconds,
+        "join_ms": join_seconds * 1000,
+        "table_kib": sum(v for k, v in sizes.items() if k == "habitinstance") / 1024,
+        "index_kib": sum(v for k, v in sizes.items() if k != "habitinstance") / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--habits", type=int, default=200)
+    parser.add_argument("--instances", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'layout':<12} {'insert/s':>12} {'join ms':>9} {'table KiB':>10} {'index KiB':>10}")
+    for layout in LAYOUTS:
+        result = run(layout, args.habits, args.instances)
+        print(
+            f"{layout:<12} {result['insert_rows_per_s']:>12,.0f} {result['join_ms']:>9.1f}"
+            f" {result['table_kib']:>10,.0f} {result['index_kib']:>10,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Comandos para o daemon local."""
+
+import typer
+from rich.console import Console
+
+from ..daemon.client import DaemonClient, DaemonUnavailableError, get_socket_path
+
+app = typer.Typer(help="Daemon local (engine e imports quentes)")
+console = Console()
+
+
+@app.command("start")
+def start_daemon(
+    socket_path: str = typer.Option(None, "--socket", help="Caminho do socket Unix"),
+):
+    """Inicia o daemon em primeiro plano (Ctrl+C para parar).
+
+    Enquanto estiver rodando, comandos de leitura (list, report, timer status,
+    ... list) são executados por ele. Use TIMEBLOCK_NO_DAEMON=1 para ignorá-lo.
+    """
+    from ..daemon.server import serve
+
+    path = socket_path or get_socket_path()
+    console.print(f"Daemon escutando em {path}", style="green")
+    try:
+        serve(path)
+    except RuntimeError as e:
+        console.print(f"✗ {e}", style="red")
+        raise typer.Exit(1) from None
+    console.print("Daemon encerrado.", style="yellow")
+
+
+@app.command("status")
+def daemon_status(
+    socket_path: str = typer.Option(None, "--socket", help="Caminho do socket Unix"),
+):
+    """Mostra se há daemon escutando."""
+    path = socket_path or get_socket_path()
+    try:
+        with DaemonClient(path, timeout=2.0) as client:
+            info = client.ping()
+    except DaemonUnavailableError:
+        console.print(f"Nenhum daemon em {path}", style="yellow")
+        raise typer.Exit(1) from None
+
+    console.print(f"Daemon ativo (pid {info['pid']}) em {path}", style="green")
+    console.print(f"Banco: {info['db_path']}")
+
+
+@app.command("stop")
+def stop_daemon(
+    socket_path: str = typer.Option(None, "--socket", help="Caminho do socket Unix"),
+):
+    """Encerra o daemon."""
+    path = socket_path or get_socket_path()
+    try:
+        with DaemonClient(path, timeout=2.0) as client:
+            client.shutdown()
+    except DaemonUnavailableError:
+        console.print(f"Nenhum daemon em {path}", style="yellow")
+        raise typer.Exit(1) from None
+
+    console.print("Daemon encerrado.", style="green")
@@ -0,0 +1,74 @@
+"""Comando de histórico de edições da agenda (tabela changelog)."""
+
+from datetime import datetime
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from src.timeblock.services.audit import AuditService
+
+console = Console()
+
+# Nome na CLI -> tabela auditada
+ENTITIES = {"event": "event", "habit": "habits", "instance": "habitinstance", "task": "tasks"}
+
+
+def _parse_cursor(cursor: str) -> tuple[datetime, int]:
+    """Cursor `CHANGED_AT/ID` impresso no fim da página anterior."""
+    changed_at, _, row_id = cursor.rpartition("/")
+    try:
+        return datetime.fromisoformat(changed_at), int(row_id)
+    except ValueError:
+        raise typer.BadParameter(f"Cursor inválido: {cursor}") from None
+
+
+def history(
+    entity: str | None = typer.Option(
+        None, "--entity", "-e", help="Filtra por tipo: event, habit, instance, task"
+    ),
+    entity_id: int | None = typer.Option(None, "--id", help="Filtra por id (com --entity)"),
+    limit: int = typer.Option(20, "--limit", "-n", help="Linhas por página"),
+    before: str | None = typer.Option(
+        None, "--before", "-b", help="Cursor da página anterior (mudanças mais antigas)"
+    ),
+):
+    """Lista as edições da agenda, da mais recente para a mais antiga."""
+    if entity is not None and entity not in ENTITIES:
+        console.print(f"✗ Tipo inválido: {entity} (use {', '.join(ENTITIES)})", style="red")
+        raise typer.Exit(1)
+    cursor = _parse_cursor(before) if before else None
+
+    changes = AuditService.history(
+        limit=limit,
+        before=cursor,
+        entity=ENTITIES[entity] if entity else None,
+        entity_id=entity_id,
+    )
+    if not changes:
+        console.print("Nenhuma mudança registrada", style="dim")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Quando")
+    table.add_column("Registro")
+    table.add_column("Mudança")
+    table.add_column("Campo")
+    table.add_column("De")
+    table.add_column("Para")
+    for change in changes:
+        table.add_row(
+            change.changed_at.strftime("%Y-%m-%d %H:%M:%S"),
+            f"{change.entity}#{change.entity_id}",
+            change.change_type.value,
+            change.field_name or "",
+            change.old_value or "",
+            change.new_value or "",
+        )
+    console.print(table)
+
+    if len(changes) == limit:
+        last = changes[-1]
+        console.print(
+            f"Mais antigas: --before {last.changed_at.isoformat()}/{last.id}", style="dim"
+        )
@@ -4,10 +4,15 @@ import typer
 from rich.console import Console
 from sqlmodel import Session
 
-from ..database import get_engine_context
+from ..database import get_readonly_engine_context
 from ..utils.event_date_filters import DateFilterBuilder
 from ..utils.event_list_presenter import ListPresenter
-from ..utils.queries import fetch_events_in_range
+from ..utils.queries import (
+    build_events_query,
+    fetch_events_in_range,
+    period_filters,
+    stream_rows,
+)
 
 console = Console()
 
@@ -18,10 +23,14 @@ def list_events(
     month: str = typer.Option(None, "--month", "-m", help="Month: 1-12 or +/-N"),
     week: str = typer.Option(None, "--week", "-w", help="Week: 0 (this), +N (next N), -N (last N)"),
     day: str = typer.Option(None, "--day", "-d", help="Day: 0 (today), +/-N"),
+    pager: bool = typer.Option(
+        True, "--pager/--no-pager", help="Page --all/--limit output on a TTY"
+    ),
 ) -> None:
     """List scheduled events with flexible filtering.
 
-    By default, shows events from the next 2 weeks.
+    By default, shows events from the next 2 weeks. --all and --limit
+    stream rows as they are read (paged on a TTY, tab-separated when piped).
 
     Examples:
         timeblock list                    # Next 2 weeks (default)
@@ -44,34 +53,37 @@ def list_events(
             day=day,
         )
 
-        # Fetch events from database
-        with get_engine_context() as engine:
+        presenter = ListPresenter(console)
+
+        if all_events or limit:
+            # Unbounded listing: stream rows straight from the cursor
+            title = "All Events" if all_events else f"Latest {limit} Events"
+            if limit_val:
+                # Use limit without date filter, newest first
+                statement = build_events_query(ascending=False, limit=limit_val)
+            else:
+                statement = build_events_query(start, end, ascending=False)
+            with get_readonly_engine_context() as engine, Session(engine) as session:
+                shown = presenter.stream_table(stream_rows(session, statement), title, pager=pager)
+            if not shown:
+                presenter.show_no_events(_describe_filter(all_events, limit, month, week, day))
+            return
+
+        # Fetch each time bucket with its own bounded query, newest first
+        with get_readonly_engine_context() as engine:
             with Session(engine) as session:
-                if limit_val:
-                    # Use limit without date filter, newest first
-                    events = fetch_events_in_range(session, start=None, end=None, ascending=False)[
-                        :limit_val
-                    ]
-                else:
-                    # Use date range filter, newest first
-                    events = fetch_events_in_range(session, start=start, end=end, ascending=False)
+                past, present, future = (
+                    fetch_events_in_range(session, ascending=False, **filters)
+                    for filters in period_filters(start, end, filter_builder.now)
+                )
 
-        # Present results
-        presenter = ListPresenter(console)
-        if not events:
+        if not (past or present or future):
             filter_desc = _describe_filter(all_events, limit, month, week, day)
             presenter.show_no_events(filter_desc)
             return
 
-        # Choose presentation style
-        if all_events or limit:
-            # Simple single table
-            title = "All Events" if all_events else f"Latest {limit} Events"
-            presenter.show_single_table(events, title)
-        else:
-            # Split view by time period
-            past, present, future = presenter.split_by_time(events)
-            presenter.show_split_view(past, present, future)
+        # Split view by time period
+        presenter.show_split_view(past, present, future)
 
     except Exception as error:
         console.print(f"[red]✗[/red] Error: {error}", style="bold red")
@@ -0,0 +1,64 @@
+"""Comandos do outbox de eventos de domínio (ADR-023)."""
+
+import typer
+from rich.console import Console
+
+from src.timeblock.database import create_db_and_tables
+from src.timeblock.services.outbox import OutboxPublisher, OutboxService, open_sink
+
+app = typer.Typer(help="Publicar eventos de domínio (outbox, ADR-023)")
+console = Console()
+
+
+@app.command("publish")
+def publish(
+    to: str = typer.Option(..., "--to", "-t", help="Destino: file:CAMINHO ou unix:CAMINHO"),
+    batch_size: int = typer.Option(100, "--batch-size", "-b", help="Eventos por lote"),
+    follow: bool = typer.Option(False, "--follow", "-f", help="Continua publicando (Ctrl+C sai)"),
+):
+    """Publica no destino os eventos que ele ainda não recebeu."""
+    create_db_and_tables()
+    try:
+        publisher = OutboxPublisher(open_sink(to), to, batch_size)
+    except ValueError as e:
+        console.print(f"✗ Erro: {e}", style="red")
+        raise typer.Exit(1) from None
+
+    if follow:
+        try:
+            publisher.run()
+        except KeyboardInterrupt:
+            return
+
+    result = publisher.drain()
+    console.print(f"✓ {result.published} evento(s) publicados", style="green")
+    if result.error is not None:
+        retry_at = result.retry_at.strftime("%H:%M:%S") if result.retry_at else "?"
+        console.print(
+            f"✗ Destino falhou: {result.error} ({result.pending} pendente(s), "
+            f"nova tentativa a partir de {retry_at})",
+            style="red",
+        )
+        raise typer.Exit(1)
+
+
+@app.command("status")
+def status():
+    """Mostra cada destino, seu offset e quantos eventos faltam."""
+    create_db_and_tables()
+    offsets = OutboxService.status()
+    if not offsets:
+        console.print("Nenhum destino publicou ainda", style="dim")
+    for offset, pending in offsets:
+        line = f"{offset.sink}: offset {offset.last_id}, {pending} pendente(s)"
+        if offset.last_error:
+            line += f" [red](falhas: {offset.attempts}, {offset.last_error})[/red]"
+        console.print(line)
+
+
+@app.command("prune")
+def prune():
+    """Remove eventos já entregues a todos os destinos."""
+    create_db_and_tables()
+    removed = OutboxService.prune()
+    console.print(f"✓ {removed} evento(s) removidos", style="green")
@@ -0,0 +1,68 @@
+"""Comandos de snapshot e reconstrução do banco pelo log de operações (ADR-023)."""
+
+import typer
+from rich.console import Console
+from sqlalchemy.exc import OperationalError
+
+from src.timeblock.database import create_db_and_tables
+from src.timeblock.services.replay import KEEP_SNAPSHOTS, ReplayService
+
+app = typer.Typer(help="Snapshots e reconstrução do banco a partir do log (recuperação)")
+console = Console()
+
+
+@app.command("snapshot")
+def snapshot(
+    directory: str | None = typer.Option(
+        None, "--dir", "-d", help="Diretório dos snapshots (padrão: ao lado do banco)"
+    ),
+    every: int = typer.Option(
+        0, "--every", help="Só copia se o log andou N operações desde o último (para cron)"
+    ),
+    keep: int = typer.Option(KEEP_SNAPSHOTS, "--keep", help="Snapshots mantidos"),
+):
+    """Copia o banco atual para um snapshot marcado com o seq do log."""
+    create_db_and_tables()
+    created = ReplayService.snapshot(directory, every, keep)
+    if created is None:
+        console.print("Último snapshot ainda recente; nada a fazer", style="dim")
+        return
+    console.print(f"✓ Snapshot {created.path} (log até seq {created.seq})", style="green")
+
+
+@app.command("rebuild")
+def rebuild(
+    target: str = typer.Argument(..., help="Banco novo a criar"),
+    directory: str | None = typer.Option(
+        None, "--dir", "-d", help="Diretório dos snapshots (padrão: ao lado do banco)"
+    ),
+    verify: bool = typer.Option(False, "--verify", help="Compara o banco reconstruído com o atual"),
+):
+    """Reconstrói o banco em TARGET: último snapshot + operações posteriores."""
+    create_db_and_tables()
+    try:
+        stats = ReplayService.rebuild(target, directory)
+    except (OSError, ValueError, OperationalError) as e:
+        console.print(f"✗ Erro: {e}", style="red")
+        raise typer.Exit(1) from None
+
+    console.print(
+        f"✓ {stats.events} operação(ões) do log (seq {stats.snapshot_seq}..{stats.until_seq}) "
+        f"aplicadas como {stats.rows} escrita(s) em {stats.seconds:.2f}s "
+        f"({stats.events_per_second:,.0f} ops/s)",
+        style="green",
+    )
+    if not verify:
+        return
+
+    report = ReplayService.verify(target)
+    if not report.tables:
+        console.print("✓ Idêntico ao banco atual", style="green")
+        return
+    for name, table in report.tables.items():
+        console.print(
+            f"{name}: {len(table.missing)} só no reconstruído, {len(table.changed)} diferentes, "
+            f"{len(table.extra)} só no atual",
+            style="red",
+        )
+    raise typer.Exit(1)
@@ -4,7 +4,9 @@ from datetime import datetime
 
 import typer
 from rich.console import Console
+from sqlmodel import Session
 
+from src.timeblock.database import get_readonly_engine_context
 from src.timeblock.services.event_reordering_service import EventReorderingService
 from src.timeblock.utils.conflict_display import display_conflicts
 
@@ -28,7 +30,10 @@ def show_conflicts(
     if event_id and event_type:
         # Conflitos de um evento específico
         try:
-            conflicts = EventReorderingService.detect_conflicts(event_id, event_type)
+            with get_readonly_engine_context() as engine, Session(engine) as session:
+                conflicts = EventReorderingService.detect_conflicts(
+                    event_id, event_type, session=session
+                )
             display_conflicts(conflicts, console)
         except ValueError as e:
             console.print(f"[red]✗ Erro: {e}[/red]")
@@ -38,7 +43,10 @@ def show_conflicts(
         # Conflitos de um dia específico
         try:
             parsed_date = datetime.strptime(date, "%Y-%m-%d").date()
-            conflicts = EventReorderingService.get_conflicts_for_day(parsed_date)
+            with get_readonly_engine_context() as engine, Session(engine) as session:
+                conflicts = EventReorderingService.get_conflicts_for_day(
+                    parsed_date, session=session
+                )
             display_conflicts(conflicts, console)
         except ValueError:
             console.print("[red]✗ Formato de data inválido. Use YYYY-MM-DD[/red]")
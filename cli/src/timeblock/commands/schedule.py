@@ -7,12 +7,17 @@ from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.table import Table
+from rich.markup import escape
+from sqlmodel import Session
 
+from src.timeblock.database import get_readonly_engine_context
+from src.timeblock.models import Habit, HabitInstance
 from src.timeblock.services.event_reordering_service import EventReorderingService
 from src.timeblock.services.habit_instance_service import HabitInstanceService
 from src.timeblock.services.habit_service import HabitService
 from src.timeblock.utils.proposal_display import confirm_apply_proposal, display_proposal
+from src.timeblock.utils.queries import build_instances_query, stream_rows
+from src.timeblock.utils.table_stream import StreamColumn, TableStream
 
 app = typer.Typer(help="Gerenciar agenda de hábitos")
 console = Console()
@@ -45,53 +50,61 @@ def generate_instances(
         raise typer.Exit(1)
 
 
+# Layout fixo: todos os blocos do streaming ficam alinhados
+INSTANCE_COLUMNS = [
+    StreamColumn("ID", 6, style="cyan"),
+    StreamColumn("Hábito", 20, style="white", flex=True),
+    StreamColumn("Data", 10, style="magenta"),
+    StreamColumn("Horário", 13, style="blue"),
+    StreamColumn("Ajustado", 8, style="yellow"),
+]
+
+
+def _instance_row(instance: HabitInstance, habit: Habit) -> tuple[str, ...]:
+    adjusted = "[OK]" if instance.scheduled_start != habit.scheduled_start else "—"
+    return (
+        str(instance.id),
+        escape(habit.title),
+        instance.date.strftime("%d/%m/%Y"),
+        f"{instance.scheduled_start.strftime('%H:%M')} → {instance.scheduled_end.strftime('%H:%M')}",
+        escape(adjusted),
+    )
+
+
 @app.command("list")
 def list_instances(
     date_filter: str = typer.Option(None, "--date", "-d", help="Filtrar por data (YYYY-MM-DD)"),
     habit_id: int = typer.Option(None, "--habit", "-h", help="Filtrar por hábito"),
+    pager: bool = typer.Option(True, "--pager/--no-pager", help="Paginar a saída no terminal"),
 ):
-    """Lista instâncias agendadas."""
+    """Lista instâncias agendadas.
+
+    As linhas são exibidas conforme são lidas do banco (paginadas no
+    terminal, separadas por tab quando a saída é redirecionada).
+    """
     try:
         date_obj = date.fromisoformat(date_filter) if date_filter else None
-        instances = HabitInstanceService.list_instances(date=date_obj, habit_id=habit_id)
+        with get_readonly_engine_context() as engine, Session(engine) as session:
+            # Título da tabela
+            if habit_id:
+                habit = HabitService.get_habit(habit_id, session=session)
+                if habit is None:
+                    raise ValueError(f"Hábito {habit_id} não encontrado")
+            if date_filter and habit_id:
+                title = f"Agenda - {habit.title} em {date_obj.strftime('%d/%m/%Y')}"
+            elif date_filter:
+                title = f"Agenda - {date_obj.strftime('%d/%m/%Y')}"
+            elif habit_id:
+                title = f"Agenda - {habit.title}"
+            else:
+                title = "Agenda"
+
+            rows = stream_rows(session, build_instances_query(date_obj, habit_id))
+            stream = TableStream(console, INSTANCE_COLUMNS, pager=pager)
+            shown = stream.write((_instance_row(inst, habit) for inst, habit in rows), title)
 
-        if not instances:
+        if not shown:
             console.print("Nenhum hábito agendado encontrado.", style="yellow")
-            return
-
-        # Título da tabela
-        if date_filter and habit_id:
-            habit = HabitService.get_habit(habit_id)
-            title = f"Agenda - {habit.title} em {date_obj.strftime('%d/%m/%Y')}"
-        elif date_filter:
-            title = f"Agenda - {date_obj.strftime('%d/%m/%Y')}"
-        elif habit_id:
-            habit = HabitService.get_habit(habit_id)
-            title = f"Agenda - {habit.title}"
-        else:
-            title = "Agenda"
-
-        table = Table(title=title)
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Hábito", style="white")
-        table.add_column("Data", style="magenta")
-        table.add_column("Horário", style="blue")
-        table.add_column("Ajustado", style="yellow")
-
-        for inst in instances:
-            habit = HabitService.get_habit(inst.habit_id)
-            adjusted = "[OK]" if inst.scheduled_start != habit.scheduled_start else "—"
-            table.add_row(
-                str(inst.id),
-                habit.title,
-                inst.date.strftime("%d/%m/%Y"),
-                f"{inst.scheduled_start.strftime('%H:%M')} → {inst.scheduled_end.strftime('%H:%M')}",
-                adjusted,
-            )
-
-        console.print()
-        console.print(table)
-        console.print()
 
     except ValueError as e:
         console.print(f"[X] Erro: {e}", style="red")
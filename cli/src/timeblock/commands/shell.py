@@ -0,0 +1,183 @@
+"""Modo interativo: vários comandos em um único processo."""
+
+import os
+import shlex
+import time
+from collections.abc import Callable
+
+import click
+import typer
+from rich.console import Console
+
+from ..database import shared_engines
+
+console = Console()
+
+PROMPT = "timeblock> "
+HISTORY_FILE = "~/.timeblock_history"
+HISTORY_LENGTH = 1000
+EXIT_WORDS = frozenset({"exit", "quit"})
+
+# Comandos que não fazem sentido dentro do shell
+BLOCKED_COMMANDS = frozenset({"shell", "daemon"})
+
+
+def complete_words(root: click.Command, words: list[str], prefix: str) -> list[str]:
+    """Candidatos de completion para a próxima palavra.
+
+    Desce pelos grupos seguindo `words` (palavras já completas) e devolve os
+    subcomandos do grupo atingido, ou as opções do comando final, que
+    começam com `prefix`.
+
+    Args:
+        root: Grupo raiz da CLI
+        words: Palavras anteriores ao cursor
+        prefix: Palavra sob o cursor (parcial)
+
+    Returns:
+        Candidatos ordenados
+    """
+    ctx = click.Context(root, info_name="timeblock")
+    command = root
+    for word in words:
+        if word.startswith("-") or not isinstance(command, click.Group):
+            break
+        sub = command.get_command(ctx, word)
+        if sub is None:
+            return []
+        command = sub
+
+    if isinstance(command, click.Group) and not prefix.startswith("-"):
+        names = [name for name in command.list_commands(ctx) if name not in BLOCKED_COMMANDS] + (
+            sorted(EXIT_WORDS) if command is root else []
+        )
+    else:
+        names = [opt for param in command.params for opt in param.opts if opt.startswith("-")]
+        names.append("--help")
+    return sorted(name for name in names if name.startswith(prefix))
+
+
+def run_line(root: click.Command, line: str) -> int | None:
+    """Executa uma linha do shell como se fosse `timeblock <linha>`.
+
+    Returns:
+        Exit code do comando, ou None para linha vazia
+    """
+    try:
+        args = shlex.split(line)
+    except ValueError as e:
+        console.print(f"✗ {e}", style="red")
+        return 2
+    if not args:
+        return None
+    if args[0] in BLOCKED_COMMANDS:
+        console.print(f"✗ '{args[0]}' não está disponível no shell", style="red")
+        return 2
+
+    try:
+        result = root.main(args=args, prog_name="timeblock", standalone_mode=False)
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Abort:
+        console.print("Abortado.", style="yellow")
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except KeyboardInterrupt:
+        console.print("\nInterrompido.", style="yellow")
+        return 130
+    except Exception as e:
+        # Um comando com erro não derruba o shell
+        console.print(f"✗ Erro: {type(e).__name__}: {e}", style="red")
+        return 1
+    return result if isinstance(result, int) else 0
+
+
+def _setup_readline(root: click.Command, history_path: str) -> Callable[[], None]:
+    """Ativa histórico e completion com Tab; devolve função que salva o histórico."""
+    try:
+        import readline
+    except ImportError:  # Windows sem pyreadline
+        return lambda: None
+
+    def completer(text: str, state: int) -> str | None:
+        buffer = readline.get_line_buffer()[: readline.get_begidx()]
+        try:
+            words = shlex.split(buffer)
+        except ValueError:
+            return None
+        matches = complete_words(root, words, text)
+        return matches[state] + " " if state < len(matches) else None
+
+    readline.set_completer(completer)
+    readline.set_completer_delims(" \t")
+    readline.parse_and_bind("tab: complete")
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(history_path)
+    except OSError:
+        pass
+
+    def save() -> None:
+        try:
+            readline.write_history_file(history_path)
+        except OSError:
+            pass
+
+    return save
+
+
+def repl(
+    root: click.Command,
+    read_line: Callable[[str], str] = input,
+    history_path: str | None = None,
+    show_timing: bool = False,
+) -> None:
+    """Loop do shell até `exit`, `quit` ou EOF (Ctrl+D).
+
+    Args:
+        root: Grupo raiz da CLI
+        read_line: Função de leitura (input, ou fake em testes)
+        history_path: Arquivo de histórico (None = sem readline)
+        show_timing: Exibe a duração de cada comando
+    """
+    save_history = _setup_readline(root, history_path) if history_path else (lambda: None)
+    try:
+        while True:
+            try:
+                line = read_line(PROMPT)
+            except EOFError:
+                console.print()
+                break
+            except KeyboardInterrupt:
+                console.print()
+                continue
+            if line.strip() in EXIT_WORDS:
+                break
+
+            start = time.perf_counter()
+            exit_code = run_line(root, line)
+            if show_timing and exit_code is not None:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                console.print(f"[dim]({elapsed_ms:.0f} ms, exit {exit_code})[/dim]")
+    finally:
+        save_history()
+
+
+def shell(
+    timing: bool = typer.Option(False, "--timing", help="Exibe a duração de cada comando"),
+):
+    """Modo interativo: executa comandos sem reiniciar o processo.
+
+    Imports, engine e conexão com o SQLite são reaproveitados entre comandos.
+    Tab completa comandos e opções; histórico em ~/.timeblock_history.
+    """
+    from ..main import app
+
+    root = typer.main.get_command(app)
+    console.print("TimeBlock shell - 'exit' ou Ctrl+D para sair, '--help' para ajuda")
+    with shared_engines():
+        repl(root, history_path=os.path.expanduser(HISTORY_FILE), show_timing=timing)
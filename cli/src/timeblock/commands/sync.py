@@ -0,0 +1,102 @@
+"""Comandos de sincronização entre dispositivos por delta (change_seq)."""
+
+import sys
+
+import typer
+from rich.console import Console
+from sqlalchemy.exc import OperationalError
+
+from src.timeblock.database import create_db_and_tables
+from src.timeblock.services.delta_sync import DeltaSyncService
+from src.timeblock.services.merkle_diff import MerkleDiffService
+
+app = typer.Typer(help="Sincronizar com outro dispositivo (export/import de mudanças)")
+# Resumos vão para stderr: stdout pode ser o próprio delta
+console = Console(stderr=True)
+
+
+@app.command("export")
+def export_changes(
+    since: int = typer.Option(0, "--since", "-s", help="Último seq já enviado (0 = tudo)"),
+    output: str | None = typer.Option(
+        None, "--output", "-o", help="Arquivo de saída (padrão: stdout)"
+    ),
+):
+    """Exporta as mudanças posteriores a --since (JSON Lines)."""
+    create_db_and_tables()
+    if output is None:
+        stats = DeltaSyncService.export_changes(sys.stdout, since)
+    else:
+        with open(output, "w", encoding="utf-8") as out:
+            stats = DeltaSyncService.export_changes(out, since)
+
+    console.print(
+        f"✓ {stats.upserts} linha(s) e {stats.deletes} remoção(ões) exportadas",
+        style="green",
+    )
+    console.print(f"Próximo export para este destino: --since {stats.until}")
+
+
+@app.command("import")
+def import_changes(
+    source: str = typer.Argument("-", help="Arquivo do delta ('-' = stdin)"),
+):
+    """Aplica um delta exportado por outro dispositivo."""
+    create_db_and_tables()
+    try:
+        if source == "-":
+            stats = DeltaSyncService.import_changes(sys.stdin)
+        else:
+            with open(source, encoding="utf-8") as lines:
+                stats = DeltaSyncService.import_changes(lines)
+    except (OSError, ValueError) as e:
+        console.print(f"✗ Erro: {e}", style="red")
+        raise typer.Exit(1) from None
+
+    console.print(
+        f"✓ {stats.upserts} linha(s) e {stats.deletes} remoção(ões) aplicadas "
+        f"(seq {stats.since}..{stats.until} da origem)",
+        style="green",
+    )
+
+
+@app.command("diff")
+def diff(
+    other: str = typer.Argument(..., help="Outro banco (ex.: cópia vinda do celular)"),
+    output: str | None = typer.Option(
+        None, "--output", "-o", help="Grava as linhas que faltam ou diferem aqui como delta"
+    ),
+):
+    """Compara com outro banco trocando só hashes dos trechos que diferem."""
+    create_db_and_tables()
+    try:
+        if output is None:
+            report = MerkleDiffService.diff(other)
+        else:
+            with open(output, "w", encoding="utf-8") as out:
+                report = MerkleDiffService.diff(other, out)
+    except (OSError, ValueError, OperationalError) as e:
+        console.print(f"✗ Erro: {e}", style="red")
+        raise typer.Exit(1) from None
+
+    if not report.tables:
+        console.print("✓ Bancos idênticos", style="green")
+    for name, table in report.tables.items():
+        console.print(
+            f"{name}: {len(table.missing)} só no outro, {len(table.changed)} diferentes, "
+            f"{len(table.extra)} só aqui"
+        )
+    console.print(
+        f"{report.buckets_compared} trecho(s) comparados em {report.round_trips} "
+        f"ida(s) e volta(s), {report.bytes_exchanged} bytes trocados",
+        style="dim",
+    )
+    if output is not None:
+        console.print(f"✓ {report.rows_fetched} linha(s) gravadas em {output} (use sync import)")
+
+
+@app.command("status")
+def status():
+    """Mostra o último seq de mudança deste banco."""
+    create_db_and_tables()
+    typer.echo(DeltaSyncService.current_seq())
@@ -10,7 +10,10 @@ from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
+from sqlmodel import Session
 
+from src.timeblock.database import DataVersionWatcher, get_readonly_engine_context
+from src.timeblock.models import Habit, HabitInstance, Task, TimeLog
 from src.timeblock.services.habit_instance_service import HabitInstanceService
 from src.timeblock.services.habit_service import HabitService
 from src.timeblock.services.task_service import TaskService
@@ -33,33 +36,56 @@ def _get_selected_schedule():
         return None
 
 
+def _resolve_activity(session: Session, timelog: TimeLog) -> str:
+    """Rótulo da atividade do timer (resolvido uma vez por display)."""
+    if timelog.habit_instance_id:
+        instance = session.get(HabitInstance, timelog.habit_instance_id)
+        habit = session.get(Habit, instance.habit_id) if instance else None
+        if instance and habit:
+            return f"{habit.title} ({instance.date.strftime('%d/%m/%Y')})"
+    elif timelog.task_id:
+        task = session.get(Task, timelog.task_id)
+        if task:
+            return task.title
+    return "Atividade"
+
+
 def _display_timer(timelog_id: int):
-    """Mostra timer ativo com atualização em tempo real."""
-    with Live(refresh_per_second=1, console=console) as live:
+    """Mostra timer ativo com atualização em tempo real.
+
+    O rótulo da atividade é resolvido uma vez e o tempo decorrido é calculado
+    localmente a cada segundo. O banco só é relido quando outro processo faz
+    commit (PRAGMA data_version), ex: `timer pause` em outro terminal.
+    """
+    with (
+        get_readonly_engine_context() as engine,
+        Session(engine, expire_on_commit=False) as session,
+        DataVersionWatcher(engine) as watcher,
+        Live(refresh_per_second=1, console=console) as live,
+    ):
+        timelog = session.get(TimeLog, timelog_id)
+        if timelog is None:
+            return
+        state = TimerService.get_timer_state(session)
+        activity = _resolve_activity(session, timelog)
+        session.commit()  # Encerra o snapshot de leitura
+
         while True:
             try:
-                timelog = TimerService.get_timelog(timelog_id)
+                if watcher.changed():
+                    session.expunge_all()
+                    timelog = session.get(TimeLog, timelog_id)
+                    state = TimerService.get_timer_state(session)
+                    session.commit()
 
-                if timelog.end_time:
+                if timelog is None or timelog.end_time:
                     break
 
-                # Calcular tempo decorrido
-                elapsed = datetime.now() - timelog.start_time
-                total_seconds = int(elapsed.total_seconds())
+                # Calcular tempo decorrido (local, sem query)
+                total_seconds = TimerService.elapsed_seconds(timelog, state, datetime.now())
                 hours, remainder = divmod(total_seconds, 3600)
                 minutes, seconds = divmod(remainder, 60)
 
-                # Determinar atividade
-                if timelog.habit_instance_id:
-                    instance = HabitInstanceService.get_instance(timelog.habit_instance_id)
-                    habit = HabitService.get_habit(instance.habit_id)
-                    activity = f"{habit.title} ({instance.date.strftime('%d/%m/%Y')})"
-                elif timelog.task_id:
-                    task = TaskService.get_task(timelog.task_id)
-                    activity = f"{task.title}"
-                else:
-                    activity = "Atividade"
-
                 # Criar display
                 text = Text()
                 text.append("[>] ", style="bold cyan")
@@ -69,18 +95,12 @@ def _display_timer(timelog_id: int):
                 text.append(" | ", style="dim")
 
                 # Status
-                if hasattr(timelog, "paused") and timelog.paused:
+                if state is not None and state.pause_start is not None:
                     text.append("[||] Pausado", style="yellow")
                 else:
                     text.append("[>] Em andamento", style="green")
 
                 info = f"\n\nIniciado: {timelog.start_time.strftime('%H:%M')}\n"
-
-                # Pausas (se houver)
-                pause_count = 0  # Implementar lógica de pausas no service
-                if pause_count > 0:
-                    info += f"Pausas: {pause_count}\n"
-
                 info += "\nComandos: [yellow]pause[/] | [green]stop[/] | [red]cancel[/]"
 
                 panel = Panel(text.append(info), title="Timer Ativo", border_style="cyan")
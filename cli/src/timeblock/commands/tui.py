@@ -0,0 +1,27 @@
+"""Comando para abrir a interface de terminal (Textual)."""
+
+import typer
+from rich.console import Console
+
+from ..database import create_db_and_tables, get_readonly_engine_context
+from ..database.catalog import get_catalog
+
+console = Console()
+
+
+def tui():
+    """Abre o calendário interativo (t = hoje, q = sair).
+
+    Requer o extra `tui`: pip install timeblock-organizer[tui]
+    """
+    try:
+        from ..tui.app import TimeBlockApp
+    except ImportError as e:
+        console.print(f"✗ TUI indisponível ({e.name} não instalado)", style="red")
+        console.print("Instale com: pip install timeblock-organizer[tui]")
+        raise typer.Exit(1) from None
+
+    create_db_and_tables()
+    with get_readonly_engine_context() as engine:
+        get_catalog().warm(engine)
+        TimeBlockApp(engine).run()
@@ -0,0 +1,21 @@
+"""Daemon local opcional (socket Unix, protocolo JSON lines).
+
+Só o cliente é exportado aqui: ele é importado pelo entry point e precisa
+ficar leve. O servidor fica em `daemon.server`.
+"""
+
+from .client import (
+    DaemonClient,
+    DaemonError,
+    DaemonUnavailableError,
+    forward,
+    get_socket_path,
+)
+
+__all__ = [
+    "DaemonClient",
+    "DaemonError",
+    "DaemonUnavailableError",
+    "forward",
+    "get_socket_path",
+]
@@ -0,0 +1,205 @@
+"""Cliente do daemon (somente stdlib).
+
+Importado pelo entry point antes de qualquer comando: não pode puxar
+SQLModel, Rich ou os services, senão o ganho do daemon se perde.
+
+Protocolo (JSON lines sobre socket Unix), uma requisição por linha:
+
+    {"id": 1, "op": "ping"}
+    {"id": 2, "op": "call", "service": "TaskService", "method": "list_tasks",
+     "args": {"start": "2025-10-20T00:00:00"}}
+    {"id": 3, "op": "run", "argv": ["report", "daily"]}
+    {"id": 4, "op": "shutdown"}
+
+Resposta, uma linha por requisição:
+
+    {"id": 2, "ok": true, "result": [...]}
+    {"id": 2, "ok": false, "error": {"type": "ValueError", "message": "..."}}
+"""
+
+import json
+import os
+import socket
+import sys
+
+from ..status import resolve_db_path
+
+SOCKET_SUFFIX = ".sock"
+
+# Espera máxima por um comando encaminhado. Passou disso (daemon ocupado ou
+# travado com o lock global), o comando roda localmente: é só leitura
+FORWARD_TIMEOUT = 3.0
+
+# Comandos sem prompt e sem display ao vivo, seguros para rodar no daemon.
+# Prefixos de argv; o restante (opções, argumentos) é repassado como está.
+FORWARDED_COMMANDS: frozenset[tuple[str, ...]] = frozenset(
+    {
+        ("list",),
+        ("history",),
+        ("report",),
+        ("reschedule", "conflicts"),
+        ("timer", "status"),
+        ("habit", "list"),
+        ("routine", "list"),
+        ("tag", "list"),
+        ("task", "list"),
+    }
+)
+
+# Listagens em streaming (paginadas, tamanho ilimitado) rodam no processo
+# local: o daemon capturaria a saída inteira em memória antes de devolvê-la.
+STREAMED_LIST_OPTIONS = frozenset({"--all", "-a", "--limit", "-l"})
+
+
+class DaemonUnavailableError(Exception):
+    """Daemon inacessível: ausente, recusado, sem permissão, mudo ou ilegível."""
+
+
+class DaemonError(Exception):
+    """Erro levantado pelo service dentro do daemon.
+
+    Attributes:
+        error_type: Nome da classe da exceção original
+    """
+
+    def __init__(self, error_type: str, message: str):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def get_socket_path(db_path: str | None = None) -> str:
+    """Caminho do socket: TIMEBLOCK_DAEMON_SOCKET ou `<banco>.sock`."""
+    path = os.getenv("TIMEBLOCK_DAEMON_SOCKET")
+    if path:
+        return path
+    return resolve_db_path(db_path) + SOCKET_SUFFIX
+
+
+class DaemonClient:
+    """Conexão com o daemon; uma conexão pode levar várias requisições."""
+
+    def __init__(self, socket_path: str | None = None, timeout: float = 30.0):
+        self.socket_path = socket_path or get_socket_path()
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._reader = None
+        self._next_id = 0
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            # Inclui socket de outro usuário (PermissionError) e TimeoutError
+            sock.close()
+            raise DaemonUnavailableError(str(e)) from None
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+    def close(self) -> None:
+        """Fecha a conexão (o daemon continua rodando)."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def request(self, op: str, **fields: object) -> object:
+        """Envia uma requisição e devolve `result`.
+
+        Raises:
+            DaemonUnavailableError: Sem daemon no socket, conexão encerrada,
+                timeout ou resposta ilegível
+            DaemonError: O daemon respondeu com erro
+        """
+        if self._sock is None:
+            self._connect()
+        self._next_id += 1
+        payload = {"id": self._next_id, "op": op, **fields}
+        try:
+            self._sock.sendall(json.dumps(payload).encode() + b"\n")
+            line = self._reader.readline()
+        except OSError as e:
+            # Depois de um timeout a resposta pode chegar atrasada e ser lida
+            # pela próxima requisição: a conexão não é mais reutilizável
+            self.close()
+            raise DaemonUnavailableError(str(e) or type(e).__name__) from None
+        if not line:
+            self.close()
+            raise DaemonUnavailableError("Connection closed by daemon")
+
+        try:
+            response = json.loads(line)
+            ok = response["ok"]
+            if ok:
+                return response["result"]
+            error_type, message = response["error"]["type"], response["error"]["message"]
+        except (ValueError, KeyError, TypeError) as e:
+            self.close()
+            raise DaemonUnavailableError(f"Invalid response from daemon: {e}") from None
+        raise DaemonError(error_type, message)
+
+    def ping(self) -> dict:
+        """Informações do daemon (pid, banco)."""
+        return self.request("ping")
+
+    def call(self, service: str, method: str, **args: object) -> object:
+        """Chama `service.method(**args)` no daemon; resultado em tipos JSON."""
+        return self.request("call", service=service, method=method, args=args)
+
+    def run(self, argv: list[str]) -> dict:
+        """Executa um comando da CLI no daemon (stdout, stderr, exit_code)."""
+        return self.request("run", argv=argv)
+
+    def shutdown(self) -> None:
+        """Pede ao daemon que encerre."""
+        self.request("shutdown")
+
+
+def should_forward(argv: list[str]) -> bool:
+    """Se o comando pode ser executado pelo daemon."""
+    if argv[:1] == ["list"] and STREAMED_LIST_OPTIONS.intersection(argv):
+        return False
+    return any(tuple(argv[: len(prefix)]) == prefix for prefix in FORWARDED_COMMANDS)
+
+
+def forward(
+    argv: list[str], socket_path: str | None = None, timeout: float = FORWARD_TIMEOUT
+) -> int | None:
+    """Executa o comando no daemon, se houver um escutando.
+
+    Args:
+        argv: Argumentos da CLI (sem o nome do programa)
+        socket_path: Socket do daemon (padrão: get_socket_path())
+        timeout: Segundos de espera pelo daemon antes de executar localmente
+
+    Returns:
+        Exit code do comando, ou None quando o chamador deve executar
+        localmente (comando não encaminhável, TIMEBLOCK_NO_DAEMON definido,
+        ou o daemon não respondeu a tempo)
+    """
+    if os.getenv("TIMEBLOCK_NO_DAEMON") or not should_forward(argv):
+        return None
+    socket_path = socket_path or get_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+
+    try:
+        with DaemonClient(socket_path, timeout=timeout) as client:
+            result = client.run(argv)
+        stdout, stderr, exit_code = result["stdout"], result["stderr"], result["exit_code"]
+    except (DaemonUnavailableError, DaemonError, KeyError, TypeError):
+        # Comandos encaminháveis são só leitura: repetir localmente é seguro
+        return None
+
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return exit_code
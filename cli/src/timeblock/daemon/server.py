@@ -0,0 +1,166 @@
+"""Daemon local: services e comandos servidos por socket Unix.
+
+Cada invocação de `timeblock` paga interpretador, imports, criação do engine
+e cache frio do SQLite. O daemon paga isso uma vez: mantém os módulos
+importados e um único par de engines (`shared_engines`), e atende pelo
+protocolo JSON lines descrito em `daemon.client`.
+
+As requisições são atendidas uma de cada vez (lock global): `run` troca
+stdout/stderr do processo enquanto o comando executa, e o SQLite tem um
+único writer de qualquer forma.
+"""
+
+import json
+import os
+import socketserver
+import threading
+import traceback
+from typing import Any, get_type_hints
+
+import typer
+from click.testing import CliRunner
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from ..database import get_db_path, shared_engines
+from ..main import app
+from ..services.event_reordering_service import EventReorderingService
+from ..services.habit_instance_service import HabitInstanceService
+from ..services.task_service import TaskService
+from ..services.timer_service import TimerService
+from .client import DaemonClient, DaemonUnavailableError, get_socket_path, should_forward
+
+# Services expostos pelo op "call" (apenas métodos públicos)
+SERVICES: dict[str, type] = {
+    "HabitInstanceService": HabitInstanceService,
+    "TaskService": TaskService,
+    "TimerService": TimerService,
+    "EventReorderingService": EventReorderingService,
+}
+
+
+def call_service(service: str, method: str, args: dict[str, Any]) -> Any:
+    """Executa `service.method(**args)` convertendo argumentos e resultado.
+
+    Argumentos chegam como tipos JSON e são validados contra as anotações do
+    método (datas em ISO 8601, enums pelo valor). O resultado (models,
+    dataclasses, datas) é convertido para tipos JSON.
+
+    Raises:
+        ValueError: Service ou método desconhecido, ou argumento `session`
+    """
+    service_cls = SERVICES.get(service)
+    if service_cls is None:
+        raise ValueError(f"Unknown service: {service}")
+    if method.startswith("_") or not hasattr(service_cls, method):
+        raise ValueError(f"Unknown method: {service}.{method}")
+    if "session" in args:
+        raise ValueError("Argument 'session' is not accepted over the socket")
+
+    func = getattr(service_cls, method)
+    hints = get_type_hints(func)
+    kwargs = {
+        name: TypeAdapter(hints[name]).validate_python(value) if name in hints else value
+        for name, value in args.items()
+    }
+    return to_jsonable_python(func(**kwargs))
+
+
+def run_command(argv: list[str]) -> dict[str, Any]:
+    """Executa um comando encaminhável da CLI capturando a saída.
+
+    Raises:
+        ValueError: Comando fora de FORWARDED_COMMANDS
+    """
+    if not should_forward(argv):
+        raise ValueError(f"Command not forwardable: {' '.join(argv)}")
+
+    result = CliRunner().invoke(typer.main.get_command(app), argv)
+    stderr = result.stderr
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        stderr += "".join(traceback.format_exception(*result.exc_info))
+    return {"stdout": result.stdout, "stderr": stderr, "exit_code": result.exit_code}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Lê requisições JSON lines até o cliente fechar a conexão."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {"id": None, "ok": False, "error": _error(e)}
+            else:
+                response = self.server.dispatch(request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+def _error(exc: BaseException) -> dict[str, str]:
+    return {"type": type(exc).__name__, "message": str(exc)}
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Servidor do daemon escutando em `socket_path`.
+
+    Um socket remanescente de um daemon que morreu é removido; se outro
+    daemon responder no mesmo caminho, levanta RuntimeError.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str | None = None):
+        self.socket_path = socket_path or get_socket_path()
+        self._lock = threading.Lock()
+        if os.path.exists(self.socket_path):
+            try:
+                with DaemonClient(self.socket_path, timeout=1.0) as client:
+                    client.ping()
+            except DaemonUnavailableError:
+                os.unlink(self.socket_path)
+            else:
+                raise RuntimeError(f"Daemon already running at {self.socket_path}")
+        super().__init__(self.socket_path, _RequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Executa uma requisição e monta a resposta (nunca levanta)."""
+        request_id = request.get("id")
+        op = request.get("op")
+        try:
+            with self._lock:
+                if op == "ping":
+                    result = {"pid": os.getpid(), "db_path": get_db_path()}
+                elif op == "call":
+                    result = call_service(
+                        request["service"], request["method"], request.get("args") or {}
+                    )
+                elif op == "run":
+                    result = run_command(list(request["argv"]))
+                elif op == "shutdown":
+                    # shutdown() bloqueia até serve_forever sair: outra thread
+                    threading.Thread(target=self.shutdown, daemon=True).start()
+                    result = None
+                else:
+                    raise ValueError(f"Unknown op: {op}")
+        except Exception as e:
+            return {"id": request_id, "ok": False, "error": _error(e)}
+        return {"id": request_id, "ok": True, "result": result}
+
+
+def serve(socket_path: str | None = None) -> None:
+    """Roda o daemon em primeiro plano até `shutdown` ou Ctrl+C."""
+    with shared_engines(), DaemonServer(socket_path) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -1,5 +1,33 @@
 """Database utilities."""
 
-from .engine import create_db_and_tables, get_db_path, get_engine, get_engine_context
+from .engine import (
+    create_db_and_tables,
+    get_async_engine,
+    get_async_engine_context,
+    get_db_path,
+    get_engine,
+    get_engine_context,
+    get_readonly_engine,
+    get_readonly_engine_context,
+    shared_async_engine,
+    shared_engines,
+)
+from .query_cache import QueryCache, cached_query, get_query_cache
+from .watcher import DataVersionWatcher
 
-__all__ = ["create_db_and_tables", "get_db_path", "get_engine", "get_engine_context"]
+__all__ = [
+    "DataVersionWatcher",
+    "QueryCache",
+    "cached_query",
+    "create_db_and_tables",
+    "get_async_engine",
+    "get_async_engine_context",
+    "get_db_path",
+    "get_engine",
+    "get_engine_context",
+    "get_query_cache",
+    "get_readonly_engine",
+    "get_readonly_engine_context",
+    "shared_async_engine",
+    "shared_engines",
+]
@@ -0,0 +1,188 @@
+"""Catálogo em memória de hábitos, rotinas e tags.
+
+Relatórios e o loop do timer chamam `HabitService.get_habit` uma vez por
+instância, e rotina ativa e tags são relidas a cada comando. São tabelas
+pequenas que quase nunca mudam: o catálogo carrega as três de uma vez (três
+SELECTs numa única transação de leitura) e responde `get_*`/`list_*` a partir
+de dicts, por processo e por arquivo de banco.
+
+Validade: cada entrada guarda a identidade do arquivo (st_dev, st_ino) e o
+`PRAGMA data_version` lido por uma conexão sqlite3 própria, somente leitura.
+Qualquer commit de outra conexão (deste ou de outro processo) muda o valor,
+e a próxima consulta recarrega. Além disso, sessões que fazem commit com
+mudanças em Habit, Routine ou Tag descartam o catálogo na hora.
+
+Como no QueryCache, objetos ORM não são compartilhados: o catálogo guarda os
+valores das colunas e cada consulta devolve instâncias novas, mescladas na
+sessão do chamador. Bancos em memória e sessões com escritas não commitadas
+consultam o banco pela própria sessão, como antes.
+"""
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, SQLModel, select
+
+from ..models import Habit, Routine, Tag
+from .query_cache import detached_instance, model_row, session_has_writes
+
+ModelT = TypeVar("ModelT", Habit, Routine, Tag)
+
+CATALOG_MODELS: tuple[type[SQLModel], ...] = (Habit, Routine, Tag)
+
+# Marca na sessão: houve flush de um modelo do catálogo desde o último commit
+_CATALOG_WRITES_KEY = "catalog_writes"
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _mark_catalog_writes(session: OrmSession, flush_context: Any) -> None:
+    touched = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, CATALOG_MODELS) for obj in touched):
+        session.info[_CATALOG_WRITES_KEY] = True
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _invalidate_on_commit(session: OrmSession) -> None:
+    if session.info.pop(_CATALOG_WRITES_KEY, None):
+        _catalog.invalidate()
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _clear_catalog_writes(session: OrmSession) -> None:
+    session.info.pop(_CATALOG_WRITES_KEY, None)
+
+
+def database_file(engine: Engine) -> str | None:
+    """Caminho real do arquivo do engine, ou None se for banco em memória."""
+    database = engine.url.database
+    if not database or database == ":memory:" or engine.url.query.get("mode") == "memory":
+        return None
+    if database.startswith("file:"):
+        database = database.removeprefix("file:").split("?", 1)[0]
+    return os.path.realpath(database)
+
+
+@dataclass
+class _Entry:
+    """Catálogo de um arquivo: carimbo de validade e linhas por modelo e id."""
+
+    connection: sqlite3.Connection
+    file_id: tuple[int, int]
+    version: int | None = None
+    rows: dict[type[SQLModel], dict[int, dict[str, Any]]] = field(default_factory=dict)
+
+    def data_version(self) -> int:
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+
+def _file_id(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_dev, stat.st_ino
+
+
+class Catalog:
+    """Hábitos, rotinas e tags por id, recarregados quando o banco muda.
+
+    Attributes:
+        loads: Quantas vezes as tabelas foram (re)carregadas
+    """
+
+    def __init__(self) -> None:
+        self.loads = 0
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def _rows(self, engine: Engine) -> dict[type[SQLModel], dict[int, dict[str, Any]]] | None:
+        """Linhas válidas do arquivo do engine, recarregando se preciso."""
+        path = database_file(engine)
+        if path is None:
+            return None
+        try:
+            file_id = _file_id(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.file_id != file_id:
+                # Arquivo recriado: a conexão antiga aponta para o inode velho
+                entry.connection.close()
+                entry = None
+            if entry is None:
+                connection = sqlite3.connect(
+                    f"file:{path}?mode=ro", uri=True, check_same_thread=False
+                )
+                entry = self._entries[path] = _Entry(connection, file_id)
+
+            version = entry.data_version()
+            if entry.version != version or not entry.rows:
+                # Carimbo lido antes da carga: um commit no meio só causa
+                # uma recarga a mais na próxima consulta
+                entry.rows = self._load(engine)
+                entry.version = version
+                self.loads += 1
+            return entry.rows
+
+    @staticmethod
+    def _load(engine: Engine) -> dict[type[SQLModel], dict[int, dict[str, Any]]]:
+        with Session(engine) as session, session.begin():
+            return {
+                model: {obj.id: model_row(obj) for obj in session.exec(select(model))}
+                for model in CATALOG_MODELS
+            }
+
+    def _table(self, model: type[SQLModel], session: Session) -> dict[int, dict[str, Any]] | None:
+        """Linhas do modelo por id, ou None se a sessão não pode usar o catálogo."""
+        if session_has_writes(session):
+            return None
+        bind = session.get_bind()
+        if not isinstance(bind, Engine):
+            return None
+        rows = self._rows(bind)
+        return None if rows is None else rows[model]
+
+    def get(self, model: type[ModelT], obj_id: int, session: Session) -> ModelT | None:
+        """Linha por id como instância da sessão (`session.get` se não se aplica)."""
+        rows = self._table(model, session)
+        if rows is None:
+            return session.get(model, obj_id)
+        row = rows.get(obj_id)
+        return None if row is None else detached_instance(model, row, session)
+
+    def all(self, model: type[ModelT], session: Session) -> list[ModelT]:
+        """Todas as linhas do modelo em ordem de id, como instâncias da sessão."""
+        rows = self._table(model, session)
+        if rows is None:
+            return list(session.exec(select(model).order_by(model.id)).all())
+        return [detached_instance(model, row, session) for _, row in sorted(rows.items())]
+
+    def warm(self, engine: Engine) -> None:
+        """Carrega o catálogo do engine agora (início do daemon e da TUI)."""
+        self._rows(engine)
+
+    def invalidate(self) -> None:
+        """Descarta as linhas carregadas; a próxima consulta recarrega."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.rows = {}
+
+    def close(self) -> None:
+        """Fecha as conexões de validação e esvazia o catálogo."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.connection.close()
+            self._entries.clear()
+
+
+_catalog = Catalog()
+
+
+def get_catalog() -> Catalog:
+    """Catálogo do processo."""
+    return _catalog
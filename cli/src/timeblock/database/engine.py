@@ -1,7 +1,7 @@
 """Database connection and operations."""
 
 import os
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -27,17 +27,59 @@ def get_engine():
     # Habilitar foreign keys no SQLite (CRÍTICO para RESTRICT)
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_conn: Any, connection_record: Any) -> None:
-        """Habilita foreign keys no SQLite."""
+        """Habilita foreign keys e WAL no SQLite."""
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        # WAL: leitores (report/list) não bloqueiam o writer do timer e vice-versa
+        cursor.execute("PRAGMA journal_mode=WAL")
         cursor.close()
 
     return engine
 
 
+def get_readonly_engine(db_path: str | None = None):
+    """Get read-only SQLite engine for report/list queries.
+
+    Abre o arquivo via URI `file:...?mode=ro` com `PRAGMA query_only`, e emite
+    BEGIN explícito no início de cada transação. Com o banco em WAL, toda a
+    leitura de uma sessão enxerga um único snapshot consistente e nunca
+    adquire lock de escrita. `db_path` abre outro banco (ex.: `sync diff`).
+    """
+    path = Path(db_path or get_db_path()).resolve()
+    engine = create_engine(
+        f"sqlite:///file:{path.as_posix()}?mode=ro&uri=true",
+        echo=False,
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn: Any, connection_record: Any) -> None:
+        """Desabilita o BEGIN implícito do pysqlite e bloqueia escritas."""
+        dbapi_conn.isolation_level = None
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn: Any) -> None:
+        """Inicia transação de leitura (snapshot WAL) na primeira query."""
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+# Engines compartilhados por processos de longa duração (daemon). Quando
+# definidos, os contextos abaixo os reutilizam em vez de criar e descartar um
+# engine por chamada, mantendo conexões e cache de páginas do SQLite quentes.
+_shared_engine = None
+_shared_readonly_engine = None
+
+
 @contextmanager
 def get_engine_context():
     """Get SQLite engine with automatic cleanup."""
+    if _shared_engine is not None:
+        yield _shared_engine
+        return
     engine = get_engine()
     try:
         yield engine
@@ -45,8 +87,116 @@ def get_engine_context():
         engine.dispose()
 
 
+@contextmanager
+def get_readonly_engine_context():
+    """Get read-only SQLite engine with automatic cleanup."""
+    if _shared_readonly_engine is not None:
+        yield _shared_readonly_engine
+        return
+    engine = get_readonly_engine()
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@contextmanager
+def shared_engines():
+    """Reutiliza um único par de engines (escrita e leitura) no bloco.
+
+    Usado pelo daemon e pelo shell: todas as chamadas de service dentro do
+    bloco passam pelo mesmo pool de conexões, e as leituras marcadas com
+    `cached_query` são servidas pelo QueryCache enquanto o banco não mudar.
+    O catálogo de hábitos, rotinas e tags é carregado já na entrada. Os
+    engines são descartados na saída.
+    """
+    global _shared_engine, _shared_readonly_engine
+    if _shared_engine is not None:
+        raise RuntimeError("Shared engines already active")
+
+    from .catalog import get_catalog
+    from .query_cache import QueryCache, set_query_cache
+    from .watcher import DataVersionWatcher
+
+    create_db_and_tables()
+    _shared_engine = get_engine()
+    _shared_readonly_engine = get_readonly_engine()
+    watcher = DataVersionWatcher(_shared_readonly_engine)
+    set_query_cache(QueryCache(watcher, engines=(_shared_engine, _shared_readonly_engine)))
+    get_catalog().warm(_shared_readonly_engine)
+    try:
+        yield _shared_engine
+    finally:
+        set_query_cache(None)
+        watcher.close()
+        _shared_engine.dispose()
+        _shared_readonly_engine.dispose()
+        _shared_engine = None
+        _shared_readonly_engine = None
+
+
+def get_async_engine():
+    """Get async SQLite engine (aiosqlite) with foreign keys enabled.
+
+    Mesmos PRAGMAs do engine síncrono. aiosqlite é dependência opcional
+    (extra `async`); o import só acontece aqui.
+    """
+    try:
+        import aiosqlite  # noqa: F401
+        from sqlalchemy.ext.asyncio import create_async_engine
+    except ImportError as e:
+        raise ImportError("Async engine requires: pip install timeblock-organizer[async]") from e
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{get_db_path()}", echo=False)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragma(dbapi_conn: Any, connection_record: Any) -> None:
+        """Habilita foreign keys e WAL no SQLite."""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+    return engine
+
+
+_shared_async_engine = None
+
+
+@asynccontextmanager
+async def get_async_engine_context():
+    """Get async SQLite engine with automatic cleanup."""
+    if _shared_async_engine is not None:
+        yield _shared_async_engine
+        return
+    engine = get_async_engine()
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@asynccontextmanager
+async def shared_async_engine():
+    """Reutiliza um único engine assíncrono no bloco (ex: durante a TUI)."""
+    global _shared_async_engine
+    if _shared_async_engine is not None:
+        raise RuntimeError("Shared async engine already active")
+
+    _shared_async_engine = get_async_engine()
+    try:
+        yield _shared_async_engine
+    finally:
+        await _shared_async_engine.dispose()
+        _shared_async_engine = None
+
+
 def create_db_and_tables():
     """Create database tables."""
+    # Registra todas as tabelas (e a view schedule_item) no metadata: com o
+    # carregamento sob demanda da CLI, `init` não importa mais os models.
+    from .. import models  # noqa: F401
+
     with get_engine_context() as engine:
         SQLModel.metadata.create_all(engine)
     return engine
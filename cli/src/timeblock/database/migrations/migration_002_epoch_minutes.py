@@ -0,0 +1,63 @@
+"""Migração 002: Colunas start_min/end_min em minutos desde epoch.
+
+Adiciona colunas geradas (VIRTUAL) e indexadas em:
+- tasks (scheduled_datetime, duração assumida de 1 hora)
+- habitinstance (date + scheduled_start/scheduled_end)
+- event (scheduled_start/scheduled_end)
+
+Colunas VIRTUAL não exigem backfill: o SQLite calcula o valor a partir das
+colunas existentes, inclusive para linhas antigas.
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from ...models.time_encoding import epoch_minutes_sql
+
+# (tabela, coluna, expressão datetime, offset em segundos)
+_COLUMNS = [
+    ("tasks", "start_min", "scheduled_datetime", 0),
+    ("tasks", "end_min", "scheduled_datetime", 3600),
+    ("habitinstance", "start_min", "date || ' ' || scheduled_start", 0),
+    ("habitinstance", "end_min", "date || ' ' || scheduled_end", 0),
+    ("event", "start_min", "scheduled_start", 0),
+    ("event", "end_min", "scheduled_end", 0),
+]
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: adiciona colunas geradas e índices.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    for table, column, expr, offset in _COLUMNS:
+        session.exec(
+            text(f"""
+            ALTER TABLE {table}
+            ADD COLUMN {column} INTEGER
+            GENERATED ALWAYS AS ({epoch_minutes_sql(expr, offset)}) VIRTUAL
+        """)
+        )
+        session.exec(text(f"CREATE INDEX ix_{table}_{column} ON {table} ({column})"))
+
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove índices e colunas geradas.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    for table, column, _expr, _offset in _COLUMNS:
+        session.exec(text(f"DROP INDEX IF EXISTS ix_{table}_{column}"))
+        session.exec(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+
+    session.commit()
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "002"
+MIGRATION_NAME = "epoch_minutes"
+MIGRATION_DESCRIPTION = "Colunas start_min/end_min indexadas para overlap em SQL"
@@ -0,0 +1,37 @@
+"""Migração 003: View unificada schedule_item.
+
+Cria a view `schedule_item` (kind, id, start_min, end_min, status, title)
+sobre tasks, habitinstance e event. Depende da migração 002 (colunas
+start_min/end_min).
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from ...models.schedule_item import DROP_SCHEDULE_ITEM_VIEW_SQL, SCHEDULE_ITEM_VIEW_SQL
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: cria a view schedule_item.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(text(SCHEDULE_ITEM_VIEW_SQL))
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove a view schedule_item.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(text(DROP_SCHEDULE_ITEM_VIEW_SQL))
+    session.commit()
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "003"
+MIGRATION_NAME = "schedule_item_view"
+MIGRATION_DESCRIPTION = "View schedule_item unificando Task, HabitInstance e Event"
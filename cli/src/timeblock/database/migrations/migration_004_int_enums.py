@@ -0,0 +1,130 @@
+"""Migração 004: Enums armazenados como inteiros.
+
+Converte as colunas de enum de VARCHAR (nome do membro) para SMALLINT com
+CHECK constraint:
+- habitinstance: status, done_substatus, not_done_substatus, skip_reason
+- event: status
+- habits: recurrence
+
+Segue o padrão da migração 001: coluna temporária, UPDATE com mapeamento,
+remoção da coluna antiga e renomeação. A view schedule_item referencia as
+colunas de status e é recriada ao final.
+
+ADD COLUMN não aceita NOT NULL sem DEFAULT. As tabelas com coluna NOT NULL
+trocada são recriadas no fim (`table_rebuild`), para que o esquema migrado
+fique igual ao de um banco novo.
+"""
+
+import re
+from collections.abc import Callable
+from enum import Enum
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from ...models.enum_encoding import enum_check_sql, enum_decode_sql, enum_encode_sql
+from ...models.enums import DoneSubstatus, NotDoneSubstatus, SkipReason, Status
+from ...models.event import EventStatus
+from ...models.habit import Recurrence
+from ...models.schedule_item import DROP_SCHEDULE_ITEM_VIEW_SQL, SCHEDULE_ITEM_VIEW_SQL
+from .table_rebuild import foreign_keys_off, rebuild_table
+
+# (tabela, coluna, enum)
+_COLUMNS = [
+    ("habitinstance", "status", Status),
+    ("habitinstance", "done_substatus", DoneSubstatus),
+    ("habitinstance", "not_done_substatus", NotDoneSubstatus),
+    ("habitinstance", "skip_reason", SkipReason),
+    ("event", "status", EventStatus),
+    ("habits", "recurrence", Recurrence),
+]
+
+
+def _swap_column(session: Session, table: str, column: str, definition: str, value: str) -> None:
+    """Substitui `column` por uma nova coluna preenchida com `value`."""
+    session.exec(text(f"ALTER TABLE {table} ADD COLUMN {column}_new {definition}"))
+    session.exec(text(f"UPDATE {table} SET {column}_new = {value}"))
+    session.exec(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+    session.exec(text(f"ALTER TABLE {table} RENAME COLUMN {column}_new TO {column}"))
+
+
+def _not_null_columns(session: Session) -> dict[str, list[str]]:
+    """Colunas de `_COLUMNS` que são NOT NULL hoje, por tabela."""
+    result: dict[str, list[str]] = {}
+    for table, column, _ in _COLUMNS:
+        info = session.exec(text(f"PRAGMA table_info({table})")).all()
+        if any(row[1] == column and row[3] for row in info):
+            result.setdefault(table, []).append(column)
+    return result
+
+
+def _add_not_null(table: str, columns: list[str], column_type: str) -> Callable[[str], str]:
+    """Transformação do CREATE TABLE que marca `columns` como NOT NULL."""
+
+    def rewrite(sql: str) -> str:
+        for column in columns:
+            sql, found = re.subn(
+                rf"(?<![\w\"]){column} {re.escape(column_type)}",
+                f"{column} {column_type} NOT NULL",
+                sql,
+                count=1,
+            )
+            if not found:
+                raise RuntimeError(f"Coluna {table}.{column} não encontrada no esquema")
+        return sql
+
+    return rewrite
+
+
+def _migrate(
+    session: Session,
+    definition: Callable[[str, type[Enum]], str],
+    value: Callable[[str, type[Enum]], str],
+    column_type: str,
+) -> None:
+    """Troca todas as colunas de `_COLUMNS`, preservando NOT NULL.
+
+    Args:
+        definition: Definição da coluna nova; recebe (coluna, enum)
+        value: Expressão que preenche a coluna nova; recebe (coluna, enum)
+        column_type: Tipo da coluna nova, para localizá-la no esquema
+    """
+    with foreign_keys_off(session):
+        not_null = _not_null_columns(session)
+        session.exec(text(DROP_SCHEDULE_ITEM_VIEW_SQL))
+        for table, column, enum_cls in _COLUMNS:
+            _swap_column(
+                session, table, column, definition(column, enum_cls), value(column, enum_cls)
+            )
+        for table, columns in not_null.items():
+            rebuild_table(session, table, _add_not_null(table, columns, column_type))
+        session.exec(text(SCHEDULE_ITEM_VIEW_SQL))
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: converte nomes de enum em códigos inteiros.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+
+    def definition(column: str, enum_cls: type[Enum]) -> str:
+        check = enum_check_sql(f"{column}_new", enum_cls)
+        return f"SMALLINT CONSTRAINT ck_{column}_code CHECK ({check})"
+
+    _migrate(session, definition, enum_encode_sql, "SMALLINT")
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: volta a gravar o nome do membro como VARCHAR.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    _migrate(session, lambda column, enum_cls: "VARCHAR(50)", enum_decode_sql, "VARCHAR(50)")
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "004"
+MIGRATION_NAME = "int_enums"
+MIGRATION_DESCRIPTION = "Enums de status/recorrência armazenados como SMALLINT com CHECK"
@@ -0,0 +1,109 @@
+"""Migração 005: Coluna uuid (UUIDv7 em BLOB) nas tabelas sincronizáveis.
+
+Adiciona a chave alternativa global prevista no ADR-013 sem trocar a chave
+física: o `id` inteiro continua sendo PK e alvo das FKs.
+
+- Coluna `uuid` BLOB(16) NOT NULL UNIQUE em cada tabela, como no modelo
+- Backfill com UUIDv7 em ordem de `id`, para o índice ficar ordenado
+- Índice em habitinstance.habit_id (join mais frequente)
+
+ADD COLUMN não aceita NOT NULL sem DEFAULT nem UNIQUE: a coluna entra
+anulável, é preenchida e a tabela é recriada com a definição final
+(`table_rebuild`). Pelo mesmo motivo o downgrade recria as tabelas sem a
+coluna: DROP COLUMN recusa colunas UNIQUE.
+"""
+
+import re
+import time
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from ...models.uuid_encoding import uuid7
+from .table_rebuild import foreign_keys_off, rebuild_table
+
+_TABLES = ["routines", "tags", "habits", "habitinstance", "tasks", "event", "time_log"]
+
+# Marca no SQL do índice: o downgrade só remove o índice que o upgrade criou
+_HABIT_ID_INDEX_SQL = (
+    "CREATE INDEX ix_habitinstance_habit_id ON habitinstance (habit_id) /* migration 005 */"
+)
+
+
+def _add_uuid_constraints(sql: str) -> str:
+    sql, found = re.subn(r"(?<![\w\"])uuid BLOB(?=\s*[,)])", "uuid BLOB NOT NULL UNIQUE", sql)
+    if found != 1:
+        raise RuntimeError("Coluna uuid não encontrada no esquema")
+    return sql
+
+
+def _drop_uuid_column(sql: str) -> str:
+    # Coluna (nunca a primeira: id vem antes) e UNIQUE de tabela de um banco novo
+    sql, found = re.subn(r",\s*uuid BLOB[^,()]*", "", sql, count=1)
+    if not found:
+        raise RuntimeError("Coluna uuid não encontrada no esquema")
+    return re.sub(r",\s*UNIQUE \(uuid\)", "", sql)
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: adiciona, preenche e indexa as colunas uuid.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    now_ms = time.time_ns() // 1_000_000
+
+    with foreign_keys_off(session):
+        connection = session.connection()
+        for table in _TABLES:
+            session.exec(text(f"ALTER TABLE {table} ADD COLUMN uuid BLOB"))
+
+            ids = [row[0] for row in session.exec(text(f"SELECT id FROM {table} ORDER BY id"))]
+            # Um ms por linha, terminando em "agora": preserva a ordem de id
+            base_ms = now_ms - len(ids)
+            if ids:
+                connection.execute(
+                    text(f"UPDATE {table} SET uuid = :uuid WHERE id = :id"),
+                    [
+                        {"uuid": uuid7(base_ms + offset).bytes, "id": row_id}
+                        for offset, row_id in enumerate(ids)
+                    ],
+                )
+
+            rebuild_table(session, table, _add_uuid_constraints)
+
+        has_habit_id_index = session.exec(
+            text(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'index' AND name = 'ix_habitinstance_habit_id'"
+            )
+        ).first()
+        if has_habit_id_index is None:
+            session.exec(text(_HABIT_ID_INDEX_SQL))
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove as colunas uuid e o índice criado pelo upgrade.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    with foreign_keys_off(session):
+        created_index = session.exec(
+            text(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'index' AND name = 'ix_habitinstance_habit_id' AND sql = :sql"
+            ).bindparams(sql=_HABIT_ID_INDEX_SQL)
+        ).first()
+        if created_index is not None:
+            session.exec(text("DROP INDEX ix_habitinstance_habit_id"))
+        for table in _TABLES:
+            # Índice separado da versão anterior desta migração
+            session.exec(text(f"DROP INDEX IF EXISTS ux_{table}_uuid"))
+            rebuild_table(session, table, _drop_uuid_column)
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "005"
+MIGRATION_NAME = "uuid_keys"
+MIGRATION_DESCRIPTION = "Chave alternativa uuid (UUIDv7 BLOB) para sync (ADR-013)"
@@ -0,0 +1,58 @@
+"""Migração 006: Estado persistente do timer (tabela active_timer).
+
+Substitui o estado em memória de pausa (BR-TIMER-006 MVP) por uma tabela de
+linha única. Timers abertos em bancos existentes (TimeLog sem end_time) são
+registrados como ativos, preservando o comportamento de BR-TIMER-001.
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: cria active_timer e registra timer aberto.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(
+        text("""
+        CREATE TABLE active_timer (
+            id INTEGER NOT NULL PRIMARY KEY,
+            timelog_id INTEGER NOT NULL UNIQUE REFERENCES time_log (id),
+            pause_log_id INTEGER REFERENCES pauselog (id),
+            pause_start DATETIME,
+            paused_seconds INTEGER NOT NULL DEFAULT 0,
+            CONSTRAINT ck_active_timer_single_row CHECK (id = 1)
+        )
+    """)
+    )
+
+    session.exec(
+        text("""
+        INSERT INTO active_timer (id, timelog_id, paused_seconds)
+        SELECT 1, id, COALESCE(paused_duration, 0)
+        FROM time_log
+        WHERE end_time IS NULL
+        ORDER BY id DESC
+        LIMIT 1
+    """)
+    )
+
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove active_timer.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(text("DROP TABLE IF EXISTS active_timer"))
+    session.commit()
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "006"
+MIGRATION_NAME = "active_timer"
+MIGRATION_DESCRIPTION = "Estado do timer em tabela de linha única (BR-TIMER-006)"
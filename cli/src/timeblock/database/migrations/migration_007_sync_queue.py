@@ -0,0 +1,48 @@
+"""Migração 007: Fila de sincronização (tabela sync_queue, ADR-012).
+
+O ADR-012 previa a fila em `~/.timeblock/sync_queue.json`, reescrito a cada
+operação. Aqui ela é uma tabela append-only no próprio banco, gravada na
+mesma transação da mutação. Bancos existentes começam com a fila vazia:
+o primeiro sync envia o estado completo.
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: cria sync_queue e seu índice por entidade.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(
+        text("""
+        CREATE TABLE sync_queue (
+            seq INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+            entity VARCHAR(50) NOT NULL,
+            entity_uuid BLOB NOT NULL,
+            op SMALLINT NOT NULL CONSTRAINT ck_op_code CHECK (op BETWEEN 0 AND 2),
+            payload VARCHAR,
+            created_at DATETIME NOT NULL
+        )
+    """)
+    )
+    session.exec(text("CREATE INDEX ix_sync_queue_entity ON sync_queue (entity, entity_uuid)"))
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove sync_queue.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(text("DROP TABLE IF EXISTS sync_queue"))
+    session.commit()
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "007"
+MIGRATION_NAME = "sync_queue"
+MIGRATION_DESCRIPTION = "Fila de sincronização append-only no banco (ADR-012)"
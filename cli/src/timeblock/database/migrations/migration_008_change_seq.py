@@ -0,0 +1,74 @@
+"""Migração 008: Sequência de mudanças para sync por delta.
+
+Adiciona `change_seq` indexada às tabelas sincronizadas, o contador
+`sync_state`, as lápides `sync_tombstone` e os triggers que mantêm tudo.
+Linhas existentes recebem números em ordem de tabela e id, então o primeiro
+`sync export --since 0` leva o banco inteiro.
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from ...models.change_tracking import SEED_SYNC_STATE_SQL, SYNCED_TABLES, change_seq_triggers_sql
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: colunas, índices, tabelas de controle e triggers.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(
+        text("""
+        CREATE TABLE sync_state (
+            id INTEGER NOT NULL PRIMARY KEY,
+            counter INTEGER NOT NULL DEFAULT 0,
+            importing INTEGER NOT NULL DEFAULT 0,
+            CONSTRAINT ck_sync_state_single_row CHECK (id = 1)
+        )
+    """)
+    )
+    session.exec(
+        text("""
+        CREATE TABLE sync_tombstone (
+            id INTEGER NOT NULL PRIMARY KEY,
+            entity VARCHAR(50) NOT NULL,
+            entity_uuid BLOB NOT NULL,
+            change_seq INTEGER NOT NULL
+        )
+    """)
+    )
+    session.exec(text("CREATE INDEX ix_sync_tombstone_change_seq ON sync_tombstone (change_seq)"))
+    session.exec(text(SEED_SYNC_STATE_SQL))
+
+    for table in SYNCED_TABLES:
+        session.exec(text(f"ALTER TABLE {table} ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0"))
+        session.exec(text(f"CREATE INDEX ix_{table}_change_seq ON {table} (change_seq)"))
+        for sql in change_seq_triggers_sql(table):
+            session.exec(text(sql))
+        # Numera as linhas existentes: o trigger de UPDATE carimba cada uma
+        session.exec(text(f"UPDATE {table} SET change_seq = change_seq"))
+
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove triggers, índices, colunas e tabelas de controle.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    for table in SYNCED_TABLES:
+        for suffix in ("insert", "update", "delete"):
+            session.exec(text(f"DROP TRIGGER IF EXISTS trg_{table}_change_seq_{suffix}"))
+        session.exec(text(f"DROP INDEX IF EXISTS ix_{table}_change_seq"))
+        session.exec(text(f"ALTER TABLE {table} DROP COLUMN change_seq"))
+    session.exec(text("DROP TABLE IF EXISTS sync_tombstone"))
+    session.exec(text("DROP TABLE IF EXISTS sync_state"))
+    session.commit()
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "008"
+MIGRATION_NAME = "change_seq"
+MIGRATION_DESCRIPTION = "Sequência de mudanças e lápides para sync por delta"
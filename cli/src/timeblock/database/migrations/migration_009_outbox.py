@@ -0,0 +1,58 @@
+"""Migração 009: Outbox transacional de eventos de domínio (ADR-023).
+
+Cria `outbox`, onde os services gravam os eventos (timer, conclusões,
+skips) na mesma transação da mudança, e `outbox_offset`, com o progresso
+de cada destino do publisher.
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: cria outbox e outbox_offset.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(
+        text("""
+        CREATE TABLE outbox (
+            id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+            event_id VARCHAR(36) NOT NULL,
+            type VARCHAR(100) NOT NULL,
+            subject VARCHAR(100) NOT NULL,
+            time DATETIME NOT NULL,
+            data VARCHAR NOT NULL
+        )
+    """)
+    )
+    session.exec(
+        text("""
+        CREATE TABLE outbox_offset (
+            sink VARCHAR(255) NOT NULL PRIMARY KEY,
+            last_id INTEGER NOT NULL,
+            attempts INTEGER NOT NULL,
+            next_attempt_at DATETIME,
+            last_error VARCHAR
+        )
+    """)
+    )
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove outbox e outbox_offset.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(text("DROP TABLE IF EXISTS outbox_offset"))
+    session.exec(text("DROP TABLE IF EXISTS outbox"))
+    session.commit()
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "009"
+MIGRATION_NAME = "outbox"
+MIGRATION_DESCRIPTION = "Outbox transacional de eventos de domínio (ADR-023)"
@@ -0,0 +1,68 @@
+"""Migração 010: ChangeLog como audit trail de toda a agenda.
+
+A tabela `changelog` existia com FK para `event.id` e nunca foi escrita.
+Ela é recriada genérica (`entity` + `entity_id`, sem FK, para o histórico
+sobreviver à remoção da linha), com `change_type` como código inteiro e
+índice por entidade. Como estava vazia, não há dados a copiar.
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: recria changelog no formato de auditoria.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(text("DROP TABLE IF EXISTS changelog"))
+    session.exec(
+        text("""
+        CREATE TABLE changelog (
+            id INTEGER NOT NULL PRIMARY KEY,
+            entity VARCHAR(50) NOT NULL,
+            entity_id INTEGER NOT NULL,
+            change_type SMALLINT NOT NULL
+                CONSTRAINT ck_change_type_code CHECK (change_type BETWEEN 0 AND 4),
+            field_name VARCHAR(50),
+            old_value VARCHAR(500),
+            new_value VARCHAR(500),
+            changed_at DATETIME NOT NULL
+        )
+    """)
+    )
+    session.exec(text("CREATE INDEX ix_changelog_entity ON changelog (entity, entity_id)"))
+    session.exec(text("CREATE INDEX ix_changelog_changed_at ON changelog (changed_at)"))
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: volta ao changelog original, ligado a event.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(text("DROP TABLE IF EXISTS changelog"))
+    session.exec(
+        text("""
+        CREATE TABLE changelog (
+            id INTEGER NOT NULL PRIMARY KEY,
+            event_id INTEGER NOT NULL REFERENCES event (id),
+            change_type VARCHAR(14) NOT NULL,
+            field_name VARCHAR(50),
+            old_value VARCHAR(500),
+            new_value VARCHAR(500),
+            changed_at DATETIME NOT NULL
+        )
+    """)
+    )
+    session.exec(text("CREATE INDEX ix_changelog_event_id ON changelog (event_id)"))
+    session.exec(text("CREATE INDEX ix_changelog_changed_at ON changelog (changed_at)"))
+    session.commit()
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "010"
+MIGRATION_NAME = "changelog_audit"
+MIGRATION_DESCRIPTION = "ChangeLog genérico para auditoria de edições da agenda"
@@ -0,0 +1,36 @@
+"""Migração 011: id local da linha em cada operação da sync_queue.
+
+O payload das operações leva as FKs como ids locais, mas não o id da própria
+linha. Sem ele, o replay (`services/replay.py`) não consegue reconstruir o
+banco com os mesmos ids e as FKs das operações seguintes apontariam para as
+linhas erradas. Operações já gravadas ficam com `entity_id` nulo.
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: adiciona sync_queue.entity_id.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(text("ALTER TABLE sync_queue ADD COLUMN entity_id INTEGER"))
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove sync_queue.entity_id.
+
+    Args:
+        session: Sessão do banco de dados
+    """
+    session.exec(text("ALTER TABLE sync_queue DROP COLUMN entity_id"))
+    session.commit()
+
+
+# Metadata para controle de versão
+MIGRATION_VERSION = "011"
+MIGRATION_NAME = "sync_queue_entity_id"
+MIGRATION_DESCRIPTION = "Id local da linha nas operações da sync_queue (replay)"
@@ -0,0 +1,100 @@
+"""Recriação de tabelas para mudanças que o ALTER TABLE do SQLite não faz.
+
+ADD COLUMN não aceita NOT NULL sem DEFAULT nem UNIQUE, e DROP COLUMN recusa
+colunas UNIQUE. Nesses casos as migrações recriam a tabela (procedimento do
+ALTER TABLE na documentação do SQLite), para que o esquema migrado fique
+igual ao de um banco novo.
+"""
+
+import re
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from sqlalchemy.engine import Connection
+from sqlmodel import Session
+
+
+@contextmanager
+def foreign_keys_off(session: Session) -> Iterator[None]:
+    """Desliga foreign_keys durante o bloco, que roda numa transação.
+
+    Com FKs ligadas, o DROP da tabela antiga apagaria ou recusaria as linhas
+    filhas. O PRAGMA não tem efeito dentro de uma transação aberta, então o
+    bloco precisa começar sem uma. Commit no fim, rollback em erro, e
+    foreign_keys volta ao valor anterior.
+
+    Raises:
+        RuntimeError: Se a sessão já tem uma transação aberta
+    """
+    conn = session.connection()
+    enabled = conn.exec_driver_sql("PRAGMA foreign_keys").scalar_one()
+    conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+    if conn.exec_driver_sql("PRAGMA foreign_keys").scalar_one():
+        raise RuntimeError("Recriar tabelas exige rodar fora de uma transação aberta")
+
+    try:
+        yield
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        # Fora de transação (commit ou rollback acima), o PRAGMA tem efeito
+        if enabled:
+            session.connection().exec_driver_sql("PRAGMA foreign_keys=ON")
+
+
+def _stored_columns(conn: Connection, table: str) -> list[str]:
+    # table_xinfo marca colunas geradas com hidden 2 ou 3
+    return [row[1] for row in conn.exec_driver_sql(f"PRAGMA table_xinfo({table})") if row[6] == 0]
+
+
+def rebuild_table(session: Session, table: str, rewrite: Callable[[str], str]) -> None:
+    """Recria `table` com o CREATE TABLE atual transformado por `rewrite`.
+
+    Cria a tabela nova, copia as colunas armazenadas presentes nas duas (as
+    geradas são recalculadas), troca as tabelas e recria índices, triggers
+    e views. Índices ou triggers que citam uma coluna removida precisam ser
+    apagados antes. Deve rodar dentro de `foreign_keys_off`.
+
+    Args:
+        session: Sessão do banco de dados
+        table: Nome da tabela
+        rewrite: Recebe o CREATE TABLE atual e devolve o novo
+    """
+    conn = session.connection()
+    sql = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).scalar_one()
+    sql, found = re.subn(
+        rf'^CREATE TABLE\s+"?{table}"?', f"CREATE TABLE {table}_rebuild", rewrite(sql)
+    )
+    if not found:
+        raise RuntimeError(f"Esquema inesperado para {table}")
+
+    derived = (
+        conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master "
+            "WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL",
+            (table,),
+        )
+        .scalars()
+        .all()
+    )
+    # O RENAME confere o esquema inteiro: uma view sobre a tabela apagada o faria falhar
+    views = conn.exec_driver_sql("SELECT name, sql FROM sqlite_master WHERE type = 'view'").all()
+    for name, _ in views:
+        conn.exec_driver_sql(f'DROP VIEW "{name}"')
+
+    old_columns = set(_stored_columns(conn, table))
+    conn.exec_driver_sql(sql)
+    columns = ", ".join(
+        column for column in _stored_columns(conn, f"{table}_rebuild") if column in old_columns
+    )
+    conn.exec_driver_sql(f"INSERT INTO {table}_rebuild ({columns}) SELECT {columns} FROM {table}")
+    conn.exec_driver_sql(f"DROP TABLE {table}")
+    conn.exec_driver_sql(f"ALTER TABLE {table}_rebuild RENAME TO {table}")
+    for statement in derived:
+        conn.exec_driver_sql(statement)
+    for _, view_sql in views:
+        conn.exec_driver_sql(view_sql)
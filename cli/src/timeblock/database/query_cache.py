@@ -0,0 +1,254 @@
+"""Cache de resultados de leitura dos services, invalidado por data_version.
+
+Ativo enquanto `shared_engines()` estiver ativo (shell, daemon): nesses
+processos as mesmas leituras (ex: instâncias do dia) se repetem entre
+comandos. Hábitos, rotinas e tags ficam no catálogo (`catalog.py`). Um
+processo de comando único não ativa o cache e nada muda para ele.
+
+Invalidação: o cache guarda o `PRAGMA data_version` lido por uma conexão
+dedicada (DataVersionWatcher). Qualquer commit de outra conexão, deste ou de
+outro processo, muda o valor, e o cache inteiro é descartado na próxima
+leitura. A conexão do watcher nunca escreve, então todo commit conta.
+
+Resultados ORM não são compartilhados: o cache guarda os valores das
+colunas e cada acerto devolve instâncias novas, detached (como um service
+devolve após fechar a sessão) ou mescladas na sessão do chamador.
+
+Com sessão explícita, o cache só é usado se a sessão pertence a um dos
+engines compartilhados e não tem escritas pendentes ou não commitadas: do
+contrário a sessão pode enxergar dados que o cache não conhece.
+"""
+
+import functools
+import inspect
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, SQLModel
+
+from .watcher import DataVersionWatcher
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 1024
+
+# Marca na sessão: houve flush desde o último commit/rollback
+_WRITES_KEY = "query_cache_writes"
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _mark_writes(session: OrmSession, flush_context: Any) -> None:
+    session.info[_WRITES_KEY] = True
+
+
+@event.listens_for(OrmSession, "after_commit")
+@event.listens_for(OrmSession, "after_rollback")
+def _clear_writes(session: OrmSession) -> None:
+    session.info.pop(_WRITES_KEY, None)
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """Resultado guardado: modelo, forma ("list", "one", "none") e colunas."""
+
+    model: type[SQLModel] | None
+    shape: str
+    rows: tuple[dict[str, Any], ...]
+    size: int
+
+
+def session_has_writes(session: Session) -> bool:
+    """Se a sessão tem mudanças pendentes ou enviadas (flush) sem commit."""
+    return bool(session.info.get(_WRITES_KEY) or session.new or session.dirty or session.deleted)
+
+
+def model_row(obj: SQLModel) -> dict[str, Any] | None:
+    """Valores carregados das colunas, ou None se algum não está carregado."""
+    state = sa_inspect(obj)
+    keys = [attr.key for attr in state.mapper.column_attrs]
+    if any(key in state.unloaded for key in keys):
+        return None
+    return {key: state.dict[key] for key in keys}
+
+
+def _snapshot(result: Any) -> _Snapshot | None:
+    """Converte o resultado de um service em snapshot, se for cacheável."""
+    if result is None:
+        return _Snapshot(None, "none", (), 0)
+    objs = result if isinstance(result, list) else [result]
+    if not all(isinstance(obj, SQLModel) and hasattr(obj, "_sa_instance_state") for obj in objs):
+        return None
+    if len({type(obj) for obj in objs}) > 1:
+        return None
+
+    rows = []
+    for obj in objs:
+        row = model_row(obj)
+        if row is None:
+            return None
+        rows.append(row)
+    size = sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values()) for row in rows
+    )
+    model = type(objs[0]) if objs else None
+    return _Snapshot(model, "list" if isinstance(result, list) else "one", tuple(rows), size)
+
+
+def detached_instance(model: type[SQLModel], row: dict[str, Any], session: Session | None) -> Any:
+    """Instância nova com os valores de `row`, detached ou mesclada na sessão."""
+    # Mesmo caminho do ORM ao carregar uma linha: sem __init__, sem dirty
+    obj = sa_inspect(model).class_manager.new_instance()
+    for key, value in row.items():
+        set_committed_value(obj, key, value)
+    make_transient_to_detached(obj)
+    if session is not None:
+        obj = session.merge(obj, load=False)
+    return obj
+
+
+def _restore(snapshot: _Snapshot, session: Session | None) -> Any:
+    """Recria o resultado a partir do snapshot (instâncias novas)."""
+    if snapshot.shape == "none":
+        return None
+    objs = [detached_instance(snapshot.model, row, session) for row in snapshot.rows]
+    return objs if snapshot.shape == "list" else objs[0]
+
+
+class QueryCache:
+    """LRU de snapshots limitado por número de entradas e bytes estimados.
+
+    Attributes:
+        hits: Leituras servidas da memória
+        misses: Leituras que foram ao banco
+    """
+
+    def __init__(
+        self,
+        watcher: DataVersionWatcher,
+        engines: tuple[Any, ...] = (),
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.watcher = watcher
+        self.engines = engines
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, _Snapshot] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Tamanho estimado das entradas em cache."""
+        return self._bytes
+
+    def accepts(self, session: Session | None) -> bool:
+        """Se leituras feitas nesta sessão podem usar o cache."""
+        if session is None:
+            return True
+        if session_has_writes(session):
+            return False
+        return session.get_bind() in self.engines
+
+    def clear(self) -> None:
+        """Descarta todas as entradas."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get(self, key: tuple) -> _Snapshot | None:
+        """Snapshot da chave, descartando tudo antes se o banco mudou."""
+        with self._lock:
+            if self.watcher.changed():
+                self._entries.clear()
+                self._bytes = 0
+            snapshot = self._entries.get(key)
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return snapshot
+
+    def put(self, key: tuple, snapshot: _Snapshot) -> None:
+        """Guarda o snapshot e remove os menos usados acima dos limites."""
+        if snapshot.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = snapshot
+            self._bytes += snapshot.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+
+_active_cache: QueryCache | None = None
+
+
+def get_query_cache() -> QueryCache | None:
+    """Cache ativo (dentro de shared_engines), ou None."""
+    return _active_cache
+
+
+def set_query_cache(cache: QueryCache | None) -> None:
+    """Ativa (ou desativa, com None) o cache global."""
+    global _active_cache
+    _active_cache = cache
+
+
+def cached_query(func: Callable) -> Callable:
+    """Serve a leitura do cache ativo quando o banco não mudou.
+
+    A chave é o nome qualificado da função mais os argumentos normalizados
+    (defaults aplicados), sem `session`. Em métodos de instância (ex:
+    RoutineService), a sessão vem de `self.session`. Argumentos não
+    hasheáveis ou resultados que não são modelos desviam do cache.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cache = _active_cache
+        if cache is None:
+            return func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        session = arguments.pop("session", None)
+        if "self" in arguments:
+            session = getattr(arguments.pop("self"), "session", None)
+        if not cache.accepts(session):
+            return func(*args, **kwargs)
+
+        key = (func.__qualname__, *sorted(arguments.items()))
+        try:
+            snapshot = cache.get(key)
+        except TypeError:  # argumento não hasheável
+            return func(*args, **kwargs)
+        if snapshot is not None:
+            return _restore(snapshot, session)
+
+        result = func(*args, **kwargs)
+        snapshot = _snapshot(result)
+        if snapshot is not None:
+            cache.put(key, snapshot)
+        return result
+
+    return wrapper
@@ -0,0 +1,47 @@
+"""Detecção de mudanças no banco sem polling de tabelas."""
+
+from typing import Any
+
+from sqlalchemy.engine import Engine
+
+
+class DataVersionWatcher:
+    """Detecta commits feitos por outras conexões via `PRAGMA data_version`.
+
+    O SQLite incrementa `data_version` de uma conexão sempre que outra
+    conexão (do mesmo ou de outro processo) faz commit no arquivo. Ler o
+    pragma não toca em páginas de tabela, então pode ser chamado a cada
+    segundo; as tabelas só são relidas quando o valor muda.
+
+    Mantém uma conexão dedicada aberta: o contador é por conexão.
+    """
+
+    def __init__(self, engine: Engine):
+        self._connection: Any = engine.raw_connection()
+        self._version = self._read()
+
+    def _read(self) -> int:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute("PRAGMA data_version")
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+    def changed(self) -> bool:
+        """Retorna True se houve commit externo desde a última chamada."""
+        version = self._read()
+        if version == self._version:
+            return False
+        self._version = version
+        return True
+
+    def close(self) -> None:
+        """Devolve a conexão dedicada ao pool."""
+        self._connection.close()
+
+    def __enter__(self) -> "DataVersionWatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -1,41 +1,111 @@
 """Entry point do TimeBlock Organizer CLI."""
 
+import importlib
+import sys
+
+import click
 import typer
+from typer.core import TyperGroup
+
+# Subcomandos carregados sob demanda: nome -> (módulo, atributo).
+# Atributo "app" é um sub-Typer; qualquer outro é uma função de comando.
+_LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    # Comandos v1.0
+    "init": ("src.timeblock.commands.init", "init"),
+    "add": ("src.timeblock.commands.add", "add"),
+    "list": ("src.timeblock.commands.list", "list_events"),
+    "shell": ("src.timeblock.commands.shell", "shell"),
+    "tui": ("src.timeblock.commands.tui", "tui"),
+    # Comandos v2.0
+    "routine": ("src.timeblock.commands.routine", "app"),
+    "habit": ("src.timeblock.commands.habit", "app"),
+    "schedule": ("src.timeblock.commands.schedule", "app"),
+    "task": ("src.timeblock.commands.task", "app"),
+    "timer": ("src.timeblock.commands.timer", "app"),
+    "report": ("src.timeblock.commands.report", "app"),
+    "tag": ("src.timeblock.commands.tag", "app"),
+    "reschedule": ("src.timeblock.commands.reschedule", "app"),
+    "daemon": ("src.timeblock.commands.daemon", "app"),
+    "sync": ("src.timeblock.commands.sync", "app"),
+    "outbox": ("src.timeblock.commands.outbox", "app"),
+    "replay": ("src.timeblock.commands.replay", "app"),
+    "history": ("src.timeblock.commands.history", "history"),
+}
+
+
+def _root() -> None:
+    # Callback explícito: garante que o Typer monte um grupo mesmo com um
+    # único comando registrado de forma eager (version).
+    pass
+
+
+def _load_command(name: str) -> click.Command:
+    """Importa o módulo do subcomando e o converte em comando Click.
+
+    O comando é montado dentro de um Typer equivalente ao raiz (sem
+    completion, com callback), exatamente como `add_typer`/`command` fariam
+    no registro eager, para que help e opções não mudem. Não há cache aqui:
+    o import já é memoizado por `sys.modules`, e montar o comando a cada
+    resolução respeita módulos recarregados.
+    """
+    module_path, attribute = _LAZY_COMMANDS[name]
+    # Mesma resolução de `from pacote import modulo`: atributo do pacote
+    # primeiro, import do submódulo só se ainda não foi carregado.
+    package_path, _, module_name = module_path.rpartition(".")
+    module = getattr(importlib.import_module(package_path), module_name, None)
+    if module is None:
+        module = importlib.import_module(module_path)
+    target = getattr(module, attribute)
+
+    wrapper = typer.Typer(add_completion=False)
+    wrapper.callback()(_root)
+    if isinstance(target, typer.Typer):
+        wrapper.add_typer(target, name=name)
+    else:
+        wrapper.command(name)(target)
+    return typer.main.get_command(wrapper).commands[name]
+
+
+class LazyGroup(TyperGroup):
+    """Grupo raiz que só importa o módulo do subcomando invocado.
+
+    `timeblock version` não carrega nenhum módulo de comando, e
+    `timeblock timer status` carrega apenas `commands.timer` (e o que ele
+    importa), em vez de Rich Live/Table, dateutil e todos os services.
+    """
+
+    def main(self, args=None, *main_args, **main_kwargs):
+        # Invocação real (args=None, lê sys.argv): tenta o daemon antes de
+        # importar qualquer comando. CliRunner e o próprio daemon passam args.
+        if args is None:
+            from .daemon.client import forward
+
+            exit_code = forward(sys.argv[1:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+        return super().main(args, *main_args, **main_kwargs)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        # Mesma ordem do registro eager: comandos simples antes dos grupos
+        commands = [name for name, (_, attr) in _LAZY_COMMANDS.items() if attr != "app"]
+        groups = [name for name, (_, attr) in _LAZY_COMMANDS.items() if attr == "app"]
+        return [*commands, *super().list_commands(ctx), *groups]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in _LAZY_COMMANDS:
+            return _load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-from src.timeblock.commands import (
-    add,
-    habit,
-    init,
-    report,
-    reschedule,
-    routine,
-    schedule,
-    tag,
-    task,
-    timer,
-)
-from src.timeblock.commands import list as list_cmd
 
 app = typer.Typer(
     name="timeblock",
     help="TimeBlock Organizer - Gerenciador de tempo via CLI",
     add_completion=False,
+    cls=LazyGroup,
 )
 
-# Comandos v1.0
-app.command("init")(init.init)
-app.command("add")(add.add)
-app.command("list")(list_cmd.list_events)
-
-# Comandos v2.0
-app.add_typer(routine.app, name="routine")
-app.add_typer(habit.app, name="habit")
-app.add_typer(schedule.app, name="schedule")
-app.add_typer(task.app, name="task")
-app.add_typer(timer.app, name="timer")
-app.add_typer(report.app, name="report")
-app.add_typer(tag.app, name="tag")
-app.add_typer(reschedule.app, name="reschedule")
+
+app.callback()(_root)
 
 
 @app.command()
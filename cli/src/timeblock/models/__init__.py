@@ -1,19 +1,24 @@
 """Data models for TimeBlock application."""
 
+from .change_tracking import SyncState, SyncTombstone
 from .enums import DoneSubstatus, NotDoneSubstatus, SkipReason, Status
 from .event import ChangeLog, ChangeType, Event, EventStatus, PauseLog
 from .habit import Habit, Recurrence
 from .habit_instance import HabitInstance
+from .outbox import OutboxEvent, OutboxOffset
 from .routine import Routine
+from .schedule_item import ScheduleItem, schedule_item
+from .sync_operation import SyncOp, SyncOperation
 from .tag import Tag
 from .task import Task
-from .time_log import TimeLog
+from .time_log import ActiveTimer, TimeLog
 
 __all__ = [
     # Events
     "Event",
     "EventStatus",
     "TimeLog",
+    "ActiveTimer",
     "PauseLog",
     "ChangeLog",
     "ChangeType",
@@ -30,4 +35,15 @@ __all__ = [
     # Tags & Tasks
     "Tag",
     "Task",
+    # Agenda unificada
+    "ScheduleItem",
+    "schedule_item",
+    # Sincronização (ADR-012)
+    "SyncOp",
+    "SyncOperation",
+    "SyncState",
+    "SyncTombstone",
+    # Eventos de domínio (ADR-023)
+    "OutboxEvent",
+    "OutboxOffset",
 ]
@@ -0,0 +1,104 @@
+"""Sequência de mudanças para sincronização por delta entre dispositivos.
+
+Toda tabela sincronizada (as que têm `uuid`, ADR-013) ganha a coluna
+indexada `change_seq`. Triggers do SQLite a preenchem a partir de um
+contador global em `sync_state`: cada INSERT ou UPDATE recebe o próximo
+valor, e cada DELETE deixa uma lápide em `sync_tombstone` com o seu valor.
+"O que mudou desde N" vira uma busca por faixa no índice, sem varrer a
+tabela, e vale também para escritas em SQL direto, fora do ORM.
+
+Durante uma importação (`sync_state.importing = 1`, só visível dentro da
+transação que importa) os triggers não disparam: linhas recebidas de outro
+dispositivo não voltam no próximo export.
+"""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import CheckConstraint, Column, Integer, event
+from sqlmodel import Field, SQLModel
+
+from .uuid_encoding import UUIDBlob
+
+# Tabelas sincronizadas, pais antes de filhos (ordem das FKs)
+SYNCED_TABLES = ("event", "routines", "tags", "habits", "tasks", "habitinstance", "time_log")
+
+SYNC_STATE_ID = 1
+
+
+def change_seq_column() -> Column:
+    """Coluna `change_seq` indexada, mantida pelos triggers."""
+    return Column("change_seq", Integer, nullable=False, default=0, server_default="0", index=True)
+
+
+class SyncState(SQLModel, table=True):
+    """Contador global de mudanças (linha única)."""
+
+    __tablename__ = "sync_state"
+    __table_args__ = (CheckConstraint("id = 1", name="ck_sync_state_single_row"),)
+
+    id: int = Field(default=SYNC_STATE_ID, primary_key=True)
+    counter: int = Field(default=0)
+    importing: int = Field(default=0)
+
+
+class SyncTombstone(SQLModel, table=True):
+    """Linha removida, para que o delta leve a remoção ao outro dispositivo."""
+
+    __tablename__ = "sync_tombstone"
+
+    id: int | None = Field(default=None, primary_key=True)
+    entity: str = Field(max_length=50)
+    entity_uuid: UUID = Field(sa_column=Column("entity_uuid", UUIDBlob(), nullable=False))
+    change_seq: int = Field(index=True)
+
+
+_NOT_IMPORTING = f"(SELECT importing FROM sync_state WHERE id = {SYNC_STATE_ID}) = 0"
+_NEXT_SEQ = f"UPDATE sync_state SET counter = counter + 1 WHERE id = {SYNC_STATE_ID};"
+_CURRENT_SEQ = f"(SELECT counter FROM sync_state WHERE id = {SYNC_STATE_ID})"
+
+SEED_SYNC_STATE_SQL = (
+    f"INSERT OR IGNORE INTO sync_state (id, counter, importing) VALUES ({SYNC_STATE_ID}, 0, 0)"
+)
+
+
+def change_seq_triggers_sql(table: str) -> list[str]:
+    """Triggers de INSERT, UPDATE e DELETE que mantêm `change_seq` da tabela."""
+    stamp = f"UPDATE {table} SET change_seq = {_CURRENT_SEQ} WHERE rowid = NEW.rowid;"
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_change_seq_insert
+        AFTER INSERT ON {table} WHEN {_NOT_IMPORTING}
+        BEGIN {_NEXT_SEQ} {stamp} END
+        """,
+        # A guarda em change_seq evita tratar o próprio carimbo como mudança
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_change_seq_update
+        AFTER UPDATE ON {table} WHEN NEW.change_seq = OLD.change_seq AND {_NOT_IMPORTING}
+        BEGIN {_NEXT_SEQ} {stamp} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_change_seq_delete
+        AFTER DELETE ON {table} WHEN {_NOT_IMPORTING}
+        BEGIN
+            {_NEXT_SEQ}
+            INSERT INTO sync_tombstone (entity, entity_uuid, change_seq)
+            VALUES ('{table}', OLD.uuid, {_CURRENT_SEQ});
+        END
+        """,
+    ]
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_change_tracking(target: Any, connection: Any, tables: Any = (), **kw: Any) -> None:
+    # `tables` são só as tabelas criadas agora: bancos existentes recebem os
+    # triggers pela migração 008, e create_all parciais (sem sync_state) não
+    # criam triggers que apontariam para uma tabela inexistente
+    created = {table.name for table in tables}
+    if SyncState.__tablename__ not in created:
+        return
+    connection.exec_driver_sql(SEED_SYNC_STATE_SQL)
+    for table in SYNCED_TABLES:
+        if table in created:
+            for sql in change_seq_triggers_sql(table):
+                connection.exec_driver_sql(sql)
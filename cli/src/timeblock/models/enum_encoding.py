@@ -0,0 +1,118 @@
+"""Codificação de enums como inteiros pequenos no armazenamento.
+
+Status, substatus, motivos de skip e recorrência eram gravados como VARCHAR
+com o nome do membro em toda linha. Aqui cada membro recebe um código inteiro
+(posição na declaração do enum), protegido por CHECK constraint. A API Python
+continua expondo os mesmos enums; só o formato em disco muda.
+
+Os códigos são a ordem de declaração: novos membros devem ser acrescentados
+sempre no final do enum, nunca inseridos ou reordenados.
+"""
+
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import CheckConstraint, Column, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+def enum_codes(enum_cls: type[Enum]) -> dict[Enum, int]:
+    """Mapa membro -> código inteiro, na ordem de declaração."""
+    return {member: code for code, member in enumerate(enum_cls)}
+
+
+class IntEnumType(TypeDecorator):
+    """Persiste membros de um Enum como SMALLINT.
+
+    Aceita na escrita o membro, seu nome ou seu valor (compatível com o que o
+    tipo Enum do SQLAlchemy aceitava); na leitura devolve sempre o membro.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[Enum], *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.enum_cls = enum_cls
+        self._codes = enum_codes(enum_cls)
+        self._members = list(enum_cls)
+
+    def _coerce(self, value: Any) -> Enum:
+        if isinstance(value, self.enum_cls):
+            return value
+        if isinstance(value, str) and value in self.enum_cls.__members__:
+            return self.enum_cls[value]
+        try:
+            return self.enum_cls(value)
+        except ValueError:
+            raise LookupError(
+                f"'{value}' is not among the defined enum values. "
+                f"Enum name: {self.enum_cls.__name__}. "
+                f"Possible values: {', '.join(self.enum_cls.__members__)}"
+            ) from None
+
+    def process_bind_param(self, value: Any, dialect: Any) -> int | None:
+        if value is None:
+            return None
+        return self._codes[self._coerce(value)]
+
+    def process_result_value(self, value: Any, dialect: Any) -> Enum | None:
+        if value is None:
+            return None
+        return self._members[value]
+
+    @property
+    def python_type(self) -> type[Enum]:
+        return self.enum_cls
+
+
+def enum_check_sql(column: str, enum_cls: type[Enum]) -> str:
+    """Expressão CHECK que restringe a coluna aos códigos válidos."""
+    return f"{column} BETWEEN 0 AND {len(enum_cls) - 1}"
+
+
+def int_enum_column(
+    name: str,
+    enum_cls: type[Enum],
+    nullable: bool = False,
+    index: bool = False,
+) -> Column:
+    """Coluna SMALLINT com CHECK para um enum.
+
+    Args:
+        name: Nome da coluna (necessário para a CHECK constraint)
+        enum_cls: Enum persistido
+        nullable: Se a coluna aceita NULL
+        index: Se a coluna deve ser indexada
+
+    Returns:
+        Coluna SQLAlchemy para uso em `sa_column`
+    """
+    return Column(
+        name,
+        IntEnumType(enum_cls),
+        CheckConstraint(enum_check_sql(name, enum_cls), name=f"ck_{name}_code"),
+        nullable=nullable,
+        index=index,
+    )
+
+
+def enum_decode_sql(expr: str, enum_cls: type[Enum]) -> str:
+    """Expressão SQL que traduz o código inteiro de volta para o nome do membro.
+
+    Valores que não são códigos (ex: bancos ainda não migrados, que guardam o
+    nome) passam inalterados.
+    """
+    branches = " ".join(
+        f"WHEN {code} THEN '{member.name}'" for member, code in enum_codes(enum_cls).items()
+    )
+    return f"CASE {expr} {branches} ELSE {expr} END"
+
+
+def enum_encode_sql(expr: str, enum_cls: type[Enum]) -> str:
+    """Expressão SQL que traduz nome ou valor textual para o código inteiro."""
+    branches = " ".join(
+        f"WHEN {expr} IN ('{member.name}', '{member.value}') THEN {code}"
+        for member, code in enum_codes(enum_cls).items()
+    )
+    return f"CASE {branches} END"
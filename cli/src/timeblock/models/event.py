@@ -2,9 +2,16 @@
 
 from datetime import UTC, datetime
 from enum import Enum
+from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
+from .change_tracking import change_seq_column
+from .enum_encoding import int_enum_column
+from .time_encoding import epoch_minutes_column
+from .uuid_encoding import uuid7, uuid_column
+
 
 class EventStatus(str, Enum):
     """Event lifecycle status."""
@@ -21,15 +28,23 @@ class Event(SQLModel, table=True):
     """Time-blocked event with scheduling information."""
 
     id: int | None = Field(default=None, primary_key=True)
+    uuid: UUID = Field(default_factory=uuid7, sa_column=uuid_column())
+    change_seq: int = Field(default=0, sa_column=change_seq_column())
     title: str = Field(max_length=200, index=True)
     description: str | None = Field(default=None, max_length=1000)
     color: str | None = Field(default=None, max_length=7)
-    status: EventStatus = Field(default=EventStatus.PLANNED)
+    status: EventStatus = Field(
+        default=EventStatus.PLANNED, sa_column=int_enum_column("status", EventStatus)
+    )
     scheduled_start: datetime = Field(index=True)
     scheduled_end: datetime
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
+    # Minutos desde epoch (gerados pelo SQLite)
+    start_min: int | None = Field(default=None, sa_column=epoch_minutes_column("scheduled_start"))
+    end_min: int | None = Field(default=None, sa_column=epoch_minutes_column("scheduled_end"))
+
 
 class PauseLog(SQLModel, table=True):
     """Individual pause intervals for time tracking."""
@@ -52,11 +67,21 @@ class ChangeType(str, Enum):
 
 
 class ChangeLog(SQLModel, table=True):
-    """Audit trail for event modifications."""
+    """Audit trail for schedule edits (events, habits, instances, tasks).
+
+    Written by the audit hook in `services/audit.py`: one row per changed
+    field (or one per insert/delete), in the same transaction as the edit.
+    `entity` is the table name and `entity_id` the local id; there is no FK,
+    so history survives the row being deleted. The `changed_at` index also
+    holds the rowid, so keyset pages by (changed_at, id) need no sort.
+    """
+
+    __table_args__ = (Index("ix_changelog_entity", "entity", "entity_id"),)
 
     id: int | None = Field(default=None, primary_key=True)
-    event_id: int = Field(foreign_key="event.id", index=True)
-    change_type: ChangeType
+    entity: str = Field(max_length=50)
+    entity_id: int
+    change_type: ChangeType = Field(sa_column=int_enum_column("change_type", ChangeType))
     field_name: str | None = Field(default=None, max_length=50)
     old_value: str | None = Field(default=None, max_length=500)
     new_value: str | None = Field(default=None, max_length=500)
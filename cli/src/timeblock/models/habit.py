@@ -3,11 +3,15 @@
 from datetime import time
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel
 
+from .change_tracking import change_seq_column
+from .enum_encoding import int_enum_column
 from .habit_instance import HabitInstance
 from .routine import Routine
+from .uuid_encoding import uuid7, uuid_column
 
 if TYPE_CHECKING:
     from .tag import Tag
@@ -34,6 +38,8 @@ class Habit(SQLModel, table=True):
     __tablename__ = "habits"  # type: ignore[assignment]
 
     id: int | None = Field(default=None, primary_key=True)
+    uuid: UUID = Field(default_factory=uuid7, sa_column=uuid_column())
+    change_seq: int = Field(default=0, sa_column=change_seq_column())
     routine_id: int = Field(
         foreign_key="routines.id",
         ondelete="RESTRICT",  # BR-ROUTINE-002: Bloqueia delete com habits
@@ -41,7 +47,7 @@ class Habit(SQLModel, table=True):
     title: str = Field(max_length=200)
     scheduled_start: time
     scheduled_end: time
-    recurrence: Recurrence
+    recurrence: Recurrence = Field(sa_column=int_enum_column("recurrence", Recurrence))
     color: str | None = Field(default=None, max_length=7)
     tag_id: int | None = Field(default=None, foreign_key="tags.id")
 
@@ -3,10 +3,15 @@
 from datetime import date as date_type
 from datetime import datetime, time
 from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel
 
+from .change_tracking import change_seq_column
+from .enum_encoding import int_enum_column
 from .enums import DoneSubstatus, NotDoneSubstatus, SkipReason, Status
+from .time_encoding import epoch_minutes_column
+from .uuid_encoding import uuid7, uuid_column
 
 if TYPE_CHECKING:
     from .habit import Habit
@@ -24,16 +29,34 @@ class HabitInstance(SQLModel, table=True):
     __tablename__ = "habitinstance"
 
     id: int | None = Field(default=None, primary_key=True)
-    habit_id: int = Field(foreign_key="habits.id")
+    uuid: UUID = Field(default_factory=uuid7, sa_column=uuid_column())
+    change_seq: int = Field(default=0, sa_column=change_seq_column())
+    habit_id: int = Field(foreign_key="habits.id", index=True)
     date: date_type = Field(index=True)
     scheduled_start: time
     scheduled_end: time
-    status: Status = Field(default=Status.PENDING)
-    done_substatus: DoneSubstatus | None = Field(default=None)
-    not_done_substatus: NotDoneSubstatus | None = Field(default=None)
-    skip_reason: SkipReason | None = Field(default=None)
+    status: Status = Field(default=Status.PENDING, sa_column=int_enum_column("status", Status))
+    done_substatus: DoneSubstatus | None = Field(
+        default=None, sa_column=int_enum_column("done_substatus", DoneSubstatus, nullable=True)
+    )
+    not_done_substatus: NotDoneSubstatus | None = Field(
+        default=None,
+        sa_column=int_enum_column("not_done_substatus", NotDoneSubstatus, nullable=True),
+    )
+    skip_reason: SkipReason | None = Field(
+        default=None, sa_column=int_enum_column("skip_reason", SkipReason, nullable=True)
+    )
     skip_note: str | None = Field(default=None)
     completion_percentage: int | None = Field(default=None)
+
+    # Minutos desde epoch (gerados pelo SQLite a partir de date + time)
+    start_min: int | None = Field(
+        default=None, sa_column=epoch_minutes_column("date || ' ' || scheduled_start")
+    )
+    end_min: int | None = Field(
+        default=None, sa_column=epoch_minutes_column("date || ' ' || scheduled_end")
+    )
+
     habit: Optional["Habit"] = Relationship(back_populates="instances")
 
     @property
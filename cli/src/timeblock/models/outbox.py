@@ -0,0 +1,41 @@
+"""Outbox transacional de eventos de domínio (ADR-023)."""
+
+from datetime import UTC, datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class OutboxEvent(SQLModel, table=True):
+    """Evento de domínio aguardando publicação.
+
+    Gravado pelos services na mesma transação da mudança que o origina: ou
+    os dois são confirmados, ou nenhum. `id` é AUTOINCREMENT e serve de
+    offset para o publisher (nunca reaproveitado depois de `prune`).
+    `data` é o JSON do campo `data` do CloudEvent.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: int | None = Field(default=None, primary_key=True)
+    event_id: str = Field(max_length=36)
+    type: str = Field(max_length=100)
+    subject: str = Field(max_length=100)
+    time: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    data: str
+
+
+class OutboxOffset(SQLModel, table=True):
+    """Progresso de um destino (sink) na leitura do outbox.
+
+    `last_id` é o último evento confirmado pelo destino. Falhas seguidas
+    aumentam `attempts` e adiam `next_attempt_at` (backoff exponencial).
+    """
+
+    __tablename__ = "outbox_offset"
+
+    sink: str = Field(primary_key=True, max_length=255)
+    last_id: int = Field(default=0)
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime | None = Field(default=None)
+    last_error: str | None = Field(default=None)
@@ -2,9 +2,13 @@
 
 from datetime import datetime
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel
 
+from .change_tracking import change_seq_column
+from .uuid_encoding import uuid7, uuid_column
+
 if TYPE_CHECKING:
     from .habit import Habit
 
@@ -15,6 +19,8 @@ class Routine(SQLModel, table=True):
     __tablename__ = "routines"  # type: ignore[assignment]
 
     id: int | None = Field(default=None, primary_key=True)
+    uuid: UUID = Field(default_factory=uuid7, sa_column=uuid_column())
+    change_seq: int = Field(default=0, sa_column=change_seq_column())
     name: str = Field(index=True, max_length=200)
     is_active: bool = Field(default=False)  # BR-ROUTINE-001: Não ativa por padrão
     created_at: datetime = Field(default_factory=datetime.now)
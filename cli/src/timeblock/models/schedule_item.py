@@ -0,0 +1,74 @@
+"""Projeção unificada de itens agendáveis (Task, HabitInstance, Event).
+
+`schedule_item` é uma VIEW SQL com uma linha por item da agenda, chaveada por
+(kind, id) e com os limites em minutos desde epoch (start_min/end_min). O
+status é exposto pelo nome do membro do enum, decodificado na própria view. Toda
+leitura por intervalo de tempo passa por uma única query indexada em vez de
+três queries e despacho por string em Python.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import DDL, Column, Integer, MetaData, String, Table, event
+from sqlmodel import SQLModel
+
+from .enum_encoding import enum_decode_sql
+from .enums import Status
+from .event import EventStatus
+from .time_encoding import from_epoch_minutes
+
+SCHEDULE_ITEM_VIEW_SQL = f"""
+CREATE VIEW IF NOT EXISTS schedule_item AS
+SELECT 'task' AS kind, t.id AS id, t.start_min AS start_min, t.end_min AS end_min,
+       CASE WHEN t.completed_datetime IS NULL THEN 'PENDING' ELSE 'DONE' END AS status,
+       t.title AS title
+FROM tasks AS t
+UNION ALL
+SELECT 'habit_instance', hi.id, hi.start_min, hi.end_min,
+       {enum_decode_sql("hi.status", Status)}, h.title
+FROM habitinstance AS hi LEFT JOIN habits AS h ON h.id = hi.habit_id
+UNION ALL
+SELECT 'event', e.id, e.start_min, e.end_min,
+       {enum_decode_sql("e.status", EventStatus)}, e.title
+FROM event AS e
+"""
+
+DROP_SCHEDULE_ITEM_VIEW_SQL = "DROP VIEW IF EXISTS schedule_item"
+
+# Metadata própria: a view não deve ser criada como tabela pelo create_all
+schedule_item = Table(
+    "schedule_item",
+    MetaData(),
+    Column("kind", String),
+    Column("id", Integer),
+    Column("start_min", Integer),
+    Column("end_min", Integer),
+    Column("status", String),
+    Column("title", String),
+)
+
+event.listen(SQLModel.metadata, "after_create", DDL(SCHEDULE_ITEM_VIEW_SQL))
+event.listen(SQLModel.metadata, "before_drop", DDL(DROP_SCHEDULE_ITEM_VIEW_SQL))
+
+
+@dataclass(frozen=True)
+class ScheduleItem:
+    """Item da agenda lido da view schedule_item."""
+
+    kind: str  # "task", "habit_instance", "event"
+    id: int
+    start_min: int
+    end_min: int
+    status: str
+    title: str | None
+
+    @property
+    def start(self) -> datetime:
+        """Início como datetime (horário de parede)."""
+        return from_epoch_minutes(self.start_min)
+
+    @property
+    def end(self) -> datetime:
+        """Fim como datetime (horário de parede)."""
+        return from_epoch_minutes(self.end_min)
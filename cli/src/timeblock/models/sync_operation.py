@@ -0,0 +1,46 @@
+"""Fila de sincronização (ADR-012) como log de operações append-only."""
+
+from datetime import UTC, datetime
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import Column, Index
+from sqlmodel import Field, SQLModel
+
+from .enum_encoding import int_enum_column
+from .uuid_encoding import UUIDBlob
+
+
+class SyncOp(str, Enum):
+    """Tipo de operação registrada na fila."""
+
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class SyncOperation(SQLModel, table=True):
+    """Uma mutação local ainda não enviada ao servidor.
+
+    `seq` é AUTOINCREMENT: nunca reaproveitado, nem depois de `ack` apagar
+    o início da fila, então serve de cursor para leituras em lotes. A linha é
+    identificada pela tabela e pelo `uuid` (ADR-013), não pelo id local.
+    `payload` é JSON: todas as colunas no INSERT, só as alteradas no UPDATE,
+    nulo no DELETE. `entity_id` é o id local da linha, para o replay
+    reconstruir o banco com os mesmos ids (as FKs do payload são ids locais);
+    nulo nas operações gravadas antes da migração 011.
+    """
+
+    __tablename__ = "sync_queue"
+    __table_args__ = (
+        Index("ix_sync_queue_entity", "entity", "entity_uuid"),
+        {"sqlite_autoincrement": True},
+    )
+
+    seq: int | None = Field(default=None, primary_key=True)
+    entity: str = Field(max_length=50)
+    entity_uuid: UUID = Field(sa_column=Column("entity_uuid", UUIDBlob(), nullable=False))
+    op: SyncOp = Field(sa_column=int_enum_column("op", SyncOp))
+    entity_id: int | None = Field(default=None)
+    payload: str | None = Field(default=None)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
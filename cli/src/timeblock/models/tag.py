@@ -1,9 +1,13 @@
 """Tag model for categorizing tasks and habits."""
 
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel
 
+from .change_tracking import change_seq_column
+from .uuid_encoding import uuid7, uuid_column
+
 if TYPE_CHECKING:
     from .habit import Habit
     from .task import Task
@@ -15,6 +19,8 @@ class Tag(SQLModel, table=True):
     __tablename__ = "tags"
 
     id: int | None = Field(default=None, primary_key=True)
+    uuid: UUID = Field(default_factory=uuid7, sa_column=uuid_column())
+    change_seq: int = Field(default=0, sa_column=change_seq_column())
     name: str = Field(unique=True, index=True, min_length=1, max_length=50)
     color: str = Field(default="#808080", max_length=7)
 
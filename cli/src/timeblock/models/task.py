@@ -2,9 +2,14 @@
 
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel
 
+from .change_tracking import change_seq_column
+from .time_encoding import epoch_minutes_column
+from .uuid_encoding import uuid7, uuid_column
+
 if TYPE_CHECKING:
     from .tag import Tag
 
@@ -15,6 +20,8 @@ class Task(SQLModel, table=True):
     __tablename__ = "tasks"
 
     id: int | None = Field(default=None, primary_key=True)
+    uuid: UUID = Field(default_factory=uuid7, sa_column=uuid_column())
+    change_seq: int = Field(default=0, sa_column=change_seq_column())
     title: str = Field(index=True, min_length=1, max_length=200)
     scheduled_datetime: datetime = Field(index=True)
     completed_datetime: datetime | None = Field(default=None)
@@ -22,5 +29,13 @@ class Task(SQLModel, table=True):
     color: str | None = Field(default=None)
     tag_id: int | None = Field(default=None, foreign_key="tags.id")
 
+    # Minutos desde epoch (gerados pelo SQLite); task assume duração de 1 hora
+    start_min: int | None = Field(
+        default=None, sa_column=epoch_minutes_column("scheduled_datetime")
+    )
+    end_min: int | None = Field(
+        default=None, sa_column=epoch_minutes_column("scheduled_datetime", offset_seconds=3600)
+    )
+
     # Relationships
     tag: Optional["Tag"] = Relationship(back_populates="tasks")
@@ -0,0 +1,53 @@
+"""Codificação de horários em minutos inteiros (epoch) para aritmética em SQL.
+
+Task, HabitInstance e Event guardam horários em formatos diferentes
+(datetime pontual, date + time, datetime completo). As colunas
+`start_min`/`end_min` normalizam todos para minutos desde epoch, de modo que
+overlap, slots livres e utilização virem predicados de intervalo indexados.
+
+As colunas são geradas pelo próprio SQLite (VIRTUAL), então ficam corretas
+mesmo para linhas criadas fora dos services.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, Computed, Integer
+
+
+def epoch_minutes_sql(datetime_expr: str, offset_seconds: int = 0) -> str:
+    """Expressão SQLite que converte texto datetime em minutos desde epoch.
+
+    Args:
+        datetime_expr: Expressão SQL que produz 'YYYY-MM-DD HH:MM:SS[.ffffff]'
+        offset_seconds: Deslocamento somado antes da divisão (ex: duração padrão)
+
+    Returns:
+        Expressão SQL inteira
+    """
+    seconds = f"CAST(strftime('%s', {datetime_expr}) AS INTEGER)"
+    if offset_seconds:
+        seconds = f"({seconds} + {offset_seconds})"
+    return f"{seconds} / 60"
+
+
+def epoch_minutes_column(datetime_expr: str, offset_seconds: int = 0) -> Column:
+    """Coluna gerada e indexada com minutos desde epoch."""
+    return Column(
+        Integer,
+        Computed(epoch_minutes_sql(datetime_expr, offset_seconds)),
+        index=True,
+    )
+
+
+def to_epoch_minutes(value: datetime) -> int:
+    """Converte datetime para minutos desde epoch, com a mesma regra do SQLite.
+
+    O SQLite armazena o horário de parede sem timezone e `strftime('%s')`
+    o interpreta como UTC; o tzinfo é descartado aqui pelo mesmo motivo.
+    """
+    return int(value.replace(tzinfo=UTC).timestamp()) // 60
+
+
+def from_epoch_minutes(minutes: int) -> datetime:
+    """Converte minutos desde epoch de volta para datetime naive."""
+    return datetime.fromtimestamp(minutes * 60, UTC).replace(tzinfo=None)
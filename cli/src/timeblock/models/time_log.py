@@ -1,9 +1,16 @@
 """Unified TimeLog model for time tracking."""
 
 from datetime import datetime
+from uuid import UUID
 
+from sqlalchemy import CheckConstraint
 from sqlmodel import Field, SQLModel
 
+from .change_tracking import change_seq_column
+from .uuid_encoding import uuid7, uuid_column
+
+ACTIVE_TIMER_ID = 1
+
 
 class TimeLog(SQLModel, table=True):
     """Registro unificado de tempo rastreado."""
@@ -11,6 +18,8 @@ class TimeLog(SQLModel, table=True):
     __tablename__ = "time_log"
 
     id: int | None = Field(default=None, primary_key=True)
+    uuid: UUID = Field(default_factory=uuid7, sa_column=uuid_column())
+    change_seq: int = Field(default=0, sa_column=change_seq_column())
 
     # Foreign keys opcionais (apenas um preenchido por registro)
     event_id: int | None = Field(foreign_key="event.id", default=None, index=True)
@@ -27,3 +36,26 @@ class TimeLog(SQLModel, table=True):
 
     # Notes
     notes: str | None = Field(default=None, max_length=500)
+
+
+class ActiveTimer(SQLModel, table=True):
+    """Estado persistente do timer ativo (BR-TIMER-001, BR-TIMER-006).
+
+    Tabela de linha única: a PK é sempre 1, então existir linha significa
+    existir timer ativo e toda operação é uma busca por chave primária. O
+    estado sobrevive entre invocações da CLI (pause em um processo, resume
+    em outro).
+    """
+
+    __tablename__ = "active_timer"
+    __table_args__ = (CheckConstraint("id = 1", name="ck_active_timer_single_row"),)
+
+    id: int = Field(default=ACTIVE_TIMER_ID, primary_key=True)
+    timelog_id: int = Field(foreign_key="time_log.id", unique=True)
+
+    # Pausa em andamento (PauseLog aberto)
+    pause_log_id: int | None = Field(default=None, foreign_key="pauselog.id")
+    pause_start: datetime | None = Field(default=None)
+
+    # Total pausado em segundos (pausas já encerradas)
+    paused_seconds: int = Field(default=0)
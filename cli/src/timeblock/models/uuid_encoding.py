@@ -0,0 +1,68 @@
+"""Identificadores globais (ADR-013) como UUIDv7 em BLOB de 16 bytes.
+
+O ADR-013 prevê UUIDs para sincronização entre dispositivos. UUIDs em TEXT
+(36 caracteres) e aleatórios (v4) inflam os índices e espalham inserções pela
+árvore. Aqui:
+
+- O UUID é v7 (RFC 9562): os 48 bits iniciais são o timestamp em ms, então
+  novas linhas caem no fim do índice, como um auto-increment.
+- O valor é gravado como BLOB de 16 bytes, não como texto.
+- O `id` inteiro (rowid) continua sendo a chave física e o alvo das FKs;
+  a coluna `uuid` é uma chave alternativa única usada pelo sync.
+"""
+
+import os
+import time
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Column, LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+def uuid7(timestamp_ms: int | None = None) -> UUID:
+    """Gera um UUID versão 7 (timestamp Unix em ms + 74 bits aleatórios).
+
+    Args:
+        timestamp_ms: Timestamp em milissegundos (padrão: agora)
+
+    Returns:
+        UUID ordenável pelo instante de criação
+    """
+    if timestamp_ms is None:
+        timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # versão
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # variante RFC 9562
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF
+    return UUID(int=value)
+
+
+class UUIDBlob(TypeDecorator):
+    """Persiste uuid.UUID como BLOB de 16 bytes."""
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> bytes | None:
+        if value is None:
+            return None
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value: Any, dialect: Any) -> UUID | None:
+        if value is None:
+            return None
+        return UUID(bytes=bytes(value))
+
+    @property
+    def python_type(self) -> type[UUID]:
+        return UUID
+
+
+def uuid_column() -> Column:
+    """Coluna `uuid` única (chave alternativa global)."""
+    return Column("uuid", UUIDBlob(), unique=True, nullable=False)
@@ -1,15 +1,19 @@
 """Services do TimeBlock Organizer."""
 
+from src.timeblock.services.audit import AuditService
 from src.timeblock.services.habit_instance_service import HabitInstanceService
 from src.timeblock.services.habit_service import HabitService
 from src.timeblock.services.routine_service import RoutineService
+from src.timeblock.services.sync_queue import SyncQueue
 from src.timeblock.services.task_service import TaskService
 from src.timeblock.services.timer_service import TimerService
 
 __all__ = [
+    "AuditService",
     "HabitInstanceService",
     "HabitService",
     "RoutineService",
+    "SyncQueue",
     "TaskService",
     "TimerService",
 ]
@@ -0,0 +1,113 @@
+"""Versões assíncronas dos services, sobre engine aiosqlite.
+
+A TUI (ADR-006) roda no event loop do asyncio; chamar os services síncronos
+bloquearia o loop durante o I/O do SQLite. Aqui cada método é a versão
+`async` do método síncrono correspondente, executado com
+`AsyncSession.run_sync`: a query e as regras de negócio são exatamente as
+mesmas (o método síncrono recebe a sessão síncrona da AsyncSession), e o
+I/O acontece na thread do aiosqlite, sem bloquear o loop.
+
+Cada chamada sem `session` abre sua própria AsyncSession, então leituras
+independentes podem rodar em paralelo:
+
+    calendar, timer, conflicts = await asyncio.gather(
+        AsyncTaskService.list_tasks(start, end),
+        AsyncTimerService.get_active_timer(),
+        AsyncEventReorderingService.get_conflicts_for_day(today),
+    )
+
+Requer o extra `async` (aiosqlite). Não é reexportado por `services` para
+que o import da CLI não dependa dele.
+"""
+
+import functools
+from collections.abc import Callable
+from typing import Any
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.timeblock.database import get_async_engine_context
+
+from .event_reordering_service import EventReorderingService
+from .habit_instance_service import HabitInstanceService
+from .habit_service import HabitService
+from .task_service import TaskService
+from .timer_service import TimerService
+
+
+def _async_method(func: Callable[..., Any]) -> staticmethod:
+    """Converte um método de service com `session` em corrotina.
+
+    Com `session` (AsyncSession), roda dentro dela, sem commit extra: o
+    chamador controla a transação, como nos services síncronos.
+    """
+
+    @functools.wraps(func)
+    async def method(*args: Any, session: AsyncSession | None = None, **kwargs: Any) -> Any:
+        def call(sync_session: Any) -> Any:
+            return func(*args, session=sync_session, **kwargs)
+
+        if session is not None:
+            return await session.run_sync(call)
+        async with (
+            get_async_engine_context() as engine,
+            AsyncSession(engine, expire_on_commit=False) as sess,
+        ):
+            return await sess.run_sync(call)
+
+    return staticmethod(method)
+
+
+class AsyncHabitInstanceService:
+    """Versão assíncrona de HabitInstanceService."""
+
+    generate_instances = _async_method(HabitInstanceService.generate_instances)
+    list_instances = _async_method(HabitInstanceService.list_instances)
+    adjust_instance_time = _async_method(HabitInstanceService.adjust_instance_time)
+    skip_habit_instance = _async_method(HabitInstanceService.skip_habit_instance)
+    mark_completed = _async_method(HabitInstanceService.mark_completed)
+    mark_skipped = _async_method(HabitInstanceService.mark_skipped)
+
+
+class AsyncTaskService:
+    """Versão assíncrona de TaskService."""
+
+    create_task = _async_method(TaskService.create_task)
+    get_task = _async_method(TaskService.get_task)
+    list_tasks = _async_method(TaskService.list_tasks)
+    list_pending_tasks = _async_method(TaskService.list_pending_tasks)
+    update_task = _async_method(TaskService.update_task)
+    complete_task = _async_method(TaskService.complete_task)
+    delete_task = _async_method(TaskService.delete_task)
+
+
+class AsyncTimerService:
+    """Versão assíncrona de TimerService."""
+
+    start_timer = _async_method(TimerService.start_timer)
+    stop_timer = _async_method(TimerService.stop_timer)
+    pause_timer = _async_method(TimerService.pause_timer)
+    resume_timer = _async_method(TimerService.resume_timer)
+    cancel_timer = _async_method(TimerService.cancel_timer)
+    get_active_timer = _async_method(TimerService.get_active_timer)
+    get_any_active_timer = _async_method(TimerService.get_any_active_timer)
+    get_timer_state = _async_method(TimerService.get_timer_state)
+    # Cálculo puro, sem I/O: o mesmo método síncrono
+    elapsed_seconds = staticmethod(TimerService.elapsed_seconds)
+
+
+class AsyncHabitService:
+    """Versão assíncrona de HabitService."""
+
+    create_habit = _async_method(HabitService.create_habit)
+    get_habit = _async_method(HabitService.get_habit)
+    list_habits = _async_method(HabitService.list_habits)
+    update_habit = _async_method(HabitService.update_habit)
+    delete_habit = _async_method(HabitService.delete_habit)
+
+
+class AsyncEventReorderingService:
+    """Versão assíncrona de EventReorderingService."""
+
+    detect_conflicts = _async_method(EventReorderingService.detect_conflicts)
+    get_conflicts_for_day = _async_method(EventReorderingService.get_conflicts_for_day)
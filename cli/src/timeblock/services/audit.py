@@ -0,0 +1,171 @@
+"""Auditoria automática de edições da agenda na tabela `changelog`.
+
+Todo flush que cria, altera ou remove um evento, hábito, instância de
+hábito ou tarefa grava o que mudou, sem chamada explícita nos services:
+
+- `before_flush` lê o histórico de atributos (valor antigo e novo de cada
+  coluna alterada) enquanto as mudanças ainda estão pendentes;
+- `after_flush`, com os ids das linhas novas já atribuídos, insere todas as
+  linhas de auditoria do flush num único executemany, na mesma transação.
+
+Se o commit falha, a auditoria some junto; gerar 365 instâncias custa um
+INSERT em lote a mais, não 365. Escritas em SQL direto não passam pelo ORM
+e não são auditadas.
+"""
+
+from datetime import UTC, date, datetime, time
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import event, inspect, tuple_
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from src.timeblock.database import get_engine_context
+from src.timeblock.models import ChangeLog, ChangeType, Event, Habit, HabitInstance, Task
+from src.timeblock.models.enum_encoding import enum_codes
+
+AUDITED_MODELS = (Event, Habit, HabitInstance, Task)
+MAX_VALUE_LENGTH = 500
+
+# Colunas de controle que não são edições
+_SKIPPED_COLUMNS = frozenset({"id", "uuid", "change_seq", "created_at", "updated_at"})
+_SCHEDULE_COLUMNS = frozenset({"scheduled_start", "scheduled_end", "scheduled_datetime", "date"})
+
+_PENDING_KEY = "audit_pending"
+_CHANGE_CODES = enum_codes(ChangeType)
+
+# SQL fixo em vez de ChangeLog.__table__.insert(): cada comando cria seu
+# engine, e o cache de compilação do SQLAlchemy morre com ele; recompilar o
+# INSERT a cada flush custava mais que executá-lo
+_INSERT_SQL = (
+    "INSERT INTO changelog "
+    "(entity, entity_id, change_type, field_name, old_value, new_value, changed_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _format(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    elif isinstance(value, datetime | date | time):
+        value = value.isoformat()
+    return str(value)[:MAX_VALUE_LENGTH]
+
+
+def _change_type(column: str) -> ChangeType:
+    if column == "status":
+        return ChangeType.STATUS_CHANGED
+    if column in _SCHEDULE_COLUMNS:
+        return ChangeType.RESCHEDULED
+    return ChangeType.UPDATED
+
+
+def _field_changes(obj: Any) -> list[tuple[ChangeType, str, str | None, str | None]]:
+    """(tipo, campo, antes, depois) de cada coluna alterada do objeto."""
+    state = inspect(obj)
+    changes = []
+    for attr in state.mapper.column_attrs:
+        key = attr.key
+        if key in _SKIPPED_COLUMNS or attr.columns[0].computed is not None:
+            continue
+        history = state.attrs[key].history
+        if not history.added:
+            continue
+        old = history.deleted[0] if history.deleted else None
+        new = history.added[0]
+        if old == new:
+            continue
+        changes.append((_change_type(key), key, _format(old), _format(new)))
+    return changes
+
+
+@event.listens_for(OrmSession, "before_flush")
+def _collect_changes(session: OrmSession, flush_context: Any, instances: Any) -> None:
+    # Linhas novas só têm id depois do flush: guarda o objeto e resolve no after_flush
+    pending: list[tuple[Any, ChangeType, str | None, str | None, str | None]] = []
+    for obj in session.new:
+        if isinstance(obj, AUDITED_MODELS):
+            pending.append((obj, ChangeType.CREATED, None, None, None))
+    for obj in session.dirty:
+        if isinstance(obj, AUDITED_MODELS):
+            pending.extend((obj, *change) for change in _field_changes(obj))
+    for obj in session.deleted:
+        if isinstance(obj, AUDITED_MODELS):
+            # Depois do DELETE não dá mais para carregar o id de um objeto expirado
+            obj.id  # noqa: B018
+            pending.append((obj, ChangeType.DELETED, None, None, None))
+    session.info[_PENDING_KEY] = pending
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _write_changes(session: OrmSession, flush_context: Any) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    # Mesmo formato texto que o tipo DateTime do SQLAlchemy grava no SQLite
+    changed_at = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S.%f")
+    rows = [
+        (
+            obj.__table__.name,
+            obj.id,
+            _CHANGE_CODES[change_type],
+            field_name,
+            old_value,
+            new_value,
+            changed_at,
+        )
+        for obj, change_type, field_name, old_value, new_value in pending
+    ]
+    session.connection().exec_driver_sql(_INSERT_SQL, rows)
+
+
+class AuditService:
+    """Consulta do histórico de edições."""
+
+    @staticmethod
+    def history(
+        limit: int = 20,
+        before: tuple[datetime, int] | None = None,
+        entity: str | None = None,
+        entity_id: int | None = None,
+        session: Session | None = None,
+    ) -> list[ChangeLog]:
+        """Página do histórico, da mudança mais recente para a mais antiga.
+
+        Paginação por keyset em (changed_at, id): a próxima página começa
+        antes da última linha desta, sem OFFSET, então o custo por página é
+        constante mesmo no fim do histórico.
+
+        Args:
+            limit: Linhas por página
+            before: (changed_at, id) da última linha da página anterior
+            entity: Filtra por tabela (ex.: "habitinstance")
+            entity_id: Filtra por id local (exige `entity`)
+            session: Optional session (for tests/transactions)
+
+        Returns:
+            Mudanças em ordem decrescente de (changed_at, id)
+        """
+
+        def _history(sess: Session) -> list[ChangeLog]:
+            statement = select(ChangeLog)
+            if before is not None:
+                statement = statement.where(tuple_(ChangeLog.changed_at, ChangeLog.id) < before)
+            if entity is not None:
+                statement = statement.where(ChangeLog.entity == entity)
+                if entity_id is not None:
+                    statement = statement.where(ChangeLog.entity_id == entity_id)
+            statement = statement.order_by(
+                ChangeLog.changed_at.desc(),  # type: ignore[attr-defined]
+                ChangeLog.id.desc(),  # type: ignore[union-attr]
+            ).limit(limit)
+            return list(sess.exec(statement).all())
+
+        if session is not None:
+            return _history(session)
+
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _history(sess)
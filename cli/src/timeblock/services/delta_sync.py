@@ -0,0 +1,343 @@
+"""Export/import por delta de `change_seq` para sincronizar dois bancos.
+
+Em vez de copiar o arquivo SQLite inteiro entre desktop e Termux, o export
+leva só as linhas com `change_seq` na faixa (since, until] e as lápides das
+removidas, e o import as aplica em upserts por lote. Depois de um dia de
+uso são kilobytes.
+
+Formato (JSON Lines, uma linha por registro):
+    {"format": "timeblock-delta", "version": 1, "since": 0, "until": 42}
+    {"table": "habits", "op": "upsert", "columns": ["uuid", "routine_id", ...]}
+    ["0192...", "0191...", ...]
+    {"table": "habits", "op": "delete"}
+    ["0192..."]
+
+Cabeçalhos são objetos e linhas de dados são arrays com os valores como
+estão no SQLite. Ids locais não viajam: `uuid` identifica a linha e as FKs
+levam o `uuid` da linha referenciada, traduzido de volta para o id local no
+import. Upserts vão em ordem de dependência (pais primeiro) e remoções na
+ordem inversa.
+
+Conflitos não são resolvidos aqui: a última importação vence.
+
+O import escreve em SQL direto, fora do flush do ORM, e grava ele mesmo as
+operações aplicadas na `sync_queue`: sem elas o replay não reconstruiria as
+linhas importadas.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, TextIO
+from uuid import UUID
+
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+
+from src.timeblock.database import get_engine_context, get_readonly_engine_context
+from src.timeblock.models.change_tracking import SYNC_STATE_ID, SYNCED_TABLES
+from src.timeblock.services.sync_queue import record_deletes, record_rows
+
+FORMAT = "timeblock-delta"
+FORMAT_VERSION = 1
+BATCH_SIZE = 500
+
+# Colunas locais: não viajam no delta
+_LOCAL_COLUMNS = frozenset({"id", "change_seq"})
+
+
+@dataclass(frozen=True)
+class DeltaStats:
+    """Resumo de um export ou import."""
+
+    since: int
+    until: int
+    upserts: int
+    deletes: int
+
+
+def _table(name: str) -> Table:
+    return SQLModel.metadata.tables[name]
+
+
+def _synced_columns(table: Table) -> list[tuple[str, str | None]]:
+    """(coluna, tabela referenciada ou None), com `uuid` primeiro.
+
+    Ficam de fora id, change_seq e colunas geradas pelo SQLite.
+    """
+    columns = [("uuid", None)]
+    for column in table.columns:
+        if column.name in _LOCAL_COLUMNS or column.name == "uuid" or column.computed is not None:
+            continue
+        parent = next(iter(column.foreign_keys), None)
+        columns.append((column.name, None if parent is None else parent.column.table.name))
+    return columns
+
+
+def _line(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def _batched(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def read_seq(conn: Connection) -> int:
+    """Valor atual do contador de mudanças (`sync_state.counter`)."""
+    return conn.exec_driver_sql(
+        "SELECT counter FROM sync_state WHERE id = ?", (SYNC_STATE_ID,)
+    ).scalar_one()
+
+
+def synced_columns(name: str) -> list[str]:
+    """Colunas de `name` que viajam no delta, com `uuid` primeiro."""
+    return [column for column, _ in _synced_columns(_table(name))]
+
+
+def synced_rows(
+    conn: Connection, name: str, where: str = "", params: tuple[Any, ...] = ()
+) -> Iterator[list[Any]]:
+    """Linhas de `name` no formato do delta, na ordem de `synced_columns`.
+
+    Valores saem como estão no SQLite, com `uuid` e FKs trocados pelo uuid
+    (em hex) da linha. `where` é o resto da query sobre o alias `t`
+    (ex.: "WHERE t.change_seq > ? ORDER BY t.change_seq").
+    """
+    columns = _synced_columns(_table(name))
+    select_list, joins = [], []
+    for index, (column, parent) in enumerate(columns):
+        if parent is None:
+            select_list.append(f"t.{column}")
+        else:
+            select_list.append(f"p{index}.uuid")
+            joins.append(f"LEFT JOIN {parent} AS p{index} ON p{index}.id = t.{column}")
+    uuid_positions = [0] + [i for i, (_, parent) in enumerate(columns) if parent is not None]
+
+    result = conn.execution_options(yield_per=BATCH_SIZE).exec_driver_sql(
+        f"SELECT {', '.join(select_list)} FROM {name} AS t {' '.join(joins)} {where}", params
+    )
+    for row in result:
+        values = list(row)
+        for position in uuid_positions:
+            if values[position] is not None:
+                values[position] = bytes(values[position]).hex()
+        yield values
+
+
+def write_header(out: TextIO, since: int, until: int) -> None:
+    """Cabeçalho do arquivo de delta."""
+    out.write(_line({"format": FORMAT, "version": FORMAT_VERSION, "since": since, "until": until}))
+
+
+def write_upserts(out: TextIO, name: str, rows: Iterable[list[Any]]) -> int:
+    """Seção de upserts de `name` (omitida se não houver linhas)."""
+    count = 0
+    for values in rows:
+        if count == 0:
+            out.write(_line({"table": name, "op": "upsert", "columns": synced_columns(name)}))
+        out.write(_line(values))
+        count += 1
+    return count
+
+
+def _export_upserts(conn: Connection, out: TextIO, name: str, since: int, until: int) -> int:
+    rows = synced_rows(
+        conn,
+        name,
+        "WHERE t.change_seq > ? AND t.change_seq <= ? ORDER BY t.change_seq",
+        (since, until),
+    )
+    return write_upserts(out, name, rows)
+
+
+def _export_deletes(conn: Connection, out: TextIO, name: str, since: int, until: int) -> int:
+    # Lápides de linhas que voltaram a existir (mesmo uuid) ficam de fora
+    result = conn.exec_driver_sql(
+        f"SELECT s.entity_uuid FROM sync_tombstone AS s "
+        f"WHERE s.entity = ? AND s.change_seq > ? AND s.change_seq <= ? "
+        f"AND NOT EXISTS (SELECT 1 FROM {name} AS t WHERE t.uuid = s.entity_uuid) "
+        "ORDER BY s.change_seq",
+        (name, since, until),
+    )
+    count = 0
+    for (entity_uuid,) in result:
+        if count == 0:
+            out.write(_line({"table": name, "op": "delete"}))
+        out.write(_line([bytes(entity_uuid).hex()]))
+        count += 1
+    return count
+
+
+def _resolve_ids(conn: Connection, parent: str, hex_uuids: set[str]) -> dict[str, int]:
+    """Ids locais das linhas de `parent` com esses uuids."""
+    ids: dict[str, int] = {}
+    for batch in _batched(hex_uuids, BATCH_SIZE):
+        placeholders = ", ".join("?" * len(batch))
+        rows = conn.exec_driver_sql(
+            f"SELECT uuid, id FROM {parent} WHERE uuid IN ({placeholders})",
+            tuple(bytes.fromhex(value) for value in batch),
+        )
+        ids.update((bytes(row_uuid).hex(), row_id) for row_uuid, row_id in rows)
+    return ids
+
+
+def _apply_upserts(conn: Connection, name: str, header: list[str], rows: list[list[Any]]) -> None:
+    parents = dict(_synced_columns(_table(name)))
+    unknown = [column for column in header if column not in parents]
+    if unknown:
+        raise ValueError(f"{name}: colunas desconhecidas no delta: {', '.join(unknown)}")
+
+    if "uuid" not in header:
+        raise ValueError(f"{name}: seção de upsert sem a coluna uuid")
+    uuid_position = header.index("uuid")
+    hex_uuids = [row[uuid_position] for row in rows]
+    existing = _resolve_ids(conn, name, set(hex_uuids))
+
+    for position, column in enumerate(header):
+        parent = parents[column]
+        if column == "uuid":
+            for row in rows:
+                row[position] = bytes.fromhex(row[position])
+        elif parent is not None:
+            wanted = {row[position] for row in rows if row[position] is not None}
+            ids = _resolve_ids(conn, parent, wanted)
+            missing = wanted - ids.keys()
+            if missing:
+                raise ValueError(
+                    f"{name}.{column} referencia {parent} inexistente: {sorted(missing)[0]}"
+                )
+            for row in rows:
+                if row[position] is not None:
+                    row[position] = ids[row[position]]
+
+    updates = ", ".join(f"{column} = excluded.{column}" for column in header if column != "uuid")
+    conn.exec_driver_sql(
+        f"INSERT INTO {name} ({', '.join(header)}) VALUES ({', '.join('?' * len(header))}) "
+        f"ON CONFLICT (uuid) DO UPDATE SET {updates}",
+        [tuple(row) for row in rows],
+    )
+    record_rows(
+        conn,
+        name,
+        [UUID(value) for value in hex_uuids],
+        {UUID(value) for value in hex_uuids if value not in existing},
+    )
+
+
+def _apply_deletes(conn: Connection, name: str, rows: list[list[Any]]) -> None:
+    # Só as linhas que existiam aqui viram operação na fila
+    removed = _resolve_ids(conn, name, {row[0] for row in rows})
+    placeholders = ", ".join("?" * len(rows))
+    conn.exec_driver_sql(
+        f"DELETE FROM {name} WHERE uuid IN ({placeholders})",
+        tuple(bytes.fromhex(row[0]) for row in rows),
+    )
+    record_deletes(conn, name, [(row_id, UUID(value)) for value, row_id in removed.items()])
+
+
+def _read_header(record: Any) -> dict[str, Any]:
+    if not isinstance(record, dict) or record.get("format") != FORMAT:
+        raise ValueError("Arquivo não é um delta do TimeBlock")
+    if record.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Versão de delta não suportada: {record.get('version')}")
+    return record
+
+
+def _read_section(record: dict[str, Any]) -> dict[str, Any]:
+    if record.get("table") not in SYNCED_TABLES or record.get("op") not in ("upsert", "delete"):
+        raise ValueError(f"Seção inválida no delta: {record!r}")
+    return record
+
+
+class DeltaSyncService:
+    """Export e import de mudanças por faixa de change_seq."""
+
+    @staticmethod
+    def current_seq() -> int:
+        """Último change_seq atribuído neste banco."""
+        with get_readonly_engine_context() as engine, engine.connect() as conn:
+            return read_seq(conn)
+
+    @staticmethod
+    def export_changes(out: TextIO, since: int = 0) -> DeltaStats:
+        """Escreve no `out` o delta das mudanças posteriores a `since`.
+
+        Tudo é lido num único snapshot: `until` é o contador nesse instante
+        e deve ser o `since` do próximo export para o mesmo destino.
+
+        Args:
+            out: Destino de texto (arquivo ou stdout)
+            since: Último change_seq já enviado (0 para tudo)
+
+        Returns:
+            Faixa exportada e contagens
+        """
+        with get_readonly_engine_context() as engine, engine.connect() as conn:
+            until = read_seq(conn)
+            write_header(out, since, until)
+            upserts = sum(_export_upserts(conn, out, name, since, until) for name in SYNCED_TABLES)
+            deletes = sum(
+                _export_deletes(conn, out, name, since, until) for name in reversed(SYNCED_TABLES)
+            )
+        return DeltaStats(since, until, upserts, deletes)
+
+    @staticmethod
+    def import_changes(lines: Iterable[str]) -> DeltaStats:
+        """Aplica um delta numa única transação, em upserts por lote.
+
+        Os triggers de change_seq ficam desligados durante o import: as
+        linhas recebidas não voltam no próximo export deste banco. Elas
+        entram na `sync_queue`, como as escritas do ORM, para o replay.
+
+        Args:
+            lines: Linhas do arquivo gerado por `export_changes`
+
+        Returns:
+            Faixa do delta e contagens aplicadas
+
+        Raises:
+            ValueError: Arquivo inválido ou FK para linha que não existe aqui
+        """
+        records = (json.loads(line) for line in lines if line.strip())
+        header = _read_header(next(records, None))
+        upserts = deletes = 0
+
+        with get_engine_context() as engine, engine.begin() as conn:
+
+            def apply(section: dict[str, Any] | None, batch: list[list[Any]]) -> None:
+                nonlocal upserts, deletes
+                if section is None or not batch:
+                    return
+                if section["op"] == "delete":
+                    _apply_deletes(conn, section["table"], batch)
+                    deletes += len(batch)
+                else:
+                    _apply_upserts(conn, section["table"], section["columns"], batch)
+                    upserts += len(batch)
+
+            conn.exec_driver_sql(
+                "UPDATE sync_state SET importing = 1 WHERE id = ?", (SYNC_STATE_ID,)
+            )
+            section: dict[str, Any] | None = None
+            batch: list[list[Any]] = []
+            for record in records:
+                if isinstance(record, dict):
+                    apply(section, batch)
+                    section, batch = _read_section(record), []
+                    continue
+                if section is None:
+                    raise ValueError("Linha de dados antes do primeiro cabeçalho de seção")
+                batch.append(record)
+                if len(batch) == BATCH_SIZE:
+                    apply(section, batch)
+                    batch = []
+            apply(section, batch)
+            conn.exec_driver_sql(
+                "UPDATE sync_state SET importing = 0 WHERE id = ?", (SYNC_STATE_ID,)
+            )
+
+        return DeltaStats(header["since"], header["until"], upserts, deletes)
@@ -1,11 +1,13 @@
 """Serviço para detecção de conflitos de eventos."""
 
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 
-from sqlmodel import Session, or_, select
+from sqlalchemy import select as sa_select
+from sqlmodel import Session, and_, or_
 
 from src.timeblock.database import get_engine_context
-from src.timeblock.models import Event, HabitInstance, Task
+from src.timeblock.models import ScheduleItem, schedule_item
+from src.timeblock.models.time_encoding import to_epoch_minutes
 
 from .event_reordering_models import Conflict, ConflictType
 
@@ -35,44 +37,28 @@ class EventReorderingService:
         """
 
         def _detect(sess: Session) -> list[Conflict]:
-            triggered = EventReorderingService._get_event_by_type(
-                sess, triggered_event_id, event_type
-            )
-            if not triggered:
-                return []
-
-            start, end = EventReorderingService._get_event_times(triggered, event_type)
-            if not start or not end:
+            row = sess.exec(
+                sa_select(schedule_item).where(
+                    schedule_item.c.kind == event_type,
+                    schedule_item.c.id == triggered_event_id,
+                )
+            ).first()
+            if row is None or row.start_min is None or row.end_min is None:
                 return []
+            triggered = ScheduleItem(**row._mapping)
 
-            conflicting_events = EventReorderingService._get_events_in_range(
-                sess, start, end, triggered_event_id, event_type
+            statement = sa_select(schedule_item).where(
+                schedule_item.c.start_min < triggered.end_min,
+                schedule_item.c.end_min > triggered.start_min,
+                or_(
+                    schedule_item.c.kind != event_type,
+                    schedule_item.c.id != triggered_event_id,
+                ),
             )
-
-            conflicts = []
-            for conf_event, conf_type in conflicting_events:
-                conf_start, conf_end = EventReorderingService._get_event_times(
-                    conf_event, conf_type
-                )
-                if not conf_start or not conf_end:
-                    continue
-
-                if EventReorderingService._has_overlap(start, end, conf_start, conf_end):
-                    conflicts.append(
-                        Conflict(
-                            triggered_event_id=triggered_event_id,
-                            triggered_event_type=event_type,
-                            conflicting_event_id=conf_event.id,
-                            conflicting_event_type=conf_type,
-                            conflict_type=ConflictType.OVERLAP,
-                            triggered_start=start,
-                            triggered_end=end,
-                            conflicting_start=conf_start,
-                            conflicting_end=conf_end,
-                        )
-                    )
-
-            return conflicts
+            return [
+                EventReorderingService._build_conflict(triggered, ScheduleItem(**other._mapping))
+                for other in sess.exec(statement)
+            ]
 
         if session is not None:
             return _detect(session)
@@ -99,69 +85,38 @@ class EventReorderingService:
         """
 
         def _get_conflicts(sess: Session) -> list[Conflict]:
-            all_conflicts = []
-
-            # Busca todos os eventos do dia
-            day_start = datetime.combine(target_date, datetime.min.time())
-            day_end = datetime.combine(target_date, datetime.max.time())
-
-            # Busca todas as tasks do dia
-            task_stmt = select(Task).where(Task.scheduled_datetime.between(day_start, day_end))
-            tasks = list(sess.exec(task_stmt).all())
-
-            # Busca todas as instâncias de hábitos do dia
-            habit_stmt = select(HabitInstance).where(HabitInstance.date == target_date)
-            habits = list(sess.exec(habit_stmt).all())
-
-            # Busca todos os eventos do dia
-            event_stmt = select(Event).where(
-                or_(
-                    Event.scheduled_start.between(day_start, day_end),
-                    Event.scheduled_end.between(day_start, day_end),
-                    (Event.scheduled_start <= day_start) & (Event.scheduled_end >= day_end),
+            day_start = to_epoch_minutes(datetime.combine(target_date, datetime.min.time()))
+            day_end = day_start + 24 * 60
+
+            # Itens do dia (uma query na view), depois self-join para os pares
+            day_items = (
+                sa_select(schedule_item)
+                .where(
+                    schedule_item.c.start_min < day_end,
+                    schedule_item.c.end_min > day_start,
                 )
+                .cte("day_items")
+            )
+            first = day_items.alias("first")
+            second = day_items.alias("second")
+            statement = sa_select(first, second).where(
+                first.c.start_min < second.c.end_min,
+                second.c.start_min < first.c.end_min,
+                # Cada par (A, B) aparece uma única vez
+                or_(
+                    first.c.kind < second.c.kind,
+                    and_(first.c.kind == second.c.kind, first.c.id < second.c.id),
+                ),
             )
-            events = list(sess.exec(event_stmt).all())
-
-            # Verifica cada task contra os outros
-            for task in tasks:
-                task_conflicts = EventReorderingService.detect_conflicts(
-                    task.id, "task", session=sess
-                )
-                all_conflicts.extend(task_conflicts)
-
-            # Verifica cada instância de hábito contra os outros
-            for habit in habits:
-                habit_conflicts = EventReorderingService.detect_conflicts(
-                    habit.id, "habit_instance", session=sess
-                )
-                all_conflicts.extend(habit_conflicts)
-
-            # Verifica cada evento contra os outros
-            for event in events:
-                event_conflicts = EventReorderingService.detect_conflicts(
-                    event.id, "event", session=sess
-                )
-                all_conflicts.extend(event_conflicts)
-
-            # Remove conflitos duplicados (A vs B e B vs A)
-            unique_conflicts = []
-            seen_pairs = set()
-
-            for conflict in all_conflicts:
-                pair = tuple(
-                    sorted(
-                        [
-                            (conflict.triggered_event_id, conflict.triggered_event_type),
-                            (conflict.conflicting_event_id, conflict.conflicting_event_type),
-                        ]
-                    )
-                )
-                if pair not in seen_pairs:
-                    seen_pairs.add(pair)
-                    unique_conflicts.append(conflict)
 
-            return unique_conflicts
+            conflicts = []
+            for row in sess.exec(statement):
+                values = tuple(row)
+                width = len(schedule_item.c)
+                triggered = ScheduleItem(*values[:width])
+                other = ScheduleItem(*values[width:])
+                conflicts.append(EventReorderingService._build_conflict(triggered, other))
+            return conflicts
 
         if session is not None:
             return _get_conflicts(session)
@@ -170,81 +125,16 @@ class EventReorderingService:
             return _get_conflicts(sess)
 
     @staticmethod
-    def _get_event_by_type(
-        session: Session, event_id: int, event_type: str
-    ) -> Task | HabitInstance | Event | None:
-        """Busca evento por tipo."""
-        if event_type == "task":
-            return session.get(Task, event_id)
-        elif event_type == "habit_instance":
-            return session.get(HabitInstance, event_id)
-        elif event_type == "event":
-            return session.get(Event, event_id)
-        return None
-
-    @staticmethod
-    def _get_event_times(
-        event: Task | HabitInstance | Event, event_type: str
-    ) -> tuple[datetime | None, datetime | None]:
-        """Obtém horários de início e fim do evento."""
-        if event_type == "task":
-            if event.scheduled_datetime:
-                # Assume duração de 1 hora para tasks
-                return event.scheduled_datetime, event.scheduled_datetime + timedelta(hours=1)
-        elif event_type == "habit_instance":
-            if event.scheduled_start and event.scheduled_end:
-                start = datetime.combine(event.date, event.scheduled_start)
-                end = datetime.combine(event.date, event.scheduled_end)
-                return start, end
-        elif event_type == "event":
-            if event.scheduled_start and event.scheduled_end:
-                return event.scheduled_start, event.scheduled_end
-        return None, None
-
-    @staticmethod
-    def _get_events_in_range(
-        session: Session,
-        start: datetime,
-        end: datetime,
-        exclude_id: int,
-        exclude_type: str,
-    ) -> list[tuple[Task | HabitInstance | Event, str]]:
-        """Busca todos os eventos que podem conflitar no intervalo de tempo."""
-        events = []
-
-        # Busca tasks
-        task_stmt = select(Task).where(
-            Task.scheduled_datetime.between(start - timedelta(hours=1), end + timedelta(hours=1))
-        )
-        if exclude_type == "task":
-            task_stmt = task_stmt.where(Task.id != exclude_id)
-        for task in session.exec(task_stmt).all():
-            events.append((task, "task"))
-
-        # Busca instâncias de hábitos
-        date = start.date()
-        habit_stmt = select(HabitInstance).where(HabitInstance.date == date)
-        if exclude_type == "habit_instance":
-            habit_stmt = habit_stmt.where(HabitInstance.id != exclude_id)
-        for habit in session.exec(habit_stmt).all():
-            events.append((habit, "habit_instance"))
-
-        # Busca eventos
-        event_stmt = select(Event).where(
-            or_(
-                Event.scheduled_start.between(start, end),
-                Event.scheduled_end.between(start, end),
-                (Event.scheduled_start <= start) & (Event.scheduled_end >= end),
-            )
+    def _build_conflict(triggered: ScheduleItem, other: ScheduleItem) -> Conflict:
+        """Monta Conflict a partir de dois itens da view schedule_item."""
+        return Conflict(
+            triggered_event_id=triggered.id,
+            triggered_event_type=triggered.kind,
+            conflicting_event_id=other.id,
+            conflicting_event_type=other.kind,
+            conflict_type=ConflictType.OVERLAP,
+            triggered_start=triggered.start,
+            triggered_end=triggered.end,
+            conflicting_start=other.start,
+            conflicting_end=other.end,
         )
-        if exclude_type == "event":
-            event_stmt = event_stmt.where(Event.id != exclude_id)
-        for evt in session.exec(event_stmt).all():
-            events.append((evt, "event"))
-
-        return events
-
-    @staticmethod
-    def _has_overlap(start1: datetime, end1: datetime, start2: datetime, end2: datetime) -> bool:
-        """Verifica se dois intervalos de tempo se sobrepõem."""
-        return start1 < end2 and start2 < end1
@@ -4,7 +4,7 @@ from datetime import date, time, timedelta
 
 from sqlmodel import Session, select
 
-from src.timeblock.database import get_engine_context
+from src.timeblock.database import cached_query, get_engine_context
 from src.timeblock.models import Habit, HabitInstance, Recurrence
 from src.timeblock.models.enums import NotDoneSubstatus, SkipReason, Status
 from src.timeblock.models.time_log import TimeLog
@@ -12,6 +12,7 @@ from src.timeblock.utils.logger import get_logger
 
 from .event_reordering_models import Conflict
 from .event_reordering_service import EventReorderingService
+from .outbox import EventType, record_event
 
 logger = get_logger(__name__)
 
@@ -28,13 +29,19 @@ class HabitInstanceService:
     ) -> list[HabitInstance]:
         """Gera instâncias de hábito para período."""
         logger.info(
-            f"Gerando instâncias para habit_id={habit_id}, período={start_date} até {end_date}"
+            "Gerando instâncias para habit_id=%s, período=%s até %s",
+            habit_id,
+            start_date,
+            end_date,
+            extra={"habit_id": habit_id},
         )
 
         def _generate(sess: Session) -> list[HabitInstance]:
             habit = sess.get(Habit, habit_id)
             if not habit:
-                logger.error(f"Hábito não encontrado: habit_id={habit_id}")
+                logger.error(
+                    "Hábito não encontrado: habit_id=%s", habit_id, extra={"habit_id": habit_id}
+                )
                 raise ValueError(f"Habit {habit_id} not found")
 
             instances = []
@@ -57,7 +64,12 @@ class HabitInstanceService:
             for instance in instances:
                 sess.refresh(instance)
 
-            logger.info(f"Criadas {len(instances)} instâncias para habit_id={habit_id}")
+            logger.info(
+                "Criadas %d instâncias para habit_id=%s",
+                len(instances),
+                habit_id,
+                extra={"habit_id": habit_id, "count": len(instances)},
+            )
             return instances
 
         if session is not None:
@@ -66,6 +78,45 @@ class HabitInstanceService:
         with get_engine_context() as engine, Session(engine) as sess:
             return _generate(sess)
 
+    @staticmethod
+    @cached_query
+    def list_instances(
+        habit_id: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        session: Session | None = None,
+    ) -> list[HabitInstance]:
+        """Lista instâncias por hábito e/ou período, ordenadas por data e horário.
+
+        Args:
+            habit_id: Só instâncias deste hábito
+            start_date: Data inicial (inclusive)
+            end_date: Data final (inclusive)
+            session: Sessão opcional
+
+        Returns:
+            Instâncias encontradas
+        """
+
+        def _list(sess: Session) -> list[HabitInstance]:
+            statement = select(HabitInstance)
+            if habit_id is not None:
+                statement = statement.where(HabitInstance.habit_id == habit_id)
+            if start_date is not None:
+                statement = statement.where(HabitInstance.date >= start_date)
+            if end_date is not None:
+                statement = statement.where(HabitInstance.date <= end_date)
+            statement = statement.order_by(
+                HabitInstance.date, HabitInstance.scheduled_start, HabitInstance.id
+            )
+            return list(sess.exec(statement).all())
+
+        if session is not None:
+            return _list(session)
+
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _list(sess)
+
     @staticmethod
     def adjust_instance_time(
         instance_id: int,
@@ -89,21 +140,32 @@ class HabitInstanceService:
             Tupla (instância atualizada, lista de conflitos detectados ou None)
         """
         logger.debug(
-            f"Ajustando horário instance_id={instance_id}, new_start={new_start}, new_end={new_end}"
+            "Ajustando horário instance_id=%s, new_start=%s, new_end=%s",
+            instance_id,
+            new_start,
+            new_end,
+            extra={"instance_id": instance_id},
         )
 
         # Validação
         if new_start is not None and new_end is not None and new_start >= new_end:
             logger.warning(
-                f"Horário inválido para instance_id={instance_id}: "
-                f"start={new_start} >= end={new_end}"
+                "Horário inválido para instance_id=%s: start=%s >= end=%s",
+                instance_id,
+                new_start,
+                new_end,
+                extra={"instance_id": instance_id},
             )
             raise ValueError("Start time must be before end time")
 
         def _adjust(sess: Session) -> tuple[HabitInstance, bool]:
             instance = sess.get(HabitInstance, instance_id)
             if not instance:
-                logger.error(f"Instância não encontrada: instance_id={instance_id}")
+                logger.error(
+                    "Instância não encontrada: instance_id=%s",
+                    instance_id,
+                    extra={"instance_id": instance_id},
+                )
                 raise ValueError(f"HabitInstance {instance_id} not found")
 
             time_changed = False
@@ -118,8 +180,11 @@ class HabitInstanceService:
 
             if time_changed:
                 logger.info(
-                    f"Horário ajustado para instance_id={instance_id}, "
-                    f"novo horário={instance.scheduled_start}-{instance.scheduled_end}"
+                    "Horário ajustado para instance_id=%s, novo horário=%s-%s",
+                    instance_id,
+                    instance.scheduled_start,
+                    instance.scheduled_end,
+                    extra={"instance_id": instance_id},
                 )
 
             sess.add(instance)
@@ -144,8 +209,10 @@ class HabitInstanceService:
 
             if conflicts:
                 logger.warning(
-                    f"Conflitos detectados para instance_id={instance_id}: "
-                    f"{len(conflicts)} conflito(s)"
+                    "Conflitos detectados para instance_id=%s: %d conflito(s)",
+                    instance_id,
+                    len(conflicts),
+                    extra={"instance_id": instance_id, "conflicts": len(conflicts)},
                 )
 
         return instance, conflicts
@@ -180,23 +247,32 @@ class HabitInstanceService:
             - completion_percentage → None
         """
         logger.debug(
-            f"Skip habit_instance_id={habit_instance_id}, "
-            f"reason={skip_reason.value}, note={skip_note}"
+            "Skip habit_instance_id=%s, reason=%s, note=%s",
+            habit_instance_id,
+            skip_reason.value,
+            skip_note,
+            extra={"instance_id": habit_instance_id},
         )
 
         def _skip(sess: Session) -> HabitInstance:
             # 1. Validação: nota <= 500 chars
             if skip_note and len(skip_note) > 500:
                 logger.warning(
-                    f"Skip note muito longa para instance_id={habit_instance_id}: "
-                    f"{len(skip_note)} chars"
+                    "Skip note muito longa para instance_id=%s: %d chars",
+                    habit_instance_id,
+                    len(skip_note),
+                    extra={"instance_id": habit_instance_id},
                 )
                 raise ValueError("Skip note must be <= 500 characters")
 
             # 2. Buscar HabitInstance
             instance = sess.get(HabitInstance, habit_instance_id)
             if not instance:
-                logger.error(f"HabitInstance não encontrada: {habit_instance_id}")
+                logger.error(
+                    "HabitInstance não encontrada: %s",
+                    habit_instance_id,
+                    extra={"instance_id": habit_instance_id},
+                )
                 raise ValueError(f"HabitInstance {habit_instance_id} not found")
 
             # 3. Validação: não pode ter timer ativo
@@ -207,14 +283,18 @@ class HabitInstanceService:
             active_timer = sess.exec(statement).first()
             if active_timer:
                 logger.warning(
-                    f"Tentativa de skip com timer ativo: instance_id={habit_instance_id}"
+                    "Tentativa de skip com timer ativo: instance_id=%s",
+                    habit_instance_id,
+                    extra={"instance_id": habit_instance_id},
                 )
                 raise ValueError("Cannot skip with active timer. Stop timer first.")
 
             # 4. Validação: não pode skip se já completada
             if instance.status == Status.DONE:
                 logger.warning(
-                    f"Tentativa de skip de instance completada: instance_id={habit_instance_id}"
+                    "Tentativa de skip de instance completada: instance_id=%s",
+                    habit_instance_id,
+                    extra={"instance_id": habit_instance_id},
                 )
                 raise ValueError("Cannot skip completed instance")
 
@@ -231,13 +311,22 @@ class HabitInstanceService:
             # 6. Validar consistência (BR-HABIT-INSTANCE-STATUS-001)
             instance.validate_status_consistency()
 
-            # 7. Persistir
+            # 7. Persistir (evento no outbox, mesma transação)
             sess.add(instance)
+            record_event(
+                sess,
+                EventType.HABIT_INSTANCE_SKIPPED,
+                instance,
+                {"date": instance.date, "skip_reason": skip_reason.value, "skip_note": skip_note},
+            )
             sess.commit()
             sess.refresh(instance)
 
             logger.info(
-                f"Instance skipped: instance_id={habit_instance_id}, reason={skip_reason.value}"
+                "Instance skipped: instance_id=%s, reason=%s",
+                habit_instance_id,
+                skip_reason.value,
+                extra={"instance_id": habit_instance_id, "reason": skip_reason.value},
             )
             return instance
 
@@ -253,22 +342,35 @@ class HabitInstanceService:
         session: Session | None = None,
     ) -> HabitInstance | None:
         """Marca instância como completa."""
-        logger.debug(f"Marcando como completa: instance_id={instance_id}")
+        logger.debug(
+            "Marcando como completa: instance_id=%s",
+            instance_id,
+            extra={"instance_id": instance_id},
+        )
 
         def _mark(sess: Session) -> HabitInstance | None:
             instance = sess.get(HabitInstance, instance_id)
             if not instance:
                 logger.warning(
-                    f"Tentativa de completar instância inexistente: instance_id={instance_id}"
+                    "Tentativa de completar instância inexistente: instance_id=%s",
+                    instance_id,
+                    extra={"instance_id": instance_id},
                 )
                 return None
 
             instance.status = Status.DONE
             sess.add(instance)
+            record_event(
+                sess, EventType.HABIT_INSTANCE_COMPLETED, instance, {"date": instance.date}
+            )
             sess.commit()
             sess.refresh(instance)
 
-            logger.info(f"Instância completada: instance_id={instance_id}")
+            logger.info(
+                "Instância completada: instance_id=%s",
+                instance_id,
+                extra={"instance_id": instance_id},
+            )
             return instance
 
         if session is not None:
@@ -286,22 +388,34 @@ class HabitInstanceService:
 
         DEPRECATED: Use skip_habit_instance() com categoria para BR-HABIT-SKIP-001.
         """
-        logger.debug(f"Marcando como pulada: instance_id={instance_id}")
+        logger.debug(
+            "Marcando como pulada: instance_id=%s", instance_id, extra={"instance_id": instance_id}
+        )
 
         def _mark(sess: Session) -> HabitInstance | None:
             instance = sess.get(HabitInstance, instance_id)
             if not instance:
                 logger.warning(
-                    f"Tentativa de pular instância inexistente: instance_id={instance_id}"
+                    "Tentativa de pular instância inexistente: instance_id=%s",
+                    instance_id,
+                    extra={"instance_id": instance_id},
                 )
                 return None
 
             instance.status = Status.NOT_DONE
             sess.add(instance)
+            record_event(
+                sess,
+                EventType.HABIT_INSTANCE_SKIPPED,
+                instance,
+                {"date": instance.date, "skip_reason": None, "skip_note": None},
+            )
             sess.commit()
             sess.refresh(instance)
 
-            logger.info(f"Instância pulada: instance_id={instance_id}")
+            logger.info(
+                "Instância pulada: instance_id=%s", instance_id, extra={"instance_id": instance_id}
+            )
             return instance
 
         if session is not None:
@@ -2,9 +2,10 @@
 
 from datetime import time
 
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from src.timeblock.database import get_engine_context
+from src.timeblock.database.catalog import get_catalog
 from src.timeblock.models import Habit, Recurrence
 
 
@@ -52,10 +53,10 @@ class HabitService:
 
     @staticmethod
     def get_habit(habit_id: int, session: Session | None = None) -> Habit | None:
-        """Busca hábito por ID."""
+        """Busca hábito por ID (servido pelo catálogo em memória)."""
 
         def _get(sess: Session) -> Habit | None:
-            return sess.get(Habit, habit_id)
+            return get_catalog().get(Habit, habit_id, sess)
 
         if session is not None:
             return _get(session)
@@ -71,10 +72,10 @@ class HabitService:
         """Lista hábitos, opcionalmente filtrados por rotina."""
 
         def _list(sess: Session) -> list[Habit]:
-            statement = select(Habit)
-            if routine_id is not None:
-                statement = statement.where(Habit.routine_id == routine_id)
-            return list(sess.exec(statement).all())
+            habits = get_catalog().all(Habit, sess)
+            if routine_id is None:
+                return habits
+            return [habit for habit in habits if habit.routine_id == routine_id]
 
         if session is not None:
             return _list(session)
@@ -0,0 +1,308 @@
+"""Diff entre dois bancos por árvore de hashes (Merkle) sobre faixas de chave.
+
+Quando desktop e Termux divergem (ADR-012), comparar linha a linha exige
+mandar a tabela inteira pelo link. Aqui cada lado resume suas tabelas numa
+árvore de hashes e os dois trocam só os resumos dos ramos que diferem:
+
+- A chave de cada linha é o hash do seu `uuid` (ids são locais de cada
+  dispositivo e uuid v7 começa pelo timestamp, o que concentraria tudo num
+  mesmo ramo). Um ramo é um prefixo hex dessa chave, com 16 filhos.
+- O hash de uma linha cobre os valores que viajam no delta (FKs pelo uuid
+  da linha referenciada), então linhas iguais têm o mesmo hash nos dois
+  bancos mesmo com ids diferentes.
+- O hash de um ramo é o hash dos hashes das suas linhas, em ordem de chave.
+
+A troca é feita por nível, um request para todas as tabelas: ramos com
+poucas linhas devolvem os hashes por linha, os demais devolvem os filhos.
+São poucas idas e voltas (profundidade da árvore + 2) e o volume é
+proporcional ao que difere, não ao tamanho do banco. No fim só as linhas
+que diferem são buscadas, já no formato do delta (`delta_sync`), para o
+`sync import`.
+
+O transporte é qualquer objeto com `request(dict) -> dict`; `LoopbackTransport`
+serializa em JSON e conta bytes e idas e voltas, simulando o link.
+"""
+
+import json
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Any, Protocol, TextIO
+
+from sqlalchemy.engine import Engine
+
+from src.timeblock.database import get_readonly_engine, get_readonly_engine_context
+from src.timeblock.models.change_tracking import SYNCED_TABLES
+from src.timeblock.services.delta_sync import (
+    BATCH_SIZE,
+    synced_rows,
+    write_header,
+    write_upserts,
+)
+
+# Ramo com até LEAF_SIZE linhas (nos dois lados) troca hashes por linha
+LEAF_SIZE = 32
+_DIGEST_SIZE = 8
+_HEX = "0123456789abcdef"
+
+# Resumo de um ramo: [linhas, hash]
+Summary = list[Any]
+
+
+def _digest(data: bytes) -> str:
+    return blake2b(data, digest_size=_DIGEST_SIZE).hexdigest()
+
+
+def _row_key(uuid_hex: str) -> str:
+    return _digest(bytes.fromhex(uuid_hex))
+
+
+def _row_digest(values: list[Any]) -> str:
+    return _digest(json.dumps(values, separators=(",", ":"), ensure_ascii=False).encode())
+
+
+class TableDigest:
+    """Árvore de hashes de uma tabela, com ramos calculados sob demanda."""
+
+    def __init__(self, rows: Iterable[list[Any]]):
+        entries = sorted((_row_key(values[0]), values[0], _row_digest(values)) for values in rows)
+        self._keys = [key for key, _, _ in entries]
+        self._uuids = [uuid_hex for _, uuid_hex, _ in entries]
+        self._digests = [digest for _, _, digest in entries]
+
+    def _range(self, prefix: str) -> tuple[int, int]:
+        # "g" ordena depois de qualquer dígito hex: fim do prefixo
+        return bisect_left(self._keys, prefix), bisect_left(self._keys, prefix + "g")
+
+    def summary(self, prefix: str = "") -> Summary:
+        """Quantidade de linhas e hash do ramo."""
+        lo, hi = self._range(prefix)
+        return [hi - lo, _digest("".join(self._digests[lo:hi]).encode())]
+
+    def children(self, prefix: str) -> dict[str, Summary]:
+        """Resumo dos filhos não vazios do ramo."""
+        summaries = (self.summary(prefix + digit) for digit in _HEX)
+        return {
+            prefix + digit: summary
+            for digit, summary in zip(_HEX, summaries, strict=True)
+            if summary[0]
+        }
+
+    def rows(self, prefix: str) -> dict[str, str]:
+        """Hash de cada linha do ramo, por uuid."""
+        lo, hi = self._range(prefix)
+        return dict(zip(self._uuids[lo:hi], self._digests[lo:hi], strict=True))
+
+
+class DigestPeer:
+    """Responde aos requests do diff sobre um banco (lado local ou remoto)."""
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self._digests: dict[str, TableDigest] = {}
+
+    def _table(self, name: str) -> TableDigest:
+        if name not in self._digests:
+            with self._engine.connect() as conn:
+                self._digests[name] = TableDigest(synced_rows(conn, name))
+        return self._digests[name]
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Atende um request (ver `MerkleDiff` para a sequência).
+
+        - roots: {tabela: resumo}
+        - expand: filhos dos ramos em `children` e hashes por linha dos
+          ramos em `rows`, ambos {tabela: [prefixo, ...]}
+        - fetch: linhas no formato do delta, por uuid
+        """
+        op = request["op"]
+        if op == "roots":
+            return {name: self._table(name).summary() for name in SYNCED_TABLES}
+        if op == "expand":
+            return {
+                "children": {
+                    name: {prefix: self._table(name).children(prefix) for prefix in prefixes}
+                    for name, prefixes in request["children"].items()
+                },
+                "rows": {
+                    name: {prefix: self._table(name).rows(prefix) for prefix in prefixes}
+                    for name, prefixes in request["rows"].items()
+                },
+            }
+        if op == "fetch":
+            return {name: self._fetch(name, uuids) for name, uuids in request["uuids"].items()}
+        raise ValueError(f"Request desconhecido: {op}")
+
+    def _fetch(self, name: str, uuids: list[str]) -> list[list[Any]]:
+        rows: list[list[Any]] = []
+        with self._engine.connect() as conn:
+            for start in range(0, len(uuids), BATCH_SIZE):
+                batch = uuids[start : start + BATCH_SIZE]
+                rows.extend(
+                    synced_rows(
+                        conn,
+                        name,
+                        f"WHERE t.uuid IN ({', '.join('?' * len(batch))})",
+                        tuple(bytes.fromhex(value) for value in batch),
+                    )
+                )
+        return rows
+
+
+class Transport(Protocol):
+    """Canal até o outro dispositivo."""
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]: ...
+
+
+@dataclass
+class LoopbackTransport:
+    """Transporte simulado: serializa em JSON e mede o tráfego."""
+
+    peer: DigestPeer
+    round_trips: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        sent = json.dumps(payload, separators=(",", ":"))
+        received = json.dumps(self.peer.handle(json.loads(sent)), separators=(",", ":"))
+        self.round_trips += 1
+        self.bytes_sent += len(sent)
+        self.bytes_received += len(received)
+        return json.loads(received)
+
+
+@dataclass
+class TableDiff:
+    """Linhas (por uuid em hex) que diferem numa tabela."""
+
+    missing: list[str] = field(default_factory=list)  # só no remoto
+    changed: list[str] = field(default_factory=list)  # nos dois, com valores diferentes
+    extra: list[str] = field(default_factory=list)  # só no local
+
+    def __bool__(self) -> bool:
+        return bool(self.missing or self.changed or self.extra)
+
+
+class MerkleDiff:
+    """Compara o banco local com um remoto, descendo só nos ramos diferentes."""
+
+    def __init__(self, local: DigestPeer, remote: Transport):
+        self.local = local
+        self.remote = remote
+        self.tables: dict[str, TableDiff] = {}
+        self.buckets_compared = 0
+
+    def run(self) -> dict[str, TableDiff]:
+        """Executa o diff e devolve as tabelas com diferenças."""
+        local_roots = self.local.handle({"op": "roots"})
+        remote_roots = self.remote.request({"op": "roots"})
+        # (tabela, prefixo) -> maior contagem entre os dois lados
+        pending = {
+            (name, ""): max(local_roots[name][0], remote_roots[name][0])
+            for name in SYNCED_TABLES
+            if local_roots[name] != remote_roots[name]
+        }
+        self.buckets_compared = len(SYNCED_TABLES)
+
+        while pending:
+            request: dict[str, Any] = {"op": "expand", "children": {}, "rows": {}}
+            for (name, prefix), count in pending.items():
+                kind = (
+                    "rows" if count <= LEAF_SIZE or len(prefix) == 2 * _DIGEST_SIZE else "children"
+                )
+                request[kind].setdefault(name, []).append(prefix)
+            local, remote = self.local.handle(request), self.remote.request(request)
+
+            pending = {}
+            for name, branches in local["children"].items():
+                for prefix, local_children in branches.items():
+                    remote_children = remote["children"][name][prefix]
+                    for child in local_children.keys() | remote_children.keys():
+                        self.buckets_compared += 1
+                        mine, theirs = local_children.get(child), remote_children.get(child)
+                        if mine != theirs:
+                            pending[(name, child)] = max(
+                                mine[0] if mine else 0, theirs[0] if theirs else 0
+                            )
+            for name, branches in local["rows"].items():
+                diff = self.tables.setdefault(name, TableDiff())
+                for prefix, mine in branches.items():
+                    theirs = remote["rows"][name][prefix]
+                    diff.missing.extend(sorted(theirs.keys() - mine.keys()))
+                    diff.extra.extend(sorted(mine.keys() - theirs.keys()))
+                    diff.changed.extend(
+                        sorted(u for u in mine.keys() & theirs.keys() if mine[u] != theirs[u])
+                    )
+
+        self.tables = {name: diff for name, diff in self.tables.items() if diff}
+        return self.tables
+
+    def fetch(self, out: TextIO, until: int = 0) -> int:
+        """Busca no remoto as linhas que faltam ou diferem e grava como delta.
+
+        Args:
+            out: Destino do delta (para `sync import`)
+            until: Contador do remoto, gravado como `until` do delta
+
+        Returns:
+            Quantidade de linhas gravadas
+        """
+        wanted = {
+            name: diff.missing + diff.changed
+            for name, diff in self.tables.items()
+            if diff.missing or diff.changed
+        }
+        rows = self.remote.request({"op": "fetch", "uuids": wanted}) if wanted else {}
+        write_header(out, 0, until)
+        return sum(write_upserts(out, name, rows[name]) for name in SYNCED_TABLES if name in rows)
+
+
+@dataclass(frozen=True)
+class DiffReport:
+    """Resultado de `MerkleDiffService.diff`."""
+
+    tables: dict[str, TableDiff]
+    buckets_compared: int
+    round_trips: int
+    bytes_exchanged: int
+    rows_fetched: int
+
+
+class MerkleDiffService:
+    """Diff entre o banco atual e outro arquivo, com transporte simulado."""
+
+    @staticmethod
+    def diff(other_db: str, out: TextIO | None = None) -> DiffReport:
+        """Compara o banco atual com `other_db`.
+
+        Args:
+            other_db: Caminho do outro banco (o "remoto")
+            out: Se informado, recebe as linhas do remoto que faltam ou
+                diferem aqui, no formato do delta
+
+        Returns:
+            Diferenças por tabela e custo da troca
+        """
+        remote_engine = get_readonly_engine(other_db)
+        try:
+            with get_readonly_engine_context() as engine:
+                transport = LoopbackTransport(DigestPeer(remote_engine))
+                merkle = MerkleDiff(DigestPeer(engine), transport)
+                tables = merkle.run()
+                fetched = 0
+                if out is not None:
+                    with remote_engine.connect() as conn:
+                        until = conn.exec_driver_sql("SELECT counter FROM sync_state").scalar_one()
+                    fetched = merkle.fetch(out, until)
+        finally:
+            remote_engine.dispose()
+        return DiffReport(
+            tables,
+            merkle.buckets_compared,
+            transport.round_trips,
+            transport.bytes_sent + transport.bytes_received,
+            fetched,
+        )
@@ -0,0 +1,281 @@
+"""Outbox transacional e publisher de eventos de domínio (ADR-023).
+
+Os services registram eventos (timer, conclusões, skips) com `record_event`
+na própria sessão, antes do commit: o evento entra na tabela `outbox` na
+mesma transação da mudança e o caminho quente nunca espera pelo broker.
+
+Um `OutboxPublisher` drena a tabela em lotes para um destino (`Sink`) e só
+avança o offset do destino (`outbox_offset`) depois que o lote foi aceito.
+A entrega é pelo menos uma vez: se o processo cair entre a entrega e a
+gravação do offset, o lote é reenviado, e consumidores deduplicam pelo `id`
+do CloudEvent. Falhas do destino adiam a próxima tentativa com backoff
+exponencial, registrado no banco para valer entre execuções.
+
+Destinos incluídos: arquivo JSON Lines e socket Unix, que servem de
+substitutos do Kafka em testes e integrações locais. Um destino Kafka é só
+mais uma classe com `publish(lote)`.
+"""
+
+import json
+import os
+import socket
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any, Protocol
+
+from sqlalchemy import delete, func
+from sqlmodel import Session, SQLModel, select
+
+from src.timeblock.database import get_engine_context
+from src.timeblock.models import OutboxEvent, OutboxOffset
+from src.timeblock.models.uuid_encoding import uuid7
+
+SOURCE = "/timeblock/v1"
+BATCH_SIZE = 100
+BASE_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 300.0
+
+
+class EventType(str, Enum):
+    """Tipos de CloudEvent publicados pelo TimeBlock Core."""
+
+    TIMER_STARTED = "timeblock.timer.started"
+    TIMER_PAUSED = "timeblock.timer.paused"
+    TIMER_RESUMED = "timeblock.timer.resumed"
+    TIMER_STOPPED = "timeblock.timer.stopped"
+    TIMER_CANCELLED = "timeblock.timer.cancelled"
+    HABIT_INSTANCE_COMPLETED = "timeblock.habits.instance.completed"
+    HABIT_INSTANCE_SKIPPED = "timeblock.habits.instance.skipped"
+    TASK_COMPLETED = "timeblock.tasks.completed"
+
+
+def record_event(sess: Session, event_type: EventType, entity: SQLModel, data: dict) -> None:
+    """Adiciona um evento ao outbox na transação da sessão.
+
+    Não faz flush nem commit: o evento é gravado junto com o commit do
+    service que o chamou, ou descartado junto com seu rollback.
+
+    Args:
+        sess: Sessão do service
+        event_type: Tipo do evento
+        entity: Linha a que o evento se refere (vira o `subject`)
+        data: Conteúdo do evento (JSON; datas viram ISO 8601)
+    """
+    sess.add(
+        OutboxEvent(
+            event_id=str(uuid7()),
+            type=event_type.value,
+            subject=f"{entity.__tablename__}/{entity.uuid}",  # type: ignore[attr-defined]
+            data=json.dumps(data, ensure_ascii=False, default=_isoformat),
+        )
+    )
+
+
+def _isoformat(value: Any) -> str:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def to_cloudevent(event: OutboxEvent) -> dict[str, Any]:
+    """Envelope CloudEvents 1.0 do evento (formato do ADR-023)."""
+    return {
+        "specversion": "1.0",
+        "type": event.type,
+        "source": SOURCE,
+        "id": event.event_id,
+        # Gravado em UTC; o SQLite devolve sem fuso
+        "time": event.time.replace(tzinfo=UTC).isoformat().replace("+00:00", "Z"),
+        "subject": event.subject,
+        "datacontenttype": "application/json",
+        "data": json.loads(event.data),
+    }
+
+
+class Sink(Protocol):
+    """Destino dos eventos. `publish` só retorna depois de aceitar o lote."""
+
+    def publish(self, events: list[dict[str, Any]]) -> None: ...
+
+
+class FileSink:
+    """Acrescenta cada evento como uma linha JSON num arquivo."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def publish(self, events: list[dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class UnixSocketSink:
+    """Envia o lote como um array JSON numa linha e espera `ok` de volta."""
+
+    def __init__(self, path: str | Path, timeout: float = 5.0):
+        self.path = Path(path)
+        self.timeout = timeout
+
+    def publish(self, events: list[dict[str, Any]]) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.path))
+            sock.sendall((json.dumps(events, ensure_ascii=False) + "\n").encode())
+            with sock.makefile("r", encoding="utf-8") as reply:
+                answer = reply.readline().strip()
+        if answer != "ok":
+            raise OSError(f"Destino recusou o lote: {answer or 'sem resposta'}")
+
+
+def open_sink(url: str) -> Sink:
+    """Destino a partir de `file:CAMINHO` ou `unix:CAMINHO`.
+
+    Raises:
+        ValueError: Esquema desconhecido
+    """
+    scheme, _, path = url.partition(":")
+    if scheme == "file" and path:
+        return FileSink(path)
+    if scheme == "unix" and path:
+        return UnixSocketSink(path)
+    raise ValueError(f"Destino inválido: {url} (use file:CAMINHO ou unix:CAMINHO)")
+
+
+@dataclass(frozen=True)
+class DrainResult:
+    """Resultado de uma drenagem do outbox."""
+
+    published: int
+    pending: int
+    error: str | None = None
+    retry_at: datetime | None = None
+
+
+class OutboxPublisher:
+    """Publica o outbox em lotes num destino, com offset e backoff.
+
+    Args:
+        sink: Destino dos eventos
+        name: Identifica o destino em `outbox_offset` (ex.: a URL)
+        batch_size: Eventos por chamada a `sink.publish`
+    """
+
+    def __init__(self, sink: Sink, name: str, batch_size: int = BATCH_SIZE):
+        self.sink = sink
+        self.name = name
+        self.batch_size = batch_size
+
+    def drain(self, now: datetime | None = None) -> DrainResult:
+        """Publica lotes até esvaziar o outbox ou o destino falhar.
+
+        Durante o backoff de uma falha anterior não tenta nada.
+
+        Args:
+            now: Instante de referência para o backoff (padrão: agora)
+
+        Returns:
+            Quantos eventos foram publicados, quantos faltam e, em caso de
+            falha, o erro e quando tentar de novo
+        """
+        now = now or datetime.now()
+        published = 0
+        with get_engine_context() as engine:
+            while True:
+                with Session(engine) as sess:
+                    offset = sess.get(OutboxOffset, self.name) or OutboxOffset(sink=self.name)
+                    if offset.next_attempt_at is not None and offset.next_attempt_at > now:
+                        return DrainResult(
+                            published,
+                            _pending(sess, offset.last_id),
+                            offset.last_error,
+                            offset.next_attempt_at,
+                        )
+                    events = sess.exec(
+                        select(OutboxEvent)
+                        .where(OutboxEvent.id > offset.last_id)
+                        .order_by(OutboxEvent.id)
+                        .limit(self.batch_size)
+                    ).all()
+                    if not events:
+                        return DrainResult(published, 0)
+                    batch = [to_cloudevent(event) for event in events]
+
+                # Fora de transação: o destino pode demorar sem segurar o banco
+                try:
+                    self.sink.publish(batch)
+                except Exception as e:  # qualquer falha do destino entra no backoff
+                    with Session(engine) as sess:
+                        offset = _record_failure(sess, self.name, e, now)
+                        return DrainResult(
+                            published,
+                            _pending(sess, offset.last_id),
+                            offset.last_error,
+                            offset.next_attempt_at,
+                        )
+
+                with Session(engine) as sess:
+                    offset = sess.get(OutboxOffset, self.name) or OutboxOffset(sink=self.name)
+                    offset.last_id = events[-1].id
+                    offset.attempts = 0
+                    offset.next_attempt_at = None
+                    offset.last_error = None
+                    sess.add(offset)
+                    sess.commit()
+                published += len(batch)
+
+    def run(self, poll_interval: float = 1.0) -> None:
+        """Drena continuamente, esperando novos eventos ou o fim do backoff."""
+        while True:
+            result = self.drain()
+            wait = poll_interval
+            if result.retry_at is not None:
+                wait = max(wait, (result.retry_at - datetime.now()).total_seconds())
+            time.sleep(wait)
+
+
+def _pending(sess: Session, last_id: int) -> int:
+    return sess.exec(select(func.count()).where(OutboxEvent.id > last_id)).one()
+
+
+def _record_failure(sess: Session, name: str, error: Exception, now: datetime) -> OutboxOffset:
+    offset = sess.get(OutboxOffset, name) or OutboxOffset(sink=name)
+    offset.attempts += 1
+    delay = min(BASE_BACKOFF_SECONDS * 2 ** (offset.attempts - 1), MAX_BACKOFF_SECONDS)
+    offset.next_attempt_at = now + timedelta(seconds=delay)
+    offset.last_error = f"{type(error).__name__}: {error}"
+    sess.add(offset)
+    sess.commit()
+    sess.refresh(offset)
+    return offset
+
+
+class OutboxService:
+    """Consulta e limpeza do outbox."""
+
+    @staticmethod
+    def status() -> list[tuple[OutboxOffset, int]]:
+        """Offset de cada destino conhecido e quantos eventos ele ainda não recebeu."""
+        with get_engine_context() as engine, Session(engine) as sess:
+            offsets = sess.exec(select(OutboxOffset).order_by(OutboxOffset.sink)).all()
+            return [(offset, _pending(sess, offset.last_id)) for offset in offsets]
+
+    @staticmethod
+    def prune() -> int:
+        """Remove eventos já confirmados por todos os destinos conhecidos.
+
+        Returns:
+            Quantidade de eventos removidos (0 se nenhum destino existe)
+        """
+        with get_engine_context() as engine, Session(engine) as sess:
+            floor = sess.exec(select(func.min(OutboxOffset.last_id))).one()
+            if floor is None:
+                return 0
+            result = sess.exec(delete(OutboxEvent).where(OutboxEvent.id <= floor))
+            sess.commit()
+            return result.rowcount
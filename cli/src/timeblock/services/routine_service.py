@@ -2,6 +2,7 @@
 
 from sqlmodel import Session, select
 
+from src.timeblock.database.catalog import get_catalog
 from src.timeblock.models import Routine
 
 
@@ -49,7 +50,7 @@ class RoutineService:
 
     def get_routine(self, routine_id: int) -> Routine | None:
         """Busca rotina por ID."""
-        return self.session.get(Routine, routine_id)
+        return get_catalog().get(Routine, routine_id, self.session)
 
     def get_active_routine(self) -> Routine | None:
         """
@@ -58,14 +59,14 @@ class RoutineService:
         Business Rules:
             - BR-ROUTINE-004: get_active retorna routine ativa
         """
-        return self.session.exec(select(Routine).where(Routine.is_active == True)).first()  # noqa: E712
+        return next(iter(self.list_routines(active_only=True)), None)
 
     def list_routines(self, active_only: bool = False) -> list[Routine]:
         """Lista rotinas."""
-        statement = select(Routine)
+        routines = get_catalog().all(Routine, self.session)
         if active_only:
-            statement = statement.where(Routine.is_active == True)  # noqa: E712
-        return list(self.session.exec(statement).all())
+            return [routine for routine in routines if routine.is_active]
+        return routines
 
     def activate_routine(self, routine_id: int) -> Routine:
         """
@@ -0,0 +1,367 @@
+"""Fila de sincronização (ADR-012) como log append-only no banco.
+
+O ADR-012 previa `SyncQueue.add(operation)` reescrevendo
+`~/.timeblock/sync_queue.json` a cada operação: custo proporcional ao tamanho
+da fila por escrita e arquivo corrompido se o processo morrer no meio. Aqui
+cada mutação vira uma linha em `sync_queue`, inserida pelo próprio flush do
+ORM, na mesma transação da mutação: se o commit falha, a operação some junto;
+se passa, ela está na fila.
+
+Registro: qualquer flush que insere, altera ou remove um modelo com `uuid`
+(ADR-013) grava uma operação por linha. Não é preciso chamar nada nos
+services. Escritas em SQL direto (fora do ORM) não passam pelo flush e não
+entram na fila, a menos que gravem as operações com `record_rows` e
+`record_deletes`, como o import de delta faz.
+
+Envio:
+    1. `compact()` junta as operações repetidas da mesma linha
+    2. `batches()` lê a fila em lotes por `seq`
+    3. `ack(seq)` remove o que o servidor confirmou
+"""
+
+import json
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, time
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, event, func, inspect, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, SQLModel, select
+
+from src.timeblock.database import get_engine_context
+from src.timeblock.models import SyncOp, SyncOperation
+
+BATCH_SIZE = 500
+
+# Fora do payload: a linha é identificada pelo uuid; change_seq é local
+_SKIPPED_COLUMNS = frozenset({"id", "uuid", "change_seq"})
+
+_synced: dict[type, bool] = {}
+
+
+def _is_synced(obj: Any) -> bool:
+    """Se o modelo do objeto entra na fila (tem a chave global `uuid`)."""
+    cls = type(obj)
+    if cls not in _synced:
+        mapper = inspect(cls, raiseerr=False)
+        _synced[cls] = mapper is not None and "uuid" in mapper.columns
+    return _synced[cls]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} não serializável")
+
+
+def _columns(obj: Any, changed_only: bool) -> dict[str, Any]:
+    """Colunas carregadas do objeto (ou só as alteradas).
+
+    Ficam de fora id, uuid e colunas geradas pelo SQLite (ex: start_min),
+    que o destino recalcula.
+    """
+    state = inspect(obj)
+    values = {}
+    for attr in state.mapper.column_attrs:
+        key = attr.key
+        if key in _SKIPPED_COLUMNS or key not in state.dict or attr.columns[0].computed is not None:
+            continue
+        if changed_only and not state.attrs[key].history.has_changes():
+            continue
+        values[key] = state.dict[key]
+    return values
+
+
+def _operation(obj: Any, op: SyncOp, payload: dict[str, Any] | None) -> dict[str, Any]:
+    return {
+        "entity": obj.__table__.name,
+        "entity_uuid": obj.uuid,
+        "entity_id": obj.id,
+        "op": op,
+        "payload": None if payload is None else json.dumps(payload, default=_json_default),
+        "created_at": datetime.now(UTC),
+    }
+
+
+@event.listens_for(OrmSession, "before_flush")
+def _load_deleted_uuids(session: OrmSession, flush_context: Any, instances: Any) -> None:
+    # Depois do DELETE não dá mais para carregar o uuid de um objeto expirado
+    for obj in session.deleted:
+        if _is_synced(obj):
+            obj.uuid  # noqa: B018
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _record_operations(session: OrmSession, flush_context: Any) -> None:
+    # Em after_flush, new/dirty/deleted e o histórico ainda são os do flush
+    operations = [
+        _operation(obj, SyncOp.INSERT, _columns(obj, changed_only=False))
+        for obj in session.new
+        if _is_synced(obj)
+    ]
+    for obj in session.dirty:
+        if _is_synced(obj):
+            changed = _columns(obj, changed_only=True)
+            if changed:
+                operations.append(_operation(obj, SyncOp.UPDATE, changed))
+    operations.extend(
+        _operation(obj, SyncOp.DELETE, None) for obj in session.deleted if _is_synced(obj)
+    )
+    if operations:
+        session.connection().execute(SyncOperation.__table__.insert(), operations)
+
+
+def record_rows(conn: Connection, name: str, uuids: list[UUID], inserted: set[UUID]) -> None:
+    """Grava na fila as linhas de `name` escritas em SQL direto.
+
+    As linhas são lidas de volta pelos tipos das colunas, para que o payload
+    saia como o do flush: INSERT com a linha inteira para as de `inserted`,
+    UPDATE com a linha inteira para as que já existiam.
+    """
+    table = SQLModel.metadata.tables[name]
+    columns = [
+        column
+        for column in table.columns
+        if column.name not in _SKIPPED_COLUMNS and column.computed is None
+    ]
+    for start in range(0, len(uuids), BATCH_SIZE):
+        rows = conn.execute(
+            select(table.c.id, table.c.uuid, *columns).where(
+                table.c.uuid.in_(uuids[start : start + BATCH_SIZE])
+            )
+        ).all()
+        operations = [
+            {
+                "entity": name,
+                "entity_uuid": row.uuid,
+                "entity_id": row.id,
+                "op": SyncOp.INSERT if row.uuid in inserted else SyncOp.UPDATE,
+                "payload": json.dumps(
+                    {column.name: row._mapping[column] for column in columns},
+                    default=_json_default,
+                ),
+                "created_at": datetime.now(UTC),
+            }
+            for row in rows
+        ]
+        if operations:
+            conn.execute(SyncOperation.__table__.insert(), operations)
+
+
+def record_deletes(conn: Connection, name: str, rows: list[tuple[int, UUID]]) -> None:
+    """Grava na fila as remoções de `name` feitas em SQL direto.
+
+    Args:
+        conn: Conexão da transação que removeu as linhas
+        name: Tabela
+        rows: (id, uuid) de cada linha removida
+    """
+    if rows:
+        conn.execute(
+            SyncOperation.__table__.insert(),
+            [
+                {
+                    "entity": name,
+                    "entity_uuid": entity_uuid,
+                    "entity_id": entity_id,
+                    "op": SyncOp.DELETE,
+                    "payload": None,
+                    "created_at": datetime.now(UTC),
+                }
+                for entity_id, entity_uuid in rows
+            ],
+        )
+
+
+def collapse(
+    ops: list[tuple[SyncOp, dict[str, Any] | None]],
+) -> tuple[SyncOp, dict[str, Any] | None] | None:
+    """Reduz as operações de uma linha (em ordem de seq) ao efeito líquido.
+
+    - INSERT + UPDATEs: um INSERT com os valores finais
+    - UPDATEs: um UPDATE com a união das colunas alteradas (a última vence)
+    - INSERT + ... + DELETE: nada (a linha nunca chegou ao servidor)
+    - ... + DELETE: um DELETE
+    - DELETE + INSERT (mesmo uuid): um UPDATE com a linha inteira
+
+    Returns:
+        Operação resultante, ou None se não há nada a enviar
+    """
+    result: tuple[SyncOp, dict[str, Any] | None] | None = None
+    for op, payload in ops:
+        if op is SyncOp.INSERT:
+            if result is not None and result[0] is SyncOp.DELETE:
+                result = (SyncOp.UPDATE, dict(payload or {}))
+            else:
+                result = (SyncOp.INSERT, dict(payload or {}))
+        elif op is SyncOp.UPDATE:
+            if result is None or result[0] is SyncOp.DELETE:
+                result = (SyncOp.UPDATE, dict(payload or {}))
+            else:
+                result = (result[0], {**(result[1] or {}), **(payload or {})})
+        elif result is not None and result[0] is SyncOp.INSERT:
+            result = None
+        else:
+            result = (SyncOp.DELETE, None)
+    return result
+
+
+class SyncQueue:
+    """Leitura, compactação e confirmação da fila de sincronização."""
+
+    @staticmethod
+    def count(session: Session | None = None) -> int:
+        """Número de operações na fila."""
+
+        def _count(sess: Session) -> int:
+            return sess.exec(select(func.count()).select_from(SyncOperation)).one()
+
+        if session is not None:
+            return _count(session)
+
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _count(sess)
+
+    @staticmethod
+    def read(
+        after_seq: int = 0,
+        limit: int = BATCH_SIZE,
+        session: Session | None = None,
+    ) -> list[SyncOperation]:
+        """Lê até `limit` operações com seq maior que `after_seq`, em ordem.
+
+        Args:
+            after_seq: Último seq já lido (0 para o início da fila)
+            limit: Tamanho máximo do lote
+            session: Sessão opcional
+
+        Returns:
+            Operações do lote (vazio no fim da fila)
+        """
+
+        def _read(sess: Session) -> list[SyncOperation]:
+            statement = (
+                select(SyncOperation)
+                .where(SyncOperation.seq > after_seq)
+                .order_by(SyncOperation.seq)
+                .limit(limit)
+            )
+            return list(sess.exec(statement).all())
+
+        if session is not None:
+            return _read(session)
+
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _read(sess)
+
+    @staticmethod
+    def batches(
+        batch_size: int = BATCH_SIZE, session: Session | None = None
+    ) -> Iterator[list[SyncOperation]]:
+        """Percorre a fila inteira em lotes, paginando por seq (keyset)."""
+        after_seq = 0
+        while batch := SyncQueue.read(after_seq, batch_size, session=session):
+            yield batch
+            after_seq = batch[-1].seq
+
+    @staticmethod
+    def compact(session: Session | None = None) -> int:
+        """Junta as operações repetidas de cada linha (ver `collapse`).
+
+        A operação resultante fica no seq do INSERT original, quando há um
+        (a linha precisa existir antes das que a referenciam), e no seq da
+        última operação nos demais casos. Linhas com uma só operação não são
+        lidas.
+
+        Returns:
+            Número de operações removidas da fila
+        """
+
+        def _compact(sess: Session) -> int:
+            table = SyncOperation.__table__
+            repeated = (
+                select(table.c.entity, table.c.entity_uuid)
+                .group_by(table.c.entity, table.c.entity_uuid)
+                .having(func.count() > 1)
+                .subquery()
+            )
+            rows = sess.exec(
+                select(
+                    table.c.seq, table.c.entity, table.c.entity_uuid, table.c.op, table.c.payload
+                )
+                .join(
+                    repeated,
+                    (table.c.entity == repeated.c.entity)
+                    & (table.c.entity_uuid == repeated.c.entity_uuid),
+                )
+                .order_by(table.c.entity, table.c.entity_uuid, table.c.seq)
+            ).all()
+
+            groups: dict[tuple[str, UUID], list[Any]] = {}
+            for row in rows:
+                groups.setdefault((row.entity, row.entity_uuid), []).append(row)
+
+            removed: list[int] = []
+            for group in groups.values():
+                result = collapse(
+                    [
+                        (row.op, None if row.payload is None else json.loads(row.payload))
+                        for row in group
+                    ]
+                )
+                seqs = [row.seq for row in group]
+                if result is None:
+                    removed.extend(seqs)
+                    continue
+                op, payload = result
+                keep = seqs[0] if op is SyncOp.INSERT else seqs[-1]
+                sess.exec(
+                    update(table)
+                    .where(table.c.seq == keep)
+                    .values(
+                        op=op,
+                        payload=None
+                        if payload is None
+                        else json.dumps(payload, default=_json_default),
+                    )
+                )
+                removed.extend(seq for seq in seqs if seq != keep)
+
+            # Em blocos: o SQLite limita o número de parâmetros por comando
+            for start in range(0, len(removed), BATCH_SIZE):
+                chunk = removed[start : start + BATCH_SIZE]
+                sess.exec(delete(table).where(table.c.seq.in_(chunk)))
+            sess.commit()
+            return len(removed)
+
+        if session is not None:
+            return _compact(session)
+
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _compact(sess)
+
+    @staticmethod
+    def ack(up_to_seq: int, session: Session | None = None) -> int:
+        """Remove as operações confirmadas pelo servidor (seq <= up_to_seq).
+
+        Returns:
+            Número de operações removidas
+        """
+
+        def _ack(sess: Session) -> int:
+            result = sess.exec(delete(SyncOperation).where(SyncOperation.seq <= up_to_seq))
+            sess.commit()
+            return result.rowcount
+
+        if session is not None:
+            return _ack(session)
+
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _ack(sess)
@@ -1,8 +1,9 @@
 """Service para gerenciar tags."""
 
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from src.timeblock.database import get_engine_context
+from src.timeblock.database.catalog import get_catalog
 from src.timeblock.models import Tag
 
 
@@ -26,18 +27,18 @@ class TagService:
         """Busca tag por ID."""
         with get_engine_context() as engine:
             with Session(engine) as session:
-                tag = session.get(Tag, tag_id)
+                tag = get_catalog().get(Tag, tag_id, session)
                 if not tag:
                     raise ValueError(f"Tag {tag_id} não encontrada")
                 return tag
 
     @staticmethod
     def list_tags() -> list[Tag]:
-        """Lista todas as tags."""
+        """Lista todas as tags, por nome."""
         with get_engine_context() as engine:
             with Session(engine) as session:
-                statement = select(Tag).order_by(Tag.name)
-                return list(session.exec(statement).all())
+                tags = get_catalog().all(Tag, session)
+                return sorted(tags, key=lambda tag: tag.name)
 
     @staticmethod
     def update_tag(tag_id: int, **kwargs) -> Tag:
@@ -9,6 +9,7 @@ from src.timeblock.database import get_engine_context
 from ..models import Task
 from .event_reordering_models import Conflict
 from .event_reordering_service import EventReorderingService
+from .outbox import EventType, record_event
 
 
 class TaskService:
@@ -187,6 +188,12 @@ class TaskService:
                 return None
             task.completed_datetime = datetime.now()
             sess.add(task)
+            record_event(
+                sess,
+                EventType.TASK_COMPLETED,
+                task,
+                {"title": task.title, "completed_datetime": task.completed_datetime},
+            )
             sess.commit()
             sess.refresh(task)
             return task
@@ -2,19 +2,80 @@
 
 from datetime import datetime
 
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
 from ..database.engine import get_engine_context
 from ..models.enums import DoneSubstatus, Status
+from ..models.event import PauseLog
+from ..models.habit import Habit
 from ..models.habit_instance import HabitInstance
-from ..models.time_log import TimeLog
+from ..models.time_log import ACTIVE_TIMER_ID, ActiveTimer, TimeLog
+from ..status import get_status_path, write_state
+from .outbox import EventType, record_event
 
 
 class TimerService:
-    """Service para operações de timer."""
+    """Service para operações de timer.
 
-    # Estado em memória para pause tracking (BR-TIMER-006 MVP)
-    _active_pause_start: datetime | None = None
+    O timer ativo vive na tabela de linha única `active_timer` (PK = 1):
+    start, pause, resume, stop e status são buscas por chave primária, e o
+    estado sobrevive entre invocações da CLI. Cada pausa gera um PauseLog
+    (ADR-022 v2.0); `TimeLog.paused_duration` continua sendo o total.
+    """
+
+    @staticmethod
+    def _publish_status(sess: Session) -> None:
+        """Reescreve o arquivo de estado lido por `timeblock-status`.
+
+        O arquivo fica ao lado do banco da sessão; bancos em memória não têm
+        arquivo. Falha de escrita não interrompe a operação do timer: o
+        arquivo é só um cache para o prompt do shell.
+        """
+        db_path = sess.get_bind().url.database
+        if not db_path or db_path == ":memory:":
+            return
+
+        state = sess.get(ActiveTimer, ACTIVE_TIMER_ID)
+        payload = None
+        if state is not None:
+            timelog = sess.get(TimeLog, state.timelog_id)
+            instance = (
+                sess.get(HabitInstance, timelog.habit_instance_id)
+                if timelog.habit_instance_id
+                else None
+            )
+            habit = sess.get(Habit, instance.habit_id) if instance else None
+            payload = {
+                "timelog_id": timelog.id,
+                "label": habit.title if habit else "Atividade",
+                "started_at": timelog.start_time.timestamp(),
+                "paused_seconds": state.paused_seconds,
+                "paused_at": state.pause_start.timestamp() if state.pause_start else None,
+            }
+
+        try:
+            write_state(get_status_path(db_path), payload)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _close_pause(sess: Session, state: ActiveTimer, now: datetime) -> int:
+        """Encerra a pausa em andamento e devolve sua duração em segundos."""
+        if state.pause_start is None:
+            return 0
+
+        pause_seconds = int((now - state.pause_start).total_seconds())
+        if state.pause_log_id is not None:
+            pause_log = sess.get(PauseLog, state.pause_log_id)
+            if pause_log is not None:
+                pause_log.pause_end = now
+                sess.add(pause_log)
+
+        state.paused_seconds += pause_seconds
+        state.pause_log_id = None
+        state.pause_start = None
+        return pause_seconds
 
     @staticmethod
     def start_timer(habit_instance_id: int, session: Session | None = None) -> TimeLog:
@@ -37,9 +98,7 @@ class TimerService:
                 raise ValueError(f"HabitInstance {habit_instance_id} not found")
 
             # BR-TIMER-001: Verificar se já existe qualquer timer ativo (global)
-            statement = select(TimeLog).where(TimeLog.end_time.is_(None))
-            existing_timer = sess.exec(statement).first()
-            if existing_timer:
+            if sess.get(ActiveTimer, ACTIVE_TIMER_ID) is not None:
                 raise ValueError("Timer already active")
 
             timelog = TimeLog(
@@ -48,8 +107,22 @@ class TimerService:
                 end_time=None,
             )
             sess.add(timelog)
-            sess.commit()
+            sess.flush()
+            sess.add(ActiveTimer(timelog_id=timelog.id))
+            record_event(
+                sess,
+                EventType.TIMER_STARTED,
+                timelog,
+                {"habit_instance": str(instance.uuid), "start_time": timelog.start_time},
+            )
+            try:
+                sess.commit()
+            except IntegrityError:
+                # Outro processo iniciou um timer entre a checagem e o commit
+                sess.rollback()
+                raise ValueError("Timer already active") from None
             sess.refresh(timelog)
+            TimerService._publish_status(sess)
             return timelog
 
         if session is not None:
@@ -88,13 +161,15 @@ class TimerService:
                 raise ValueError("Timer already stopped")
 
             # 2. BR-TIMER-006: Se estava pausado, acumula última pausa
-            if TimerService._active_pause_start is not None:
-                pause_duration = (datetime.now() - TimerService._active_pause_start).total_seconds()
-                timelog.paused_duration = (timelog.paused_duration or 0) + int(pause_duration)
-                TimerService._active_pause_start = None
+            now = datetime.now()
+            state = sess.get(ActiveTimer, ACTIVE_TIMER_ID)
+            if state is not None and state.timelog_id == timelog.id:
+                pause_seconds = TimerService._close_pause(sess, state, now)
+                timelog.paused_duration = (timelog.paused_duration or 0) + pause_seconds
+                sess.delete(state)
 
             # 3. Parar timer
-            timelog.end_time = datetime.now()
+            timelog.end_time = now
             total_duration = (timelog.end_time - timelog.start_time).total_seconds()
             paused_duration = timelog.paused_duration or 0
             timelog.duration_seconds = int(total_duration - paused_duration)
@@ -139,12 +214,33 @@ class TimerService:
             # 8. Validar consistência (BR-HABIT-INSTANCE-STATUS-001)
             instance.validate_status_consistency()
 
-            # 9. Persistir tudo
+            # 9. Persistir tudo (eventos no outbox, mesma transação)
             sess.add(timelog)
             sess.add(instance)
+            record_event(
+                sess,
+                EventType.TIMER_STOPPED,
+                timelog,
+                {
+                    "habit_instance": str(instance.uuid),
+                    "duration_seconds": timelog.duration_seconds,
+                    "paused_duration": paused_duration,
+                },
+            )
+            record_event(
+                sess,
+                EventType.HABIT_INSTANCE_COMPLETED,
+                instance,
+                {
+                    "date": instance.date,
+                    "done_substatus": done_substatus.value,
+                    "completion_percentage": completion_percentage,
+                },
+            )
             sess.commit()
             sess.refresh(timelog)
             sess.refresh(instance)
+            TimerService._publish_status(sess)
 
             return timelog
 
@@ -156,19 +252,19 @@ class TimerService:
 
     @staticmethod
     def pause_timer(timelog_id: int, session: Session | None = None) -> TimeLog:
-        """Marca início de pausa (não persiste ainda).
+        """Marca início de pausa, abrindo um PauseLog.
 
-        BR-TIMER-006: Pause Tracking MVP
+        BR-TIMER-006: Pause Tracking
 
         Args:
             timelog_id: ID do TimeLog
             session: Optional session (for tests/transactions)
 
         Returns:
-            TimeLog (pausa marcada em memória)
+            TimeLog pausado
 
         Raises:
-            ValueError: Se timer não existe, já stopped, ou já pausado
+            ValueError: Se timer não existe, já stopped, não ativo ou já pausado
         """
 
         def _pause(sess: Session) -> TimeLog:
@@ -179,10 +275,26 @@ class TimerService:
             if timelog.end_time is not None:
                 raise ValueError("Timer already stopped")
 
-            if TimerService._active_pause_start is not None:
+            state = sess.get(ActiveTimer, ACTIVE_TIMER_ID)
+            if state is None or state.timelog_id != timelog.id:
+                raise ValueError("Timer not active")
+
+            if state.pause_start is not None:
                 raise ValueError("Timer already paused")
 
-            TimerService._active_pause_start = datetime.now()
+            pause_log = PauseLog(timelog_id=timelog.id, pause_start=datetime.now())
+            sess.add(pause_log)
+            sess.flush()
+
+            state.pause_log_id = pause_log.id
+            state.pause_start = pause_log.pause_start
+            sess.add(state)
+            record_event(
+                sess, EventType.TIMER_PAUSED, timelog, {"pause_start": pause_log.pause_start}
+            )
+            sess.commit()
+            sess.refresh(timelog)
+            TimerService._publish_status(sess)
             return timelog
 
         if session is not None:
@@ -193,9 +305,9 @@ class TimerService:
 
     @staticmethod
     def resume_timer(timelog_id: int, session: Session | None = None) -> TimeLog:
-        """Calcula duração da pausa e acumula em paused_duration.
+        """Encerra a pausa e acumula sua duração em paused_duration.
 
-        BR-TIMER-006: Pause Tracking MVP
+        BR-TIMER-006: Pause Tracking
 
         Args:
             timelog_id: ID do TimeLog
@@ -213,19 +325,25 @@ class TimerService:
             if not timelog:
                 raise ValueError(f"TimeLog {timelog_id} not found")
 
-            if TimerService._active_pause_start is None:
+            state = sess.get(ActiveTimer, ACTIVE_TIMER_ID)
+            if state is None or state.timelog_id != timelog.id or state.pause_start is None:
                 raise ValueError("Timer not paused")
 
-            # Calcula e acumula
-            pause_duration = (datetime.now() - TimerService._active_pause_start).total_seconds()
-            timelog.paused_duration = (timelog.paused_duration or 0) + int(pause_duration)
-
-            # Limpa estado
-            TimerService._active_pause_start = None
+            # Calcula, acumula e limpa estado de pausa
+            pause_seconds = TimerService._close_pause(sess, state, datetime.now())
+            timelog.paused_duration = (timelog.paused_duration or 0) + pause_seconds
 
+            sess.add(state)
             sess.add(timelog)
+            record_event(
+                sess,
+                EventType.TIMER_RESUMED,
+                timelog,
+                {"pause_seconds": pause_seconds, "paused_duration": timelog.paused_duration},
+            )
             sess.commit()
             sess.refresh(timelog)
+            TimerService._publish_status(sess)
             return timelog
 
         if session is not None:
@@ -235,11 +353,13 @@ class TimerService:
             return _resume(sess)
 
     @staticmethod
-    def get_active_timer(habit_instance_id: int, session: Session | None = None) -> TimeLog | None:
-        """Busca timer ativo para HabitInstance.
+    def get_active_timer(
+        habit_instance_id: int | None = None, session: Session | None = None
+    ) -> TimeLog | None:
+        """Busca timer ativo, opcionalmente restrito a uma HabitInstance.
 
         Args:
-            habit_instance_id: ID da instância
+            habit_instance_id: ID da instância (None = qualquer timer ativo)
             session: Optional session
 
         Returns:
@@ -247,10 +367,15 @@ class TimerService:
         """
 
         def _get(sess: Session) -> TimeLog | None:
-            statement = select(TimeLog).where(
-                TimeLog.habit_instance_id == habit_instance_id, TimeLog.end_time is None
-            )
-            return sess.exec(statement).first()
+            state = sess.get(ActiveTimer, ACTIVE_TIMER_ID)
+            if state is None:
+                return None
+            timelog = sess.get(TimeLog, state.timelog_id)
+            if habit_instance_id is not None and (
+                timelog is None or timelog.habit_instance_id != habit_instance_id
+            ):
+                return None
+            return timelog
 
         if session is not None:
             return _get(session)
@@ -277,11 +402,21 @@ class TimerService:
             if not timelog:
                 raise ValueError(f"TimeLog {timelog_id} not found")
 
-            # Limpar estado de pausa se estava pausado
-            TimerService._active_pause_start = None
-
+            # Limpar estado ativo e pausas do timer descartado
+            state = sess.get(ActiveTimer, ACTIVE_TIMER_ID)
+            if state is not None and state.timelog_id == timelog.id:
+                sess.delete(state)
+                sess.flush()
+            for pause_log in sess.exec(select(PauseLog).where(PauseLog.timelog_id == timelog.id)):
+                sess.delete(pause_log)
+            sess.flush()
+
+            record_event(
+                sess, EventType.TIMER_CANCELLED, timelog, {"start_time": timelog.start_time}
+            )
             sess.delete(timelog)
             sess.commit()
+            TimerService._publish_status(sess)
 
         if session is not None:
             return _cancel(session)
@@ -302,12 +437,45 @@ class TimerService:
             TimeLog ativo ou None se não houver
         """
 
-        def _get(sess: Session) -> TimeLog | None:
-            statement = select(TimeLog).where(TimeLog.end_time.is_(None))
-            return sess.exec(statement).first()
+        return TimerService.get_active_timer(session=session)
+
+    @staticmethod
+    def get_timer_state(session: Session | None = None) -> ActiveTimer | None:
+        """Busca o estado do timer ativo (pausa em andamento, total pausado).
+
+        Args:
+            session: Optional session
+
+        Returns:
+            ActiveTimer ou None se não houver timer ativo
+        """
+
+        def _get(sess: Session) -> ActiveTimer | None:
+            return sess.get(ActiveTimer, ACTIVE_TIMER_ID)
 
         if session is not None:
             return _get(session)
 
         with get_engine_context() as engine, Session(engine) as sess:
             return _get(sess)
+
+    @staticmethod
+    def elapsed_seconds(timelog: TimeLog, state: ActiveTimer | None, now: datetime) -> int:
+        """Tempo efetivo do timer em segundos, descontando pausas.
+
+        Cálculo local, sem acesso ao banco: usado pelo display ao vivo para
+        atualizar o relógio a cada segundo a partir de um único snapshot.
+
+        Args:
+            timelog: TimeLog do timer
+            state: Estado ativo (None se o timer não está ativo)
+            now: Instante de referência
+
+        Returns:
+            Segundos decorridos menos o tempo pausado
+        """
+        end = timelog.end_time or now
+        paused = state.paused_seconds if state is not None else (timelog.paused_duration or 0)
+        if state is not None and state.pause_start is not None:
+            paused += int((end - state.pause_start).total_seconds())
+        return max(0, int((end - timelog.start_time).total_seconds()) - paused)
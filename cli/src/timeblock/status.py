@@ -0,0 +1,142 @@
+"""Status do timer para prompt de shell e tmux (somente stdlib).
+
+`timeblock timer status` importa Typer, Rich, SQLModel e abre o SQLite, o que
+custa centenas de ms por prompt. Este módulo lê apenas o arquivo de estado
+que o TimerService reescreve atomicamente a cada mudança (start, pause,
+resume, stop, cancel) e formata o tempo localmente.
+
+Uso:
+    timeblock-status                       # "> 00:42 Leitura"
+    timeblock-status "{elapsed} {label}"   # formato customizado
+    python -m timeblock.status
+
+Campos do formato: {icon}, {elapsed}, {label}. Sem timer ativo, não imprime
+nada (prompt limpo).
+
+Não importe nada além da stdlib aqui: o tempo de import é o orçamento. Pelo
+mesmo motivo o arquivo é uma linha separada por TAB, não JSON (o import de
+`json` puxa `re` e `enum` e custa mais que o resto do comando):
+
+    1<TAB>timelog_id<TAB>started_at<TAB>paused_seconds<TAB>paused_at|-<TAB>label
+"""
+
+import os
+import sys
+import time
+
+STATUS_SUFFIX = ".status"
+FORMAT_VERSION = "1"
+DEFAULT_FORMAT = "{icon} {elapsed} {label}"
+ICON_RUNNING = ">"
+ICON_PAUSED = "||"
+
+
+def resolve_db_path(db_path: str | None = None) -> str:
+    """Caminho do banco sem importar `database` (mesma regra de get_db_path)."""
+    if db_path is None:
+        db_path = os.getenv("TIMEBLOCK_DB_PATH")
+    if db_path is None:
+        src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        db_path = os.path.join(src_dir, "data", "timeblock.db")
+    return db_path
+
+
+def get_status_path(db_path: str | None = None) -> str:
+    """Caminho do arquivo de estado, ao lado do banco.
+
+    Args:
+        db_path: Caminho do banco (padrão: TIMEBLOCK_DB_PATH ou data/timeblock.db)
+
+    Returns:
+        Caminho do arquivo de estado
+    """
+    return resolve_db_path(db_path) + STATUS_SUFFIX
+
+
+def write_state(path: str, state: dict | None) -> None:
+    """Grava (ou remove, se None) o arquivo de estado de forma atômica.
+
+    Escreve em arquivo temporário no mesmo diretório e faz `os.replace`, de
+    modo que um prompt nunca leia um arquivo pela metade.
+    """
+    if state is None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return
+
+    paused_at = state.get("paused_at")
+    fields = [
+        FORMAT_VERSION,
+        str(state["timelog_id"]),
+        repr(float(state["started_at"])),
+        str(int(state.get("paused_seconds", 0))),
+        "-" if paused_at is None else repr(float(paused_at)),
+        " ".join(str(state.get("label", "")).split()),
+    ]
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("\t".join(fields) + "\n")
+    os.replace(tmp_path, path)
+
+
+def read_state(path: str) -> dict | None:
+    """Lê o arquivo de estado; None se não houver timer ativo ou arquivo inválido."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            line = f.readline().rstrip("\n")
+        version, timelog_id, started_at, paused_seconds, paused_at, label = line.split("\t", 5)
+        if version != FORMAT_VERSION:
+            return None
+        return {
+            "timelog_id": int(timelog_id),
+            "started_at": float(started_at),
+            "paused_seconds": int(paused_seconds),
+            "paused_at": None if paused_at == "-" else float(paused_at),
+            "label": label,
+        }
+    except (OSError, ValueError):
+        return None
+
+
+def format_status(state: dict | None, now: float, fmt: str = DEFAULT_FORMAT) -> str:
+    """Formata o status do timer.
+
+    Args:
+        state: Estado lido do arquivo (None = sem timer)
+        now: Timestamp Unix de referência
+        fmt: Formato com {icon}, {elapsed} e {label}
+
+    Returns:
+        Texto formatado, ou string vazia sem timer ativo
+    """
+    if not state:
+        return ""
+
+    paused_at = state.get("paused_at")
+    end = paused_at if paused_at is not None else now
+    seconds = max(0, int(end - state["started_at"]) - state.get("paused_seconds", 0))
+    hours, remainder = divmod(seconds, 3600)
+    minutes = remainder // 60
+
+    return fmt.format(
+        icon=ICON_PAUSED if paused_at is not None else ICON_RUNNING,
+        elapsed=f"{hours:02d}:{minutes:02d}",
+        label=state.get("label", ""),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point de `timeblock-status`."""
+    args = sys.argv[1:] if argv is None else argv
+    fmt = args[0] if args else DEFAULT_FORMAT
+    text = format_status(read_state(get_status_path()), time.time(), fmt)
+    if text:
+        sys.stdout.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+"""Interface de terminal (Textual) do TimeBlock.
+
+Requer o extra `tui` (textual). `windows` não depende do Textual; `app` sim.
+"""
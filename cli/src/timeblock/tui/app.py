@@ -0,0 +1,183 @@
+"""App Textual com calendário virtualizado (ADR-006).
+
+`CalendarView` é um ScrollView com uma linha por dia, cobrindo anos em volta
+de hoje. Só as linhas visíveis são desenhadas (`render_line`), e os dados
+chegam por janela semanal (`CalendarWindows`) lidas em threads de worker,
+então rolar nunca espera o banco. Commits de outros processos são
+detectados por `PRAGMA data_version` e aplicados como diff: só os dias
+alterados são redesenhados.
+"""
+
+from datetime import date, timedelta
+from functools import partial
+from typing import ClassVar
+
+from rich.segment import Segment
+from rich.style import Style
+from sqlalchemy.engine import Engine
+from textual.app import App, ComposeResult
+from textual.binding import BindingType
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import Footer, Header
+
+from ..database import DataVersionWatcher
+from ..models.schedule_item import ScheduleItem
+from .windows import WINDOW_DAYS, CalendarWindows, format_day, make_loader
+
+# Dias antes e depois de hoje alcançáveis pela rolagem
+SPAN_DAYS = 10 * 365
+POLL_INTERVAL = 1.0
+
+TODAY_STYLE = Style(bold=True, reverse=True)
+WEEKEND_STYLE = Style(dim=True)
+
+
+class CalendarView(ScrollView, can_focus=True):
+    """Lista rolável de dias, desenhada linha a linha."""
+
+    DEFAULT_CSS = """
+    CalendarView {
+        height: 1fr;
+    }
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        today: date | None = None,
+        poll_interval: float = POLL_INTERVAL,
+        windows: CalendarWindows | None = None,
+    ):
+        super().__init__()
+        self.engine = engine
+        self.today = today or date.today()
+        self.origin = self.today - timedelta(days=SPAN_DAYS)
+        self.poll_interval = poll_interval
+        self.windows = windows or CalendarWindows(make_loader(engine))
+        self._watcher: DataVersionWatcher | None = None
+        self.virtual_size = Size(0, 2 * SPAN_DAYS + 1)
+
+    def day_at(self, y: int) -> date:
+        """Dia da linha virtual `y`."""
+        return self.origin + timedelta(days=y)
+
+    def line_of(self, day: date) -> int:
+        """Linha virtual do dia."""
+        return (day - self.origin).days
+
+    def visible_days(self) -> tuple[date, date]:
+        """Primeiro e último dia visíveis."""
+        first = self.day_at(round(self.scroll_y))
+        return first, first + timedelta(days=max(self.size.height, 1) - 1)
+
+    def scroll_to_day(self, day: date) -> None:
+        """Rola até o dia, posicionando-o no topo."""
+        self.scroll_to(y=self.line_of(day), animate=False)
+
+    def on_mount(self) -> None:
+        self._watcher = DataVersionWatcher(self.engine)
+        self.set_interval(self.poll_interval, self.poll_changes)
+        self.call_after_refresh(self.scroll_to_day, self.today)
+
+    def on_unmount(self) -> None:
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def on_resize(self) -> None:
+        self.request_windows()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        self.request_windows()
+
+    def render_line(self, y: int) -> Strip:
+        """Desenha a linha `y` da tela (dados em memória, sem I/O)."""
+        scroll_x, scroll_y = self.scroll_offset
+        line = scroll_y + y
+        width = self.size.width
+        if not 0 <= line < self.virtual_size.height:
+            return Strip.blank(width)
+
+        day = self.day_at(line)
+        text = format_day(day, self.windows.items_for_day(day))
+        style = Style()
+        if day == self.today:
+            style = TODAY_STYLE
+        elif day.weekday() >= 5:
+            style = WEEKEND_STYLE
+        strip = Strip([Segment(text, style)])
+        return strip.crop(scroll_x, scroll_x + width).extend_cell_length(width, style)
+
+    def request_windows(self) -> None:
+        """Dispara workers para as janelas visíveis e adjacentes que faltam."""
+        if not self.size.height:
+            return
+        for start in self.windows.pending(*self.visible_days()):
+            self.run_worker(
+                partial(self._load_window, start),
+                thread=True,
+                group="calendar-windows",
+                exit_on_error=False,
+            )
+
+    def _load_window(self, start: date) -> None:
+        """Roda na thread do worker: lê a janela e entrega à thread da UI."""
+        try:
+            items = self.windows.loader(start)
+        except Exception:
+            self.app.call_from_thread(self.windows.release, start)
+            raise
+        self.app.call_from_thread(self.apply_window, start, items)
+
+    def apply_window(self, start: date, items: list[ScheduleItem]) -> None:
+        """Grava a janela e redesenha só o que mudou.
+
+        Na primeira carga a semana inteira sai do placeholder; nas releituras
+        só os dias presentes no diff.
+        """
+        first_load = start not in self.windows
+        diff = self.windows.store(start, items)
+        if first_load:
+            self.refresh_lines(self.line_of(start), WINDOW_DAYS)
+            return
+        for day in diff.days:
+            self.refresh_line(self.line_of(day))
+
+    def poll_changes(self) -> None:
+        """Relê as janelas em vista se outro processo fez commit."""
+        if self._watcher is not None and self._watcher.changed():
+            self.windows.invalidate()
+            self.request_windows()
+
+
+class TimeBlockApp(App):
+    """TUI do TimeBlock: calendário de dias com a agenda de cada um."""
+
+    TITLE = "TimeBlock"
+    BINDINGS: ClassVar[list[BindingType]] = [
+        ("t", "today", "Hoje"),
+        ("q", "quit", "Sair"),
+    ]
+
+    def __init__(
+        self, engine: Engine, today: date | None = None, poll_interval: float = POLL_INTERVAL
+    ):
+        super().__init__()
+        self.engine = engine
+        self.today = today
+        self.poll_interval = poll_interval
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield CalendarView(self.engine, today=self.today, poll_interval=self.poll_interval)
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self.query_one(CalendarView).focus()
+
+    def action_today(self) -> None:
+        view = self.query_one(CalendarView)
+        view.scroll_to_day(view.today)
@@ -0,0 +1,211 @@
+"""Janelas semanais da agenda para o calendário virtualizado da TUI.
+
+O calendário nunca carrega a agenda inteira (como `schedule list` faz): ele
+pede uma semana por vez, só para as semanas visíveis e as adjacentes
+(prefetch), e mantém um número limitado delas em cache (LRU). Quando o banco
+muda, as janelas em cache são relidas e comparadas com a versão anterior;
+só os dias com diferença são redesenhados.
+
+Este módulo não depende do Textual: a lógica de janelas, cache e diff é
+testável isoladamente.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from ..models.schedule_item import ScheduleItem
+from ..utils.queries import fetch_schedule_items
+
+WINDOW_DAYS = 7
+WEEKDAYS = ("Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom")
+STATUS_MARKS = {"DONE": "✓", "COMPLETED": "✓", "NOT_DONE": "✗", "CANCELLED": "✗"}
+PLACEHOLDER = "…"
+
+ItemKey = tuple[str, int]
+Loader = Callable[[date], list[ScheduleItem]]
+
+
+def window_start(day: date) -> date:
+    """Segunda-feira da semana que contém `day`."""
+    return day - timedelta(days=day.weekday())
+
+
+def windows_between(first: date, last: date) -> list[date]:
+    """Inícios das janelas que cobrem o intervalo [first, last]."""
+    start = window_start(first)
+    starts = []
+    while start <= last:
+        starts.append(start)
+        start += timedelta(days=WINDOW_DAYS)
+    return starts
+
+
+def item_day(item: ScheduleItem) -> date:
+    """Dia em que o item aparece no calendário (dia de início)."""
+    return item.start.date()
+
+
+def format_day(day: date, items: list[ScheduleItem] | None) -> str:
+    """Texto de uma linha do calendário: data e itens do dia em ordem.
+
+    `items` None (janela ainda não carregada) vira um placeholder.
+    """
+    label = f"{WEEKDAYS[day.weekday()]} {day.strftime('%d/%m/%Y')} │"
+    if items is None:
+        return f"{label} {PLACEHOLDER}"
+    entries = [
+        f"{item.start.strftime('%H:%M')} {item.title or '-'} {STATUS_MARKS.get(item.status, '·')}"
+        for item in sorted(items, key=lambda i: (i.start_min, i.kind, i.id))
+    ]
+    return " ".join([label, *entries]) if entries else label
+
+
+@dataclass(frozen=True)
+class WindowDiff:
+    """Diferença entre duas leituras da mesma janela."""
+
+    added: list[ScheduleItem] = field(default_factory=list)
+    removed: list[ScheduleItem] = field(default_factory=list)
+    changed: list[tuple[ScheduleItem, ScheduleItem]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def days(self) -> set[date]:
+        """Dias cujo conteúdo mudou (inclui o dia antigo de itens movidos)."""
+        touched = {item_day(item) for item in self.added + self.removed}
+        for old, new in self.changed:
+            touched.add(item_day(old))
+            touched.add(item_day(new))
+        return touched
+
+
+def diff_items(old: Iterable[ScheduleItem], new: Iterable[ScheduleItem]) -> WindowDiff:
+    """Compara duas listas de itens pela chave (kind, id)."""
+    old_by_key: dict[ItemKey, ScheduleItem] = {(i.kind, i.id): i for i in old}
+    new_by_key: dict[ItemKey, ScheduleItem] = {(i.kind, i.id): i for i in new}
+    return WindowDiff(
+        added=[item for key, item in new_by_key.items() if key not in old_by_key],
+        removed=[item for key, item in old_by_key.items() if key not in new_by_key],
+        changed=[
+            (old_by_key[key], item)
+            for key, item in new_by_key.items()
+            if key in old_by_key and old_by_key[key] != item
+        ],
+    )
+
+
+class CalendarWindows:
+    """Cache LRU de janelas semanais com prefetch e diff incremental.
+
+    Uso pela view (thread da UI):
+        1. `pending(first, last)` diz quais janelas buscar (visíveis primeiro)
+        2. `loader(start)` roda numa thread de worker
+        3. `store(start, items)` grava o resultado e devolve o diff
+
+    `items_for_day` devolve None para dias cuja janela ainda não chegou, e a
+    view desenha um placeholder no lugar.
+    """
+
+    def __init__(self, loader: Loader, capacity: int = 16, prefetch: int = 1):
+        self.loader = loader
+        self.capacity = capacity
+        self.prefetch = prefetch
+        self._windows: OrderedDict[date, list[ScheduleItem]] = OrderedDict()
+        self._by_day: dict[date, list[ScheduleItem]] = {}
+        self._in_flight: set[date] = set()
+        self._stale: set[date] = set()
+
+    def __contains__(self, start: date) -> bool:
+        return start in self._windows
+
+    def items_for_day(self, day: date) -> list[ScheduleItem] | None:
+        """Itens do dia, ou None se a janela ainda não foi carregada."""
+        start = window_start(day)
+        if start not in self._windows:
+            return None
+        self._windows.move_to_end(start)
+        return self._by_day.get(day, [])
+
+    def pending(self, first_visible: date, last_visible: date) -> list[date]:
+        """Janelas a buscar: visíveis, depois `prefetch` de cada lado.
+
+        Exclui as que já estão em cache (e não obsoletas) ou em andamento, e
+        as marca como em andamento.
+        """
+        visible = windows_between(first_visible, last_visible)
+        step = timedelta(days=WINDOW_DAYS)
+        before = [visible[0] - step * n for n in range(1, self.prefetch + 1)]
+        after = [visible[-1] + step * n for n in range(1, self.prefetch + 1)]
+
+        wanted = []
+        for start in visible + after + before:
+            cached = start in self._windows and start not in self._stale
+            if cached or start in self._in_flight:
+                continue
+            self._in_flight.add(start)
+            wanted.append(start)
+        return wanted
+
+    def store(self, start: date, items: list[ScheduleItem]) -> WindowDiff:
+        """Grava a janela carregada e devolve o diff contra a versão anterior.
+
+        Na primeira carga, todos os itens contam como adicionados. Itens que
+        começam fora da janela (sobreposição com a semana vizinha) pertencem
+        à janela do seu dia de início e são descartados aqui.
+        """
+        window_end = start + timedelta(days=WINDOW_DAYS)
+        items = [item for item in items if start <= item_day(item) < window_end]
+        self._in_flight.discard(start)
+        self._stale.discard(start)
+        diff = diff_items(self._windows.get(start, []), items)
+
+        self._windows[start] = items
+        self._windows.move_to_end(start)
+        for offset in range(WINDOW_DAYS):
+            self._by_day.pop(start + timedelta(days=offset), None)
+        for item in items:
+            self._by_day.setdefault(item_day(item), []).append(item)
+
+        while len(self._windows) > self.capacity:
+            evicted, _ = self._windows.popitem(last=False)
+            for offset in range(WINDOW_DAYS):
+                self._by_day.pop(evicted + timedelta(days=offset), None)
+        return diff
+
+    def release(self, start: date) -> None:
+        """Desiste de uma janela em andamento (ex: erro no loader).
+
+        Ela volta a ser pedida pelo próximo `pending`.
+        """
+        self._in_flight.discard(start)
+
+    def invalidate(self) -> None:
+        """Marca todas as janelas em cache como obsoletas (banco mudou).
+
+        Os dados antigos continuam sendo exibidos até a releitura chegar, e
+        `pending` volta a pedi-las.
+        """
+        self._stale.update(self._windows)
+
+
+def make_loader(engine: Engine) -> Loader:
+    """Loader que lê uma janela semanal da view schedule_item.
+
+    Uma query por janela; abre e fecha sessão a cada chamada, então pode
+    rodar em qualquer thread de worker.
+    """
+
+    def load(start: date) -> list[ScheduleItem]:
+        window_begin = datetime.combine(start, datetime.min.time())
+        window_end = window_begin + timedelta(days=WINDOW_DAYS)
+        with Session(engine) as session:
+            return fetch_schedule_items(session, window_begin, window_end)
+
+    return load
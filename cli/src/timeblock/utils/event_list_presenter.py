@@ -1,11 +1,12 @@
 """Presentation layer for displaying event lists in terminal."""
 
-from datetime import UTC, datetime, timedelta
+from collections.abc import Iterable
 
 from rich.console import Console
 
 from ..models import Event
-from .formatters import create_events_table
+from .formatters import EVENT_COLUMNS, create_events_table, event_row
+from .table_stream import TableStream
 
 
 class ListPresenter:
@@ -42,6 +43,23 @@ class ListPresenter:
         self.console.print(table)
         self.console.print()
 
+    def stream_table(self, events: Iterable[Event], title: str, pager: bool = True) -> int:
+        """Display events as they are read, in fixed-width chunks.
+
+        Unlike show_single_table, rows are rendered while the cursor is
+        still being consumed, so memory does not grow with the result size.
+
+        Args:
+            events: Event iterator (e.g. from stream_rows).
+            title: Title to show above the table.
+            pager: Page the output when stdout is a TTY.
+
+        Returns:
+            Number of events displayed (0 means nothing was printed).
+        """
+        stream = TableStream(self.console, EVENT_COLUMNS, pager=pager)
+        return stream.write((event_row(event) for event in events), title)
+
     def show_split_view(
         self,
         past_events: list[Event],
@@ -67,29 +85,3 @@ class ListPresenter:
         # Display summary count
         total = len(past_events) + len(present_events) + len(future_events)
         self.console.print(f"[dim]Total: {total} events[/dim]")
-
-    def split_by_time(self, events: list[Event]) -> tuple[list[Event], list[Event], list[Event]]:
-        """Split events into past, present, and future.
-
-        Time periods:
-        - Past: More than 7 days ago
-        - Present: Last 7 days until now
-        - Future: From now onwards
-
-        Args:
-            events: Complete list of events to split.
-
-        Returns:
-            Tuple of (past_events, present_events, future_events)
-        """
-        now = datetime.now(UTC)
-        week_ago = now - timedelta(days=7)
-
-        # SQLite returns naive datetimes, convert to aware for comparison
-        past = [e for e in events if e.scheduled_start.replace(tzinfo=UTC) < week_ago]
-
-        present = [e for e in events if week_ago <= e.scheduled_start.replace(tzinfo=UTC) < now]
-
-        future = [e for e in events if e.scheduled_start.replace(tzinfo=UTC) >= now]
-
-        return (past, present, future)
@@ -1,8 +1,10 @@
 """Rich formatting utilities for terminal output."""
 
+from rich.markup import escape
 from rich.table import Table
 
 from ..models import Event
+from .table_stream import StreamColumn
 
 # Status color mapping for terminal display
 STATUS_COLORS = {
@@ -14,6 +16,57 @@ STATUS_COLORS = {
 }
 
 
+# Column layout shared by the buffered table and the streaming presenter
+EVENT_COLUMNS = [
+    StreamColumn("ID", 4, style="dim"),
+    StreamColumn("Date", 10, style="cyan"),
+    StreamColumn("Title", 20, style="bold", flex=True),
+    StreamColumn("Time", 13, style="cyan"),
+    StreamColumn("Duration", 8, justify="right"),
+    StreamColumn("Status", 11, justify="center"),
+    StreamColumn("Color", 8, justify="center"),
+]
+
+
+def event_row(event: Event) -> tuple[str, ...]:
+    """Format one event as table cells (with Rich markup).
+
+    Args:
+        event: Event to format
+
+    Returns:
+        Cells in EVENT_COLUMNS order
+    """
+    duration = (event.scheduled_end - event.scheduled_start).total_seconds() / 3600
+
+    # Format status with color
+    status_color = STATUS_COLORS.get(event.status.value, "white")
+    status_text = f"[{status_color}]{event.status.value}[/{status_color}]"
+
+    # Format color
+    color_display = "[dim]-[/dim]"
+    if event.color:
+        color_display = f"[{event.color}]●[/{event.color}] {event.color}"
+
+    # Format date
+    date_str = event.scheduled_start.strftime("%Y-%m-%d")
+
+    # Format time range
+    time_str = (
+        f"{event.scheduled_start.strftime('%H:%M')} → {event.scheduled_end.strftime('%H:%M')}"
+    )
+
+    return (
+        str(event.id),
+        date_str,
+        escape(event.title),
+        time_str,
+        f"{duration:.1f}h",
+        status_text,
+        color_display,
+    )
+
+
 def create_events_table(events: list[Event], title: str) -> Table:
     """Create a formatted table for events.
 
@@ -33,43 +86,17 @@ def create_events_table(events: list[Event], title: str) -> Table:
         box=None,  # Remove box for cleaner look
     )
 
-    # Fixed widths to prevent truncation
-    table.add_column("ID", style="dim", min_width=4, no_wrap=True)
-    table.add_column("Date", style="cyan", min_width=10, no_wrap=True)
-    table.add_column("Title", style="bold", min_width=20, no_wrap=True)
-    table.add_column("Time", style="cyan", min_width=13, no_wrap=True)
-    table.add_column("Duration", justify="right", min_width=8, no_wrap=True)
-    table.add_column("Status", justify="center", min_width=12, no_wrap=True)
-    table.add_column("Color", justify="center", min_width=15, no_wrap=True)
-
-    for event in events:
-        duration = (event.scheduled_end - event.scheduled_start).total_seconds() / 3600
-
-        # Format status with color
-        status_color = STATUS_COLORS.get(event.status.value, "white")
-        status_text = f"[{status_color}]{event.status.value}[/{status_color}]"
-
-        # Format color
-        color_display = "[dim]-[/dim]"
-        if event.color:
-            color_display = f"[{event.color}]●[/{event.color}] {event.color}"
-
-        # Format date
-        date_str = event.scheduled_start.strftime("%Y-%m-%d")
-
-        # Format time range
-        time_str = (
-            f"{event.scheduled_start.strftime('%H:%M')} → {event.scheduled_end.strftime('%H:%M')}"
+    # Minimum widths to prevent truncation
+    for column in EVENT_COLUMNS:
+        table.add_column(
+            column.header,
+            style=column.style,
+            justify=column.justify,
+            min_width=column.width,
+            no_wrap=True,
         )
 
-        table.add_row(
-            str(event.id),
-            date_str,
-            event.title,
-            time_str,
-            f"{duration:.1f}h",
-            status_text,
-            color_display,
-        )
+    for event in events:
+        table.add_row(*event_row(event))
 
     return table
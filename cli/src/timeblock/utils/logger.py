@@ -2,16 +2,135 @@
 
 Este módulo fornece logging padronizado com:
 - Formato estruturado com timestamp, nível, módulo
+- Formato JSON opcional (uma linha por registro, com os campos de `extra`)
 - Suporte a console e arquivo
 - Rotação automática de logs
+- Escrita em arquivo fora da thread que loga (QueueHandler + QueueListener)
 - Configuração por nível (DEBUG, INFO, WARNING, ERROR)
+
+Os argumentos da mensagem são avaliados só se o nível está habilitado:
+use `logger.debug("instance_id=%s", instance_id)`, nunca f-string, que
+formata a mensagem mesmo com DEBUG desligado. Campos para o JSON vão em
+`extra`:
+
+    logger.info("Instância completada: instance_id=%s", instance_id,
+                extra={"instance_id": instance_id})
+
+Os loggers de `get_logger` (os dos services) leem duas variáveis de ambiente
+na primeira chamada do processo:
+- TIMEBLOCK_LOG_FILE: também grava neste arquivo, via fila
+- TIMEBLOCK_LOG_FORMAT=json: console e arquivo em JSON
 """
 
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+LOG_FILE_ENV = "TIMEBLOCK_LOG_FILE"
+LOG_FORMAT_ENV = "TIMEBLOCK_LOG_FORMAT"
+
+# Atributos que todo LogRecord tem; o resto veio de `extra`
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+# Listener de cada logger configurado com queued=True (chave: nome do logger)
+_listeners: dict[str, QueueListener] = {}
+# Handlers compartilhados pelos loggers de get_logger
+_default_handlers: list[logging.Handler] | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Uma linha JSON por registro: ts, level, logger, msg e campos de `extra`.
+
+    Exemplo de saída:
+        {"ts": "2025-10-20T09:00:00.123-03:00", "level": "INFO",
+         "logger": "src.timeblock.services.habit_instance_service",
+         "msg": "Instância completada: instance_id=7", "instance_id": 7}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created)
+            .astimezone()
+            .isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler para um listener no mesmo processo.
+
+    O `prepare` padrão formata a linha inteira na thread que loga e descarta
+    a traceback, para o registro poder ser serializado. Aqui ele não sai do
+    processo: só a mensagem é interpolada na hora (os argumentos podem mudar
+    depois); formatação e traceback ficam para a thread do listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def _formatter(json_format: bool) -> logging.Formatter:
+    if json_format:
+        return JsonFormatter()
+    # Formato estruturado: [timestamp] [level] [module] message
+    return logging.Formatter(
+        fmt="[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+
+def _file_handler(
+    log_file: Path, max_bytes: int, backup_count: int, formatter: logging.Formatter
+) -> RotatingFileHandler:
+    # Garante que diretório existe
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    file_handler = RotatingFileHandler(
+        filename=log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    file_handler.setFormatter(formatter)
+    return file_handler
+
+
+def _queue_handler(key: str, handlers: list[logging.Handler]) -> QueueHandler:
+    """Liga `handlers` a uma thread própria e devolve o handler que enfileira."""
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[key] = listener
+    return _InProcessQueueHandler(log_queue)
+
+
+def _stop_listener(key: str) -> None:
+    listener = _listeners.pop(key, None)
+    if listener is not None:
+        # Escreve o que ainda está na fila antes de parar
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
 
 def setup_logger(
     name: str,
@@ -20,6 +139,8 @@ def setup_logger(
     max_bytes: int = 10_000_000,
     backup_count: int = 5,
     console: bool = True,
+    json_format: bool = False,
+    queued: bool = False,
 ) -> logging.Logger:
     """Configura logger com formato estruturado.
 
@@ -30,6 +151,10 @@ def setup_logger(
         max_bytes: Tamanho máximo antes de rotação (padrão: 10MB)
         backup_count: Número de backups mantidos (padrão: 5)
         console: Se True, também loga no console
+        json_format: Se True, uma linha JSON por registro (JsonFormatter)
+        queued: Se True, o logger só enfileira os registros e uma thread
+            escreve no console e no arquivo; chame shutdown_logging() antes
+            de ler o arquivo (no fim do processo isso é automático)
 
     Returns:
         Logger configurado
@@ -46,30 +171,28 @@ def setup_logger(
 
     # Remove handlers existentes (evita duplicação)
     logger.handlers.clear()
+    _stop_listener(name)
 
-    # Formato estruturado: [timestamp] [level] [module] message
-    formatter = logging.Formatter(
-        fmt="[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    formatter = _formatter(json_format)
+    handlers: list[logging.Handler] = []
 
     # Handler para console (stderr)
     if console:
         console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setLevel(getattr(logging, level.upper()))
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # Handler para arquivo com rotação
     if log_file:
-        # Garante que diretório existe
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(_file_handler(log_file, max_bytes, backup_count, formatter))
 
-        file_handler = RotatingFileHandler(
-            filename=log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
-        )
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    for handler in handlers:
+        handler.setLevel(getattr(logging, level.upper()))
+    if queued and handlers:
+        logger.addHandler(_queue_handler(name, handlers))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     # Evita propagação para root logger
     logger.propagate = False
@@ -87,17 +210,51 @@ def get_logger(name: str) -> logging.Logger:
         Logger configurado
 
     Nota:
-        Se logger não existir, cria com nível INFO e console only.
+        Se logger não existir, cria com nível INFO e os handlers padrão,
+        compartilhados por todos os módulos: console e, com
+        TIMEBLOCK_LOG_FILE, o arquivo (escrito pela thread da fila).
     """
     logger = logging.getLogger(name)
 
     # Se logger não tem handlers, configura padrão
     if not logger.handlers:
-        return setup_logger(name, level="INFO", console=True)
+        logger.setLevel(logging.INFO)
+        for handler in _defaults():
+            logger.addHandler(handler)
+        logger.propagate = False
 
     return logger
 
 
+def _defaults() -> list[logging.Handler]:
+    """Handlers de get_logger, criados na primeira chamada a partir do ambiente."""
+    global _default_handlers
+    if _default_handlers is None:
+        formatter = _formatter(os.getenv(LOG_FORMAT_ENV, "").lower() == "json")
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(formatter)
+        handlers: list[logging.Handler] = [console_handler]
+        log_file = os.getenv(LOG_FILE_ENV)
+        if log_file:
+            file_handler = _file_handler(Path(log_file), 10_000_000, 5, formatter)
+            handlers.append(_queue_handler(LOG_FILE_ENV, [file_handler]))
+        _default_handlers = handlers
+    return _default_handlers
+
+
+def shutdown_logging() -> None:
+    """Escreve o que está nas filas e para as threads de logging.
+
+    Registrada no atexit. Loggers com fila não devem ser usados depois,
+    a menos que sejam configurados de novo.
+    """
+    for key in list(_listeners):
+        _stop_listener(key)
+
+
+atexit.register(shutdown_logging)
+
+
 def disable_logging():
     """Desabilita todos os logs (útil para testes).
 
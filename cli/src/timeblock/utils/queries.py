@@ -1,23 +1,49 @@
 """Database query utilities."""
 
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
 
+from sqlalchemy import select as sa_select
+from sqlalchemy import tuple_
 from sqlmodel import Session, select
 
-from ..models import Event
+from ..models import Event, Habit, HabitInstance, ScheduleItem, schedule_item
+from ..models.time_encoding import to_epoch_minutes
+
+# Keyset cursor: (scheduled_start, id) of the last event of the previous page
+EventCursor = tuple[datetime, int]
+
+
+def event_cursor(event: Event) -> EventCursor:
+    """Keyset cursor pointing right after `event` in the listing order."""
+    return (event.scheduled_start, event.id)
 
 
 def build_events_query(
     start: datetime | None = None,
     end: datetime | None = None,
     ascending: bool = True,
+    limit: int | None = None,
+    offset: int | None = None,
+    after: EventCursor | None = None,
+    before: datetime | None = None,
 ):
     """Build a query for events with optional date range filter.
 
+    Ordering is (scheduled_start, id), which the scheduled_start index
+    serves directly, so `limit` reads only that many rows. For paging
+    prefer `after` (keyset) over `offset`: offset still walks the skipped
+    rows, a cursor seeks straight to the next page.
+
     Args:
         start: Filter events starting from this datetime (inclusive).
         end: Filter events up to this datetime (inclusive).
         ascending: Sort by start time ascending (True) or descending (False).
+        limit: Maximum number of rows (applied in SQL).
+        offset: Number of rows to skip (applied in SQL).
+        after: Keyset cursor (see event_cursor); only rows after it in the
+            chosen order are returned.
+        before: Filter events starting strictly before this datetime.
 
     Returns:
         SQLModel Select statement ready to execute.
@@ -31,32 +57,76 @@ def build_events_query(
         >>> start = datetime(2025, 10, 1, tzinfo=timezone.utc)
         >>> end = datetime(2025, 10, 31, tzinfo=timezone.utc)
         >>> query = build_events_query(start, end)
+
+        >>> # Next page of 50, after the last event already shown
+        >>> query = build_events_query(limit=50, after=event_cursor(last_event))
     """
     statement = select(Event)
 
     # Apply date range filters
-    if start is not None and end is not None:
-        statement = statement.where(
-            Event.scheduled_start >= start,
-            Event.scheduled_start <= end,
-        )  # type: ignore
-    elif start is not None:
+    if start is not None:
         statement = statement.where(Event.scheduled_start >= start)  # type: ignore
-    elif end is not None:
+    if end is not None:
         statement = statement.where(Event.scheduled_start <= end)  # type: ignore
+    if before is not None:
+        statement = statement.where(Event.scheduled_start < before)  # type: ignore
+
+    # Apply keyset cursor (row-value comparison matches the ordering)
+    if after is not None:
+        key = tuple_(Event.scheduled_start, Event.id)
+        statement = statement.where(key > tuple_(*after) if ascending else key < tuple_(*after))
 
     # Apply ordering
     if ascending:
-        statement = statement.order_by(Event.scheduled_start)  # type: ignore
+        statement = statement.order_by(Event.scheduled_start, Event.id)  # type: ignore
     else:
         # Pylint false positive: SQLModel dynamic attributes
         statement = statement.order_by(
-            Event.scheduled_start.desc()  # pylint: disable=no-member
+            Event.scheduled_start.desc(),  # pylint: disable=no-member
+            Event.id.desc(),  # pylint: disable=no-member
         )
 
+    if limit is not None:
+        statement = statement.limit(limit)
+    if offset is not None:
+        statement = statement.offset(offset)
+
     return statement
 
 
+def period_filters(
+    start: datetime | None, end: datetime | None, now: datetime
+) -> tuple[dict, dict, dict]:
+    """Range filters for the past/present/future buckets of the list view.
+
+    Buckets (ListPresenter.show_split_view renders one table per bucket):
+        - Past: before 7 days ago
+        - Present: last 7 days until now
+        - Future: from now onwards
+
+    Each dict holds build_events_query keyword arguments, intersected with
+    the [start, end] range, so every bucket is its own bounded query.
+
+    Args:
+        start: Range start (inclusive), or None.
+        end: Range end (inclusive), or None.
+        now: Reference datetime.
+
+    Returns:
+        Tuple of (past, present, future) filter dicts.
+    """
+    week_ago = now - timedelta(days=7)
+
+    def clamp(lower: datetime) -> datetime:
+        return lower if start is None else max(start, lower)
+
+    return (
+        {"start": start, "end": end, "before": week_ago},
+        {"start": clamp(week_ago), "end": end, "before": now},
+        {"start": clamp(now), "end": end},
+    )
+
+
 def fetch_events(session: Session, statement) -> list[Event]:
     """Execute query and return list of events.
 
@@ -75,11 +145,36 @@ def fetch_events(session: Session, statement) -> list[Event]:
     return list(session.exec(statement))
 
 
+def stream_rows(session: Session, statement, chunk_size: int = 500) -> Iterator:
+    """Execute query and yield results while the cursor is consumed.
+
+    Rows are fetched `chunk_size` at a time (yield_per), so memory stays
+    bounded regardless of the result size. The session must stay open
+    until the iterator is exhausted.
+
+    Args:
+        session: Active SQLModel session.
+        statement: Query statement to execute.
+        chunk_size: Rows fetched per round trip.
+
+    Returns:
+        Iterator of results (Event objects for build_events_query, tuples
+        for multi-entity selects).
+
+    Examples:
+        >>> with Session(engine) as session:
+        ...     for event in stream_rows(session, build_events_query()):
+        ...         print(event.title)
+    """
+    return iter(session.exec(statement.execution_options(yield_per=chunk_size)))
+
+
 def fetch_events_in_range(
     session: Session,
     start: datetime | None = None,
     end: datetime | None = None,
     ascending: bool = True,
+    **filters,
 ) -> list[Event]:
     """Fetch events in a date range (convenience function).
 
@@ -90,6 +185,8 @@ def fetch_events_in_range(
         start: Filter events starting from this datetime (inclusive).
         end: Filter events up to this datetime (inclusive).
         ascending: Sort by start time ascending (True) or descending (False).
+        **filters: Other build_events_query arguments (limit, offset,
+            after, before).
 
     Returns:
         List of Event objects matching the criteria.
@@ -106,5 +203,83 @@ def fetch_events_in_range(
         >>> with Session(engine) as session:
         ...     events = fetch_events_in_range(session, start, end)
     """
-    query = build_events_query(start, end, ascending)
+    query = build_events_query(start, end, ascending, **filters)
     return fetch_events(session, query)
+
+
+def build_instances_query(day: date | None = None, habit_id: int | None = None):
+    """Build a query for habit instances joined with their habit.
+
+    One query instead of one habit lookup per instance; rows are
+    (HabitInstance, Habit) ordered by date and start time. Pair with
+    stream_rows for listings of unbounded size.
+
+    Args:
+        day: Only instances on this date.
+        habit_id: Only instances of this habit.
+
+    Returns:
+        SQLModel Select statement ready to execute.
+    """
+    statement = select(HabitInstance, Habit).join(Habit, HabitInstance.habit_id == Habit.id)
+    if day is not None:
+        statement = statement.where(HabitInstance.date == day)
+    if habit_id is not None:
+        statement = statement.where(HabitInstance.habit_id == habit_id)
+    return statement.order_by(HabitInstance.date, HabitInstance.scheduled_start, HabitInstance.id)
+
+
+def build_schedule_query(
+    start: datetime,
+    end: datetime,
+    kinds: list[str] | None = None,
+):
+    """Build a query over the unified schedule_item view.
+
+    Returns every item (task, habit instance or event) overlapping the
+    half-open range [start, end), ordered by start time. Minute resolution.
+
+    Args:
+        start: Range start (inclusive).
+        end: Range end (exclusive).
+        kinds: Optional subset of kinds ("task", "habit_instance", "event").
+
+    Returns:
+        SQLAlchemy Select statement ready to execute.
+
+    Examples:
+        >>> from datetime import datetime
+        >>> query = build_schedule_query(datetime(2025, 10, 1), datetime(2025, 10, 8))
+    """
+    statement = sa_select(schedule_item).where(
+        schedule_item.c.start_min < to_epoch_minutes(end),
+        schedule_item.c.end_min > to_epoch_minutes(start),
+    )
+    if kinds is not None:
+        statement = statement.where(schedule_item.c.kind.in_(kinds))
+    return statement.order_by(schedule_item.c.start_min, schedule_item.c.kind, schedule_item.c.id)
+
+
+def fetch_schedule_items(
+    session: Session,
+    start: datetime,
+    end: datetime,
+    kinds: list[str] | None = None,
+) -> list[ScheduleItem]:
+    """Fetch everything on the calendar between start and end in one round trip.
+
+    Args:
+        session: Active SQLModel session.
+        start: Range start (inclusive).
+        end: Range end (exclusive).
+        kinds: Optional subset of kinds.
+
+    Returns:
+        List of ScheduleItem ordered by start time.
+
+    Examples:
+        >>> with Session(engine) as session:
+        ...     items = fetch_schedule_items(session, week_start, week_end)
+    """
+    statement = build_schedule_query(start, end, kinds)
+    return [ScheduleItem(**row._mapping) for row in session.exec(statement)]
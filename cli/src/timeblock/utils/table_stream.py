@@ -0,0 +1,196 @@
+"""Streaming table output for listings of unbounded size.
+
+A Rich `Table` measures every row before printing the first one, so a
+listing only shows up once the whole result set is in memory. `TableStream`
+instead renders rows in fixed-size chunks as they arrive from the cursor:
+every chunk is a small table with the same fixed column widths, so the
+chunks line up as one table and memory stays bounded by the chunk size.
+
+Output target depends on where stdout goes:
+    - TTY: chunks are piped into `$PAGER` (default `less -FRX`) as they
+      are rendered, so the first page shows before the query finishes
+    - TTY without pager: chunks printed straight to the console
+    - Pipe/file: plain tab-separated lines (no markup, no header), with the
+      title and total on stderr so the data stays script-friendly
+"""
+
+import os
+import shlex
+import subprocess
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Literal
+
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+CHUNK_SIZE = 200
+DEFAULT_PAGER = "less -FRX"
+
+Row = tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class StreamColumn:
+    """Column with a fixed width, shared by every chunk of the stream.
+
+    A `flex` column takes `width` as its minimum and grows to fill the
+    console; its final width is still fixed once the stream starts.
+    """
+
+    header: str
+    width: int
+    style: str = ""
+    justify: Literal["left", "center", "right"] = "left"
+    flex: bool = False
+
+
+def _plain(cell: str) -> str:
+    """Strip Rich markup from a cell."""
+    return Text.from_markup(cell).plain
+
+
+@contextmanager
+def _pager_console(console: Console) -> Iterator[Console]:
+    """Console writing into a pager subprocess, or `console` if none starts.
+
+    Quitting the pager early closes the pipe; the resulting BrokenPipeError
+    just ends the stream.
+    """
+    command = shlex.split(os.environ.get("PAGER") or DEFAULT_PAGER)
+    try:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, text=True, encoding="utf-8")
+    except OSError:
+        yield console
+        return
+
+    assert process.stdin is not None
+    pager = Console(
+        file=process.stdin,
+        force_terminal=True,
+        color_system=console.color_system,
+        width=console.width,
+    )
+    try:
+        yield pager
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        process.wait()
+
+
+class TableStream:
+    """Render rows from an iterator in fixed-width chunks."""
+
+    def __init__(
+        self,
+        console: Console,
+        columns: list[StreamColumn],
+        chunk_size: int = CHUNK_SIZE,
+        pager: bool = True,
+    ):
+        """Initialize the stream.
+
+        Args:
+            console: Console bound to stdout.
+            columns: Column layout, applied to every chunk.
+            chunk_size: Rows rendered per chunk (upper bound on buffered rows).
+            pager: Use `$PAGER` when stdout is a TTY.
+        """
+        self.console = console
+        self.columns = columns
+        self.chunk_size = chunk_size
+        self.pager = pager
+
+    def write(self, rows: Iterable[Row], title: str = "") -> int:
+        """Render all rows and return how many were written.
+
+        Nothing is printed (and no pager is started) when `rows` is empty.
+
+        Args:
+            rows: Row iterator; cells may contain Rich markup.
+            title: Title shown above the first chunk.
+
+        Returns:
+            Number of rows written.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return 0
+        rows = chain([first], rows)
+
+        if not self.console.is_terminal:
+            return self._write_plain(rows, title)
+        if self.pager:
+            with _pager_console(self.console) as target:
+                return self._write_chunks(target, rows, title)
+        return self._write_chunks(self.console, rows, title)
+
+    def _widths(self, console_width: int) -> list[int]:
+        """Resolve column widths once, so every chunk lines up."""
+        separators = len(self.columns) - 1
+        spare = console_width - separators - sum(column.width for column in self.columns)
+        flex = [column for column in self.columns if column.flex]
+        extra = max(spare, 0) // len(flex) if flex else 0
+        return [column.width + (extra if column.flex else 0) for column in self.columns]
+
+    def _new_table(self, widths: list[int], title: str, show_header: bool) -> Table:
+        table = Table(
+            title=title or None,
+            show_header=show_header,
+            header_style="bold cyan",
+            box=None,
+            padding=(0, 1, 0, 0),
+            pad_edge=False,
+        )
+        for column, width in zip(self.columns, widths, strict=True):
+            table.add_column(
+                column.header,
+                style=column.style,
+                justify=column.justify,
+                width=width,
+                no_wrap=True,
+                overflow="ellipsis",
+            )
+        return table
+
+    def _write_chunks(self, target: Console, rows: Iterator[Row], title: str) -> int:
+        widths = self._widths(target.width)
+        total = 0
+        target.print()
+        while chunk := list(islice(rows, self.chunk_size)):
+            table = self._new_table(widths, title if total == 0 else "", show_header=total == 0)
+            for row in chunk:
+                table.add_row(*row)
+            target.print(table)
+            total += len(chunk)
+        target.print()
+        target.print(f"[dim]Total: {total}[/dim]")
+        return total
+
+    def _write_plain(self, rows: Iterator[Row], title: str) -> int:
+        stderr = Console(stderr=True)
+        if title:
+            stderr.print(title, highlight=False)
+        out = self.console.file
+        total = 0
+        try:
+            for row in rows:
+                out.write("\t".join(_plain(cell) for cell in row) + "\n")
+                total += 1
+            out.flush()
+        except BrokenPipeError:
+            # Reader closed the pipe (e.g. `| head`): stop quietly. stdout is
+            # pointed at devnull so the interpreter's final flush does not fail.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), out.fileno())
+            return total
+        stderr.print(f"Total: {total}", highlight=False)
+        return total
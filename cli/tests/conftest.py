@@ -23,6 +23,37 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Opção para habilitar os benchmarks (lentos)."""
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Executa testes marcados com @pytest.mark.benchmark",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Pula testes `benchmark` a menos que --run-benchmarks seja passado.
+
+    Com a opção e a cobertura ligada (o padrão do pytest.ini), roda-os com a
+    coleta pausada (`no_cover` do pytest-cov): o tracer deixaria o código
+    medido várias vezes mais lento.
+    """
+    if config.getoption("--run-benchmarks"):
+        # Sem --cov ou com --no-cov não há coleta a pausar
+        cov_plugin = config.pluginmanager.getplugin("_cov")
+        if getattr(cov_plugin, "cov_controller", None) is not None:
+            for item in items:
+                if "benchmark" in item.keywords:
+                    item.add_marker(pytest.mark.no_cover)
+        return
+    skip = pytest.mark.skip(reason="benchmark: use --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture
 def test_engine() -> Engine:
     """Engine SQLite em memória para testes isolados."""
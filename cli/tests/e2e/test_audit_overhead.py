@@ -0,0 +1,43 @@
+"""
+E2E: custo da auditoria na latência de escrita.
+
+Roda a carga de `benchmarks/bench_audit.py` com e sem os hooks de auditoria
+e falha se o overhead passar de 10%. Lento e dependente da máquina, por
+isso só roda com `--run-benchmarks`.
+
+Referências:
+    - ADR-019: Test Naming Convention
+    - benchmarks/bench_audit.py
+"""
+
+import pytest
+
+from benchmarks.bench_audit import MAX_OVERHEAD, measure
+
+
+@pytest.mark.benchmark
+class TestBRAuditOverhead:
+    """
+    E2E: Auditoria dentro do orçamento de escrita.
+
+    BRs cobertas:
+    - BR-AUDIT-OVERHEAD-001: Overhead da auditoria < 10%
+    """
+
+    def test_br_audit_overhead_001_within_budget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        E2E: Escritas auditadas custam menos de 10% a mais.
+
+        DADO: Bancos novos por rodada, alternando com e sem auditoria
+        QUANDO: A mesma carga de escrita roda 5 vezes em cada variante
+        ENTÃO: O menor tempo com auditoria fica abaixo de 110% do menor sem
+        """
+        # measure() aponta TIMEBLOCK_DB_PATH para bancos temporários
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", "")
+
+        result = measure(runs=5)
+
+        assert result["overhead"] < MAX_OVERHEAD, (
+            f"auditoria custa {result['overhead']:.1%} "
+            f"({result['audited_s'] * 1000:.0f} ms vs {result['plain_s'] * 1000:.0f} ms)"
+        )
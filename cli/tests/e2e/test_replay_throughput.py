@@ -0,0 +1,48 @@
+"""
+E2E: vazão da reconstrução do banco pelo log de operações.
+
+Roda a carga de `benchmarks/bench_replay.py` e falha se o replay completo
+ou o replay a partir do snapshot ficar abaixo de 50 mil operações por
+segundo, ou se algum banco reconstruído divergir do atual. Lento e
+dependente da máquina, por isso só roda com `--run-benchmarks`.
+
+Referências:
+    - ADR-019: Test Naming Convention
+    - benchmarks/bench_replay.py
+"""
+
+import pytest
+
+from benchmarks.bench_replay import TARGET_EVENTS_PER_SECOND, measure
+
+
+@pytest.mark.benchmark
+class TestBRReplayThroughput:
+    """
+    E2E: Replay dentro da vazão alvo.
+
+    BRs cobertas:
+    - BR-REPLAY-THROUGHPUT-001: Replay completo e a partir do snapshot
+      >= 50 mil operações/s
+    """
+
+    def test_br_replay_throughput_001_full_and_snapshot(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        E2E: Os dois modos reaplicam o log a 50 mil operações/s ou mais.
+
+        DADO: Um banco com ~117 mil operações no log e um snapshot no meio
+        QUANDO: O banco é reconstruído 5 vezes sem e com o snapshot
+        ENTÃO: A melhor vazão de cada modo atinge o alvo e todos conferem
+        """
+        # measure() aponta TIMEBLOCK_DB_PATH para bancos temporários
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", "")
+
+        result = measure(runs=5)
+
+        for mode, label in (("full", "replay completo"), ("snapshot", "replay do snapshot")):
+            assert result[f"{mode}_events_per_s"] >= TARGET_EVENTS_PER_SECOND, (
+                f"{label} a {result[f'{mode}_events_per_s']:,.0f} ops/s "
+                f"({result[f'{mode}_events']:,.0f} operações)"
+            )
@@ -0,0 +1,157 @@
+"""
+E2E: orçamento de tempo de inicialização da CLI.
+
+Os testes marcados com `benchmark` executam cada comando representativo em
+processos novos contra um banco temporário populado e falham quando o
+comando termina com erro ou a mediana passa do orçamento em
+`benchmarks/startup_budgets.json`. São lentos e dependem da máquina, por
+isso só rodam com `--run-benchmarks`.
+
+Referências:
+    - ADR-019: Test Naming Convention
+    - benchmarks/bench_startup.py
+"""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.bench_startup import (
+    COMMANDS,
+    check_budgets,
+    import_offenders,
+    load_budgets,
+    parse_importtime,
+    seed_database,
+    time_command,
+)
+
+
+@pytest.fixture(scope="module")
+def seeded_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Banco populado compartilhado pelos comandos medidos."""
+    db_path = tmp_path_factory.mktemp("startup") / "bench.db"
+    seed_database(db_path)
+    return db_path
+
+
+class TestBRCLIStartupBudgetHelpers:
+    """
+    Unit: Funções de apoio do benchmark de inicialização.
+
+    BRs cobertas:
+    - BR-CLI-STARTUP-001: Ofensores de import agregados por pacote
+    - BR-CLI-STARTUP-002: Violação de orçamento detectada
+    - BR-CLI-STARTUP-003: Orçamentos só para comandos medidos
+    - BR-CLI-STARTUP-005: Comando com erro é violação, mesmo rápido
+    """
+
+    def test_br_cli_startup_001_parse_importtime_groups_by_package(self) -> None:
+        """
+        Unit: Tempo próprio somado por pacote de topo.
+
+        DADO: Saída de `-X importtime` com submódulos de sqlalchemy e do projeto
+        QUANDO: A saída é analisada
+        ENTÃO: sqlalchemy é somado em uma entrada
+        E: Módulos do projeto são agrupados pelo subpacote
+        """
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |   sqlalchemy.sql\n"
+            "import time:        50 |        150 | sqlalchemy\n"
+            "import time:        30 |         30 |     src.timeblock.models.habit\n"
+            "import time:        20 |         50 |   src.timeblock.models\n"
+            "unrelated line\n"
+        )
+
+        totals = parse_importtime(stderr)
+
+        assert totals == {"sqlalchemy": 150, "src.timeblock.models": 50}
+
+    def test_br_cli_startup_002_check_budgets_reports_violations(self) -> None:
+        """
+        Unit: Comando acima do orçamento ou sem orçamento é violação.
+
+        DADO: Resultados para três comandos
+        QUANDO: Comparados com orçamentos onde um estoura e um falta
+        ENTÃO: Apenas esses dois são reportados
+        """
+        results = {
+            "version": {"median_ms": 90.0},
+            "list": {"median_ms": 900.0},
+            "habit list": {"median_ms": 100.0},
+        }
+        budgets = {"version": 150.0, "list": 500.0}
+
+        violations = check_budgets(results, budgets)
+
+        assert len(violations) == 2
+        assert violations[0].startswith("list: 900 ms")
+        assert violations[1].startswith("habit list: sem orçamento")
+
+    def test_br_cli_startup_003_budgets_only_for_measured_commands(self) -> None:
+        """
+        Unit: Arquivo de orçamentos só tem comandos medidos.
+
+        DADO: startup_budgets.json versionado
+        QUANDO: Comparado com COMMANDS
+        ENTÃO: Todo orçamento é de um comando medido e é positivo
+        E: Comandos sem orçamento (quebrados ao gravar) viram violação no check
+        """
+        budgets = load_budgets()
+
+        assert set(budgets) <= set(COMMANDS)
+        assert all(value > 0 for value in budgets.values())
+
+    def test_br_cli_startup_005_broken_command_is_violation(self) -> None:
+        """
+        Unit: Comando que termina com erro é reportado como quebrado.
+
+        DADO: Um comando dentro do orçamento, mas com exit_code 1
+        QUANDO: Comparado com os orçamentos
+        ENTÃO: A violação aponta o código de saída e a última linha do erro
+        """
+        results = {
+            "timer status": {
+                "median_ms": 90.0,
+                "exit_code": 1,
+                "error": "AttributeError: boom",
+            },
+            "version": {"median_ms": 90.0, "exit_code": 0, "error": ""},
+        }
+        budgets = {"timer status": 150.0, "version": 150.0}
+
+        violations = check_budgets(results, budgets)
+
+        assert violations == ["timer status: quebrado, saiu com código 1: AttributeError: boom"]
+
+
+@pytest.mark.benchmark
+class TestBRCLIStartupBudget:
+    """
+    E2E: Comandos da CLI dentro do orçamento de inicialização.
+
+    BRs cobertas:
+    - BR-CLI-STARTUP-004: Comando termina sem erro e com mediana <= orçamento
+    """
+
+    @pytest.mark.parametrize("name", list(COMMANDS))
+    def test_br_cli_startup_004_command_within_budget(self, name: str, seeded_db: Path) -> None:
+        """
+        E2E: Comando termina dentro do orçamento em processo novo.
+
+        DADO: Banco temporário populado
+        QUANDO: O comando roda 5 vezes em processos Python novos
+        ENTÃO: Todas as execuções terminam com código 0
+        E: A mediana de tempo de parede não passa do orçamento
+        """
+        result = time_command(COMMANDS[name], seeded_db, runs=5)
+
+        violations = check_budgets({name: result}, load_budgets())
+
+        if result["exit_code"]:
+            pytest.fail(violations[0])
+        if violations:
+            offenders = import_offenders(COMMANDS[name], seeded_db)
+            detail = "\n".join(f"  {ms:7.1f} ms  {package}" for package, ms in offenders)
+            pytest.fail(f"{violations[0]}\nMaiores imports:\n{detail}")
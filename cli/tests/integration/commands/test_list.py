@@ -54,7 +54,9 @@ def isolated_db(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
 
     # Mock get_engine_context para retornar test engine
     monkeypatch.setattr("src.timeblock.database.get_engine_context", mock_engine_context)
-    monkeypatch.setattr("src.timeblock.commands.list.get_engine_context", mock_engine_context)
+    monkeypatch.setattr(
+        "src.timeblock.commands.list.get_readonly_engine_context", mock_engine_context
+    )
 
     # Criar tabelas
     SQLModel.metadata.create_all(engine)
@@ -0,0 +1,166 @@
+"""
+Integration tests para listagens em streaming (`list --all/--limit`, `schedule list`).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+import pytest
+from sqlmodel import Session
+from typer.testing import CliRunner
+
+from src.timeblock.daemon.client import should_forward
+from src.timeblock.database import create_db_and_tables, get_engine_context
+from src.timeblock.main import app
+from src.timeblock.models import Event, Habit, HabitInstance, Recurrence, Routine
+
+
+@pytest.fixture
+def runner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> CliRunner:
+    """CliRunner com banco isolado e tabelas criadas."""
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(tmp_path / "stream.db"))
+    monkeypatch.setenv("TIMEBLOCK_NO_DAEMON", "1")
+    create_db_and_tables()
+    return CliRunner()
+
+
+def _add_events(count: int) -> None:
+    start = datetime(2025, 10, 1, 9, 0)
+    with get_engine_context() as engine, Session(engine) as session:
+        for index in range(count):
+            day_start = start + timedelta(days=index)
+            session.add(
+                Event(
+                    title=f"Evento {index}",
+                    scheduled_start=day_start,
+                    scheduled_end=day_start + timedelta(hours=1),
+                )
+            )
+        session.commit()
+
+
+def _add_instances() -> None:
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Rotina", is_active=True)
+        session.add(routine)
+        session.flush()
+        habits = [
+            Habit(
+                routine_id=routine.id,
+                title=title,
+                scheduled_start=time(hour, 0),
+                scheduled_end=time(hour, 30),
+                recurrence=Recurrence.EVERYDAY,
+            )
+            for title, hour in (("Leitura", 7), ("Academia", 18))
+        ]
+        session.add_all(habits)
+        session.flush()
+        for offset in range(2):
+            for habit in habits:
+                session.add(
+                    HabitInstance(
+                        habit_id=habit.id,
+                        date=date(2025, 10, 20) + timedelta(days=offset),
+                        scheduled_start=habit.scheduled_start,
+                        scheduled_end=habit.scheduled_end,
+                    )
+                )
+        session.commit()
+
+
+def _data_lines(output: str) -> list[list[str]]:
+    return [line.split("\t") for line in output.splitlines() if "\t" in line]
+
+
+class TestBRListStreaming:
+    """
+    Integration: Listagens sem limite são exibidas em streaming (BR-LIST-STREAM-*).
+
+    BRs cobertas:
+    - BR-LIST-STREAM-001: Saída redirecionada é uma linha por evento, separada por tab
+    - BR-LIST-STREAM-002: --limit é aplicado na query, mais recentes primeiro
+    - BR-LIST-STREAM-003: schedule list lista instâncias com o hábito em uma query
+    - BR-LIST-STREAM-004: Listagens em streaming não passam pelo daemon
+    """
+
+    def test_br_list_stream_001_piped_output_is_plain(self, runner: CliRunner) -> None:
+        """
+        Integration: `list --all` redirecionado gera linhas de dados simples.
+
+        DADO: 250 eventos (mais que um bloco)
+        QUANDO: Usuário lista com --all sem TTY
+        ENTÃO: stdout tem 250 linhas separadas por tab, sem markup
+        E: Título e total vão para stderr
+        """
+        _add_events(250)
+
+        result = runner.invoke(app, ["list", "--all"])
+
+        assert result.exit_code == 0
+        rows = _data_lines(result.stdout)
+        assert len(rows) == 250
+        assert rows[0][2] == "Evento 249"
+        assert all("[" not in cell for row in rows for cell in row)
+        assert "All Events" in result.stderr
+        assert "Total: 250" in result.stderr
+
+    def test_br_list_stream_002_limit_applies_in_query(self, runner: CliRunner) -> None:
+        """
+        Integration: `list --limit 3` devolve os 3 eventos mais recentes.
+
+        DADO: 10 eventos
+        QUANDO: Usuário lista com --limit 3
+        ENTÃO: Só os 3 últimos aparecem, do mais recente ao mais antigo
+        """
+        _add_events(10)
+
+        result = runner.invoke(app, ["list", "--limit", "3"])
+
+        assert result.exit_code == 0
+        assert [row[2] for row in _data_lines(result.stdout)] == [
+            "Evento 9",
+            "Evento 8",
+            "Evento 7",
+        ]
+
+    def test_br_list_stream_003_schedule_list(self, runner: CliRunner) -> None:
+        """
+        Integration: `schedule list` lista instâncias ordenadas com o hábito.
+
+        DADO: Dois hábitos com instâncias em dois dias
+        QUANDO: Usuário lista a agenda inteira e filtrada por data
+        ENTÃO: Linhas vêm por data e horário, com o título do hábito
+        E: O filtro por data restringe às instâncias do dia
+        """
+        _add_instances()
+
+        full = runner.invoke(app, ["schedule", "list"])
+        by_date = runner.invoke(app, ["schedule", "list", "--date", "2025-10-21"])
+
+        assert full.exit_code == 0
+        assert [(row[1], row[2]) for row in _data_lines(full.stdout)] == [
+            ("Leitura", "20/10/2025"),
+            ("Academia", "20/10/2025"),
+            ("Leitura", "21/10/2025"),
+            ("Academia", "21/10/2025"),
+        ]
+        assert {row[2] for row in _data_lines(by_date.stdout)} == {"21/10/2025"}
+        assert "Agenda - 21/10/2025" in by_date.stderr
+
+    def test_br_list_stream_004_not_forwarded_to_daemon(self) -> None:
+        """
+        Integration: Daemon não executa listagens em streaming.
+
+        DADO: Argumentos de listagens com e sem streaming
+        QUANDO: should_forward é consultado
+        ENTÃO: Só a listagem padrão (janela de 2 semanas) é encaminhada
+        """
+        assert should_forward(["list"]) is True
+        assert should_forward(["list", "--week", "+1"]) is True
+        assert should_forward(["list", "--all"]) is False
+        assert should_forward(["list", "-l", "5"]) is False
+        assert should_forward(["schedule", "list"]) is False
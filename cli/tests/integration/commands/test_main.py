@@ -9,6 +9,12 @@ Referências:
     - RTM: Requirements Traceability Matrix
 """
 
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
 from typer.testing import CliRunner
 
 from src.timeblock.main import app
@@ -49,3 +55,109 @@ class TestBRCLIMainCommands:
         assert result.exit_code == 0, "Comando version deve ter sucesso"
         assert "TimeBlock v" in result.output, "Deve exibir identificação"
         assert "0.1.0" in result.output, "Deve exibir número de versão"
+
+
+def _loaded_modules_after(args: list[str]) -> set[str]:
+    """Executa o CLI em processo limpo e devolve os módulos importados."""
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from src.timeblock.main import app\n"
+        f"result = CliRunner().invoke(app, {args!r})\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def _import_time_us(module: str) -> int:
+    """Tempo cumulativo de import (µs) medido por `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Formato: "import time: <self> | <cumulative> | <módulo indentado>"
+    for line in result.stderr.splitlines():
+        _self_us, cumulative, name = line.split(":", 1)[1].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} não encontrado na saída de importtime")
+
+
+class TestBRCLIMainLazyLoading:
+    """
+    Integration: Subcomandos carregados sob demanda (BR-CLI-MAIN-*).
+
+    BRs cobertas:
+    - BR-CLI-MAIN-002: version não importa módulos de comando
+    - BR-CLI-MAIN-003: Subcomando importa apenas o próprio módulo
+    - BR-CLI-MAIN-004: Import do entry point fica abaixo do eager
+    """
+
+    def test_br_cli_main_002_version_imports_no_commands(self) -> None:
+        """
+        Integration: version não carrega comandos, services nem SQLModel.
+
+        DADO: Processo Python limpo
+        QUANDO: Usuário executa `timeblock version`
+        ENTÃO: Nenhum módulo de comando, service ou SQLModel é importado
+        """
+        modules = _loaded_modules_after(["version"])
+
+        assert not {m for m in modules if m.startswith("src.timeblock.commands.")}
+        assert not {m for m in modules if m.startswith("src.timeblock.services")}
+        assert "sqlmodel" not in modules
+
+    def test_br_cli_main_003_subcommand_imports_only_its_module(self) -> None:
+        """
+        Integration: `timer --help` carrega só commands.timer.
+
+        DADO: Processo Python limpo
+        QUANDO: Usuário executa `timeblock timer --help`
+        ENTÃO: Apenas o módulo de comando timer é importado
+        """
+        modules = _loaded_modules_after(["timer", "--help"])
+
+        commands = {m for m in modules if m.startswith("src.timeblock.commands.")}
+        assert commands == {"src.timeblock.commands.timer"}
+
+    def test_br_cli_main_004_startup_regression(self) -> None:
+        """
+        Integration: Import do entry point é menor que o dos comandos.
+
+        DADO: Processo Python limpo
+        QUANDO: Tempo de import é medido com `-X importtime`
+        ENTÃO: main custa menos da metade de importar os módulos de comando
+        """
+        main_us = _import_time_us("src.timeblock.main")
+        commands_us = _import_time_us("src.timeblock.commands.report") + _import_time_us(
+            "src.timeblock.commands.timer"
+        )
+
+        assert main_us < commands_us / 2
+
+    def test_br_cli_main_005_init_creates_tables_in_clean_process(self, tmp_path: Path) -> None:
+        """
+        Integration: `init` cria as tabelas sem depender de imports eager.
+
+        DADO: Processo Python limpo (nenhum model importado pelo entry point)
+        QUANDO: Usuário executa `timeblock init`
+        ENTÃO: Todas as tabelas e a view schedule_item são criadas
+        """
+        db_path = tmp_path / "test.db"
+        subprocess.run(
+            [sys.executable, "-m", "src.timeblock.main", "init"],
+            capture_output=True,
+            check=True,
+            env={**os.environ, "TIMEBLOCK_DB_PATH": str(db_path)},
+        )
+
+        with sqlite3.connect(db_path) as conn:
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        assert {"event", "habits", "habitinstance", "tasks", "active_timer"} <= names
+        assert "schedule_item" in names
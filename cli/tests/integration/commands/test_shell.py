@@ -0,0 +1,137 @@
+"""
+Integration tests para o modo interativo (`timeblock shell`).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+import typer
+
+from src.timeblock.commands.shell import complete_words, repl
+from src.timeblock.database import engine as engine_module
+from src.timeblock.database import shared_engines
+from src.timeblock.main import app
+
+
+def _reader(lines: list[str]) -> Callable[[str], str]:
+    """Fake de input(): devolve as linhas em ordem e depois EOF."""
+    remaining: Iterator[str] = iter(lines)
+
+    def read_line(prompt: str) -> str:
+        try:
+            return next(remaining)
+        except StopIteration:
+            raise EOFError from None
+
+    return read_line
+
+
+@pytest.fixture
+def root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Grupo raiz da CLI com banco isolado."""
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(tmp_path / "shell.db"))
+    return typer.main.get_command(app)
+
+
+class TestBRShellCompletion:
+    """
+    Integration: Completion de comandos e opções (BR-SHELL-COMPLETE-*).
+
+    BRs cobertas:
+    - BR-SHELL-COMPLETE-001: Comandos do grupo atingido
+    - BR-SHELL-COMPLETE-002: Opções do comando final
+    """
+
+    def test_br_shell_complete_001_commands(self, root) -> None:
+        """
+        Integration: Comandos raiz e subcomandos são sugeridos.
+
+        DADO: Grupo raiz da CLI
+        QUANDO: Completion é pedido na raiz e dentro de `timer`
+        ENTÃO: Sugere comandos pelo prefixo, sem `shell` e `daemon`
+        """
+        assert complete_words(root, [], "ti") == ["timer"]
+        assert "shell" not in complete_words(root, [], "")
+        assert "daemon" not in complete_words(root, [], "")
+        assert complete_words(root, ["timer"], "st") == ["start", "status", "stop"]
+        assert complete_words(root, ["inexistente"], "") == []
+
+    def test_br_shell_complete_002_options(self, root) -> None:
+        """
+        Integration: Opções do comando final são sugeridas.
+
+        DADO: Comando `task create`
+        QUANDO: Completion é pedido para `--`
+        ENTÃO: Sugere as opções do comando, incluindo --help
+        """
+        options = complete_words(root, ["task", "create"], "--")
+
+        assert "--help" in options
+        assert all(option.startswith("--") for option in options)
+        assert len(options) > 1
+
+
+class TestBRShellLoop:
+    """
+    Integration: Execução de comandos no shell (BR-SHELL-*).
+
+    BRs cobertas:
+    - BR-SHELL-001: Vários comandos no mesmo processo e engine
+    - BR-SHELL-002: Erros não encerram o shell
+    """
+
+    def test_br_shell_001_commands_share_engine(
+        self, root, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """
+        Integration: Comandos do shell não criam engines novos.
+
+        DADO: Shell rodando dentro de shared_engines
+        QUANDO: Usuário cria uma tarefa e lista as tarefas
+        ENTÃO: A tarefa aparece na listagem
+        E: Nenhum engine é criado além do compartilhado
+        """
+        created = []
+        get_engine = engine_module.get_engine
+
+        def counting_get_engine():
+            created.append(1)
+            return get_engine()
+
+        monkeypatch.setattr(engine_module, "get_engine", counting_get_engine)
+
+        with shared_engines():
+            engines_before = len(created)
+            repl(
+                root,
+                read_line=_reader(
+                    ['task create -t "Dentista" -D "2030-12-01 14:30"', "task list", "exit"]
+                ),
+            )
+
+        assert len(created) == engines_before
+        assert "Dentista" in capsys.readouterr().out
+
+    def test_br_shell_002_errors_do_not_exit(
+        self, root, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """
+        Integration: Opção inválida, aspas abertas e comando bloqueado.
+
+        DADO: Shell rodando
+        QUANDO: Usuário digita linhas inválidas e depois `version`
+        ENTÃO: Cada erro é reportado
+        E: `version` ainda executa e o loop termina no EOF
+        """
+        with shared_engines():
+            repl(root, read_line=_reader(["list --bogus", '"aberto', "shell", "", "version"]))
+
+        output = capsys.readouterr()
+        assert "No such option" in output.err
+        assert "No closing quotation" in output.out
+        assert "não está disponível" in output.out
+        assert "TimeBlock v0.1.0" in output.out
@@ -0,0 +1,99 @@
+"""
+Integration tests para o display ao vivo do timer.
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from contextlib import contextmanager
+from datetime import date, time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel
+
+from src.timeblock.commands import timer as timer_command
+from src.timeblock.database import get_engine_context, get_readonly_engine_context
+from src.timeblock.models import Habit, HabitInstance, Recurrence, Routine
+from src.timeblock.services.timer_service import TimerService
+
+
+@pytest.fixture
+def active_timelog_id(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> int:
+    """Banco em arquivo com timer ativo em uma HabitInstance."""
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(tmp_path / "timer.db"))
+    with get_engine_context() as engine:
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            routine = Routine(name="Rotina")
+            session.add(routine)
+            session.commit()
+            habit = Habit(
+                routine_id=routine.id,
+                title="Leitura",
+                scheduled_start=time(9, 0),
+                scheduled_end=time(10, 0),
+                recurrence=Recurrence.EVERYDAY,
+            )
+            session.add(habit)
+            session.commit()
+            instance = HabitInstance(
+                habit_id=habit.id,
+                date=date.today(),
+                scheduled_start=time(9, 0),
+                scheduled_end=time(10, 0),
+            )
+            session.add(instance)
+            session.commit()
+            return TimerService.start_timer(instance.id, session).id
+
+
+class TestBRTimerDisplay:
+    """
+    Integration: Display do timer sem polling por segundo (BR-TIMER-DISPLAY-*).
+
+    BRs cobertas:
+    - BR-TIMER-DISPLAY-001: Banco só é relido quando muda
+    """
+
+    def test_br_timer_display_001_rereads_only_on_change(
+        self, active_timelog_id: int, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Integration: display consulta o banco só no início e após commits.
+
+        DADO: Timer ativo e display aberto
+        QUANDO: Outro processo pausa e depois para o timer
+        ENTÃO: Display relê estado apenas nessas mudanças e encerra no stop
+        """
+        selects: list[str] = []
+
+        @contextmanager
+        def counting_context():
+            with get_readonly_engine_context() as engine:
+
+                @event.listens_for(engine, "before_cursor_execute")
+                def count(conn, cursor, statement, *args):
+                    if statement.lstrip().upper().startswith("SELECT"):
+                        selects.append(statement)
+
+                yield engine
+
+        ticks = []
+
+        def fake_sleep(_seconds: float) -> None:
+            ticks.append(_seconds)
+            if len(ticks) == 3:
+                TimerService.pause_timer(active_timelog_id)
+            elif len(ticks) == 6:
+                TimerService.stop_timer(active_timelog_id)
+
+        monkeypatch.setattr(timer_command, "get_readonly_engine_context", counting_context)
+        monkeypatch.setattr(timer_command.time, "sleep", fake_sleep)
+
+        timer_command._display_timer(active_timelog_id)
+
+        assert len(ticks) == 6
+        # Snapshot inicial (timelog, estado, instância, hábito) + 2 releituras
+        assert len(selects) == 4 + 2 + 2
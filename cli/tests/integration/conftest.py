@@ -1,13 +1,18 @@
 """Fixtures para testes de integração."""
 
+from collections.abc import Callable
 from datetime import UTC, datetime, time
+from pathlib import Path
 from typing import Any
 
 import pytest
 from sqlalchemy import Engine, event
 from sqlmodel import Session, SQLModel, create_engine
 
+from src.timeblock.database import create_db_and_tables, get_engine_context
 from src.timeblock.models import Habit, Recurrence, Routine, Task
+from src.timeblock.services.habit_service import HabitService
+from src.timeblock.services.routine_service import RoutineService
 
 
 @pytest.fixture(scope="function")
@@ -48,6 +53,39 @@ def test_db(integration_session: Session):
     return integration_session
 
 
+@pytest.fixture
+def db_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Banco em arquivo com as tabelas criadas, apontado por TIMEBLOCK_DB_PATH."""
+    path = tmp_path / "timeblock.db"
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(path))
+    create_db_and_tables()
+    return path
+
+
+@pytest.fixture
+def routine_with_habits(db_path: Path) -> Callable[[int], tuple[int, list[int]]]:
+    """Cria no banco de `db_path` uma rotina ativa com `count` hábitos diários."""
+
+    def _create(count: int) -> tuple[int, list[int]]:
+        with get_engine_context() as engine, Session(engine) as session:
+            routine_id = RoutineService(session).create_routine("Rotina").id
+            session.commit()
+            habit_ids = [
+                HabitService.create_habit(
+                    routine_id,
+                    f"Hábito {index}",
+                    time(6 + index, 0),
+                    time(6 + index, 30),
+                    Recurrence.EVERYDAY,
+                    session=session,
+                ).id
+                for index in range(count)
+            ]
+        return routine_id, habit_ids
+
+    return _create
+
+
 @pytest.fixture
 def sample_routine(integration_session: Session):
     """Rotina de exemplo para testes de integração."""
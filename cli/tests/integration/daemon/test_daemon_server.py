@@ -0,0 +1,290 @@
+"""
+Integration tests para o daemon local (socket Unix, JSON lines).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+import socket
+import sys
+import tempfile
+import threading
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from src.timeblock.daemon.client import (
+    DaemonClient,
+    DaemonError,
+    DaemonUnavailableError,
+    forward,
+)
+from src.timeblock.daemon.server import DaemonServer
+from src.timeblock.database import get_engine_context, shared_engines
+from src.timeblock.main import app
+
+
+@pytest.fixture
+def socket_dir() -> Generator[Path]:
+    """Diretório curto para o socket (limite de ~100 bytes do AF_UNIX)."""
+    with tempfile.TemporaryDirectory(prefix="tb") as path:
+        yield Path(path)
+
+
+@pytest.fixture
+def daemon(
+    tmp_path: Path, socket_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[DaemonServer]:
+    """Daemon rodando em thread sobre um banco em arquivo."""
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(tmp_path / "daemon.db"))
+    with shared_engines(), DaemonServer(str(socket_dir / "d.sock")) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+class TestBRDaemonProtocol:
+    """
+    Integration: Chamadas de service pelo socket (BR-DAEMON-*).
+
+    BRs cobertas:
+    - BR-DAEMON-001: Services respondem com resultado em tipos JSON
+    - BR-DAEMON-002: Erros do service voltam com tipo e mensagem
+    - BR-DAEMON-003: Apenas métodos públicos, sem sessão externa
+    - BR-DAEMON-004: Engine compartilhado entre chamadas
+    """
+
+    def test_br_daemon_001_service_call_roundtrip(self, daemon: DaemonServer) -> None:
+        """
+        Integration: Task criada e listada pelo daemon.
+
+        DADO: Daemon rodando
+        QUANDO: Cliente chama TaskService.create_task com data ISO 8601
+        ENTÃO: Recebe a task como dicionário
+        E: list_pending_tasks na mesma conexão a inclui
+        """
+        with DaemonClient(daemon.socket_path) as client:
+            assert client.ping()["db_path"].endswith("daemon.db")
+
+            task = client.call(
+                "TaskService",
+                "create_task",
+                title="Revisar PR",
+                scheduled_datetime="2025-10-20T09:00:00",
+            )
+            pending = client.call("TaskService", "list_pending_tasks")
+
+        assert task["title"] == "Revisar PR"
+        assert task["scheduled_datetime"] == "2025-10-20T09:00:00"
+        assert [t["id"] for t in pending] == [task["id"]]
+
+    def test_br_daemon_002_service_error_is_returned(self, daemon: DaemonServer) -> None:
+        """
+        Integration: ValueError do service chega ao cliente.
+
+        DADO: Daemon rodando
+        QUANDO: Cliente cria task com título vazio
+        ENTÃO: DaemonError com tipo ValueError e a mensagem original
+        E: O daemon continua atendendo na mesma conexão
+        """
+        with DaemonClient(daemon.socket_path) as client:
+            with pytest.raises(DaemonError, match="Title cannot be empty") as exc_info:
+                client.call(
+                    "TaskService",
+                    "create_task",
+                    title="  ",
+                    scheduled_datetime="2025-10-20T09:00:00",
+                )
+            assert client.call("TimerService", "get_timer_state") is None
+
+        assert exc_info.value.error_type == "ValueError"
+
+    @pytest.mark.parametrize(
+        ("service", "method", "args"),
+        [
+            ("RoutineService", "list_routines", {}),
+            ("TimerService", "_publish_status", {}),
+            ("TaskService", "list_pending_tasks", {"session": None}),
+        ],
+    )
+    def test_br_daemon_003_rejects_non_public_calls(
+        self, daemon: DaemonServer, service: str, method: str, args: dict
+    ) -> None:
+        """
+        Integration: Service fora da lista, método privado ou sessão são recusados.
+
+        DADO: Daemon rodando
+        QUANDO: Cliente pede chamada não exposta
+        ENTÃO: DaemonError do tipo ValueError
+        """
+        with DaemonClient(daemon.socket_path) as client:
+            with pytest.raises(DaemonError) as exc_info:
+                client.call(service, method, **args)
+
+        assert exc_info.value.error_type == "ValueError"
+
+    def test_br_daemon_004_engine_context_reuses_shared_engine(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Integration: get_engine_context não cria engines dentro de shared_engines.
+
+        DADO: Bloco shared_engines ativo
+        QUANDO: Services abrem get_engine_context duas vezes
+        ENTÃO: Recebem o mesmo engine, que não é descartado entre chamadas
+        """
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(tmp_path / "shared.db"))
+
+        with shared_engines() as shared:
+            with get_engine_context() as first, get_engine_context() as second:
+                assert first is shared
+                assert second is shared
+
+        with get_engine_context() as outside:
+            assert outside is not shared
+
+
+class TestBRDaemonForwarding:
+    """
+    Integration: Encaminhamento de comandos da CLI (BR-DAEMON-FWD-*).
+
+    BRs cobertas:
+    - BR-DAEMON-FWD-001: Saída encaminhada igual à execução local
+    - BR-DAEMON-FWD-002: Sem daemon, a CLI executa localmente
+    - BR-DAEMON-FWD-003: Comandos com escrita ou prompt não são encaminhados
+    - BR-DAEMON-FWD-004: Entry point encaminha invocações reais
+    - BR-DAEMON-FWD-005: Daemon mudo ou com resposta ilegível não quebra a CLI
+    """
+
+    def test_br_daemon_fwd_001_forwarded_output_matches_local(
+        self, daemon: DaemonServer, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """
+        Integration: `list` pelo daemon produz a mesma saída.
+
+        DADO: Daemon rodando
+        QUANDO: `list` é encaminhado
+        ENTÃO: Exit code e stdout são os da execução local
+        """
+        local = CliRunner().invoke(app, ["list"])
+
+        exit_code = forward(["list"], daemon.socket_path)
+
+        assert exit_code == local.exit_code == 0
+        assert capsys.readouterr().out == local.stdout
+
+    def test_br_daemon_fwd_002_falls_back_without_daemon(self, socket_dir: Path) -> None:
+        """
+        Integration: Socket ausente ou órfão não é erro.
+
+        DADO: Nenhum daemon escutando
+        QUANDO: forward é chamado com socket inexistente ou órfão
+        ENTÃO: Retorna None (executar localmente)
+        """
+        stale_path = str(socket_dir / "stale.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(stale_path)
+        stale.close()
+
+        assert forward(["list"], str(socket_dir / "missing.sock")) is None
+        assert forward(["list"], stale_path) is None
+        with pytest.raises(DaemonUnavailableError):
+            DaemonClient(stale_path).ping()
+
+    def test_br_daemon_fwd_003_only_read_commands_forwarded(
+        self, daemon: DaemonServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Integration: init, add e timer start rodam sempre localmente.
+
+        DADO: Daemon rodando
+        QUANDO: forward recebe comandos com escrita ou interação
+        ENTÃO: Retorna None sem contatar o daemon
+        E: O daemon recusa `run` desses comandos
+        E: TIMEBLOCK_NO_DAEMON desativa o encaminhamento
+        """
+        for argv in (["init"], ["add", "X"], ["timer", "start", "1"]):
+            assert forward(argv, daemon.socket_path) is None
+
+        with DaemonClient(daemon.socket_path) as client:
+            with pytest.raises(DaemonError, match="not forwardable"):
+                client.run(["init"])
+
+        monkeypatch.setenv("TIMEBLOCK_NO_DAEMON", "1")
+        assert forward(["list"], daemon.socket_path) is None
+
+    def test_br_daemon_fwd_004_entry_point_uses_daemon(
+        self,
+        daemon: DaemonServer,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """
+        Integration: `timeblock list` real vai para o daemon.
+
+        DADO: Daemon rodando e TIMEBLOCK_DAEMON_SOCKET apontando para ele
+        QUANDO: O entry point é chamado com sys.argv = [timeblock, list]
+        ENTÃO: O daemon recebe um `run` e o processo sai com seu exit code
+        """
+        ops = []
+        dispatch = daemon.dispatch
+
+        def recording_dispatch(request: dict) -> dict:
+            ops.append(request["op"])
+            return dispatch(request)
+
+        monkeypatch.setattr(daemon, "dispatch", recording_dispatch)
+        monkeypatch.setenv("TIMEBLOCK_DAEMON_SOCKET", daemon.socket_path)
+        monkeypatch.setattr(sys, "argv", ["timeblock", "list"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            app()
+
+        assert exc_info.value.code == 0
+        assert ops == ["run"]
+        assert "No events found" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("reply", [None, b"{not json\n", b'{"id": 1}\n', b"[]\n"])
+    def test_br_daemon_fwd_005_hung_or_garbled_daemon_falls_back(
+        self, socket_dir: Path, reply: bytes | None
+    ) -> None:
+        """
+        Integration: Timeout e resposta ilegível viram execução local.
+
+        DADO: Um processo no socket que não responde ou responde lixo
+        QUANDO: forward é chamado com timeout curto
+        ENTÃO: Retorna None (executar localmente) em vez de levantar
+        E: O cliente levanta DaemonUnavailableError
+        """
+        path = str(socket_dir / "bad.sock")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen()
+        done = threading.Event()
+
+        def serve() -> None:
+            while not done.is_set():
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                with conn:
+                    conn.recv(4096)
+                    if reply is not None:
+                        conn.sendall(reply)
+                    done.wait(1.0)
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        try:
+            assert forward(["list"], path, timeout=0.2) is None
+            with pytest.raises(DaemonUnavailableError):
+                DaemonClient(path, timeout=0.2).ping()
+        finally:
+            done.set()
+            server.close()
+            thread.join()
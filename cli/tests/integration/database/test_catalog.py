@@ -0,0 +1,185 @@
+"""
+Integration tests para o catálogo em memória de hábitos, rotinas e tags.
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+import sqlite3
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.timeblock.database import get_engine_context
+from src.timeblock.database.catalog import Catalog, get_catalog
+from src.timeblock.models import Routine
+from src.timeblock.services.habit_service import HabitService
+from src.timeblock.services.routine_service import RoutineService
+from src.timeblock.services.tag_service import TagService
+
+# Fixture routine_with_habits (tests/integration/conftest.py)
+RoutineFactory = Callable[[int], tuple[int, list[int]]]
+
+
+@pytest.fixture
+def catalog() -> Iterator[Catalog]:
+    catalog = get_catalog()
+    catalog.invalidate()
+    yield catalog
+    catalog.close()
+
+
+class TestBRCatalog:
+    """
+    Integration: Hábitos, rotinas e tags servidos da memória (BR-DB-CATALOG-*).
+
+    BRs cobertas:
+    - BR-DB-CATALOG-001: Uma carga atende todas as consultas seguintes
+    - BR-DB-CATALOG-002: Escrita pelos services recarrega o catálogo
+    - BR-DB-CATALOG-003: Commit de outra conexão recarrega via data_version
+    - BR-DB-CATALOG-004: Sessão com escritas não commitadas enxerga as escritas
+    - BR-DB-CATALOG-005: Banco em memória não usa o catálogo
+    - BR-DB-CATALOG-006: Resultados iguais aos das queries (ordem, ausência)
+    """
+
+    def test_br_db_catalog_001_lookups_after_warm_hit_memory(
+        self, catalog: Catalog, routine_with_habits: RoutineFactory
+    ) -> None:
+        """
+        Integration: Depois do warm, get_habit em laço não executa SELECT.
+
+        DADO: Rotina com 5 hábitos e catálogo aquecido
+        QUANDO: get_habit é chamado para cada hábito, numa sessão vigiada
+        ENTÃO: Nenhum SELECT é executado e não há nova carga
+        E: Cada chamada devolve uma instância nova
+        """
+        _, habit_ids = routine_with_habits(5)
+        executed: list[str] = []
+
+        with get_engine_context() as engine:
+            catalog.warm(engine)
+            loads = catalog.loads
+            event.listen(
+                engine,
+                "before_cursor_execute",
+                lambda conn, cursor, statement, *args: executed.append(statement),
+            )
+            with Session(engine) as session:
+                habits = [
+                    HabitService.get_habit(habit_id, session=session) for habit_id in habit_ids
+                ]
+                again = HabitService.get_habit(habit_ids[0])
+
+        assert [habit.title for habit in habits] == [f"Hábito {index}" for index in range(5)]
+        assert again is not habits[0]
+        assert executed == []
+        assert catalog.loads == loads
+
+    def test_br_db_catalog_002_service_write_reloads(
+        self, catalog: Catalog, routine_with_habits: RoutineFactory
+    ) -> None:
+        """
+        Integration: update_habit aparece na próxima leitura.
+
+        DADO: Hábito lido pelo catálogo
+        QUANDO: O título é alterado via HabitService
+        ENTÃO: get_habit e list_habits devolvem o título novo
+        """
+        routine_id, (habit_id,) = routine_with_habits(1)
+        HabitService.get_habit(habit_id)
+
+        HabitService.update_habit(habit_id, title="Meditar")
+
+        assert HabitService.get_habit(habit_id).title == "Meditar"
+        assert [habit.title for habit in HabitService.list_habits(routine_id)] == ["Meditar"]
+
+    def test_br_db_catalog_003_external_commit_reloads(
+        self, db_path: Path, catalog: Catalog
+    ) -> None:
+        """
+        Integration: Tag inserida por outro processo é vista via data_version.
+
+        DADO: list_tags já servido pelo catálogo
+        QUANDO: Outra conexão (fora do SQLAlchemy) insere uma tag
+        ENTÃO: A próxima leitura recarrega e inclui a tag externa
+        """
+        TagService.create_tag("foco")
+        TagService.list_tags()
+        loads = catalog.loads
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO tags (uuid, name, color) VALUES (randomblob(16), 'externa', '#000000')"
+            )
+
+        assert [tag.name for tag in TagService.list_tags()] == ["externa", "foco"]
+        assert catalog.loads == loads + 1
+
+    def test_br_db_catalog_004_session_with_writes_sees_them(
+        self, catalog: Catalog, routine_with_habits: RoutineFactory
+    ) -> None:
+        """
+        Integration: Rotina criada e ativada sem commit é a rotina ativa da sessão.
+
+        DADO: Rotina ativa "Rotina" no catálogo
+        QUANDO: Na mesma sessão, "Nova" é criada e ativada sem commit
+        ENTÃO: get_active_routine da sessão devolve "Nova"
+        E: Após rollback, o catálogo volta a responder "Rotina"
+        """
+        routine_with_habits(0)
+
+        with get_engine_context() as engine, Session(engine) as session:
+            service = RoutineService(session)
+            assert service.get_active_routine().name == "Rotina"
+            service.create_routine("Nova", auto_activate=True)
+            session.flush()
+            during = service.get_active_routine().name
+            session.rollback()
+            after = service.get_active_routine().name
+
+        assert during == "Nova"
+        assert after == "Rotina"
+
+    def test_br_db_catalog_005_memory_database_bypasses(self, catalog: Catalog) -> None:
+        """
+        Integration: Sessão em banco :memory: consulta o banco direto.
+
+        DADO: Engine SQLite em memória com uma rotina
+        QUANDO: list_routines e get_routine são chamados
+        ENTÃO: Os resultados vêm do banco e o catálogo não carrega nada
+        """
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        loads = catalog.loads
+
+        with Session(engine) as session:
+            session.add(Routine(name="Memória", is_active=True))
+            session.commit()
+            service = RoutineService(session)
+            names = [routine.name for routine in service.list_routines()]
+            routine = service.get_routine(1)
+
+        assert names == ["Memória"]
+        assert routine.name == "Memória"
+        assert catalog.loads == loads
+
+    def test_br_db_catalog_006_results_match_queries(self, db_path: Path, catalog: Catalog) -> None:
+        """
+        Integration: Ordem e ausência iguais às das queries originais.
+
+        DADO: Tags "zeta" e "alfa", criadas nessa ordem
+        QUANDO: list_tags, get_tag e get_habit são chamados
+        ENTÃO: As tags vêm por nome
+        E: Ids inexistentes devolvem None (hábito) ou ValueError (tag)
+        """
+        TagService.create_tag("zeta")
+        alfa = TagService.create_tag("alfa")
+
+        assert [tag.name for tag in TagService.list_tags()] == ["alfa", "zeta"]
+        assert TagService.get_tag(alfa.id).name == "alfa"
+        assert HabitService.get_habit(999) is None
+        with pytest.raises(ValueError, match="Tag 999 não encontrada"):
+            TagService.get_tag(999)
@@ -0,0 +1,45 @@
+"""
+Integration tests para DataVersionWatcher (detecção de commits externos).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.timeblock.database import DataVersionWatcher
+from src.timeblock.models import Task
+
+
+class TestBRDatabaseDataVersion:
+    """
+    Integration: Detecção de mudanças via PRAGMA data_version (BR-DB-WATCH-*).
+
+    BRs cobertas:
+    - BR-DB-WATCH-001: Commit de outra conexão é detectado uma vez
+    """
+
+    def test_br_db_watch_001_detects_external_commit(self, tmp_path: Path):
+        """
+        Integration: changed() reflete commits de outras conexões.
+
+        DADO: Watcher aberto sobre um banco em arquivo
+        QUANDO: Outra conexão faz commit
+        ENTÃO: changed() retorna True uma única vez
+        """
+        engine = create_engine(f"sqlite:///{tmp_path / 'watch.db'}")
+        SQLModel.metadata.create_all(engine)
+
+        with DataVersionWatcher(engine) as watcher:
+            assert watcher.changed() is False
+
+            with Session(engine) as session:
+                session.add(Task(title="Nova", scheduled_datetime=datetime(2025, 10, 17, 9, 0)))
+                session.commit()
+
+            assert watcher.changed() is True
+            assert watcher.changed() is False
+        engine.dispose()
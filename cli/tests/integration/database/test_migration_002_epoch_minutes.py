@@ -0,0 +1,98 @@
+"""
+Integration tests para migração 002 (colunas start_min/end_min).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlmodel import Session, create_engine
+
+from src.timeblock.database.migrations import migration_002_epoch_minutes as migration
+from src.timeblock.models.time_encoding import to_epoch_minutes
+
+_LEGACY_SCHEMA = [
+    """CREATE TABLE tasks (
+        id INTEGER PRIMARY KEY, title VARCHAR NOT NULL,
+        scheduled_datetime DATETIME NOT NULL
+    )""",
+    """CREATE TABLE habitinstance (
+        id INTEGER PRIMARY KEY, habit_id INTEGER NOT NULL, date DATE NOT NULL,
+        scheduled_start TIME NOT NULL, scheduled_end TIME NOT NULL
+    )""",
+    """CREATE TABLE event (
+        id INTEGER PRIMARY KEY, title VARCHAR NOT NULL,
+        scheduled_start DATETIME NOT NULL, scheduled_end DATETIME NOT NULL
+    )""",
+    "INSERT INTO tasks VALUES (1, 'Task', '2025-10-17 14:00:00.000000')",
+    "INSERT INTO habitinstance VALUES (1, 1, '2025-10-17', '09:00:00.000000', '10:00:00.000000')",
+    """INSERT INTO event VALUES
+        (1, 'Event', '2025-10-17 15:00:00.000000', '2025-10-17 15:45:00.000000')""",
+]
+
+
+@pytest.fixture
+def legacy_session():
+    """Sessão sobre banco com schema anterior à migração 002."""
+    engine = create_engine("sqlite:///:memory:")
+    with Session(engine) as session:
+        for statement in _LEGACY_SCHEMA:
+            session.exec(text(statement))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+class TestBRDatabaseMigration002:
+    """
+    Integration: Migração 002 adiciona minutos desde epoch (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-007: Colunas geradas calculadas para linhas existentes
+    - BR-DB-MIGRATE-008: Downgrade remove colunas e índices
+    """
+
+    def test_br_db_migrate_007_upgrade_computes_existing_rows(self, legacy_session: Session):
+        """
+        Integration: upgrade calcula start_min/end_min sem backfill.
+
+        DADO: Banco com linhas anteriores à migração
+        QUANDO: upgrade é executado
+        ENTÃO: Linhas existentes têm start_min/end_min corretos
+        E: Colunas estão indexadas
+        """
+        migration.upgrade(legacy_session)
+
+        task = legacy_session.exec(text("SELECT start_min, end_min FROM tasks")).one()
+        instance = legacy_session.exec(text("SELECT start_min, end_min FROM habitinstance")).one()
+        event = legacy_session.exec(text("SELECT start_min, end_min FROM event")).one()
+
+        assert task == (
+            to_epoch_minutes(datetime(2025, 10, 17, 14, 0)),
+            to_epoch_minutes(datetime(2025, 10, 17, 15, 0)),
+        )
+        assert instance[1] - instance[0] == 60
+        assert event[1] - event[0] == 45
+
+        indexes = {
+            ix["name"] for ix in inspect(legacy_session.connection()).get_indexes("habitinstance")
+        }
+        assert {"ix_habitinstance_start_min", "ix_habitinstance_end_min"} <= indexes
+
+    def test_br_db_migrate_008_downgrade_removes_columns(self, legacy_session: Session):
+        """
+        Integration: downgrade restaura schema anterior.
+
+        DADO: Banco migrado
+        QUANDO: downgrade é executado
+        ENTÃO: Colunas start_min/end_min não existem mais
+        """
+        migration.upgrade(legacy_session)
+        migration.downgrade(legacy_session)
+
+        columns = {col["name"] for col in inspect(legacy_session.connection()).get_columns("event")}
+        assert "start_min" not in columns
+        assert "end_min" not in columns
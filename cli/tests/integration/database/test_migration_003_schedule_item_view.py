@@ -0,0 +1,68 @@
+"""
+Integration tests para migração 003 (view schedule_item).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from src.timeblock.database.migrations import migration_002_epoch_minutes as migration_002
+from src.timeblock.database.migrations import migration_003_schedule_item_view as migration
+
+_LEGACY_SCHEMA = [
+    """CREATE TABLE tasks (
+        id INTEGER PRIMARY KEY, title VARCHAR NOT NULL,
+        scheduled_datetime DATETIME NOT NULL, completed_datetime DATETIME
+    )""",
+    "CREATE TABLE habits (id INTEGER PRIMARY KEY, title VARCHAR NOT NULL)",
+    """CREATE TABLE habitinstance (
+        id INTEGER PRIMARY KEY, habit_id INTEGER NOT NULL, date DATE NOT NULL,
+        scheduled_start TIME NOT NULL, scheduled_end TIME NOT NULL, status VARCHAR
+    )""",
+    """CREATE TABLE event (
+        id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, status VARCHAR,
+        scheduled_start DATETIME NOT NULL, scheduled_end DATETIME NOT NULL
+    )""",
+    "INSERT INTO tasks VALUES (1, 'Task', '2025-10-17 14:00:00.000000', NULL)",
+    "INSERT INTO habits VALUES (1, 'Habit')",
+    """INSERT INTO habitinstance VALUES
+        (1, 1, '2025-10-17', '09:00:00.000000', '10:00:00.000000', 'PENDING')""",
+]
+
+
+class TestBRDatabaseMigration003:
+    """
+    Integration: Migração 003 cria view schedule_item (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-009: View unifica itens existentes
+    """
+
+    def test_br_db_migrate_009_view_over_existing_rows(self):
+        """
+        Integration: upgrade/downgrade da view schedule_item.
+
+        DADO: Banco com schema anterior e migração 002 aplicada
+        QUANDO: upgrade é executado
+        ENTÃO: View lista task e habit instance com título e status
+        E: downgrade remove a view
+        """
+        engine = create_engine("sqlite:///:memory:")
+        with Session(engine) as session:
+            for statement in _LEGACY_SCHEMA:
+                session.exec(text(statement))
+            session.commit()
+            migration_002.upgrade(session)
+
+            migration.upgrade(session)
+            rows = session.exec(
+                text("SELECT kind, title, status FROM schedule_item ORDER BY start_min")
+            ).all()
+            assert rows == [("habit_instance", "Habit", "PENDING"), ("task", "Task", "PENDING")]
+
+            migration.downgrade(session)
+            views = session.exec(text("SELECT name FROM sqlite_master WHERE type = 'view'")).all()
+            assert views == []
+        engine.dispose()
@@ -0,0 +1,198 @@
+"""
+Integration tests para migração 004 (enums como inteiros).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from datetime import date, time
+from typing import Any
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.timeblock.database.migrations import migration_004_int_enums as migration
+from src.timeblock.models import Habit, HabitInstance, Recurrence, Routine, Status
+from src.timeblock.models.enum_encoding import enum_codes
+
+_LEGACY_SCHEMA = [
+    """CREATE TABLE habits (
+        id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, recurrence VARCHAR(9) NOT NULL
+    )""",
+    """CREATE TABLE habitinstance (
+        id INTEGER PRIMARY KEY, habit_id INTEGER NOT NULL,
+        status VARCHAR(8) NOT NULL, done_substatus VARCHAR(9),
+        not_done_substatus VARCHAR(19), skip_reason VARCHAR(14),
+        start_min INTEGER, end_min INTEGER
+    )""",
+    """CREATE TABLE event (
+        id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, status VARCHAR(11) NOT NULL,
+        start_min INTEGER, end_min INTEGER
+    )""",
+    """CREATE TABLE tasks (
+        id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, completed_datetime DATETIME,
+        start_min INTEGER, end_min INTEGER
+    )""",
+    "INSERT INTO habits VALUES (1, 'Habit', 'WEEKDAYS')",
+    "INSERT INTO habitinstance VALUES (1, 1, 'DONE', 'PARTIAL', NULL, NULL, 10, 20)",
+    # Migração 001 gravava valores em minúsculas
+    "INSERT INTO habitinstance VALUES (2, 1, 'not_done', NULL, 'skipped_justified', 'saude', 30, 40)",
+    "INSERT INTO event VALUES (1, 'Event', 'COMPLETED', 50, 60)",
+]
+
+
+@pytest.fixture
+def legacy_session():
+    """Sessão sobre banco com enums gravados como texto."""
+    engine = create_engine("sqlite:///:memory:")
+    with Session(engine) as session:
+        for statement in _LEGACY_SCHEMA:
+            session.exec(text(statement))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+class TestBRDatabaseMigration004:
+    """
+    Integration: Migração 004 converte enums para inteiros (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-010: Nomes e valores legados viram códigos com CHECK
+    - BR-DB-MIGRATE-011: Downgrade restaura os nomes dos membros
+    - BR-DB-MIGRATE-020: Esquema migrado igual ao de um banco novo (NOT NULL)
+    """
+
+    def test_br_db_migrate_010_upgrade_encodes_rows(self, legacy_session: Session):
+        """
+        Integration: upgrade converte texto em códigos inteiros.
+
+        DADO: Banco com enums gravados por nome ou valor
+        QUANDO: upgrade é executado
+        ENTÃO: Colunas guardam códigos inteiros
+        E: CHECK rejeita códigos inválidos
+        E: View schedule_item expõe o nome do status
+        """
+        migration.upgrade(legacy_session)
+
+        rows = legacy_session.exec(
+            text(
+                "SELECT status, done_substatus, not_done_substatus, skip_reason"
+                " FROM habitinstance ORDER BY id"
+            )
+        ).all()
+        assert rows == [(1, 3, None, None), (2, None, 0, 0)]
+        assert legacy_session.exec(text("SELECT recurrence FROM habits")).one() == (7,)
+        assert legacy_session.exec(text("SELECT status FROM event")).one() == (3,)
+
+        statuses = legacy_session.exec(
+            text("SELECT kind, status FROM schedule_item ORDER BY start_min")
+        ).all()
+        assert statuses == [
+            ("habit_instance", "DONE"),
+            ("habit_instance", "NOT_DONE"),
+            ("event", "COMPLETED"),
+        ]
+
+        with pytest.raises(IntegrityError):
+            legacy_session.exec(text("UPDATE event SET status = 9"))
+
+    def test_br_db_migrate_011_downgrade_restores_names(self, legacy_session: Session):
+        """
+        Integration: downgrade volta a gravar nomes.
+
+        DADO: Banco migrado para códigos inteiros
+        QUANDO: downgrade é executado
+        ENTÃO: Colunas guardam o nome do membro
+        """
+        migration.upgrade(legacy_session)
+        migration.downgrade(legacy_session)
+
+        rows = legacy_session.exec(
+            text("SELECT status, not_done_substatus, skip_reason FROM habitinstance ORDER BY id")
+        ).all()
+        assert rows == [("DONE", None, None), ("NOT_DONE", "SKIPPED_JUSTIFIED", "HEALTH")]
+        assert legacy_session.exec(text("SELECT recurrence FROM habits")).one() == ("WEEKDAYS",)
+
+    def test_br_db_migrate_020_schema_matches_fresh_database(self):
+        """
+        Integration: upgrade preserva NOT NULL e deixa o esquema igual ao novo.
+
+        DADO: Banco no esquema atual, com dados e foreign_keys ligado,
+              voltado para texto pelo downgrade
+        QUANDO: upgrade é executado
+        ENTÃO: PRAGMA table_info das tabelas migradas é igual ao de create_all
+        E: Índices e triggers voltam, linhas e FKs ficam intactas
+        E: foreign_keys continua ligado
+        """
+
+        def engine_with_fks():
+            engine = create_engine("sqlite:///:memory:")
+
+            @event.listens_for(engine, "connect")
+            def set_sqlite_pragma(dbapi_conn: Any, connection_record: Any) -> None:
+                dbapi_conn.execute("PRAGMA foreign_keys=ON")
+
+            SQLModel.metadata.create_all(engine)
+            return engine
+
+        def schema(session: Session) -> dict[str, Any]:
+            result = {}
+            for table in ("habits", "habitinstance", "event"):
+                columns = session.exec(text(f"PRAGMA table_xinfo({table})")).all()
+                # A troca leva as colunas para o fim: compara por nome
+                result[table] = sorted(tuple(row[1:]) for row in columns)
+            result["derived"] = session.exec(
+                text(
+                    "SELECT type, name, sql FROM sqlite_master"
+                    " WHERE type IN ('index', 'trigger')"
+                    " AND tbl_name IN ('habits', 'habitinstance', 'event') ORDER BY name"
+                )
+            ).all()
+            return result
+
+        fresh = engine_with_fks()
+        migrated = engine_with_fks()
+        with Session(fresh) as fresh_session, Session(migrated) as session:
+            routine = Routine(name="Rotina")
+            session.add(routine)
+            session.flush()
+            habit = Habit(
+                routine_id=routine.id,
+                title="Meditar",
+                scheduled_start=time(7, 0),
+                scheduled_end=time(7, 30),
+                recurrence=Recurrence.WEEKDAYS,
+            )
+            session.add(habit)
+            session.flush()
+            session.add(
+                HabitInstance(
+                    habit_id=habit.id,
+                    date=date(2025, 1, 6),
+                    scheduled_start=time(7, 0),
+                    scheduled_end=time(7, 30),
+                    status=Status.DONE,
+                )
+            )
+            session.commit()
+
+            migration.downgrade(session)
+            downgraded = session.exec(text("PRAGMA table_info(habitinstance)")).all()
+            assert [row[3] for row in downgraded if row[1] == "status"] == [1]
+
+            migration.upgrade(session)
+
+            assert schema(session) == schema(fresh_session)
+            status = enum_codes(Status)[Status.DONE]
+            recurrence = enum_codes(Recurrence)[Recurrence.WEEKDAYS]
+            assert session.exec(text("SELECT status FROM habitinstance")).all() == [(status,)]
+            assert session.exec(text("SELECT recurrence FROM habits")).all() == [(recurrence,)]
+            assert session.exec(text("PRAGMA foreign_key_check")).all() == []
+            assert session.exec(text("PRAGMA foreign_keys")).one() == (1,)
+            with pytest.raises(IntegrityError):
+                session.exec(text("UPDATE habitinstance SET status = NULL"))
+        fresh.dispose()
+        migrated.dispose()
@@ -0,0 +1,209 @@
+"""
+Integration tests para migração 005 (coluna uuid em BLOB).
+
+Referências:
+    - ADR-013: Offline-First Schema
+    - ADR-019: Test Naming Convention
+"""
+
+from datetime import date, time
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event, inspect, text
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.timeblock.database.migrations import migration_005_uuid_keys as migration
+from src.timeblock.models import Habit, HabitInstance, Recurrence, Routine
+
+_TABLES = ["routines", "tags", "habits", "habitinstance", "tasks", "event", "time_log"]
+
+
+def _legacy_engine():
+    engine = create_engine("sqlite:///:memory:")
+    with Session(engine) as session:
+        for table in _TABLES:
+            fk = ", habit_id INTEGER" if table == "habitinstance" else ""
+            session.exec(text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY{fk})"))
+        for row_id in (3, 1, 2):
+            session.exec(text(f"INSERT INTO habits (id) VALUES ({row_id})"))
+        session.commit()
+    return engine
+
+
+class TestBRDatabaseMigration005:
+    """
+    Integration: Migração 005 adiciona uuid (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-012: Backfill com UUIDv7 ordenado por id
+    - BR-DB-MIGRATE-013: Downgrade remove colunas e índices
+    - BR-DB-MIGRATE-021: Esquema migrado igual ao de um banco novo
+    - BR-DB-MIGRATE-022: Downgrade mantém índice de habit_id que já existia
+    """
+
+    def test_br_db_migrate_012_backfill_ordered_uuid7(self):
+        """
+        Integration: upgrade preenche uuid para linhas existentes.
+
+        DADO: Banco com linhas sem uuid
+        QUANDO: upgrade é executado
+        ENTÃO: Cada linha tem UUIDv7 de 16 bytes em ordem de id
+        E: uuid é UNIQUE em cada tabela e o índice de habit_id existe
+        """
+        engine = _legacy_engine()
+        with Session(engine) as session:
+            migration.upgrade(session)
+            rows = session.exec(text("SELECT id, uuid FROM habits ORDER BY id")).all()
+
+        values = [UUID(bytes=raw) for _id, raw in rows]
+        assert all(value.version == 7 for value in values)
+        assert values == sorted(values)
+
+        inspector = inspect(engine)
+        for table in _TABLES:
+            unique = [c["column_names"] for c in inspector.get_unique_constraints(table)]
+            assert unique == [["uuid"]]
+        assert "ix_habitinstance_habit_id" in {
+            i["name"] for i in inspector.get_indexes("habitinstance")
+        }
+        engine.dispose()
+
+    def test_br_db_migrate_013_downgrade(self):
+        """
+        Integration: downgrade remove uuid.
+
+        DADO: Banco migrado
+        QUANDO: downgrade é executado
+        ENTÃO: Colunas uuid e índices deixam de existir
+        """
+        engine = _legacy_engine()
+        with Session(engine) as session:
+            migration.upgrade(session)
+            migration.downgrade(session)
+
+        inspector = inspect(engine)
+        for table in _TABLES:
+            assert "uuid" not in {c["name"] for c in inspector.get_columns(table)}
+            assert inspector.get_indexes(table) == []
+        engine.dispose()
+
+    def test_br_db_migrate_021_schema_matches_fresh_database(self):
+        """
+        Integration: upgrade deixa uuid NOT NULL UNIQUE, como create_all.
+
+        DADO: Banco no esquema atual, com dados e foreign_keys ligado,
+              sem os triggers da migração 008 (usam uuid) e voltado pelo downgrade
+        QUANDO: upgrade é executado
+        ENTÃO: PRAGMA table_info e os índices das tabelas são iguais aos de create_all
+        E: As linhas ficam intactas, uuid nulo é recusado e foreign_keys continua ligado
+        """
+
+        def engine_with_fks():
+            engine = create_engine("sqlite:///:memory:")
+
+            @event.listens_for(engine, "connect")
+            def set_sqlite_pragma(dbapi_conn: Any, connection_record: Any) -> None:
+                dbapi_conn.execute("PRAGMA foreign_keys=ON")
+
+            SQLModel.metadata.create_all(engine)
+            with engine.begin() as conn:
+                triggers = conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+                ).scalars()
+                for name in triggers.all():
+                    conn.exec_driver_sql(f"DROP TRIGGER {name}")
+            return engine
+
+        def schema(session: Session) -> dict[str, Any]:
+            result = {}
+            for table in _TABLES:
+                columns = session.exec(text(f"PRAGMA table_xinfo({table})")).all()
+                # ADD COLUMN leva uuid para o fim: compara por nome
+                result[table] = sorted(tuple(row[1:]) for row in columns)
+                # Autoíndices mudam de nome com a ordem das constraints: compara a estrutura
+                result[f"{table} indexes"] = sorted(
+                    (
+                        index[1] if not index[1].startswith("sqlite_autoindex") else "",
+                        *index[2:],
+                        tuple(
+                            row[2] for row in session.exec(text(f"PRAGMA index_info('{index[1]}')"))
+                        ),
+                    )
+                    for index in session.exec(text(f"PRAGMA index_list({table})"))
+                )
+            result["derived"] = session.exec(
+                text(
+                    "SELECT type, name, tbl_name, sql FROM sqlite_master"
+                    " WHERE type IN ('index', 'view') AND sql IS NOT NULL ORDER BY name"
+                )
+            ).all()
+            return result
+
+        fresh = engine_with_fks()
+        migrated = engine_with_fks()
+        with Session(fresh) as fresh_session, Session(migrated) as session:
+            routine = Routine(name="Rotina")
+            session.add(routine)
+            session.flush()
+            habit = Habit(
+                routine_id=routine.id,
+                title="Meditar",
+                scheduled_start=time(7, 0),
+                scheduled_end=time(7, 30),
+                recurrence=Recurrence.EVERYDAY,
+            )
+            session.add(habit)
+            session.flush()
+            session.add(
+                HabitInstance(
+                    habit_id=habit.id,
+                    date=date(2025, 1, 6),
+                    scheduled_start=time(7, 0),
+                    scheduled_end=time(7, 30),
+                )
+            )
+            session.commit()
+            rows = session.exec(text("SELECT id, habit_id, date FROM habitinstance")).all()
+
+            migration.downgrade(session)
+            columns = session.exec(text("PRAGMA table_info(habitinstance)")).all()
+            assert "uuid" not in {row[1] for row in columns}
+
+            migration.upgrade(session)
+
+            assert schema(session) == schema(fresh_session)
+            assert session.exec(text("SELECT id, habit_id, date FROM habitinstance")).all() == rows
+            assert session.exec(text("PRAGMA foreign_key_check")).all() == []
+            assert session.exec(text("PRAGMA foreign_keys")).one() == (1,)
+            with pytest.raises(IntegrityError):
+                session.exec(text("UPDATE routines SET uuid = NULL"))
+            session.rollback()
+        fresh.dispose()
+        migrated.dispose()
+
+    def test_br_db_migrate_022_downgrade_keeps_existing_habit_id_index(self):
+        """
+        Integration: downgrade só remove o índice de habit_id criado pelo upgrade.
+
+        DADO: Banco antigo que já tinha ix_habitinstance_habit_id
+        QUANDO: upgrade e downgrade são executados
+        ENTÃO: O índice continua existindo, com o SQL original
+        """
+        engine = _legacy_engine()
+        original = "CREATE INDEX ix_habitinstance_habit_id ON habitinstance (habit_id)"
+        with Session(engine) as session:
+            session.exec(text(original))
+            session.commit()
+
+            migration.upgrade(session)
+            migration.downgrade(session)
+
+            sql = session.exec(
+                text("SELECT sql FROM sqlite_master WHERE name = 'ix_habitinstance_habit_id'")
+            ).all()
+
+        assert sql == [(original,)]
+        engine.dispose()
@@ -0,0 +1,54 @@
+"""
+Integration tests para migração 006 (tabela active_timer).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from src.timeblock.database.migrations import migration_006_active_timer as migration
+
+
+class TestBRDatabaseMigration006:
+    """
+    Integration: Migração 006 persiste estado do timer (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-014: Timer aberto vira estado ativo
+    """
+
+    def test_br_db_migrate_014_open_timelog_becomes_active(self):
+        """
+        Integration: upgrade registra o TimeLog aberto.
+
+        DADO: Banco com um TimeLog encerrado e um aberto
+        QUANDO: upgrade é executado
+        ENTÃO: active_timer aponta para o TimeLog aberto
+        E: downgrade remove a tabela
+        """
+        engine = create_engine("sqlite:///:memory:")
+        with Session(engine) as session:
+            session.exec(
+                text("""CREATE TABLE time_log (
+                    id INTEGER PRIMARY KEY, end_time DATETIME, paused_duration INTEGER
+                )""")
+            )
+            session.exec(text("CREATE TABLE pauselog (id INTEGER PRIMARY KEY)"))
+            session.exec(text("INSERT INTO time_log VALUES (1, '2025-10-17 10:00:00', 0)"))
+            session.exec(text("INSERT INTO time_log VALUES (2, NULL, 120)"))
+            session.commit()
+
+            migration.upgrade(session)
+            state = session.exec(
+                text("SELECT id, timelog_id, pause_start, paused_seconds FROM active_timer")
+            ).all()
+            assert state == [(1, 2, None, 120)]
+
+            migration.downgrade(session)
+            tables = session.exec(
+                text("SELECT name FROM sqlite_master WHERE name = 'active_timer'")
+            ).all()
+            assert tables == []
+        engine.dispose()
@@ -0,0 +1,55 @@
+"""
+Integration tests para migração 007 (tabela sync_queue).
+
+Referências:
+    - ADR-012: Sync Strategy
+    - ADR-019: Test Naming Convention
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from src.timeblock.database.migrations import migration_007_sync_queue as migration
+
+
+class TestBRDatabaseMigration007:
+    """
+    Integration: Migração 007 cria a fila de sincronização (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-015: sync_queue com seq AUTOINCREMENT
+    """
+
+    def test_br_db_migrate_015_sync_queue_created(self):
+        """
+        Integration: upgrade cria sync_queue e seu índice.
+
+        DADO: Banco sem sync_queue
+        QUANDO: upgrade é executado
+        ENTÃO: A tabela e o índice por entidade existem
+        E: seq não é reutilizado após apagar a última linha
+        E: downgrade remove a tabela
+        """
+        engine = create_engine("sqlite:///:memory:")
+        with Session(engine) as session:
+            migration.upgrade(session)
+            insert = text(
+                "INSERT INTO sync_queue (entity, entity_uuid, op, created_at)"
+                " VALUES ('habits', x'00', 0, '2025-10-20 09:00:00')"
+            )
+            session.exec(insert)
+            session.exec(text("DELETE FROM sync_queue"))
+            session.exec(insert)
+            seqs = session.exec(text("SELECT seq FROM sync_queue")).all()
+            indexes = session.exec(
+                text("SELECT name FROM sqlite_master WHERE tbl_name = 'sync_queue'")
+            ).all()
+            assert seqs == [(2,)]
+            assert ("ix_sync_queue_entity",) in indexes
+
+            migration.downgrade(session)
+            tables = session.exec(
+                text("SELECT name FROM sqlite_master WHERE name = 'sync_queue'")
+            ).all()
+            assert tables == []
+        engine.dispose()
@@ -0,0 +1,60 @@
+"""
+Integration tests para migração 008 (change_seq e lápides).
+
+Referências:
+    - ADR-012: Sync Strategy
+    - ADR-019: Test Naming Convention
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from src.timeblock.database.migrations import migration_008_change_seq as migration
+
+
+class TestBRDatabaseMigration008:
+    """
+    Integration: Migração 008 numera as mudanças (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-016: change_seq, triggers e numeração das linhas existentes
+    """
+
+    def test_br_db_migrate_016_change_seq_backfilled(self):
+        """
+        Integration: upgrade numera linhas existentes e liga os triggers.
+
+        DADO: Banco pré-008 com duas rotinas
+        QUANDO: upgrade é executado e uma rotina é removida
+        ENTÃO: As rotinas recebem change_seq 1 e 2
+        E: A remoção deixa lápide com seq 3
+        E: downgrade remove coluna e tabelas de controle
+        """
+        engine = create_engine("sqlite:///:memory:")
+        with Session(engine) as session:
+            for table in ("event", "tags", "habits", "tasks", "habitinstance", "time_log"):
+                session.exec(text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, uuid BLOB)"))
+            session.exec(
+                text("CREATE TABLE routines (id INTEGER PRIMARY KEY, uuid BLOB, name TEXT)")
+            )
+            session.exec(
+                text("INSERT INTO routines (uuid, name) VALUES (x'01', 'A'), (x'02', 'B')")
+            )
+
+            migration.upgrade(session)
+            seqs = session.exec(text("SELECT change_seq FROM routines ORDER BY id")).all()
+            session.exec(text("DELETE FROM routines WHERE name = 'A'"))
+            tombstones = session.exec(
+                text("SELECT entity, entity_uuid, change_seq FROM sync_tombstone")
+            ).all()
+            assert seqs == [(1,), (2,)]
+            assert tombstones == [("routines", b"\x01", 3)]
+
+            migration.downgrade(session)
+            columns = session.exec(text("SELECT name FROM pragma_table_info('routines')")).all()
+            tables = session.exec(
+                text("SELECT name FROM sqlite_master WHERE name LIKE 'sync_%'")
+            ).all()
+            assert ("change_seq",) not in columns
+            assert tables == []
+        engine.dispose()
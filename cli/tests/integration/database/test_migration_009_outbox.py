@@ -0,0 +1,53 @@
+"""
+Integration tests para migração 009 (outbox de eventos).
+
+Referências:
+    - ADR-023: Microservices Ecosystem
+    - ADR-019: Test Naming Convention
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from src.timeblock.database.migrations import migration_009_outbox as migration
+
+
+class TestBRDatabaseMigration009:
+    """
+    Integration: Migração 009 cria o outbox (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-017: outbox com id AUTOINCREMENT e tabela de offsets
+    """
+
+    def test_br_db_migrate_017_outbox_created(self):
+        """
+        Integration: upgrade cria outbox e outbox_offset.
+
+        DADO: Banco sem outbox
+        QUANDO: upgrade é executado
+        ENTÃO: id do outbox não é reutilizado após apagar a última linha
+        E: downgrade remove as duas tabelas
+        """
+        engine = create_engine("sqlite:///:memory:")
+        with Session(engine) as session:
+            migration.upgrade(session)
+            insert = text(
+                "INSERT INTO outbox (event_id, type, subject, time, data)"
+                " VALUES ('e', 'timeblock.timer.started', 's', '2025-10-20 09:00:00', '{}')"
+            )
+            session.exec(insert)
+            session.exec(text("DELETE FROM outbox"))
+            session.exec(insert)
+            session.exec(
+                text("INSERT INTO outbox_offset (sink, last_id, attempts) VALUES ('a', 2, 0)")
+            )
+            ids = session.exec(text("SELECT id FROM outbox")).all()
+            assert ids == [(2,)]
+
+            migration.downgrade(session)
+            tables = session.exec(
+                text("SELECT name FROM sqlite_master WHERE name LIKE 'outbox%'")
+            ).all()
+            assert tables == []
+        engine.dispose()
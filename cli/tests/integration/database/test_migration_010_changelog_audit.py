@@ -0,0 +1,64 @@
+"""
+Integration tests para migração 010 (changelog de auditoria).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, create_engine
+
+from src.timeblock.database.migrations import migration_010_changelog_audit as migration
+
+
+class TestBRDatabaseMigration010:
+    """
+    Integration: Migração 010 recria o changelog (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-018: changelog genérico por entidade, sem FK para event
+    """
+
+    def test_br_db_migrate_018_changelog_recreated(self):
+        """
+        Integration: upgrade troca event_id por entity/entity_id.
+
+        DADO: Banco com o changelog original (event_id)
+        QUANDO: upgrade é executado
+        ENTÃO: Aceita linhas de qualquer entidade e índices existem
+        E: change_type fora da faixa de códigos é rejeitado
+        E: downgrade volta à coluna event_id
+        """
+        engine = create_engine("sqlite:///:memory:")
+        with Session(engine) as session:
+            migration.downgrade(session)
+            migration.upgrade(session)
+            session.exec(
+                text(
+                    "INSERT INTO changelog (entity, entity_id, change_type, changed_at)"
+                    " VALUES ('tasks', 7, 4, '2025-10-20 09:00:00')"
+                )
+            )
+            indexes = {
+                row[0]
+                for row in session.exec(
+                    text("SELECT name FROM sqlite_master WHERE tbl_name = 'changelog'")
+                ).all()
+            }
+            assert {"ix_changelog_entity", "ix_changelog_changed_at"} <= indexes
+            with pytest.raises(IntegrityError):
+                session.exec(
+                    text(
+                        "INSERT INTO changelog (entity, entity_id, change_type, changed_at)"
+                        " VALUES ('tasks', 7, 5, '2025-10-20 09:00:00')"
+                    )
+                )
+            session.rollback()
+
+            migration.downgrade(session)
+            columns = [row[1] for row in session.exec(text("PRAGMA table_info(changelog)"))]
+            assert "event_id" in columns
+            assert "entity" not in columns
+        engine.dispose()
@@ -0,0 +1,52 @@
+"""
+Integration tests para migração 011 (id local nas operações da sync_queue).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from src.timeblock.database.migrations import migration_007_sync_queue
+from src.timeblock.database.migrations import migration_011_sync_queue_entity_id as migration
+
+
+class TestBRDatabaseMigration011:
+    """
+    Integration: Migração 011 adiciona entity_id à sync_queue (BR-DB-MIGRATE-*).
+
+    BRs cobertas:
+    - BR-DB-MIGRATE-019: Coluna entity_id opcional, operações antigas ficam nulas
+    """
+
+    def test_br_db_migrate_019_entity_id_added(self):
+        """
+        Integration: upgrade adiciona entity_id sem tocar nas operações existentes.
+
+        DADO: sync_queue da migração 007 com uma operação
+        QUANDO: upgrade é executado
+        ENTÃO: A coluna existe, a operação antiga tem entity_id nulo
+        E: downgrade remove a coluna
+        """
+        engine = create_engine("sqlite:///:memory:")
+        with Session(engine) as session:
+            migration_007_sync_queue.upgrade(session)
+            session.exec(
+                text(
+                    "INSERT INTO sync_queue (entity, entity_uuid, op, payload, created_at)"
+                    " VALUES ('tasks', x'00', 0, '{}', '2025-10-20 09:00:00')"
+                )
+            )
+            session.commit()
+
+            migration.upgrade(session)
+            columns = [row[1] for row in session.exec(text("PRAGMA table_info(sync_queue)"))]
+            assert "entity_id" in columns
+            entity_id = session.exec(text("SELECT entity_id FROM sync_queue")).one()[0]
+            assert entity_id is None
+
+            migration.downgrade(session)
+            columns = [row[1] for row in session.exec(text("PRAGMA table_info(sync_queue)"))]
+            assert "entity_id" not in columns
+        engine.dispose()
@@ -0,0 +1,233 @@
+"""
+Integration tests para o cache de leituras dos services (QueryCache).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+import sqlite3
+from collections.abc import Iterator
+from datetime import date, time
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+from src.timeblock.database import engine as engine_module
+from src.timeblock.database import get_query_cache, shared_engines
+from src.timeblock.models import HabitInstance
+from src.timeblock.services.habit_instance_service import HabitInstanceService
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """Registra os SELECTs executados pelo engine compartilhado."""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            executed.append(statement)
+
+    with shared_engines() as engine:
+        event.listen(engine, "before_cursor_execute", record)
+        yield executed
+
+
+def _add_instance(habit_id: int, day: date) -> None:
+    with Session(engine_module._shared_engine) as session:
+        session.add(
+            HabitInstance(
+                habit_id=habit_id,
+                date=day,
+                scheduled_start=time(7, 0),
+                scheduled_end=time(7, 30),
+            )
+        )
+        session.commit()
+
+
+def _days(instances: list[HabitInstance]) -> list[date]:
+    return [instance.date for instance in instances]
+
+
+class TestBRQueryCache:
+    """
+    Integration: Leituras repetidas servidas da memória (BR-DB-CACHE-*).
+
+    BRs cobertas:
+    - BR-DB-CACHE-001: Leitura repetida não vai ao banco e devolve instâncias novas
+    - BR-DB-CACHE-002: Commit deste processo invalida o cache
+    - BR-DB-CACHE-003: Commit de outra conexão invalida o cache
+    - BR-DB-CACHE-004: Sessão com escritas pendentes não usa o cache
+    - BR-DB-CACHE-005: LRU limitado por entradas e bytes
+    - BR-DB-CACHE-006: Cache só existe dentro de shared_engines
+    """
+
+    def test_br_db_cache_001_repeated_read_hits_memory(
+        self, db_path, statements, routine_with_habits
+    ) -> None:
+        """
+        Integration: Segunda leitura igual não executa SELECT.
+
+        DADO: Instância de hábito criada e cache ativo
+        QUANDO: list_instances é chamado duas vezes
+        ENTÃO: A segunda chamada não executa SELECT
+        E: Os resultados são iguais mas não são os mesmos objetos
+        """
+        _, (habit_id,) = routine_with_habits(1)
+        _add_instance(habit_id, date(2025, 10, 20))
+        first = HabitInstanceService.list_instances(habit_id)
+        statements.clear()
+
+        second = HabitInstanceService.list_instances(habit_id)
+
+        assert statements == []
+        assert _days(second) == _days(first) == [date(2025, 10, 20)]
+        assert second[0] is not first[0]
+        assert get_query_cache().hits == 1
+
+    def test_br_db_cache_002_local_commit_invalidates(
+        self, db_path, statements, routine_with_habits
+    ) -> None:
+        """
+        Integration: Instância criada depois da leitura aparece na próxima.
+
+        DADO: list_instances em cache
+        QUANDO: Uma instância é criada neste processo
+        ENTÃO: A próxima leitura vai ao banco e inclui a nova instância
+        """
+        _, (habit_id,) = routine_with_habits(1)
+        _add_instance(habit_id, date(2025, 10, 20))
+        HabitInstanceService.list_instances(habit_id)
+
+        _add_instance(habit_id, date(2025, 10, 21))
+
+        assert _days(HabitInstanceService.list_instances(habit_id)) == [
+            date(2025, 10, 20),
+            date(2025, 10, 21),
+        ]
+
+    def test_br_db_cache_003_external_commit_invalidates(
+        self, db_path, statements, routine_with_habits
+    ) -> None:
+        """
+        Integration: Commit de outro processo é detectado via data_version.
+
+        DADO: list_instances em cache
+        QUANDO: Outra conexão (fora do SQLAlchemy) insere uma instância
+        ENTÃO: A próxima leitura inclui a instância externa
+        """
+        _, (habit_id,) = routine_with_habits(1)
+        _add_instance(habit_id, date(2025, 10, 21))
+        HabitInstanceService.list_instances(habit_id)
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO habitinstance (uuid, habit_id, date, scheduled_start,"
+                " scheduled_end, status) VALUES"
+                " (randomblob(16), ?, '2025-10-20', '07:00:00.000000', '07:30:00.000000', 0)",
+                (habit_id,),
+            )
+
+        assert _days(HabitInstanceService.list_instances(habit_id)) == [
+            date(2025, 10, 20),
+            date(2025, 10, 21),
+        ]
+
+    def test_br_db_cache_004_session_with_writes_bypasses(
+        self, db_path, statements, routine_with_habits
+    ) -> None:
+        """
+        Integration: Leitura na sessão que escreveu enxerga a escrita.
+
+        DADO: list_instances do hábito em cache
+        QUANDO: Uma instância é adicionada e enviada (flush) sem commit
+        ENTÃO: list_instances na mesma sessão inclui a instância nova
+        E: Após rollback, a leitura volta a usar o cache
+        """
+        _, (habit_id,) = routine_with_habits(1)
+        _add_instance(habit_id, date(2025, 10, 20))
+        HabitInstanceService.list_instances(habit_id)
+
+        with Session(engine_module._shared_engine) as session:
+            session.add(
+                HabitInstance(
+                    habit_id=habit_id,
+                    date=date(2025, 10, 21),
+                    scheduled_start=time(7, 0),
+                    scheduled_end=time(7, 30),
+                )
+            )
+            session.flush()
+            days = _days(HabitInstanceService.list_instances(habit_id, session=session))
+            session.rollback()
+            hits_before = get_query_cache().hits
+            cached = HabitInstanceService.list_instances(habit_id, session=session)
+
+        assert days == [date(2025, 10, 20), date(2025, 10, 21)]
+        assert _days(cached) == [date(2025, 10, 20)]
+        assert get_query_cache().hits == hits_before + 1
+
+    def test_br_db_cache_004_hit_merges_into_session(
+        self, db_path, statements, routine_with_habits
+    ) -> None:
+        """
+        Integration: Resultado em cache é devolvido dentro da sessão.
+
+        DADO: list_instances em cache
+        QUANDO: Outra sessão pede a mesma leitura
+        ENTÃO: Nenhum SELECT é executado e os objetos pertencem à sessão
+        """
+        _, (habit_id,) = routine_with_habits(1)
+        _add_instance(habit_id, date(2025, 10, 20))
+        HabitInstanceService.list_instances(habit_id)
+        statements.clear()
+
+        with Session(engine_module._shared_engine) as session:
+            (instance,) = HabitInstanceService.list_instances(habit_id, session=session)
+            assert instance in session
+
+        assert statements == []
+        assert instance.habit_id == habit_id
+
+    def test_br_db_cache_005_lru_bounds(self, db_path, statements, routine_with_habits) -> None:
+        """
+        Integration: Entradas menos usadas saem quando o limite é atingido.
+
+        DADO: Cache limitado a 2 entradas
+        QUANDO: As instâncias de três hábitos diferentes são lidas
+        ENTÃO: Ficam só 2 entradas e o tamanho estimado é positivo
+        E: O primeiro hábito volta a ir ao banco
+        """
+        _, habit_ids = routine_with_habits(3)
+        for habit_id in habit_ids:
+            _add_instance(habit_id, date(2025, 10, 20))
+        cache = get_query_cache()
+        cache.max_entries = 2
+
+        for habit_id in habit_ids:
+            HabitInstanceService.list_instances(habit_id)
+        statements.clear()
+        HabitInstanceService.list_instances(habit_ids[0])
+
+        assert len(cache) == 2
+        assert cache.size_bytes > 0
+        assert len(statements) == 1
+
+    def test_br_db_cache_006_inactive_outside_shared_engines(
+        self, db_path, routine_with_habits
+    ) -> None:
+        """
+        Integration: Fora de shared_engines não há cache.
+
+        DADO: Nenhum shared_engines ativo
+        QUANDO: Services são chamados
+        ENTÃO: get_query_cache() é None e as leituras funcionam normalmente
+        """
+        with shared_engines():
+            assert get_query_cache() is not None
+            _, (habit_id,) = routine_with_habits(1)
+            _add_instance(habit_id, date(2025, 10, 20))
+
+        assert get_query_cache() is None
+        assert _days(HabitInstanceService.list_instances(habit_id)) == [date(2025, 10, 20)]
@@ -0,0 +1,99 @@
+"""
+Integration tests para engine somente-leitura (report/list).
+
+Valida que o engine read-only não escreve, enxerga um snapshot
+consistente durante toda a sessão e não bloqueia o writer (WAL).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, SQLModel, func, select
+
+from src.timeblock.database import get_engine_context, get_readonly_engine_context
+from src.timeblock.models import Task
+
+
+@pytest.fixture
+def db_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Banco em arquivo com tabelas criadas e uma task."""
+    db_path = tmp_path / "readonly.db"
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(db_path))
+    with get_engine_context() as engine:
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(Task(title="Existing", scheduled_datetime=datetime(2025, 11, 1, 9, 0)))
+            session.commit()
+    yield db_path
+
+
+def _count_tasks(session: Session) -> int:
+    return session.exec(select(func.count()).select_from(Task)).one()
+
+
+class TestBRDatabaseReadOnly:
+    """
+    Integration: Conexões read-only para relatórios (BR-DB-READONLY-*).
+
+    BRs cobertas:
+    - BR-DB-READONLY-001: Escritas são rejeitadas
+    - BR-DB-READONLY-002: Sessão enxerga snapshot consistente
+    - BR-DB-READONLY-003: Leitor não bloqueia writer
+    """
+
+    def test_br_db_readonly_001_rejects_writes(self, db_file: Path) -> None:
+        """
+        Integration: Engine read-only rejeita INSERT.
+
+        DADO: Banco existente
+        QUANDO: Sessão read-only tenta inserir task
+        ENTÃO: SQLite rejeita a escrita
+        """
+        with get_readonly_engine_context() as engine, Session(engine) as session:
+            session.add(Task(title="Blocked", scheduled_datetime=datetime(2025, 11, 2, 9, 0)))
+            with pytest.raises(OperationalError):
+                session.commit()
+
+    def test_br_db_readonly_002_snapshot_isolation(self, db_file: Path) -> None:
+        """
+        Integration: Leitura longa não vê commits concorrentes.
+
+        DADO: Sessão read-only que já leu a tabela tasks
+        QUANDO: Outro engine insere nova task
+        ENTÃO: Sessão read-only continua vendo a contagem original
+        E: Nova sessão read-only vê a task inserida
+        """
+        with get_readonly_engine_context() as ro_engine:
+            with Session(ro_engine) as reader:
+                assert _count_tasks(reader) == 1
+
+                with get_engine_context() as engine, Session(engine) as writer:
+                    writer.add(Task(title="New", scheduled_datetime=datetime(2025, 11, 2, 9, 0)))
+                    writer.commit()
+
+                assert _count_tasks(reader) == 1
+
+            with Session(ro_engine) as reader:
+                assert _count_tasks(reader) == 2
+
+    def test_br_db_readonly_003_reader_does_not_block_writer(self, db_file: Path) -> None:
+        """
+        Integration: Writer comita com transação de leitura aberta.
+
+        DADO: Transação read-only aberta
+        QUANDO: Writer altera e comita
+        ENTÃO: Commit não falha com 'database is locked'
+        """
+        with get_readonly_engine_context() as ro_engine, Session(ro_engine) as reader:
+            _count_tasks(reader)
+            with get_engine_context() as engine, Session(engine) as writer:
+                task = writer.exec(select(Task)).one()
+                task.title = "Renamed"
+                writer.add(task)
+                writer.commit()
@@ -0,0 +1,167 @@
+"""
+Integration tests - services assíncronos (aiosqlite).
+
+Referências:
+    - ADR-006: Textual para TUI
+    - ADR-019: Test Naming Convention
+"""
+
+import asyncio
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.timeblock.database import (
+    get_async_engine_context,
+    shared_async_engine,
+)
+from src.timeblock.services import async_services
+from src.timeblock.services.async_services import (
+    AsyncEventReorderingService,
+    AsyncHabitService,
+    AsyncTaskService,
+    AsyncTimerService,
+)
+from src.timeblock.services.event_reordering_service import EventReorderingService
+from src.timeblock.services.habit_instance_service import HabitInstanceService
+from src.timeblock.services.habit_service import HabitService
+from src.timeblock.services.task_service import TaskService
+from src.timeblock.services.timer_service import TimerService
+
+
+def _public_methods(cls: type) -> set[str]:
+    return {name for name in vars(cls) if not name.startswith("_")}
+
+
+class TestBRAsyncServices:
+    """
+    Integration: Services assíncronos equivalentes aos síncronos (BR-ASYNC-*).
+
+    BRs cobertas:
+    - BR-ASYNC-001: Mesma API pública dos services síncronos
+    - BR-ASYNC-002: Escritas e leituras visíveis entre as duas camadas
+    - BR-ASYNC-003: Leituras concorrentes não bloqueiam o event loop
+    - BR-ASYNC-004: Sessão do chamador é reutilizada
+    - BR-ASYNC-005: Erros de validação propagam inalterados
+    """
+
+    @pytest.mark.parametrize(
+        ("sync_cls", "async_name"),
+        [
+            (HabitInstanceService, "AsyncHabitInstanceService"),
+            (TaskService, "AsyncTaskService"),
+            (TimerService, "AsyncTimerService"),
+            (HabitService, "AsyncHabitService"),
+            (EventReorderingService, "AsyncEventReorderingService"),
+        ],
+    )
+    def test_br_async_001_same_public_api(self, sync_cls: type, async_name: str) -> None:
+        """
+        Integration: Todo método público síncrono tem versão assíncrona.
+
+        DADO: Service síncrono e sua versão async
+        QUANDO: Métodos públicos são comparados
+        ENTÃO: Os conjuntos são iguais
+        """
+        async_cls = getattr(async_services, async_name)
+
+        assert _public_methods(async_cls) == _public_methods(sync_cls)
+
+    def test_br_async_002_roundtrip_with_sync_layer(self, db_path: Path) -> None:
+        """
+        Integration: Task criada via async é lida via sync e vice-versa.
+
+        DADO: Banco vazio
+        QUANDO: Uma task é criada pelo service async e outra pelo sync
+        ENTÃO: Ambas as camadas listam as duas tasks
+        """
+        scheduled = datetime(2025, 10, 20, 9, 0)
+
+        async def scenario() -> list:
+            await AsyncTaskService.create_task("Async", scheduled)
+            TaskService.create_task("Sync", scheduled)
+            return await AsyncTaskService.list_tasks()
+
+        async_titles = sorted(t.title for t in asyncio.run(scenario()))
+        sync_titles = sorted(t.title for t in TaskService.list_tasks())
+
+        assert async_titles == sync_titles == ["Async", "Sync"]
+
+    def test_br_async_003_concurrent_reads_do_not_block_loop(self, db_path: Path) -> None:
+        """
+        Integration: gather de leituras deixa o loop atender outras tarefas.
+
+        DADO: Engine assíncrono compartilhado
+        QUANDO: Calendário, timer, conflitos e hábitos são lidos com gather
+        E: Uma tarefa de heartbeat roda no mesmo loop
+        ENTÃO: Os resultados batem com os services síncronos
+        E: O heartbeat avança enquanto as leituras estão em andamento
+        """
+        TaskService.create_task("Reunião", datetime.combine(date.today(), datetime.min.time()))
+
+        async def scenario() -> tuple[list, int]:
+            ticks = 0
+            done = asyncio.Event()
+
+            async def heartbeat() -> None:
+                nonlocal ticks
+                while not done.is_set():
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            async with shared_async_engine():
+                beat = asyncio.create_task(heartbeat())
+                results = await asyncio.gather(
+                    AsyncTaskService.list_tasks(),
+                    AsyncTimerService.get_active_timer(),
+                    AsyncEventReorderingService.get_conflicts_for_day(date.today()),
+                    AsyncHabitService.list_habits(),
+                )
+                done.set()
+                await beat
+            return results, ticks
+
+        (tasks, timer, conflicts, habits), ticks = asyncio.run(scenario())
+
+        assert [t.title for t in tasks] == ["Reunião"]
+        assert timer is None
+        assert conflicts == EventReorderingService.get_conflicts_for_day(date.today())
+        assert habits == []
+        assert ticks > 1
+
+    def test_br_async_004_caller_session_is_reused(self, db_path: Path) -> None:
+        """
+        Integration: Com session explícita, as chamadas compartilham a sessão.
+
+        DADO: AsyncSession aberta pelo chamador
+        QUANDO: A mesma task é lida duas vezes passando essa sessão
+        ENTÃO: As duas leituras devolvem o mesmo objeto (identity map da sessão)
+        """
+        task_id = TaskService.create_task("Reunião", datetime(2025, 10, 20, 9, 0)).id
+
+        async def scenario() -> bool:
+            async with (
+                get_async_engine_context() as engine,
+                AsyncSession(engine) as session,
+            ):
+                first = await AsyncTaskService.get_task(task_id, session=session)
+                second = await AsyncTaskService.get_task(task_id, session=session)
+                return first is second
+
+        assert asyncio.run(scenario()) is True
+
+    def test_br_async_005_validation_errors_propagate(self, db_path: Path) -> None:
+        """
+        Integration: ValueError do service síncrono chega ao chamador async.
+
+        DADO: Service async
+        QUANDO: Task é criada com título vazio
+        ENTÃO: ValueError com a mensagem original
+        """
+        with pytest.raises(ValueError, match="Title cannot be empty"):
+            asyncio.run(AsyncTaskService.create_task("  ", datetime(2025, 10, 20, 9, 0)))
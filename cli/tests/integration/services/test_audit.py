@@ -0,0 +1,222 @@
+"""
+Integration tests para a auditoria de edições da agenda (changelog).
+
+Referências:
+    - ADR-019: Test Naming Convention
+"""
+
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+from sqlmodel import Session, select
+from typer.testing import CliRunner
+
+from src.timeblock.database import get_engine_context
+from src.timeblock.main import app
+from src.timeblock.models import ChangeLog, ChangeType, Habit, Recurrence, Routine
+from src.timeblock.services.audit import AuditService
+from src.timeblock.services.habit_instance_service import HabitInstanceService
+from src.timeblock.services.habit_service import HabitService
+from src.timeblock.services.task_service import TaskService
+
+
+def _habit() -> int:
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Rotina")
+        session.add(routine)
+        session.commit()
+        routine_id = routine.id
+    habit = HabitService.create_habit(
+        routine_id, "Meditar", time(7, 0), time(7, 30), Recurrence.EVERYDAY
+    )
+    return habit.id
+
+
+def _changes(entity: str | None = None) -> list[ChangeLog]:
+    with get_engine_context() as engine, Session(engine) as session:
+        statement = select(ChangeLog).order_by(ChangeLog.id)
+        if entity is not None:
+            statement = statement.where(ChangeLog.entity == entity)
+        return list(session.exec(statement).all())
+
+
+class TestBRAudit:
+    """
+    Integration: Auditoria automática via hooks de flush (BR-AUDIT-*).
+
+    BRs cobertas:
+    - BR-AUDIT-001: Alteração grava campo, valor antigo e novo
+    - BR-AUDIT-002: Horário e data são RESCHEDULED, status é STATUS_CHANGED
+    - BR-AUDIT-003: Remoção grava DELETED e o histórico sobrevive
+    - BR-AUDIT-004: Geração em lote grava um CREATED por linha, no mesmo instante
+    - BR-AUDIT-005: Rollback descarta a auditoria junto
+    - BR-AUDIT-006: Paginação por keyset em (changed_at, id)
+    - BR-AUDIT-007: Comando history lista e imprime o cursor
+    """
+
+    def test_br_audit_001_update_records_old_and_new(self, db_path: Path) -> None:
+        """
+        Integration: Update de hábito registra o diff por campo.
+
+        DADO: Hábito "Meditar"
+        QUANDO: Título é alterado
+        ENTÃO: Uma linha UPDATED com title "Meditar" -> "Respirar"
+        E: Campos não alterados não geram linhas
+        """
+        habit_id = _habit()
+
+        HabitService.update_habit(habit_id, title="Respirar")
+
+        updates = [c for c in _changes("habits") if c.change_type == ChangeType.UPDATED]
+        assert [(c.entity_id, c.field_name, c.old_value, c.new_value) for c in updates] == [
+            (habit_id, "title", "Meditar", "Respirar")
+        ]
+
+    def test_br_audit_002_change_types(self, db_path: Path) -> None:
+        """
+        Integration: Tipo da mudança segue a coluna alterada.
+
+        DADO: Hábito com instância e uma tarefa
+        QUANDO: Horário do hábito e da tarefa mudam e a instância é concluída
+        ENTÃO: Mudanças de horário são RESCHEDULED com valores em ISO
+        E: Mudança de status da instância é STATUS_CHANGED
+        """
+        habit_id = _habit()
+        [instance] = HabitInstanceService.generate_instances(
+            habit_id, date(2025, 10, 20), date(2025, 10, 20)
+        )
+        when = datetime(2025, 10, 20, 14, 0)
+        task = TaskService.create_task("Relatório", when)
+
+        HabitService.update_habit(habit_id, scheduled_start=time(6, 30))
+        TaskService.update_task(task.id, scheduled_datetime=when + timedelta(days=1))
+        HabitInstanceService.mark_completed(instance.id)
+
+        changes = _changes()
+        rescheduled = [
+            (c.entity, c.field_name, c.old_value, c.new_value)
+            for c in changes
+            if c.change_type == ChangeType.RESCHEDULED
+        ]
+        assert rescheduled == [
+            ("habits", "scheduled_start", "07:00:00", "06:30:00"),
+            ("tasks", "scheduled_datetime", "2025-10-20T14:00:00", "2025-10-21T14:00:00"),
+        ]
+        status = [c for c in changes if c.change_type == ChangeType.STATUS_CHANGED]
+        assert [(c.entity, c.entity_id, c.old_value, c.new_value) for c in status] == [
+            ("habitinstance", instance.id, "pending", "done")
+        ]
+
+    def test_br_audit_003_delete_survives(self, db_path: Path) -> None:
+        """
+        Integration: Remoção fica no histórico.
+
+        DADO: Tarefa criada
+        QUANDO: Tarefa é removida
+        ENTÃO: Histórico da tarefa tem CREATED e DELETED com o id dela
+        """
+        task = TaskService.create_task("Relatório", datetime(2025, 10, 20, 14, 0))
+
+        TaskService.delete_task(task.id)
+
+        changes = _changes("tasks")
+        assert [(c.change_type, c.entity_id) for c in changes] == [
+            (ChangeType.CREATED, task.id),
+            (ChangeType.DELETED, task.id),
+        ]
+
+    def test_br_audit_004_bulk_generate_single_batch(self, db_path: Path) -> None:
+        """
+        Integration: Geração de instâncias audita em lote.
+
+        DADO: Hábito diário
+        QUANDO: 30 instâncias são geradas
+        ENTÃO: 30 linhas CREATED, uma por id gerado
+        E: Todas com o mesmo changed_at (um único flush)
+        """
+        habit_id = _habit()
+        start = date(2025, 10, 1)
+
+        instances = HabitInstanceService.generate_instances(
+            habit_id, start, start + timedelta(days=29)
+        )
+
+        changes = _changes("habitinstance")
+        assert {c.change_type for c in changes} == {ChangeType.CREATED}
+        assert sorted(c.entity_id for c in changes) == sorted(i.id for i in instances)
+        assert len({c.changed_at for c in changes}) == 1
+
+    def test_br_audit_005_rollback_discards_audit(self, db_path: Path) -> None:
+        """
+        Integration: Auditoria faz parte da transação.
+
+        DADO: Hábito existente
+        QUANDO: Título é alterado e flushado, mas a transação sofre rollback
+        ENTÃO: Nenhuma linha UPDATED é gravada
+        """
+        habit_id = _habit()
+
+        with get_engine_context() as engine, Session(engine) as session:
+            habit = session.get(Habit, habit_id)
+            habit.title = "Respirar"
+            session.flush()
+            assert session.exec(select(ChangeLog).where(ChangeLog.field_name == "title")).all()
+            session.rollback()
+
+        assert [c.change_type for c in _changes("habits")] == [ChangeType.CREATED]
+
+    def test_br_audit_006_keyset_pagination(self, db_path: Path) -> None:
+        """
+        Integration: Páginas seguidas não repetem nem pulam linhas.
+
+        DADO: 25 mudanças, várias com o mesmo changed_at
+        QUANDO: Histórico é lido em páginas de 10 pelo cursor da última linha
+        ENTÃO: Páginas de 10, 10 e 5 em ordem decrescente de (changed_at, id)
+        E: Filtro por entidade e id restringe ao registro
+        """
+        habit_id = _habit()
+        HabitInstanceService.generate_instances(habit_id, date(2025, 10, 1), date(2025, 10, 20))
+        for title in ("A", "B", "C", "D"):
+            HabitService.update_habit(habit_id, title=title)
+
+        pages: list[list[ChangeLog]] = []
+        before = None
+        while True:
+            page = AuditService.history(limit=10, before=before)
+            if not page:
+                break
+            pages.append(page)
+            before = (page[-1].changed_at, page[-1].id)
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        keys = [(c.changed_at, c.id) for page in pages for c in page]
+        assert keys == sorted(keys, reverse=True)
+        assert len(set(keys)) == 25
+        habit_changes = AuditService.history(entity="habits", entity_id=habit_id)
+        assert [c.new_value for c in habit_changes] == ["D", "C", "B", "A", None]
+
+    def test_br_audit_007_history_command(self, db_path: Path) -> None:
+        """
+        Integration: `timeblock history` pagina pelo cursor impresso.
+
+        DADO: Hábito com 3 alterações de título
+        QUANDO: history --limit 2 e depois com o cursor impresso
+        ENTÃO: Primeira página traz o cursor da última linha
+        E: Segunda página traz as linhas seguintes
+        """
+        habit_id = _habit()
+        for title in ("A", "B", "C"):
+            HabitService.update_habit(habit_id, title=title)
+        runner = CliRunner()
+
+        first = runner.invoke(app, ["history", "--entity", "habit", "--limit", "2"])
+
+        assert first.exit_code == 0
+        assert "--before " in first.output
+        cursor = first.output.split("--before ")[1].split()[0]
+        second = runner.invoke(
+            app, ["history", "--entity", "habit", "--limit", "2", "--before", cursor]
+        )
+        assert second.exit_code == 0
+        assert "Meditar" in second.output
+        assert "created" in second.output
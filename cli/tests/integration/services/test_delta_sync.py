@@ -0,0 +1,224 @@
+"""
+Integration tests para sync por delta de change_seq (ADR-012).
+
+Referências:
+    - ADR-012: Sync Strategy
+    - ADR-019: Test Naming Convention
+"""
+
+import io
+import json
+from datetime import date, time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from src.timeblock.database import create_db_and_tables, get_engine_context
+from src.timeblock.models import Habit, HabitInstance, Recurrence, Routine
+from src.timeblock.services.delta_sync import DeltaSyncService
+from src.timeblock.services.habit_instance_service import HabitInstanceService
+from src.timeblock.services.habit_service import HabitService
+
+
+@pytest.fixture
+def dbs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Dois bancos (origem e destino); `use(path)` escolhe o ativo."""
+    source, target = tmp_path / "desktop.db", tmp_path / "termux.db"
+
+    def use(path: Path) -> None:
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(path))
+
+    for path in (target, source):
+        use(path)
+        create_db_and_tables()
+    return source, target, use
+
+
+def _seed() -> Habit:
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Rotina")
+        session.add(routine)
+        session.commit()
+        routine_id = routine.id
+    habit = HabitService.create_habit(
+        routine_id, "Meditar", time(7, 0), time(7, 30), Recurrence.EVERYDAY
+    )
+    HabitInstanceService.generate_instances(habit.id, date(2025, 10, 20), date(2025, 10, 26))
+    return habit
+
+
+def _export(since: int = 0) -> tuple[str, int]:
+    out = io.StringIO()
+    stats = DeltaSyncService.export_changes(out, since)
+    return out.getvalue(), stats.until
+
+
+def _sections(delta: str) -> dict[tuple[str, str], int]:
+    sections: dict[tuple[str, str], int] = {}
+    current = None
+    for line in delta.splitlines()[1:]:
+        record = json.loads(line)
+        if isinstance(record, dict):
+            current = (record["table"], record["op"])
+            sections[current] = 0
+        else:
+            sections[current] += 1
+    return sections
+
+
+class TestBRSyncDelta:
+    """
+    Integration: Export/import por faixa de change_seq (BR-SYNC-DELTA-*).
+
+    BRs cobertas:
+    - BR-SYNC-DELTA-001: Escritas recebem change_seq crescente
+    - BR-SYNC-DELTA-002: Export leva só o que mudou depois de --since
+    - BR-SYNC-DELTA-003: Import reconstrói as FKs pelo uuid
+    - BR-SYNC-DELTA-004: Remoções viajam como lápides
+    - BR-SYNC-DELTA-005: Linhas importadas não voltam no export do destino
+    - BR-SYNC-DELTA-006: Delta inválido não altera o banco
+    """
+
+    def test_br_sync_delta_001_writes_get_increasing_seq(self, dbs) -> None:
+        """
+        Integration: INSERT e UPDATE carimbam o próximo valor do contador.
+
+        DADO: Banco com rotina, hábito e instâncias
+        QUANDO: O hábito é alterado
+        ENTÃO: Seu change_seq passa a ser o maior e igual ao contador
+        """
+        habit = _seed()
+        before = DeltaSyncService.current_seq()
+
+        HabitService.update_habit(habit.id, title="Meditar 20min")
+
+        with get_engine_context() as engine, Session(engine) as session:
+            seq = session.exec(
+                text("SELECT change_seq FROM habits WHERE id = :id"), params={"id": habit.id}
+            ).scalar_one()
+        assert before >= 9
+        assert seq == before + 1 == DeltaSyncService.current_seq()
+
+    def test_br_sync_delta_002_export_since_only_changes(self, dbs) -> None:
+        """
+        Integration: Export com --since leva só as linhas alteradas.
+
+        DADO: Banco já exportado uma vez
+        QUANDO: Um hábito é alterado e exporta-se desde o último until
+        ENTÃO: O delta tem só esse hábito
+        """
+        habit = _seed()
+        full, until = _export()
+        HabitService.update_habit(habit.id, title="Meditar 20min")
+
+        delta, _ = _export(until)
+
+        assert _sections(full) == {
+            ("routines", "upsert"): 1,
+            ("habits", "upsert"): 1,
+            ("habitinstance", "upsert"): 7,
+        }
+        assert _sections(delta) == {("habits", "upsert"): 1}
+        assert "Meditar 20min" in delta
+
+    def test_br_sync_delta_003_import_rebuilds_foreign_keys(self, dbs) -> None:
+        """
+        Integration: Import traduz as FKs do uuid para o id local.
+
+        DADO: Destino com uma rotina própria (ids diferentes da origem)
+        QUANDO: O delta completo da origem é importado
+        ENTÃO: Instâncias apontam para o hábito local de mesmo uuid
+        """
+        source, target, use = dbs
+        use(target)
+        with get_engine_context() as engine, Session(engine) as session:
+            session.add(Routine(name="Só no Termux"))
+            session.commit()
+        use(source)
+        habit = _seed()
+        delta, _ = _export()
+
+        use(target)
+        stats = DeltaSyncService.import_changes(io.StringIO(delta))
+
+        with get_engine_context() as engine, Session(engine) as session:
+            local = session.exec(select(Habit).where(Habit.uuid == habit.uuid)).one()
+            routine = session.get(Routine, local.routine_id)
+            instances = session.exec(
+                select(HabitInstance).where(HabitInstance.habit_id == local.id)
+            ).all()
+        assert stats.upserts == 9
+        assert routine.name == "Rotina" and routine.id == 2
+        assert len(instances) == 7
+
+    def test_br_sync_delta_004_deletes_travel_as_tombstones(self, dbs) -> None:
+        """
+        Integration: Remover na origem remove no destino.
+
+        DADO: Destino sincronizado com a origem
+        QUANDO: O hábito é removido na origem e o delta é importado
+        ENTÃO: O hábito e suas instâncias somem do destino
+        """
+        source, target, use = dbs
+        habit = _seed()
+        full, until = _export()
+        use(target)
+        DeltaSyncService.import_changes(io.StringIO(full))
+
+        use(source)
+        HabitService.delete_habit(habit.id)
+        delta, _ = _export(until)
+        use(target)
+        stats = DeltaSyncService.import_changes(io.StringIO(delta))
+
+        with get_engine_context() as engine, Session(engine) as session:
+            habits = session.exec(select(Habit)).all()
+            instances = session.exec(select(HabitInstance)).all()
+        assert stats.deletes >= 1
+        assert habits == [] and instances == []
+
+    def test_br_sync_delta_005_import_does_not_echo(self, dbs) -> None:
+        """
+        Integration: O import não gera mudanças no destino.
+
+        DADO: Destino vazio
+        QUANDO: O delta da origem é importado
+        ENTÃO: O contador do destino não anda e seu export fica vazio
+        """
+        _source, target, use = dbs
+        _seed()
+        full, _ = _export()
+
+        use(target)
+        DeltaSyncService.import_changes(io.StringIO(full))
+        delta, until = _export()
+
+        assert until == 0
+        assert _sections(delta) == {}
+
+    def test_br_sync_delta_006_invalid_delta_rolls_back(self, dbs) -> None:
+        """
+        Integration: Delta com FK para linha desconhecida falha inteiro.
+
+        DADO: Delta só com a seção de hábitos (sem a rotina)
+        QUANDO: É importado num banco vazio
+        ENTÃO: ValueError e nenhuma linha gravada, triggers religados
+        """
+        _source, target, use = dbs
+        _seed()
+        full, _ = _export()
+        lines = full.splitlines()
+        start = lines.index(next(line for line in lines if '"table":"habits"' in line))
+        partial = "\n".join([lines[0], *lines[start : start + 2]])
+
+        use(target)
+        with pytest.raises(ValueError, match="routines"):
+            DeltaSyncService.import_changes(io.StringIO(partial))
+
+        with get_engine_context() as engine, Session(engine) as session:
+            assert session.exec(select(Habit)).all() == []
+            session.add(Routine(name="Local"))
+            session.commit()
+        assert DeltaSyncService.current_seq() == 1
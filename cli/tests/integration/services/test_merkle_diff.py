@@ -0,0 +1,154 @@
+"""
+Integration tests para o diff por árvore de hashes entre dois bancos (ADR-012).
+
+Referências:
+    - ADR-012: Sync Strategy
+    - ADR-019: Test Naming Convention
+"""
+
+import io
+import shutil
+from datetime import date, time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+from src.timeblock.database import create_db_and_tables, get_engine_context, get_readonly_engine
+from src.timeblock.models import Recurrence, Routine
+from src.timeblock.services.delta_sync import DeltaSyncService
+from src.timeblock.services.habit_instance_service import HabitInstanceService
+from src.timeblock.services.habit_service import HabitService
+from src.timeblock.services.merkle_diff import (
+    DigestPeer,
+    LoopbackTransport,
+    MerkleDiff,
+    MerkleDiffService,
+)
+
+
+@pytest.fixture
+def dbs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Local e remoto começando do mesmo banco; `use(path)` escolhe o ativo."""
+    local, remote = tmp_path / "desktop.db", tmp_path / "termux.db"
+
+    def use(path: Path) -> None:
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(path))
+
+    use(local)
+    create_db_and_tables()
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Rotina")
+        session.add(routine)
+        session.commit()
+        routine_id = routine.id
+    for title in ("Meditar", "Ler"):
+        habit = HabitService.create_habit(
+            routine_id, title, time(7, 0), time(7, 30), Recurrence.EVERYDAY
+        )
+        HabitInstanceService.generate_instances(habit.id, date(2025, 1, 1), date(2025, 3, 31))
+    shutil.copy(local, remote)
+    return local, remote, use
+
+
+def _diff(local: Path, remote: Path) -> tuple[MerkleDiff, LoopbackTransport]:
+    transport = LoopbackTransport(DigestPeer(get_readonly_engine(str(remote))))
+    merkle = MerkleDiff(DigestPeer(get_readonly_engine(str(local))), transport)
+    merkle.run()
+    return merkle, transport
+
+
+class TestBRSyncMerkle:
+    """
+    Integration: Diff entre bancos por hashes de faixas (BR-SYNC-MERKLE-*).
+
+    BRs cobertas:
+    - BR-SYNC-MERKLE-001: Bancos iguais custam uma ida e volta
+    - BR-SYNC-MERKLE-002: Diferenças classificadas por linha
+    - BR-SYNC-MERKLE-003: Tráfego proporcional ao que difere
+    - BR-SYNC-MERKLE-004: Linhas buscadas convergem via sync import
+    """
+
+    def test_br_sync_merkle_001_identical_databases(self, dbs) -> None:
+        """
+        Integration: Só as raízes são trocadas quando nada difere.
+
+        DADO: Dois bancos idênticos
+        QUANDO: O diff é executado
+        ENTÃO: Nenhuma diferença e uma única ida e volta
+        """
+        local, remote, _ = dbs
+
+        merkle, transport = _diff(local, remote)
+
+        assert merkle.tables == {}
+        assert transport.round_trips == 1
+
+    def test_br_sync_merkle_002_classifies_rows(self, dbs) -> None:
+        """
+        Integration: Diff aponta linhas faltando, alteradas e extras.
+
+        DADO: Hábito renomeado no remoto, hábito novo no remoto
+        E: Instância removida no remoto
+        QUANDO: O diff é executado a partir do local
+        ENTÃO: habits tem 1 faltando e 1 alterado; habitinstance 1 extra
+        """
+        local, remote, use = dbs
+        use(remote)
+        HabitService.update_habit(1, title="Meditar 20min")
+        HabitService.create_habit(1, "Correr", time(6, 0), time(6, 30), Recurrence.WEEKDAYS)
+        with get_engine_context() as engine, Session(engine) as session:
+            session.exec(text("DELETE FROM habitinstance WHERE id = 10"))
+            session.commit()
+
+        merkle, _ = _diff(local, remote)
+
+        assert set(merkle.tables) == {"habits", "habitinstance"}
+        habits, instances = merkle.tables["habits"], merkle.tables["habitinstance"]
+        assert (len(habits.missing), len(habits.changed), len(habits.extra)) == (1, 1, 0)
+        assert (len(instances.missing), len(instances.changed), len(instances.extra)) == (0, 0, 1)
+
+    def test_br_sync_merkle_003_traffic_tracks_differences(self, dbs) -> None:
+        """
+        Integration: Uma linha diferente não transfere a tabela inteira.
+
+        DADO: 180 instâncias, uma delas alterada no remoto
+        QUANDO: O diff é executado
+        ENTÃO: Os bytes trocados são uma fração do export completo
+        E: São poucas idas e voltas (uma por nível da árvore)
+        """
+        local, remote, use = dbs
+        use(remote)
+        with get_engine_context() as engine, Session(engine) as session:
+            session.exec(text("UPDATE habitinstance SET date = '2025-04-01' WHERE id = 42"))
+            session.commit()
+        full = io.StringIO()
+        DeltaSyncService.export_changes(full)
+
+        merkle, transport = _diff(local, remote)
+
+        assert len(merkle.tables["habitinstance"].changed) == 1
+        assert transport.bytes_sent + transport.bytes_received < len(full.getvalue()) / 5
+        assert transport.round_trips <= 4
+
+    def test_br_sync_merkle_004_fetched_rows_converge(self, dbs) -> None:
+        """
+        Integration: Delta gerado pelo diff deixa o local igual ao remoto.
+
+        DADO: Remoto com hábito renomeado e hábito novo
+        QUANDO: sync diff grava o delta e ele é importado no local
+        ENTÃO: Um novo diff não encontra diferenças
+        """
+        local, remote, use = dbs
+        use(remote)
+        HabitService.update_habit(2, title="Ler 10 páginas")
+        HabitService.create_habit(1, "Correr", time(6, 0), time(6, 30), Recurrence.WEEKDAYS)
+
+        use(local)
+        out = io.StringIO()
+        report = MerkleDiffService.diff(str(remote), out)
+        stats = DeltaSyncService.import_changes(io.StringIO(out.getvalue()))
+
+        assert report.rows_fetched == stats.upserts == 2
+        assert MerkleDiffService.diff(str(remote)).tables == {}
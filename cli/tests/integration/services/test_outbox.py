@@ -0,0 +1,228 @@
+"""
+Integration tests para o outbox transacional de eventos (ADR-023).
+
+Referências:
+    - ADR-023: Microservices Ecosystem (CloudEvents)
+    - ADR-019: Test Naming Convention
+"""
+
+import json
+import socketserver
+import threading
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+import pytest
+from sqlmodel import Session, select
+
+from src.timeblock.database import get_engine_context
+from src.timeblock.models import OutboxEvent, Recurrence, Routine, SkipReason
+from src.timeblock.services.habit_instance_service import HabitInstanceService
+from src.timeblock.services.habit_service import HabitService
+from src.timeblock.services.outbox import (
+    FileSink,
+    OutboxPublisher,
+    OutboxService,
+    UnixSocketSink,
+)
+from src.timeblock.services.task_service import TaskService
+from src.timeblock.services.timer_service import TimerService
+
+
+def _instances(count: int = 3) -> list[int]:
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Rotina")
+        session.add(routine)
+        session.commit()
+        routine_id = routine.id
+    habit = HabitService.create_habit(
+        routine_id, "Meditar", time(7, 0), time(7, 30), Recurrence.EVERYDAY
+    )
+    start = date(2025, 10, 20)
+    instances = HabitInstanceService.generate_instances(
+        habit.id, start, start + timedelta(days=count - 1)
+    )
+    return [instance.id for instance in instances]
+
+
+def _events() -> list[tuple[str, str, dict]]:
+    with get_engine_context() as engine, Session(engine) as session:
+        rows = session.exec(select(OutboxEvent).order_by(OutboxEvent.id)).all()
+        return [(row.type, row.subject, json.loads(row.data)) for row in rows]
+
+
+class _FlakySink:
+    """Destino que falha nas primeiras `failures` chamadas."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.batches: list[list[dict]] = []
+
+    def publish(self, events: list[dict]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("broker indisponível")
+        self.batches.append(events)
+
+
+class TestBROutbox:
+    """
+    Integration: Eventos de domínio via outbox (BR-OUTBOX-*).
+
+    BRs cobertas:
+    - BR-OUTBOX-001: Evento gravado no mesmo commit da mudança
+    - BR-OUTBOX-002: Mudança recusada não gera evento
+    - BR-OUTBOX-003: Publisher entrega em lotes e avança o offset
+    - BR-OUTBOX-004: Falha do destino entra em backoff sem perder eventos
+    - BR-OUTBOX-005: Destino por socket Unix confirma cada lote
+    - BR-OUTBOX-006: prune remove só o que todos os destinos receberam
+    """
+
+    def test_br_outbox_001_events_recorded_with_change(self, db_path: Path) -> None:
+        """
+        Integration: Timer, skip e tarefa concluída geram eventos.
+
+        DADO: Instâncias de hábito e uma tarefa
+        QUANDO: Timer é iniciado e parado, uma instância é pulada e a tarefa concluída
+        ENTÃO: O outbox tem um evento por ação, com subject pelo uuid
+        """
+        first, second, _ = _instances()
+        task = TaskService.create_task("Dentista", datetime(2025, 10, 20, 14, 30))
+
+        timelog = TimerService.start_timer(first)
+        TimerService.stop_timer(timelog.id)
+        HabitInstanceService.skip_habit_instance(second, SkipReason.HEALTH, "Gripe")
+        TaskService.complete_task(task.id)
+
+        events = _events()
+        assert [event_type for event_type, _, _ in events] == [
+            "timeblock.timer.started",
+            "timeblock.timer.stopped",
+            "timeblock.habits.instance.completed",
+            "timeblock.habits.instance.skipped",
+            "timeblock.tasks.completed",
+        ]
+        assert events[1][1] == f"time_log/{timelog.uuid}"
+        assert events[3][2] == {"date": "2025-10-21", "skip_reason": "saude", "skip_note": "Gripe"}
+        assert events[4][2]["title"] == "Dentista"
+
+    def test_br_outbox_002_rejected_change_has_no_event(self, db_path: Path) -> None:
+        """
+        Integration: Operação que falha não deixa evento órfão.
+
+        DADO: Timer ativo numa instância
+        QUANDO: Um segundo timer é iniciado (recusado por BR-TIMER-001)
+        ENTÃO: Só o evento do primeiro timer existe
+        """
+        first, second, _ = _instances()
+        TimerService.start_timer(first)
+
+        with pytest.raises(ValueError, match="already active"):
+            TimerService.start_timer(second)
+
+        assert [event_type for event_type, _, _ in _events()] == ["timeblock.timer.started"]
+
+    def test_br_outbox_003_publisher_batches_and_tracks_offset(
+        self, db_path: Path, tmp_path: Path
+    ) -> None:
+        """
+        Integration: Publisher entrega CloudEvents em lotes.
+
+        DADO: 5 eventos no outbox
+        QUANDO: O publisher drena com lotes de 2 para um arquivo
+        ENTÃO: O arquivo tem os 5 CloudEvents em ordem
+        E: Uma segunda drenagem não reenvia nada
+        """
+        for instance_id in _instances(5):
+            HabitInstanceService.mark_completed(instance_id)
+        out = tmp_path / "events.jsonl"
+        publisher = OutboxPublisher(FileSink(out), "file:events", batch_size=2)
+
+        result = publisher.drain()
+        again = publisher.drain()
+
+        lines = [json.loads(line) for line in out.read_text().splitlines()]
+        assert (result.published, result.pending) == (5, 0)
+        assert again.published == 0
+        assert len(lines) == 5
+        assert lines[0]["specversion"] == "1.0"
+        assert lines[0]["source"] == "/timeblock/v1"
+        assert lines[0]["time"].endswith("Z")
+        assert len({line["id"] for line in lines}) == 5
+
+    def test_br_outbox_004_failures_back_off_and_retry(self, db_path: Path) -> None:
+        """
+        Integration: Destino fora do ar não perde eventos.
+
+        DADO: 3 eventos e um destino que falha duas vezes
+        QUANDO: O publisher tenta, espera o backoff e tenta de novo
+        ENTÃO: Durante o backoff nada é enviado
+        E: Depois da recuperação os 3 eventos chegam, uma vez cada
+        """
+        for instance_id in _instances():
+            HabitInstanceService.mark_completed(instance_id)
+        sink = _FlakySink(failures=2)
+        publisher = OutboxPublisher(sink, "flaky")
+        now = datetime(2025, 10, 20, 9, 0)
+
+        first = publisher.drain(now)
+        waiting = publisher.drain(now + timedelta(milliseconds=500))
+        second = publisher.drain(now + timedelta(seconds=1))
+        done = publisher.drain(now + timedelta(seconds=4))
+
+        assert first.error == "ConnectionError: broker indisponível"
+        assert first.retry_at == now + timedelta(seconds=1)
+        assert (waiting.published, waiting.pending) == (0, 3)
+        assert second.retry_at == now + timedelta(seconds=3)
+        assert (done.published, done.pending, done.error) == (3, 0, None)
+        assert [len(batch) for batch in sink.batches] == [3]
+
+    def test_br_outbox_005_unix_socket_sink(self, db_path: Path, tmp_path: Path) -> None:
+        """
+        Integration: Lote enviado por socket Unix e confirmado com `ok`.
+
+        DADO: Um servidor Unix que guarda os lotes e responde `ok`
+        QUANDO: O publisher drena para ele
+        ENTÃO: O servidor recebe os eventos
+        """
+        received: list[dict] = []
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                received.extend(json.loads(self.rfile.readline()))
+                self.wfile.write(b"ok\n")
+
+        socket_path = tmp_path / "broker.sock"
+        server = socketserver.UnixStreamServer(str(socket_path), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            for instance_id in _instances(2):
+                HabitInstanceService.mark_completed(instance_id)
+            result = OutboxPublisher(UnixSocketSink(socket_path), "unix").drain()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert result.published == 2
+        assert [event["type"] for event in received] == ["timeblock.habits.instance.completed"] * 2
+
+    def test_br_outbox_006_prune_keeps_unacked(self, db_path: Path, tmp_path: Path) -> None:
+        """
+        Integration: prune respeita o destino mais atrasado.
+
+        DADO: Dois destinos, um com todos os eventos e outro com nenhum
+        QUANDO: prune é executado antes e depois do segundo publicar
+        ENTÃO: Primeiro nada é removido; depois, tudo
+        """
+        for instance_id in _instances():
+            HabitInstanceService.mark_completed(instance_id)
+        OutboxPublisher(FileSink(tmp_path / "a.jsonl"), "a").drain()
+        OutboxPublisher(_FlakySink(failures=1), "b").drain()
+
+        before = OutboxService.prune()
+        OutboxPublisher(FileSink(tmp_path / "b.jsonl"), "b").drain(datetime.now() + timedelta(1))
+        after = OutboxService.prune()
+
+        assert (before, after) == (0, 3)
+        assert _events() == []
@@ -0,0 +1,340 @@
+"""
+Integration tests para a reconstrução do banco pelo log, com snapshots (ADR-023).
+
+Referências:
+    - ADR-023: Sync Queue
+    - ADR-019: Test Naming Convention
+"""
+
+import io
+import sqlite3
+from datetime import date, datetime, time
+from pathlib import Path
+
+import pytest
+from sqlmodel import Session, select
+from typer.testing import CliRunner
+
+from src.timeblock.database import create_db_and_tables, get_engine_context
+from src.timeblock.main import app
+from src.timeblock.models import HabitInstance, Recurrence, Routine
+from src.timeblock.services.delta_sync import DeltaSyncService
+from src.timeblock.services.habit_instance_service import HabitInstanceService
+from src.timeblock.services.habit_service import HabitService
+from src.timeblock.services.replay import ReplayService
+from src.timeblock.services.task_service import TaskService
+from src.timeblock.services.timer_service import TimerService
+
+
+@pytest.fixture
+def db_path(db_path: Path) -> Path:
+    """Banco com uma rotina, um hábito e um mês de instâncias."""
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Rotina")
+        session.add(routine)
+        session.commit()
+        routine_id = routine.id
+    habit = HabitService.create_habit(
+        routine_id, "Meditar", time(7, 0), time(7, 30), Recurrence.EVERYDAY
+    )
+    HabitInstanceService.generate_instances(habit.id, date(2025, 1, 1), date(2025, 1, 31))
+    return db_path
+
+
+@pytest.fixture
+def snapshots(tmp_path: Path) -> Path:
+    return tmp_path / "snapshots"
+
+
+def _instance_ids() -> list[int]:
+    with get_engine_context() as engine, Session(engine) as session:
+        return list(session.exec(select(HabitInstance.id).order_by(HabitInstance.id)).all())
+
+
+def _edit_schedule(instance_ids: list[int]) -> None:
+    """Conclui, cronometra e remove instâncias; cria, remarca e remove tarefas."""
+    HabitInstanceService.mark_completed(instance_ids[0])
+    HabitInstanceService.mark_completed(instance_ids[1])
+    timelog = TimerService.start_timer(instance_ids[2])
+    TimerService.stop_timer(timelog.id)
+    with get_engine_context() as engine, Session(engine) as session:
+        session.delete(session.get(HabitInstance, instance_ids[-1]))
+        session.commit()
+    when = datetime(2025, 1, 10, 14, 0)
+    kept = TaskService.create_task("Dentista", when)
+    TaskService.update_task(kept.id, scheduled_datetime=datetime(2025, 1, 11, 9, 0))
+    dropped = TaskService.create_task("Rascunho", when)
+    TaskService.delete_task(dropped.id)
+
+
+class TestBRReplayRebuild:
+    """Reconstrução do banco a partir do snapshot e do log."""
+
+    def test_br_replay_001_rebuild_without_snapshot(
+        self, db_path: Path, snapshots: Path, tmp_path: Path
+    ):
+        """
+        Sem snapshot, o log inteiro reconstrói o banco.
+
+        DADO: Um banco com rotina, hábito, instâncias e edições, sem snapshot
+        QUANDO: rebuild é chamado
+        ENTÃO: O banco novo tem as mesmas linhas, com os mesmos ids, que o atual
+        """
+        _edit_schedule(_instance_ids())
+        target = tmp_path / "rebuilt.db"
+
+        stats = ReplayService.rebuild(str(target), str(snapshots))
+
+        assert stats.snapshot_seq == 0
+        assert stats.events > 0
+        assert ReplayService.verify(str(target)).tables == {}
+        with sqlite3.connect(target) as conn:
+            rebuilt = [row[0] for row in conn.execute("SELECT id FROM habitinstance ORDER BY id")]
+        assert rebuilt == _instance_ids()
+
+    def test_br_replay_002_rebuild_from_snapshot(
+        self, db_path: Path, snapshots: Path, tmp_path: Path
+    ):
+        """
+        Com snapshot, só as operações posteriores são aplicadas.
+
+        DADO: Um snapshot seguido de edições
+        QUANDO: rebuild é chamado
+        ENTÃO: Parte do seq do snapshot, lê só o log posterior e fica idêntico ao atual
+        """
+        created = ReplayService.snapshot(str(snapshots))
+        _edit_schedule(_instance_ids())
+        target = tmp_path / "rebuilt.db"
+
+        stats = ReplayService.rebuild(str(target), str(snapshots))
+
+        assert created is not None
+        assert stats.snapshot_seq == created.seq
+        assert stats.until_seq > created.seq
+        assert stats.events == stats.until_seq - created.seq
+        assert ReplayService.verify(str(target)).tables == {}
+
+    def test_br_replay_003_edits_reduced_to_net_effect(
+        self, db_path: Path, snapshots: Path, tmp_path: Path
+    ):
+        """
+        Várias edições da mesma linha viram uma escrita.
+
+        DADO: Um snapshot e 10 remarcações da mesma instância
+        QUANDO: rebuild é chamado
+        ENTÃO: São lidas 10 operações e escrita uma linha, com o horário final
+        """
+        ReplayService.snapshot(str(snapshots))
+        instance_id = _instance_ids()[0]
+        for minute in range(10):
+            HabitInstanceService.adjust_instance_time(instance_id, time(8, minute), time(9, 0))
+        target = tmp_path / "rebuilt.db"
+
+        stats = ReplayService.rebuild(str(target), str(snapshots))
+
+        assert stats.events == 10
+        assert stats.rows == 1
+        assert ReplayService.verify(str(target)).tables == {}
+
+    def test_br_replay_004_rows_marked_for_next_export(
+        self, db_path: Path, snapshots: Path, tmp_path: Path
+    ):
+        """
+        Linhas reaplicadas saem no próximo export e remoções deixam lápide.
+
+        DADO: Um snapshot seguido de edições com uma remoção
+        QUANDO: rebuild é chamado
+        ENTÃO: As linhas reaplicadas têm change_seq acima do contador do banco
+               atual, a remoção tem lápide e os triggers de change_seq voltam
+        """
+        ReplayService.snapshot(str(snapshots))
+        instance_ids = _instance_ids()
+        _edit_schedule(instance_ids)
+        with sqlite3.connect(db_path) as conn:
+            live_counter = conn.execute("SELECT counter FROM sync_state").fetchone()[0]
+            live_triggers = conn.execute(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'trigger'"
+            ).fetchone()[0]
+        target = tmp_path / "rebuilt.db"
+
+        ReplayService.rebuild(str(target), str(snapshots))
+
+        with sqlite3.connect(target) as conn:
+            counter = conn.execute("SELECT counter FROM sync_state").fetchone()[0]
+            seq = conn.execute(
+                "SELECT change_seq FROM habitinstance WHERE id = ?", (instance_ids[0],)
+            ).fetchone()[0]
+            tombstones = conn.execute(
+                "SELECT count(*) FROM sync_tombstone WHERE entity = 'habitinstance' "
+                "AND change_seq = ?",
+                (counter,),
+            ).fetchone()[0]
+            triggers = conn.execute(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'trigger'"
+            ).fetchone()[0]
+        assert counter > live_counter
+        assert seq == counter
+        assert tombstones == 1
+        assert triggers == live_triggers
+
+    def test_br_replay_005_target_must_not_exist(self, db_path: Path, tmp_path: Path):
+        """
+        Rebuild nunca sobrescreve um banco.
+
+        DADO: Um arquivo já existente no destino
+        QUANDO: rebuild é chamado
+        ENTÃO: Levanta FileExistsError e o arquivo fica intacto
+        """
+        target = tmp_path / "rebuilt.db"
+        target.write_bytes(b"ocupado")
+
+        with pytest.raises(FileExistsError):
+            ReplayService.rebuild(str(target))
+
+        assert target.read_bytes() == b"ocupado"
+
+    def test_br_replay_006_verify_detects_divergence(
+        self, db_path: Path, snapshots: Path, tmp_path: Path
+    ):
+        """
+        Verify aponta as linhas que diferem do banco atual.
+
+        DADO: Um banco reconstruído e depois alterado
+        QUANDO: verify é chamado
+        ENTÃO: A tabela alterada aparece no relatório
+        """
+        target = tmp_path / "rebuilt.db"
+        ReplayService.rebuild(str(target), str(snapshots))
+        with sqlite3.connect(target) as conn:
+            conn.execute("UPDATE habits SET title = 'Outro'")
+
+        report = ReplayService.verify(str(target))
+
+        assert list(report.tables) == ["habits"]
+
+    def test_br_replay_010_rebuild_imported_database(
+        self,
+        db_path: Path,
+        snapshots: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """
+        Linhas aplicadas pelo import de delta entram no log.
+
+        DADO: Um banco preenchido só por dois imports (o segundo altera e
+              remove linhas do primeiro) e uma edição local depois deles
+        QUANDO: rebuild é chamado
+        ENTÃO: O banco novo é idêntico ao importado
+        """
+        first = io.StringIO()
+        until = DeltaSyncService.export_changes(first).until
+        _edit_schedule(_instance_ids())
+        second = io.StringIO()
+        DeltaSyncService.export_changes(second, until)
+
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(tmp_path / "termux.db"))
+        create_db_and_tables()
+        DeltaSyncService.import_changes(io.StringIO(first.getvalue()))
+        DeltaSyncService.import_changes(io.StringIO(second.getvalue()))
+        HabitInstanceService.mark_completed(_instance_ids()[5])
+        target = tmp_path / "rebuilt.db"
+
+        stats = ReplayService.rebuild(str(target), str(snapshots))
+
+        assert stats.events > 0
+        assert ReplayService.verify(str(target)).tables == {}
+
+    def test_br_replay_011_rows_missing_from_log_fail(
+        self, db_path: Path, snapshots: Path, tmp_path: Path
+    ):
+        """
+        Linhas que o log não cobre fazem o rebuild falhar, não sumir.
+
+        DADO: Uma instância sem operações no log (como as anteriores à migração 007)
+        QUANDO: rebuild é chamado sem snapshot, e de novo depois de um snapshot
+        ENTÃO: Sem snapshot levanta ValueError sem deixar o destino; com ele,
+               o banco novo é idêntico ao atual
+        """
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "DELETE FROM sync_queue WHERE entity = 'habitinstance' AND entity_id = ?",
+                (_instance_ids()[-1],),
+            )
+        target = tmp_path / "rebuilt.db"
+
+        with pytest.raises(ValueError, match="habitinstance: 30 linha"):
+            ReplayService.rebuild(str(target), str(snapshots))
+        assert not target.exists()
+
+        ReplayService.snapshot(str(snapshots))
+        ReplayService.rebuild(str(target), str(snapshots))
+        assert ReplayService.verify(str(target)).tables == {}
+
+
+class TestBRReplaySnapshot:
+    """Snapshots periódicos."""
+
+    def test_br_replay_007_every_skips_recent_snapshot(self, db_path: Path, snapshots: Path):
+        """
+        Com --every, só copia depois de N operações novas no log.
+
+        DADO: Um snapshot recente
+        QUANDO: snapshot é chamado com every=5, antes e depois de 5 operações
+        ENTÃO: Devolve None na primeira vez e cria um snapshot na segunda
+        """
+        first = ReplayService.snapshot(str(snapshots))
+        assert ReplayService.snapshot(str(snapshots), every=5) is None
+
+        for instance_id in _instance_ids()[:5]:
+            HabitInstanceService.mark_completed(instance_id)
+        second = ReplayService.snapshot(str(snapshots), every=5)
+
+        assert first is not None and second is not None
+        assert second.seq >= first.seq + 5
+
+    def test_br_replay_008_keep_prunes_old_snapshots(self, db_path: Path, snapshots: Path):
+        """
+        Snapshots além de `keep` são apagados, dos mais antigos.
+
+        DADO: Três snapshots em seqs diferentes
+        QUANDO: O terceiro é criado com keep=2
+        ENTÃO: Sobram os dois mais recentes
+        """
+        instance_ids = _instance_ids()
+        created = []
+        for instance_id in instance_ids[:3]:
+            HabitInstanceService.mark_completed(instance_id)
+            created.append(ReplayService.snapshot(str(snapshots), keep=2))
+
+        remaining = ReplayService.snapshots(str(snapshots))
+
+        assert [snapshot.seq for snapshot in remaining] == [
+            snapshot.seq for snapshot in created[1:]
+        ]
+        assert not created[0].path.exists()
+
+
+class TestBRReplayCommand:
+    """Comando `replay`."""
+
+    def test_br_replay_009_cli_rebuild_verify(self, db_path: Path, snapshots: Path, tmp_path: Path):
+        """
+        `replay rebuild --verify` reconstrói e confere.
+
+        DADO: Um snapshot pelo comando e edições depois dele
+        QUANDO: `replay rebuild DESTINO --verify` é executado
+        ENTÃO: Sai com código 0 e informa que o banco é idêntico
+        """
+        runner = CliRunner()
+        result = runner.invoke(app, ["replay", "snapshot", "--dir", str(snapshots)])
+        assert result.exit_code == 0
+        _edit_schedule(_instance_ids())
+
+        target = tmp_path / "rebuilt.db"
+        result = runner.invoke(
+            app, ["replay", "rebuild", str(target), "--dir", str(snapshots), "--verify"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Idêntico" in result.output
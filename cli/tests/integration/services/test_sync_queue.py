@@ -0,0 +1,194 @@
+"""
+Integration tests para a fila de sincronização (ADR-012).
+
+Referências:
+    - ADR-012: Sync Strategy
+    - ADR-019: Test Naming Convention
+"""
+
+import json
+from datetime import date, time
+from pathlib import Path
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from src.timeblock.database import get_engine_context
+from src.timeblock.models import Habit, Recurrence, Routine, SyncOp, SyncOperation
+from src.timeblock.services.habit_instance_service import HabitInstanceService
+from src.timeblock.services.habit_service import HabitService
+from src.timeblock.services.sync_queue import SyncQueue, collapse
+
+
+def _routine() -> int:
+    with get_engine_context() as engine, Session(engine) as session:
+        routine = Routine(name="Rotina")
+        session.add(routine)
+        session.commit()
+        return routine.id
+
+
+def _habit(routine_id: int) -> Habit:
+    return HabitService.create_habit(
+        routine_id, "Meditar", time(7, 0), time(7, 30), Recurrence.EVERYDAY
+    )
+
+
+def _queue() -> list[tuple[str, SyncOp, dict | None]]:
+    return [
+        (op.entity, op.op, None if op.payload is None else json.loads(op.payload))
+        for batch in SyncQueue.batches()
+        for op in batch
+    ]
+
+
+class TestBRSyncQueue:
+    """
+    Integration: Log de operações para sincronização (BR-SYNC-QUEUE-*).
+
+    BRs cobertas:
+    - BR-SYNC-QUEUE-001: Mutações pelos services entram na fila
+    - BR-SYNC-QUEUE-002: Operação gravada na mesma transação da mutação
+    - BR-SYNC-QUEUE-003: Leitura em lotes por seq
+    - BR-SYNC-QUEUE-004: Compactação envia o conjunto mínimo de operações
+    - BR-SYNC-QUEUE-005: ack remove só o que foi confirmado
+    """
+
+    def test_br_sync_queue_001_service_mutations_are_logged(self, db_path: Path) -> None:
+        """
+        Integration: Criar, alterar e remover hábito gera três operações.
+
+        DADO: Rotina criada e fila esvaziada
+        QUANDO: Um hábito é criado, renomeado e removido via HabitService
+        ENTÃO: A fila tem INSERT (colunas completas), UPDATE (só o título) e DELETE
+        E: Todas identificam o hábito pelo uuid
+        """
+        routine_id = _routine()
+        SyncQueue.ack(10**9)
+
+        habit = _habit(routine_id)
+        HabitService.update_habit(habit.id, title="Respirar")
+        HabitService.delete_habit(habit.id)
+
+        queue = _queue()
+        assert [(entity, op) for entity, op, _ in queue] == [
+            ("habits", SyncOp.INSERT),
+            ("habits", SyncOp.UPDATE),
+            ("habits", SyncOp.DELETE),
+        ]
+        assert queue[0][2]["title"] == "Meditar"
+        assert queue[0][2]["recurrence"] == "EVERYDAY"
+        assert "id" not in queue[0][2]
+        assert queue[1][2] == {"title": "Respirar"}
+        assert queue[2][2] is None
+        assert {op.entity_uuid for op in SyncQueue.read()} == {habit.uuid}
+
+    def test_br_sync_queue_002_rollback_discards_operation(self, db_path: Path) -> None:
+        """
+        Integration: Mutação que falha não deixa operação na fila.
+
+        DADO: Fila vazia
+        QUANDO: Um hábito com rotina inexistente é inserido (FK falha no commit)
+        ENTÃO: A fila continua vazia
+        """
+        with get_engine_context() as engine, Session(engine) as session:
+            session.add(
+                Habit(
+                    routine_id=999,
+                    title="Órfão",
+                    scheduled_start=time(7, 0),
+                    scheduled_end=time(7, 30),
+                    recurrence=Recurrence.EVERYDAY,
+                )
+            )
+            with pytest.raises(IntegrityError):
+                session.commit()
+
+        assert SyncQueue.count() == 0
+
+    def test_br_sync_queue_003_batches_by_seq(self, db_path: Path) -> None:
+        """
+        Integration: batches percorre a fila em lotes de tamanho fixo.
+
+        DADO: Hábito com 5 instâncias geradas (7 operações na fila)
+        QUANDO: A fila é lida em lotes de 3
+        ENTÃO: Os lotes têm 3, 3 e 1 operações, em seq crescente e sem repetição
+        """
+        habit = _habit(_routine())
+        HabitInstanceService.generate_instances(habit.id, date(2025, 10, 20), date(2025, 10, 24))
+
+        batches = list(SyncQueue.batches(batch_size=3))
+        seqs = [op.seq for batch in batches for op in batch]
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert seqs == sorted(set(seqs))
+
+    def test_br_sync_queue_004_compact_collapses_repeated_rows(self, db_path: Path) -> None:
+        """
+        Integration: Operações da mesma linha viram uma só.
+
+        DADO: Rotina criada e já confirmada
+        E: Hábito A criado e alterado duas vezes
+        E: Hábito B criado e removido
+        QUANDO: A fila é compactada
+        ENTÃO: Resta um INSERT de A com os valores finais, no seq do INSERT original
+        E: Nada resta de B
+        """
+        routine_id = _routine()
+        SyncQueue.ack(10**9)
+        habit_a = _habit(routine_id)
+        insert_seq = SyncQueue.read()[0].seq
+        HabitService.update_habit(habit_a.id, title="Respirar")
+        HabitService.update_habit(habit_a.id, color="#00ff00")
+        habit_b = _habit(routine_id)
+        HabitService.delete_habit(habit_b.id)
+
+        removed = SyncQueue.compact()
+
+        (operation,) = SyncQueue.read()
+        payload = json.loads(operation.payload)
+        assert removed == 4
+        assert (operation.seq, operation.op) == (insert_seq, SyncOp.INSERT)
+        assert (payload["title"], payload["color"]) == ("Respirar", "#00ff00")
+
+    def test_br_sync_queue_004_collapse_rules(self) -> None:
+        """
+        Integration: Regras de redução de uma sequência de operações.
+
+        DADO: Sequências de operações de uma mesma linha
+        QUANDO: collapse é aplicado
+        ENTÃO: UPDATEs se fundem, DELETE prevalece, INSERT + DELETE some
+        """
+        assert collapse([(SyncOp.UPDATE, {"a": 1}), (SyncOp.UPDATE, {"a": 2, "b": 3})]) == (
+            SyncOp.UPDATE,
+            {"a": 2, "b": 3},
+        )
+        assert collapse([(SyncOp.UPDATE, {"a": 1}), (SyncOp.DELETE, None)]) == (
+            SyncOp.DELETE,
+            None,
+        )
+        assert collapse([(SyncOp.INSERT, {"a": 1}), (SyncOp.DELETE, None)]) is None
+        assert collapse([(SyncOp.DELETE, None), (SyncOp.INSERT, {"a": 1})]) == (
+            SyncOp.UPDATE,
+            {"a": 1},
+        )
+
+    def test_br_sync_queue_005_ack_removes_confirmed_prefix(self, db_path: Path) -> None:
+        """
+        Integration: ack(seq) remove até seq e o seq nunca é reutilizado.
+
+        DADO: Rotina e hábito na fila
+        QUANDO: O primeiro lote é confirmado e outro hábito é criado
+        ENTÃO: Ficam só as operações posteriores, com seq maior que o confirmado
+        """
+        habit = _habit(_routine())
+        last_seq = SyncQueue.read()[-1].seq
+
+        SyncQueue.ack(last_seq)
+        HabitService.update_habit(habit.id, title="Respirar")
+
+        remaining = SyncQueue.read()
+        assert [op.op for op in remaining] == [SyncOp.UPDATE]
+        assert remaining[0].seq > last_seq
+        assert isinstance(remaining[0], SyncOperation)
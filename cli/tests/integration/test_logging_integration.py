@@ -1,5 +1,6 @@
 """Testes de integração para logging nos services."""
 
+import json
 import tempfile
 from datetime import date, time, timedelta
 from pathlib import Path
@@ -9,7 +10,12 @@ from sqlmodel import Session, SQLModel, create_engine
 
 from src.timeblock.models import Habit, Recurrence, Routine
 from src.timeblock.services.habit_instance_service import HabitInstanceService
-from src.timeblock.utils.logger import disable_logging, enable_logging, setup_logger
+from src.timeblock.utils.logger import (
+    disable_logging,
+    enable_logging,
+    setup_logger,
+    shutdown_logging,
+)
 
 
 @pytest.fixture
@@ -174,6 +180,41 @@ class TestServiceLogging:
             assert "inexistente" in content
             assert "instance_id=99999" in content
 
+    def test_json_logs_structured_fields(self, habit):
+        """Verifica campos estruturados dos logs do service em JSON.
+
+        DADO: Logger do service em JSON, escrevendo pela fila
+        QUANDO: Gerar instâncias e marcar uma como completa
+        ENTÃO: Cada linha é um JSON com a mensagem e os ids em campos próprios
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "service.log"
+
+            # Preparação: Configura logging JSON com fila
+            setup_logger(
+                "src.timeblock.services.habit_instance_service",
+                level="INFO",
+                log_file=log_file,
+                console=False,
+                json_format=True,
+                queued=True,
+            )
+
+            # Ação: Gera e completa instância
+            instances = HabitInstanceService.generate_instances(
+                habit.id, date.today(), date.today()
+            )
+            HabitInstanceService.mark_completed(instances[0].id)
+            shutdown_logging()
+
+            # Verificação: Campos estruturados
+            entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+            created = next(e for e in entries if e["msg"].startswith("Criadas"))
+            assert created["habit_id"] == habit.id
+            assert created["count"] == 1
+            completed = next(e for e in entries if e["msg"].startswith("Instância completada"))
+            assert completed["instance_id"] == instances[0].id
+
 
 class TestLoggingInTests:
     """Testa comportamento de logging durante testes."""
@@ -0,0 +1,134 @@
+"""
+Integration tests - calendário virtualizado da TUI (Textual).
+
+Referências:
+    - ADR-006: Textual para TUI
+    - ADR-019: Test Naming Convention
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("textual")
+
+from src.timeblock.database import create_db_and_tables, get_readonly_engine
+from src.timeblock.services.task_service import TaskService
+from src.timeblock.tui.app import CalendarView, TimeBlockApp
+from src.timeblock.tui.windows import window_start
+
+TODAY = date(2025, 10, 22)
+
+
+def _at(day: date, hour: int) -> datetime:
+    return datetime.combine(day, datetime.min.time()) + timedelta(hours=hour)
+
+
+@pytest.fixture
+def engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Engine de leitura sobre banco em arquivo (o watcher precisa de outro processo/conexão)."""
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(tmp_path / "tui.db"))
+    create_db_and_tables()
+    engine = get_readonly_engine()
+    yield engine
+    engine.dispose()
+
+
+async def _settle(app: TimeBlockApp, pilot) -> None:
+    """Espera os workers de janela e o redesenho."""
+    await pilot.pause()
+    await app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+def _row(view: CalendarView, day: date) -> str:
+    return view.render_line(view.line_of(day) - round(view.scroll_y)).text
+
+
+class TestBRTuiCalendar:
+    """
+    Integration: Calendário virtualizado com carga por janela (BR-TUI-CAL-*).
+
+    BRs cobertas:
+    - BR-TUI-CAL-001: Abre em hoje com a semana visível carregada
+    - BR-TUI-CAL-002: Rolagem distante carrega só as janelas em vista
+    - BR-TUI-CAL-003: Commit externo redesenha só os dias alterados
+    """
+
+    def test_br_tui_cal_001_opens_on_today(self, engine) -> None:
+        """
+        Integration: Linha de hoje mostra a tarefa do dia.
+
+        DADO: Tarefa hoje às 09:00
+        QUANDO: A TUI abre
+        ENTÃO: Hoje está no topo e sua linha mostra a tarefa
+        """
+        TaskService.create_task("Dentista", _at(TODAY, 9))
+
+        async def scenario() -> tuple[int, str]:
+            app = TimeBlockApp(engine, today=TODAY)
+            async with app.run_test(size=(80, 20)) as pilot:
+                await _settle(app, pilot)
+                view = app.query_one(CalendarView)
+                return round(view.scroll_y) - view.line_of(TODAY), _row(view, TODAY)
+
+        offset, row = asyncio.run(scenario())
+
+        assert offset == 0
+        assert row.startswith("Qua 22/10/2025 │ 09:00 Dentista ·")
+
+    def test_br_tui_cal_002_far_scroll_loads_visible_windows(self, engine) -> None:
+        """
+        Integration: Rolar dois anos carrega só a vizinhança nova.
+
+        DADO: TUI aberta em hoje
+        QUANDO: Usuário rola para dois anos à frente
+        ENTÃO: A semana de destino está em cache
+        E: Semanas intermediárias nunca foram lidas
+        """
+        target = TODAY + timedelta(days=730)
+
+        async def scenario() -> CalendarView:
+            app = TimeBlockApp(engine, today=TODAY)
+            async with app.run_test(size=(80, 20)) as pilot:
+                await _settle(app, pilot)
+                view = app.query_one(CalendarView)
+                view.scroll_to_day(target)
+                await _settle(app, pilot)
+                return view
+
+        view = asyncio.run(scenario())
+
+        assert window_start(target) in view.windows
+        assert window_start(TODAY + timedelta(days=365)) not in view.windows
+
+    def test_br_tui_cal_003_external_commit_refreshes_changed_days(self, engine) -> None:
+        """
+        Integration: Tarefa criada por outra conexão aparece por diff.
+
+        DADO: TUI aberta com a semana carregada
+        QUANDO: Outra conexão cria uma tarefa amanhã
+        ENTÃO: A linha de amanhã passa a mostrar a tarefa
+        E: Só a linha de amanhã é redesenhada
+        """
+        tomorrow = TODAY + timedelta(days=1)
+
+        async def scenario() -> tuple[list[int], str, int]:
+            app = TimeBlockApp(engine, today=TODAY, poll_interval=0.05)
+            async with app.run_test(size=(80, 20)) as pilot:
+                await _settle(app, pilot)
+                view = app.query_one(CalendarView)
+                refreshed: list[int] = []
+                view.refresh_line = refreshed.append
+
+                TaskService.create_task("Reunião", _at(tomorrow, 15))
+                await pilot.pause(0.2)
+                await _settle(app, pilot)
+                return refreshed, _row(view, tomorrow), view.line_of(tomorrow)
+
+        refreshed, row, tomorrow_line = asyncio.run(scenario())
+
+        assert refreshed == [tomorrow_line]
+        assert "15:00 Reunião" in row
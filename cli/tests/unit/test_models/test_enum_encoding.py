@@ -0,0 +1,123 @@
+"""Testes para enums armazenados como inteiros (IntEnumType)."""
+
+from datetime import date, time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError, StatementError
+from sqlmodel import Session, select
+
+from src.timeblock.models import (
+    DoneSubstatus,
+    Habit,
+    HabitInstance,
+    Recurrence,
+    Routine,
+    Status,
+)
+from src.timeblock.models.enum_encoding import IntEnumType, enum_codes
+
+
+def _habit(session: Session) -> Habit:
+    routine = Routine(name="Rotina")
+    session.add(routine)
+    session.commit()
+    habit = Habit(
+        routine_id=routine.id,
+        title="Leitura",
+        scheduled_start=time(9, 0),
+        scheduled_end=time(10, 0),
+        recurrence=Recurrence.WEEKDAYS,
+    )
+    session.add(habit)
+    session.commit()
+    return habit
+
+
+class TestEnumCodes:
+    """Testes para os códigos estáveis de cada membro."""
+
+    def test_codes_follow_declaration_order(self):
+        """Códigos são a posição de declaração (contrato do formato em disco)."""
+        assert enum_codes(Status) == {Status.PENDING: 0, Status.DONE: 1, Status.NOT_DONE: 2}
+
+    def test_bind_accepts_member_name_and_value(self):
+        """Escrita aceita membro, nome ou valor."""
+        enum_type = IntEnumType(Status)
+        assert enum_type.process_bind_param(Status.DONE, None) == 1
+        assert enum_type.process_bind_param("DONE", None) == 1
+        assert enum_type.process_bind_param("done", None) == 1
+        assert enum_type.process_bind_param(None, None) is None
+
+    def test_bind_rejects_unknown_value(self):
+        """Valor fora do enum gera LookupError."""
+        with pytest.raises(LookupError):
+            IntEnumType(Status).process_bind_param("bogus", None)
+
+
+class TestIntEnumStorage:
+    """Testes de persistência com SQLite."""
+
+    def test_stored_as_integer_and_read_as_enum(self, session: Session):
+        """Coluna guarda inteiro; modelo devolve o membro do enum."""
+        habit = _habit(session)
+        instance = HabitInstance(
+            habit_id=habit.id,
+            date=date(2025, 10, 17),
+            scheduled_start=time(9, 0),
+            scheduled_end=time(10, 0),
+            status=Status.DONE,
+            done_substatus=DoneSubstatus.PARTIAL,
+        )
+        session.add(instance)
+        session.commit()
+
+        raw = session.exec(
+            text("SELECT status, done_substatus, typeof(status) FROM habitinstance")
+        ).one()
+        assert raw == (1, 3, "integer")
+        assert session.exec(text("SELECT recurrence FROM habits")).one()[0] == 7
+
+        session.expire_all()
+        loaded = session.get(HabitInstance, instance.id)
+        assert loaded.status is Status.DONE
+        assert loaded.done_substatus is DoneSubstatus.PARTIAL
+        assert loaded.not_done_substatus is None
+
+    def test_filter_by_status(self, session: Session):
+        """Filtros por enum continuam funcionando na API ORM."""
+        habit = _habit(session)
+        for status in (Status.PENDING, Status.DONE, Status.DONE):
+            session.add(
+                HabitInstance(
+                    habit_id=habit.id,
+                    date=date(2025, 10, 17),
+                    scheduled_start=time(9, 0),
+                    scheduled_end=time(10, 0),
+                    status=status,
+                )
+            )
+        session.commit()
+
+        done = session.exec(select(HabitInstance).where(HabitInstance.status == Status.DONE)).all()
+        assert len(done) == 2
+
+    def test_check_constraint_rejects_invalid_code(self, session: Session):
+        """CHECK constraint impede códigos fora do enum."""
+        habit = _habit(session)
+        with pytest.raises(IntegrityError):
+            session.exec(
+                text(
+                    "INSERT INTO habitinstance (habit_id, date, scheduled_start, scheduled_end,"
+                    " status) VALUES (:id, '2025-10-17', '09:00:00', '10:00:00', 7)"
+                ),
+                params={"id": habit.id},
+            )
+
+    def test_invalid_value_rejected_on_flush(self, session: Session):
+        """Valor inválido atribuído ao modelo falha na escrita."""
+        habit = _habit(session)
+        habit.recurrence = "NEVER"
+        session.add(habit)
+        with pytest.raises(StatementError):
+            session.commit()
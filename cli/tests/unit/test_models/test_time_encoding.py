@@ -0,0 +1,112 @@
+"""Testes para colunas start_min/end_min (minutos desde epoch)."""
+
+from datetime import UTC, date, datetime, time
+
+from sqlmodel import Session, select
+
+from src.timeblock.models import Event, Habit, HabitInstance, Recurrence, Routine, Task
+from src.timeblock.models.time_encoding import to_epoch_minutes
+
+
+def _habit(session: Session) -> Habit:
+    routine = Routine(name="Rotina")
+    session.add(routine)
+    session.commit()
+    habit = Habit(
+        routine_id=routine.id,
+        title="Leitura",
+        scheduled_start=time(9, 0),
+        scheduled_end=time(10, 0),
+        recurrence=Recurrence.EVERYDAY,
+    )
+    session.add(habit)
+    session.commit()
+    return habit
+
+
+class TestToEpochMinutes:
+    """Testes para to_epoch_minutes."""
+
+    def test_naive_datetime(self):
+        """Deve converter horário de parede para minutos desde epoch."""
+        assert to_epoch_minutes(datetime(1970, 1, 1, 1, 30)) == 90
+
+    def test_aware_datetime_ignores_timezone(self):
+        """Deve descartar tzinfo, como o SQLite faz ao armazenar."""
+        naive = datetime(2025, 10, 17, 9, 0)
+        assert to_epoch_minutes(naive.replace(tzinfo=UTC)) == to_epoch_minutes(naive)
+
+    def test_truncates_seconds(self):
+        """Deve truncar segundos para o minuto."""
+        assert to_epoch_minutes(datetime(2025, 10, 17, 9, 0, 59)) == to_epoch_minutes(
+            datetime(2025, 10, 17, 9, 0)
+        )
+
+
+class TestGeneratedColumns:
+    """Testes para colunas geradas pelo SQLite."""
+
+    def test_habit_instance_bounds(self, session: Session):
+        """Deve combinar date + time em minutos desde epoch."""
+        habit = _habit(session)
+        instance = HabitInstance(
+            habit_id=habit.id,
+            date=date(2025, 10, 17),
+            scheduled_start=time(9, 0),
+            scheduled_end=time(10, 30),
+        )
+        session.add(instance)
+        session.commit()
+        session.refresh(instance)
+
+        assert instance.start_min == to_epoch_minutes(datetime(2025, 10, 17, 9, 0))
+        assert instance.end_min == to_epoch_minutes(datetime(2025, 10, 17, 10, 30))
+
+    def test_task_assumes_one_hour(self, session: Session):
+        """Deve assumir duração de 1 hora para tasks."""
+        task = Task(title="Dentista", scheduled_datetime=datetime(2025, 10, 17, 14, 0))
+        session.add(task)
+        session.commit()
+        session.refresh(task)
+
+        assert task.end_min - task.start_min == 60
+
+    def test_event_bounds(self, session: Session):
+        """Deve converter scheduled_start/scheduled_end do evento."""
+        event = Event(
+            title="Reunião",
+            scheduled_start=datetime(2025, 10, 17, 15, 0),
+            scheduled_end=datetime(2025, 10, 17, 15, 45),
+        )
+        session.add(event)
+        session.commit()
+        session.refresh(event)
+
+        assert event.end_min - event.start_min == 45
+
+    def test_overlap_as_sql_range_predicate(self, session: Session):
+        """Deve permitir overlap entre tipos diferentes via predicado SQL."""
+        habit = _habit(session)
+        session.add(
+            HabitInstance(
+                habit_id=habit.id,
+                date=date(2025, 10, 17),
+                scheduled_start=time(9, 0),
+                scheduled_end=time(10, 0),
+            )
+        )
+        session.add(Task(title="Cedo", scheduled_datetime=datetime(2025, 10, 17, 7, 0)))
+        session.add(Task(title="Conflito", scheduled_datetime=datetime(2025, 10, 17, 9, 30)))
+        session.commit()
+
+        start = to_epoch_minutes(datetime(2025, 10, 17, 9, 0))
+        end = to_epoch_minutes(datetime(2025, 10, 17, 10, 0))
+        tasks = session.exec(select(Task).where(Task.start_min < end, Task.end_min > start)).all()
+        instances = session.exec(
+            select(HabitInstance).where(
+                HabitInstance.start_min < end, HabitInstance.end_min > start
+            )
+        ).all()
+
+        assert [t.title for t in tasks] == ["Conflito"]
+        assert len(instances) == 1
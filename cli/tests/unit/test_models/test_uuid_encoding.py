@@ -0,0 +1,67 @@
+"""Testes para UUIDv7 armazenado como BLOB (ADR-013)."""
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from src.timeblock.models import Routine, Tag
+from src.timeblock.models.uuid_encoding import UUIDBlob, uuid7
+
+
+class TestUUID7:
+    """Testes para o gerador uuid7."""
+
+    def test_version_and_variant(self):
+        """UUID gerado é versão 7, variante RFC."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_timestamp(self):
+        """Os 48 bits iniciais são o timestamp em ms."""
+        assert uuid7(1_700_000_000_000).int >> 80 == 1_700_000_000_000
+
+    def test_ordered_by_timestamp(self):
+        """UUIDs de ms diferentes ordenam pelo instante, também como bytes."""
+        values = [uuid7(1_700_000_000_000 + i) for i in range(50)]
+        assert sorted(values) == values
+        assert sorted(v.bytes for v in values) == [v.bytes for v in values]
+
+
+class TestUUIDBlob:
+    """Testes de persistência da coluna uuid."""
+
+    def test_bind_and_result(self):
+        """Conversão UUID <-> 16 bytes."""
+        value = uuid7()
+        blob_type = UUIDBlob()
+        raw = blob_type.process_bind_param(value, None)
+        assert raw == value.bytes and len(raw) == 16
+        assert blob_type.process_bind_param(str(value), None) == raw
+        assert blob_type.process_result_value(raw, None) == value
+        assert blob_type.process_bind_param(None, None) is None
+
+    def test_generated_on_insert_and_stored_as_blob(self, session: Session):
+        """Novas linhas recebem uuid v7 gravado como BLOB de 16 bytes."""
+        routine = Routine(name="Manhã")
+        session.add(routine)
+        session.commit()
+
+        raw = session.exec(text("SELECT typeof(uuid), length(uuid) FROM routines")).one()
+        assert raw == ("blob", 16)
+
+        session.expire_all()
+        loaded = session.exec(select(Routine).where(Routine.uuid == routine.uuid)).one()
+        assert isinstance(loaded.uuid, UUID)
+        assert loaded.id == routine.id
+
+    def test_uuid_is_unique(self, session: Session):
+        """Índice único impede uuid duplicado."""
+        shared = uuid7()
+        session.add(Tag(name="a", uuid=shared))
+        session.add(Tag(name="b", uuid=shared))
+        with pytest.raises(IntegrityError):
+            session.commit()
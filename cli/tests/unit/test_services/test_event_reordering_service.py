@@ -65,56 +65,29 @@ class TestDetectConflicts:
         assert conflicts[0].conflicting_event_id == task2.id
 
 
-class TestGetEventTimes:
-    """Tests for _get_event_times."""
+class TestGetConflictsForDay:
+    """Tests for get_conflicts_for_day."""
 
-    def test_task_times(self):
-        """Gets correct start/end for Task."""
-        task = Task(title="Task 1", scheduled_datetime=datetime(2025, 10, 24, 10, 0))
-        start, end = EventReorderingService._get_event_times(task, "task")
-        assert start == datetime(2025, 10, 24, 10, 0)
-        assert end == datetime(2025, 10, 24, 11, 0)
-
-    def test_habit_instance_times(self):
-        """Gets correct start/end for HabitInstance."""
-        habit_instance = HabitInstance(
+    def test_pairs_reported_once_across_kinds(self, session):
+        """Each overlapping pair is reported once, regardless of kind."""
+        task = Task(title="Task", scheduled_datetime=datetime(2025, 10, 24, 10, 0))
+        instance = HabitInstance(
             habit_id=1,
             date=datetime(2025, 10, 24).date(),
-            scheduled_start=time(10, 0),
-            scheduled_end=time(11, 0),
+            scheduled_start=time(10, 30),
+            scheduled_end=time(11, 30),
         )
-        start, end = EventReorderingService._get_event_times(habit_instance, "habit_instance")
-        assert start == datetime(2025, 10, 24, 10, 0)
-        assert end == datetime(2025, 10, 24, 11, 0)
-
-
-class TestHasOverlap:
-    """Tests for _has_overlap."""
-
-    def test_no_overlap_before(self):
-        start1 = datetime(2025, 10, 24, 10, 0)
-        end1 = datetime(2025, 10, 24, 11, 0)
-        start2 = datetime(2025, 10, 24, 11, 0)
-        end2 = datetime(2025, 10, 24, 12, 0)
-        assert not EventReorderingService._has_overlap(start1, end1, start2, end2)
-
-    def test_no_overlap_after(self):
-        start1 = datetime(2025, 10, 24, 12, 0)
-        end1 = datetime(2025, 10, 24, 13, 0)
-        start2 = datetime(2025, 10, 24, 10, 0)
-        end2 = datetime(2025, 10, 24, 11, 0)
-        assert not EventReorderingService._has_overlap(start1, end1, start2, end2)
-
-    def test_partial_overlap(self):
-        start1 = datetime(2025, 10, 24, 10, 0)
-        end1 = datetime(2025, 10, 24, 11, 30)
-        start2 = datetime(2025, 10, 24, 11, 0)
-        end2 = datetime(2025, 10, 24, 12, 0)
-        assert EventReorderingService._has_overlap(start1, end1, start2, end2)
-
-    def test_complete_overlap(self):
-        start1 = datetime(2025, 10, 24, 10, 0)
-        end1 = datetime(2025, 10, 24, 12, 0)
-        start2 = datetime(2025, 10, 24, 10, 30)
-        end2 = datetime(2025, 10, 24, 11, 30)
-        assert EventReorderingService._has_overlap(start1, end1, start2, end2)
+        other_day = Task(title="Other", scheduled_datetime=datetime(2025, 10, 25, 10, 0))
+        session.add_all([task, instance, other_day])
+        session.commit()
+
+        conflicts = EventReorderingService.get_conflicts_for_day(
+            datetime(2025, 10, 24).date(), session=session
+        )
+
+        assert len(conflicts) == 1
+        pair = {
+            (conflicts[0].triggered_event_type, conflicts[0].triggered_event_id),
+            (conflicts[0].conflicting_event_type, conflicts[0].conflicting_event_id),
+        }
+        assert pair == {("task", task.id), ("habit_instance", instance.id)}
@@ -0,0 +1,134 @@
+"""Testes para o status de timer somente-stdlib (timeblock-status)."""
+
+import subprocess
+import sys
+from datetime import date, datetime, time
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.timeblock import status
+from src.timeblock.models import Habit, HabitInstance, Recurrence, Routine
+from src.timeblock.services.timer_service import TimerService
+
+STARTED_AT = datetime(2025, 10, 17, 9, 0).timestamp()
+
+
+def _state(**overrides) -> dict:
+    state = {
+        "timelog_id": 7,
+        "label": "Leitura",
+        "started_at": STARTED_AT,
+        "paused_seconds": 0,
+        "paused_at": None,
+    }
+    state.update(overrides)
+    return state
+
+
+class TestFormatStatus:
+    """Testes para format_status."""
+
+    def test_running(self):
+        """Timer rodando mostra ícone, HH:MM e rótulo."""
+        assert status.format_status(_state(), STARTED_AT + 3725) == "> 01:02 Leitura"
+
+    def test_paused_discounts_and_freezes(self):
+        """Timer pausado desconta pausas e congela no início da pausa."""
+        state = _state(paused_seconds=600, paused_at=STARTED_AT + 1800)
+        assert status.format_status(state, STARTED_AT + 7200) == "|| 00:20 Leitura"
+
+    def test_custom_format_and_idle(self):
+        """Formato customizado; sem timer não imprime nada."""
+        assert status.format_status(_state(), STARTED_AT + 60, "{label}={elapsed}") == (
+            "Leitura=00:01"
+        )
+        assert status.format_status(None, STARTED_AT) == ""
+
+
+class TestStateFile:
+    """Testes para leitura/escrita do arquivo de estado."""
+
+    def test_round_trip_and_remove(self, tmp_path: Path):
+        """Estado gravado é lido de volta; None remove o arquivo."""
+        path = str(tmp_path / "timeblock.db.status")
+        state = _state(label="Leitura\tprofunda", paused_at=STARTED_AT + 10)
+
+        status.write_state(path, state)
+        assert status.read_state(path) == {**state, "label": "Leitura profunda"}
+        assert list(tmp_path.iterdir()) == [Path(path)]  # sem temporários
+
+        status.write_state(path, None)
+        assert status.read_state(path) is None
+        status.write_state(path, None)  # idempotente
+
+    def test_invalid_file_is_ignored(self, tmp_path: Path):
+        """Arquivo corrompido ou de outra versão é tratado como sem timer."""
+        path = tmp_path / "timeblock.db.status"
+        path.write_text("garbage")
+        assert status.read_state(str(path)) is None
+        path.write_text("2\t1\t0.0\t0\t-\tx\n")
+        assert status.read_state(str(path)) is None
+
+    def test_imports_only_stdlib(self):
+        """Módulo não importa Typer, Rich nem SQLModel/SQLAlchemy."""
+        code = (
+            "import sys, src.timeblock.status; "
+            "heavy = {'typer', 'rich', 'sqlmodel', 'sqlalchemy'}; "
+            "print(sorted(heavy & {m.split('.')[0] for m in sys.modules}))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+
+class TestTimerServicePublishesStatus:
+    """TimerService reescreve o arquivo de estado a cada mudança."""
+
+    def test_start_pause_stop(self, tmp_path: Path):
+        """start grava, pause marca pausa, stop remove o arquivo."""
+        db_path = tmp_path / "timeblock.db"
+        engine = create_engine(f"sqlite:///{db_path}")
+        SQLModel.metadata.create_all(engine)
+        status_path = status.get_status_path(str(db_path))
+
+        with Session(engine) as session:
+            routine = Routine(name="Rotina")
+            session.add(routine)
+            session.commit()
+            habit = Habit(
+                routine_id=routine.id,
+                title="Leitura",
+                scheduled_start=time(9, 0),
+                scheduled_end=time(10, 0),
+                recurrence=Recurrence.EVERYDAY,
+            )
+            session.add(habit)
+            session.commit()
+            instance = HabitInstance(
+                habit_id=habit.id,
+                date=date.today(),
+                scheduled_start=time(9, 0),
+                scheduled_end=time(10, 0),
+            )
+            session.add(instance)
+            session.commit()
+
+            timelog = TimerService.start_timer(instance.id, session)
+            state = status.read_state(status_path)
+            assert state["timelog_id"] == timelog.id
+            assert state["label"] == "Leitura"
+            assert state["paused_at"] is None
+
+            TimerService.pause_timer(timelog.id, session)
+            assert status.read_state(status_path)["paused_at"] is not None
+
+            TimerService.stop_timer(timelog.id, session)
+            assert status.read_state(status_path) is None
+        engine.dispose()
+
+    def test_default_path_follows_db_env(self, monkeypatch):
+        """Caminho padrão acompanha TIMEBLOCK_DB_PATH."""
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", "/tmp/custom.db")
+        assert status.get_status_path() == "/tmp/custom.db.status"
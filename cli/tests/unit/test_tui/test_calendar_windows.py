@@ -0,0 +1,212 @@
+"""Testes para as janelas semanais do calendário da TUI."""
+
+from datetime import date, datetime, timedelta
+
+from src.timeblock.models.schedule_item import ScheduleItem
+from src.timeblock.models.time_encoding import to_epoch_minutes
+from src.timeblock.tui.windows import (
+    CalendarWindows,
+    diff_items,
+    format_day,
+    window_start,
+    windows_between,
+)
+
+MONDAY = date(2025, 10, 20)
+
+
+def _item(item_id: int, start: datetime, title: str = "Item", status: str = "PENDING"):
+    start_min = to_epoch_minutes(start)
+    return ScheduleItem("task", item_id, start_min, start_min + 30, status, title)
+
+
+def _at(day: date, hour: int = 9) -> datetime:
+    return datetime.combine(day, datetime.min.time()) + timedelta(hours=hour)
+
+
+class TestWindowBoundaries:
+    """Testa o cálculo das janelas semanais."""
+
+    def test_window_start_is_monday(self):
+        """Toda data cai na janela da sua segunda-feira.
+
+        DADO: Dias de segunda a domingo da mesma semana
+        QUANDO: Calcular o início da janela
+        ENTÃO: Todos devolvem a segunda-feira
+        """
+        for offset in range(7):
+            assert window_start(MONDAY + timedelta(days=offset)) == MONDAY
+
+    def test_windows_between_covers_range(self):
+        """Intervalo que atravessa semanas devolve todas as janelas.
+
+        DADO: Intervalo de quarta a terça da semana seguinte
+        QUANDO: Calcular as janelas
+        ENTÃO: Devolve as duas segundas-feiras
+        """
+        starts = windows_between(MONDAY + timedelta(days=2), MONDAY + timedelta(days=8))
+
+        assert starts == [MONDAY, MONDAY + timedelta(days=7)]
+
+
+class TestDiffItems:
+    """Testa o diff entre leituras de uma janela."""
+
+    def test_diff_detects_added_removed_changed(self):
+        """Diff separa itens novos, removidos e alterados.
+
+        DADO: Leitura antiga com itens 1 e 2
+        QUANDO: Nova leitura tem 2 alterado (movido de dia) e 3 novo
+        ENTÃO: Diff aponta cada caso e os dias afetados
+        """
+        old = [_item(1, _at(MONDAY)), _item(2, _at(MONDAY + timedelta(days=1)))]
+        new = [_item(2, _at(MONDAY + timedelta(days=3))), _item(3, _at(MONDAY + timedelta(days=4)))]
+
+        diff = diff_items(old, new)
+
+        assert [i.id for i in diff.added] == [3]
+        assert [i.id for i in diff.removed] == [1]
+        assert [(o.id, n.id) for o, n in diff.changed] == [(2, 2)]
+        assert diff.days == {MONDAY + timedelta(days=d) for d in (0, 1, 3, 4)}
+
+    def test_identical_reads_have_empty_diff(self):
+        """Leituras iguais não geram diff.
+
+        DADO: Duas leituras com os mesmos itens
+        QUANDO: Comparar
+        ENTÃO: Diff é falso e sem dias
+        """
+        items = [_item(1, _at(MONDAY))]
+
+        diff = diff_items(items, list(items))
+
+        assert not diff
+        assert diff.days == set()
+
+
+class TestCalendarWindows:
+    """Testa cache, prefetch e invalidação das janelas."""
+
+    def test_pending_orders_visible_then_adjacent(self):
+        """Janelas visíveis vêm primeiro, depois as adjacentes.
+
+        DADO: Cache vazio com prefetch de 1 janela
+        QUANDO: Pedir janelas para um intervalo dentro de uma semana
+        ENTÃO: Devolve a visível, a seguinte e a anterior
+        E: Um segundo pedido não repete janelas em andamento
+        """
+        windows = CalendarWindows(loader=lambda start: [], prefetch=1)
+        week = timedelta(days=7)
+
+        first = windows.pending(MONDAY + timedelta(days=1), MONDAY + timedelta(days=3))
+
+        assert first == [MONDAY, MONDAY + week, MONDAY - week]
+        assert windows.pending(MONDAY, MONDAY + timedelta(days=6)) == []
+
+    def test_items_for_day_placeholder_until_loaded(self):
+        """Dias sem janela carregada devolvem None.
+
+        DADO: Janela ainda não carregada
+        QUANDO: A janela é gravada com um item na terça
+        ENTÃO: Antes devolve None; depois, a terça tem o item e a quarta está vazia
+        """
+        windows = CalendarWindows(loader=lambda start: [])
+        tuesday = MONDAY + timedelta(days=1)
+
+        assert windows.items_for_day(tuesday) is None
+        windows.store(MONDAY, [_item(1, _at(tuesday))])
+
+        assert [i.id for i in windows.items_for_day(tuesday)] == [1]
+        assert windows.items_for_day(tuesday + timedelta(days=1)) == []
+
+    def test_store_drops_items_outside_window(self):
+        """Itens que começam fora da janela são descartados.
+
+        DADO: Leitura com item no domingo anterior
+        QUANDO: Gravar a janela
+        ENTÃO: O item não aparece em nenhum dia da janela
+        """
+        windows = CalendarWindows(loader=lambda start: [])
+
+        diff = windows.store(MONDAY, [_item(1, _at(MONDAY - timedelta(days=1)))])
+
+        assert not diff
+        assert windows.items_for_day(MONDAY - timedelta(days=1)) is None
+
+    def test_capacity_evicts_least_recently_used(self):
+        """Acima da capacidade, a janela menos usada sai do cache.
+
+        DADO: Cache com capacidade 2 e duas janelas gravadas
+        QUANDO: A primeira é lida e uma terceira é gravada
+        ENTÃO: A segunda (menos recente) é descartada
+        """
+        windows = CalendarWindows(loader=lambda start: [], capacity=2)
+        week = timedelta(days=7)
+        windows.store(MONDAY, [])
+        windows.store(MONDAY + week, [])
+
+        windows.items_for_day(MONDAY)
+        windows.store(MONDAY + 2 * week, [])
+
+        assert MONDAY in windows
+        assert MONDAY + week not in windows
+        assert windows.items_for_day(MONDAY + week) is None
+
+    def test_invalidate_keeps_data_and_requests_reload(self):
+        """Invalidação mantém os dados exibidos e pede releitura.
+
+        DADO: Janela carregada com um item
+        QUANDO: O cache é invalidado
+        ENTÃO: O item continua visível e a janela volta em `pending`
+        E: A releitura devolve só a diferença
+        """
+        windows = CalendarWindows(loader=lambda start: [], prefetch=0)
+        windows.store(MONDAY, [_item(1, _at(MONDAY))])
+
+        windows.invalidate()
+
+        assert [i.id for i in windows.items_for_day(MONDAY)] == [1]
+        assert windows.pending(MONDAY, MONDAY) == [MONDAY]
+        diff = windows.store(MONDAY, [_item(1, _at(MONDAY)), _item(2, _at(MONDAY, 10))])
+        assert [i.id for i in diff.added] == [2]
+        assert diff.days == {MONDAY}
+
+    def test_release_allows_retry(self):
+        """Janela liberada após erro volta a ser pedida.
+
+        DADO: Janela em andamento
+        QUANDO: O worker falha e a libera
+        ENTÃO: O próximo `pending` a devolve de novo
+        """
+        windows = CalendarWindows(loader=lambda start: [], prefetch=0)
+        windows.pending(MONDAY, MONDAY)
+
+        windows.release(MONDAY)
+
+        assert windows.pending(MONDAY, MONDAY) == [MONDAY]
+
+
+class TestFormatDay:
+    """Testa o texto de uma linha do calendário."""
+
+    def test_format_day_lists_items_in_time_order(self):
+        """Itens aparecem ordenados por horário, com marca de status.
+
+        DADO: Dois itens fora de ordem, um concluído
+        QUANDO: Formatar o dia
+        ENTÃO: Linha tem dia da semana, data e itens em ordem
+        """
+        items = [_item(2, _at(MONDAY, 14), "Dentista"), _item(1, _at(MONDAY, 8), "Leitura", "DONE")]
+
+        line = format_day(MONDAY, items)
+
+        assert line == "Seg 20/10/2025 │ 08:00 Leitura ✓ 14:00 Dentista ·"
+
+    def test_format_day_placeholder(self):
+        """Dia sem dados carregados mostra placeholder.
+
+        DADO: Itens None
+        QUANDO: Formatar o dia
+        ENTÃO: Linha termina com o placeholder
+        """
+        assert format_day(MONDAY, None) == "Seg 20/10/2025 │ …"
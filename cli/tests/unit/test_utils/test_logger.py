@@ -1,11 +1,22 @@
 """Testes para módulo de logging."""
 
+import json
 import logging
 import tempfile
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
 
-from src.timeblock.utils.logger import disable_logging, enable_logging, get_logger, setup_logger
+import pytest
+
+from src.timeblock.utils import logger as logger_module
+from src.timeblock.utils.logger import (
+    disable_logging,
+    enable_logging,
+    get_logger,
+    setup_logger,
+    shutdown_logging,
+)
 
 
 class TestSetupLogger:
@@ -117,7 +128,7 @@ class TestSetupLogger:
 
             # Ação: Escreve muitas mensagens
             for i in range(50):
-                logger.info(f"Mensagem de teste número {i} com texto extra")
+                logger.info("Mensagem de teste número %s com texto extra", i)
 
             # Verificação: Arquivos de backup criados
             backup_files = list(Path(tmpdir).glob("test.log.*"))
@@ -246,3 +257,217 @@ class TestLogFormat:
 
             timestamp_pattern = r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\]"
             assert re.search(timestamp_pattern, content), "Timestamp deve estar presente"
+
+
+class TestJsonFormat:
+    """Testa o formato JSON (uma linha por registro)."""
+
+    def test_json_format_fields(self):
+        """Registro vira JSON com os campos de extra.
+
+        DADO: Logger com json_format=True
+        QUANDO: Logar mensagem com argumentos e extra
+        ENTÃO: A linha é um JSON com nível, logger, mensagem interpolada e o campo extra
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            logger = setup_logger("test.json", log_file=log_file, console=False, json_format=True)
+
+            logger.info("Instância completada: instance_id=%s", 7, extra={"instance_id": 7})
+
+            entry = json.loads(log_file.read_text())
+            assert entry["level"] == "INFO"
+            assert entry["logger"] == "test.json"
+            assert entry["msg"] == "Instância completada: instance_id=7"
+            assert entry["instance_id"] == 7
+            assert "ts" in entry
+
+    def test_json_format_exception(self):
+        """Traceback vai no campo exc.
+
+        DADO: Logger com json_format=True
+        QUANDO: Logar com logger.exception dentro de um except
+        ENTÃO: O JSON tem a traceback em exc
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            logger = setup_logger(
+                "test.json.exc", log_file=log_file, console=False, json_format=True
+            )
+
+            try:
+                raise ValueError("falhou")
+            except ValueError:
+                logger.exception("Erro ao processar")
+
+            entry = json.loads(log_file.read_text())
+            assert entry["msg"] == "Erro ao processar"
+            assert "ValueError: falhou" in entry["exc"]
+
+
+class TestQueuedLogger:
+    """Testa a escrita pela fila (QueueHandler + QueueListener)."""
+
+    def test_queued_logger_writes_after_shutdown(self):
+        """Logger com fila só enfileira; o arquivo recebe tudo no shutdown.
+
+        DADO: Logger com queued=True e arquivo
+        QUANDO: Logar mensagens e chamar shutdown_logging
+        ENTÃO: O único handler do logger é o QueueHandler e o arquivo tem as mensagens
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            logger = setup_logger("test.queued", log_file=log_file, console=False, queued=True)
+
+            for i in range(100):
+                logger.info("Mensagem %d", i)
+            shutdown_logging()
+
+            assert len(logger.handlers) == 1
+            assert isinstance(logger.handlers[0], QueueHandler)
+            lines = log_file.read_text().splitlines()
+            assert len(lines) == 100
+            assert lines[-1].endswith("Mensagem 99")
+
+    def test_queued_write_off_calling_thread(self, monkeypatch: pytest.MonkeyPatch):
+        """Arquivo é escrito pela thread do listener.
+
+        DADO: Logger com queued=True
+        QUANDO: Logar uma mensagem
+        ENTÃO: O handler de arquivo roda em outra thread, não na que logou
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            logger = setup_logger(
+                "test.queued.thread", log_file=log_file, console=False, queued=True
+            )
+            file_handler = logger_module._listeners["test.queued.thread"].handlers[0]
+            emitted_by = []
+            original_emit = file_handler.emit
+
+            def emit(record: logging.LogRecord) -> None:
+                emitted_by.append(threading.current_thread())
+                original_emit(record)
+
+            monkeypatch.setattr(file_handler, "emit", emit)
+
+            logger.info("Mensagem")
+            shutdown_logging()
+
+            assert emitted_by and emitted_by[0] is not threading.current_thread()
+            assert "Mensagem" in log_file.read_text()
+
+    def test_queued_traceback_formatted_by_listener(self):
+        """Traceback chega ao arquivo mesmo passando pela fila.
+
+        DADO: Logger com queued=True
+        QUANDO: Logar com logger.exception
+        ENTÃO: O arquivo tem a mensagem e a traceback
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            logger = setup_logger("test.queued.exc", log_file=log_file, console=False, queued=True)
+
+            try:
+                raise ValueError("falhou")
+            except ValueError:
+                logger.exception("Erro ao processar")
+            shutdown_logging()
+
+            content = log_file.read_text()
+            assert "Erro ao processar" in content
+            assert "ValueError: falhou" in content
+
+    def test_reconfigure_flushes_previous_queue(self):
+        """Reconfigurar o logger escreve o que estava na fila antiga.
+
+        DADO: Logger com fila e mensagens enfileiradas
+        QUANDO: setup_logger é chamado de novo para o mesmo nome
+        ENTÃO: As mensagens anteriores estão no arquivo
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            logger = setup_logger(
+                "test.queued.again", log_file=log_file, console=False, queued=True
+            )
+            logger.info("Antes")
+
+            setup_logger("test.queued.again", log_file=log_file, console=False)
+
+            assert "Antes" in log_file.read_text()
+
+
+class TestLazyArguments:
+    """Testa que argumentos só são formatados se o nível está habilitado."""
+
+    def test_disabled_level_does_not_format_arguments(self):
+        """Chamada abaixo do nível não formata argumentos.
+
+        DADO: Logger em INFO
+        QUANDO: Logar em DEBUG e em INFO com um argumento que conta conversões
+        ENTÃO: Só a chamada em INFO converte o argumento
+        (o RotatingFileHandler formata duas vezes: teste de rotação e escrita)
+        """
+
+        class Counted:
+            calls = 0
+
+            def __str__(self) -> str:
+                Counted.calls += 1
+                return "valor"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            logger = setup_logger("test.lazy", level="INFO", log_file=log_file, console=False)
+
+            logger.debug("Debug %s", Counted())
+            assert Counted.calls == 0
+
+            logger.info("Info %s", Counted())
+            assert Counted.calls > 0
+            assert "Info valor" in log_file.read_text()
+
+
+class TestDefaultHandlers:
+    """Testa os handlers padrão de get_logger."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_defaults(self, monkeypatch: pytest.MonkeyPatch):
+        """Handlers padrão recriados a partir do ambiente do teste."""
+        monkeypatch.setattr(logger_module, "_default_handlers", None)
+        yield
+        shutdown_logging()
+
+    def test_default_handlers_shared(self):
+        """Loggers novos compartilham os mesmos handlers.
+
+        DADO: Dois loggers que não existem
+        QUANDO: Chamar get_logger para os dois
+        ENTÃO: Os handlers são os mesmos objetos (um stderr para todos os módulos)
+        """
+        first = get_logger("test.defaults.first")
+        second = get_logger("test.defaults.second")
+
+        assert first.handlers == second.handlers
+        assert first.handlers[0] is second.handlers[0]
+
+    def test_default_log_file_from_environment(self, monkeypatch: pytest.MonkeyPatch):
+        """TIMEBLOCK_LOG_FILE e TIMEBLOCK_LOG_FORMAT configuram os services.
+
+        DADO: TIMEBLOCK_LOG_FILE e TIMEBLOCK_LOG_FORMAT=json no ambiente
+        QUANDO: Um logger novo de get_logger loga
+        ENTÃO: O arquivo recebe a linha JSON, pela fila
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "service.log"
+            monkeypatch.setenv("TIMEBLOCK_LOG_FILE", str(log_file))
+            monkeypatch.setenv("TIMEBLOCK_LOG_FORMAT", "json")
+
+            logger = get_logger("test.defaults.env")
+            logger.info("Criadas %d instâncias", 7, extra={"count": 7})
+            shutdown_logging()
+
+            assert any(isinstance(handler, QueueHandler) for handler in logger.handlers)
+            entry = json.loads(log_file.read_text())
+            assert entry["msg"] == "Criadas 7 instâncias"
+            assert entry["count"] == 7
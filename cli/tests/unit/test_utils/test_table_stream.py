@@ -0,0 +1,129 @@
+"""Testes para a saída em streaming de tabelas."""
+
+import io
+import shlex
+import sys
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from src.timeblock.utils.table_stream import StreamColumn, TableStream
+
+COLUMNS = [
+    StreamColumn("ID", 4),
+    StreamColumn("Title", 10, flex=True),
+    StreamColumn("Status", 8),
+]
+
+
+def _rows(count: int, pulled: list[int] | None = None):
+    for i in range(count):
+        if pulled is not None:
+            pulled.append(i)
+        yield (str(i), f"[bold]Item {i}[/bold]", "planned")
+
+
+class TestTableStreamPlain:
+    """Testa a saída redirecionada (não TTY)."""
+
+    def test_plain_output_is_tab_separated(self, capsys: pytest.CaptureFixture[str]):
+        """Saída redirecionada vira linhas separadas por tab, sem markup.
+
+        DADO: Console que não é terminal
+        QUANDO: Escrever 3 linhas com título
+        ENTÃO: stdout tem só os dados; título e total vão para stderr
+        """
+        out = io.StringIO()
+        console = Console(file=out, force_terminal=False)
+
+        total = TableStream(console, COLUMNS).write(_rows(3), "Eventos")
+
+        assert total == 3
+        assert out.getvalue().splitlines() == [
+            "0\tItem 0\tplanned",
+            "1\tItem 1\tplanned",
+            "2\tItem 2\tplanned",
+        ]
+        err = capsys.readouterr().err
+        assert "Eventos" in err
+        assert "Total: 3" in err
+
+    def test_empty_rows_print_nothing(self):
+        """Sem linhas, nada é impresso.
+
+        DADO: Iterador vazio
+        QUANDO: Escrever
+        ENTÃO: Retorna 0 e a saída fica vazia
+        """
+        out = io.StringIO()
+
+        total = TableStream(Console(file=out), COLUMNS).write(iter([]), "Eventos")
+
+        assert total == 0
+        assert out.getvalue() == ""
+
+
+class TestTableStreamTerminal:
+    """Testa a saída em blocos no terminal."""
+
+    def test_chunks_share_header_and_widths(self):
+        """Blocos formam uma tabela só: um cabeçalho, colunas alinhadas.
+
+        DADO: Terminal de 40 colunas e blocos de 2 linhas
+        QUANDO: Escrever 5 linhas
+        ENTÃO: Cabeçalho aparece uma vez e todas as linhas têm a mesma largura
+        E: A coluna flex ocupa a largura restante
+        """
+        out = io.StringIO()
+        console = Console(file=out, force_terminal=True, color_system=None, width=40)
+
+        total = TableStream(console, COLUMNS, chunk_size=2, pager=False).write(_rows(5), "Eventos")
+
+        lines = [line for line in out.getvalue().splitlines() if line.strip()]
+        rows = [line for line in lines if line.split()[0].isdigit()]
+        assert total == 5
+        assert sum("Status" in line for line in lines) == 1
+        assert len(rows) == 5
+        assert {line.index("planned") for line in rows} == {40 - 8}
+
+    def test_rows_are_consumed_one_chunk_at_a_time(self):
+        """O iterador é consumido em blocos, intercalado com a escrita.
+
+        DADO: Blocos de 10 linhas e um arquivo que registra o progresso
+        QUANDO: Escrever 50 linhas
+        ENTÃO: Na primeira escrita de dados, no máximo um bloco foi lido
+        """
+        pulled: list[int] = []
+        pulled_at_first_row: list[int] = []
+
+        class Recorder(io.StringIO):
+            def write(self, text: str) -> int:
+                if "Item" in text and not pulled_at_first_row:
+                    pulled_at_first_row.append(len(pulled))
+                return super().write(text)
+
+        console = Console(file=Recorder(), force_terminal=True, width=60)
+
+        TableStream(console, COLUMNS, chunk_size=10, pager=False).write(_rows(50, pulled))
+
+        assert pulled_at_first_row[0] <= 11
+        assert len(pulled) == 50
+
+    def test_pager_receives_output(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """No terminal, a saída vai para o processo do $PAGER.
+
+        DADO: PAGER que copia stdin para um arquivo
+        QUANDO: Escrever 3 linhas
+        ENTÃO: O arquivo tem as linhas e o console não recebe nada
+        """
+        target = tmp_path / "paged.txt"
+        script = f"import shutil,sys; shutil.copyfileobj(sys.stdin, open({str(target)!r}, 'w'))"
+        monkeypatch.setenv("PAGER", f"{shlex.quote(sys.executable)} -c {shlex.quote(script)}")
+        out = io.StringIO()
+        console = Console(file=out, force_terminal=True, width=40)
+
+        TableStream(console, COLUMNS).write(_rows(3), "Eventos")
+
+        assert out.getvalue() == ""
+        assert "Item 2" in target.read_text()
@@ -4,10 +4,13 @@ from datetime import UTC, timedelta
 
 from sqlmodel import Session
 
+from src.timeblock.models import Event
 from src.timeblock.utils.queries import (
     build_events_query,
+    event_cursor,
     fetch_events,
     fetch_events_in_range,
+    period_filters,
 )
 
 
@@ -74,6 +77,76 @@ class TestBuildEventsQuery:
         assert len(results) == 0
 
 
+class TestBuildEventsQueryPaging:
+    """Testes para limit, offset e cursor keyset em build_events_query."""
+
+    def test_query_limit_and_offset(self, test_db, sample_events):
+        """Deve aplicar limit e offset na ordem pedida."""
+        query = build_events_query(ascending=False, limit=2, offset=1)
+        results = list(test_db.exec(query))
+        assert [e.title for e in results] == ["Event 4", "Event 3"]
+
+    def test_query_keyset_pages_cover_all_events(self, test_db, sample_events):
+        """Páginas seguidas pelo cursor devem cobrir todos os eventos sem repetir."""
+        for ascending in (True, False):
+            titles, cursor = [], None
+            while page := list(
+                test_db.exec(build_events_query(ascending=ascending, limit=2, after=cursor))
+            ):
+                titles.extend(e.title for e in page)
+                cursor = event_cursor(page[-1])
+            expected = [f"Event {i}" for i in range(1, 6)]
+            assert titles == (expected if ascending else expected[::-1])
+
+    def test_query_keyset_breaks_ties_by_id(self, test_db, now_time):
+        """Eventos no mesmo horário não devem ser pulados entre páginas."""
+        for i in range(3):
+            test_db.add(
+                Event(
+                    title=f"Same {i}",
+                    scheduled_start=now_time,
+                    scheduled_end=now_time + timedelta(hours=1),
+                )
+            )
+        test_db.commit()
+
+        first = list(test_db.exec(build_events_query(limit=2)))
+        second = list(test_db.exec(build_events_query(limit=2, after=event_cursor(first[-1]))))
+        assert [e.title for e in first + second] == ["Same 0", "Same 1", "Same 2"]
+
+    def test_query_before_is_exclusive(self, test_db, sample_events, now_time):
+        """Deve excluir eventos que começam exatamente em `before`."""
+        query = build_events_query(before=now_time, ascending=True)
+        results = list(test_db.exec(query))
+        assert [e.title for e in results] == ["Event 1", "Event 2"]
+
+
+class TestPeriodFilters:
+    """Testes para os buckets passado/presente/futuro em SQL."""
+
+    def test_period_buckets_partition_events(self, test_db, sample_events, now_time):
+        """Cada evento deve cair em exatamente um bucket."""
+        now = now_time + timedelta(minutes=1)
+        past, present, future = (
+            [e.title for e in fetch_events_in_range(test_db, ascending=False, **f)]
+            for f in period_filters(None, None, now)
+        )
+        assert past == []
+        assert present == ["Event 3", "Event 2", "Event 1"]
+        assert future == ["Event 5", "Event 4"]
+
+    def test_period_buckets_respect_range(self, test_db, sample_events, now_time):
+        """Buckets devem ficar dentro de [start, end]."""
+        now = now_time + timedelta(days=3)
+        start = now_time - timedelta(days=1)
+        end = now_time + timedelta(days=1)
+        buckets = [
+            [e.title for e in fetch_events_in_range(test_db, **f)]
+            for f in period_filters(start, end, now)
+        ]
+        assert buckets == [[], ["Event 2", "Event 3", "Event 4"], []]
+
+
 class TestFetchEvents:
     """Testes para função fetch_events."""
 
@@ -0,0 +1,75 @@
+"""Testes para leitura unificada da agenda (view schedule_item)."""
+
+from datetime import date, datetime, time
+
+import pytest
+from sqlmodel import Session
+
+from src.timeblock.models import Event, Habit, HabitInstance, Recurrence, Routine, Task
+from src.timeblock.utils.queries import fetch_schedule_items
+
+DAY_START = datetime(2025, 10, 17)
+DAY_END = datetime(2025, 10, 18)
+
+
+@pytest.fixture
+def mixed_schedule(test_db: Session):
+    """Um item de cada tipo em 2025-10-17 e uma task no dia seguinte."""
+    routine = Routine(name="Manhã")
+    test_db.add(routine)
+    test_db.commit()
+    habit = Habit(
+        routine_id=routine.id,
+        title="Leitura",
+        scheduled_start=time(7, 0),
+        scheduled_end=time(7, 30),
+        recurrence=Recurrence.EVERYDAY,
+    )
+    test_db.add(habit)
+    test_db.commit()
+    test_db.add_all(
+        [
+            Task(title="Revisar PR", scheduled_datetime=datetime(2025, 10, 17, 14, 0)),
+            HabitInstance(
+                habit_id=habit.id,
+                date=date(2025, 10, 17),
+                scheduled_start=time(7, 0),
+                scheduled_end=time(7, 30),
+            ),
+            Event(
+                title="Reunião",
+                scheduled_start=datetime(2025, 10, 17, 9, 0),
+                scheduled_end=datetime(2025, 10, 17, 10, 0),
+            ),
+            Task(title="Amanhã", scheduled_datetime=datetime(2025, 10, 18, 8, 0)),
+        ]
+    )
+    test_db.commit()
+
+
+class TestFetchScheduleItems:
+    """Testes para fetch_schedule_items."""
+
+    def test_returns_all_kinds_ordered_by_start(self, test_db, mixed_schedule):
+        """Deve retornar os três tipos do dia, ordenados pelo início."""
+        items = fetch_schedule_items(test_db, DAY_START, DAY_END)
+
+        assert [(i.kind, i.title) for i in items] == [
+            ("habit_instance", "Leitura"),
+            ("event", "Reunião"),
+            ("task", "Revisar PR"),
+        ]
+        assert items[0].start == datetime(2025, 10, 17, 7, 0)
+        assert items[2].end == datetime(2025, 10, 17, 15, 0)
+
+    def test_filters_by_kind(self, test_db, mixed_schedule):
+        """Deve restringir aos tipos pedidos."""
+        items = fetch_schedule_items(test_db, DAY_START, DAY_END, kinds=["task"])
+        assert [i.title for i in items] == ["Revisar PR"]
+
+    def test_range_is_half_open(self, test_db, mixed_schedule):
+        """Item que termina no início do intervalo não é incluído."""
+        items = fetch_schedule_items(
+            test_db, datetime(2025, 10, 17, 10, 0), datetime(2025, 10, 17, 14, 0)
+        )
+        assert items == []